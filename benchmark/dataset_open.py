@@ -0,0 +1,347 @@
+r"""Benchmark how the time and memory to open a dataset scale with the
+number of shards.
+
+The benchmark generates URI-only datasets: the shard URI files point
+to data files that do not exist, so only the dataset structure is
+created and loaded. For each number of shards, the benchmark measures
+the time to open the dataset with ``load_from_uri`` and its steps
+(``ShardTuple.from_uri`` and ``check_shards``), the Python memory per
+shard, and the time of ``is_sorted_by_uri``, ``get_list_uris`` and
+``equal``, for example:
+
+    python -m benchmark.dataset_open --num-shards 1000 10000 --plot scaling.png
+
+The results can be compared against a stored baseline, and the
+process exits with a non-zero code if a case is slower than the
+baseline by more than the threshold. The scaling curves are only
+plotted if ``matplotlib`` is installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib.util
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from coola.utils.path import sanitize_path
+
+from benchmark.results import (
+    BenchmarkResult,
+    compare_results,
+    format_comparisons,
+    load_results,
+    save_results,
+)
+from iden import shard
+from iden.constants import SHARDS
+from iden.dataset import create_vanilla_dataset, load_from_uri
+from iden.dataset.vanilla import check_shards
+from iden.io import load_json, save_json
+from iden.shard import JsonShard, ShardTuple, create_shard_dict, create_shard_tuple
+from iden.shard.utils import get_list_uris
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NUM_SHARDS = (1_000, 10_000, 100_000, 1_000_000)
+SPLIT = "train"
+
+
+@dataclass
+class OpenMemory:
+    r"""Define the memory used by an opened dataset.
+
+    Args:
+        num_shards: The number of shards in the dataset.
+        nbytes: The Python memory retained by the opened dataset in
+            bytes.
+        peak: The peak Python memory while opening the dataset in
+            bytes.
+    """
+
+    num_shards: int
+    nbytes: int
+    peak: int
+
+    @property
+    def nbytes_per_shard(self) -> float:
+        r"""The retained Python memory per shard in bytes."""
+        return self.nbytes / max(self.num_shards, 1)
+
+
+def generate_dataset(path: Path, num_shards: int) -> str:
+    r"""Generate a URI-only dataset with a single split.
+
+    Only the URI files are written. The shards point to data files
+    that do not exist, so the dataset can be opened but its data
+    cannot be loaded.
+
+    Args:
+        path: The directory where to write the URI files.
+        num_shards: The number of shards in the split.
+
+    Returns:
+        The URI of the dataset.
+    """
+    path_uri = path.joinpath("uri")
+    path_shards = path_uri.joinpath(SPLIT, "shards")
+    path_shards.mkdir(parents=True, exist_ok=True)
+    shards = []
+    # The shard URI files are written directly because the shard
+    # creation functions also save the data.
+    width = len(str(num_shards))
+    for i in range(num_shards):
+        uri_file = path_shards.joinpath(f"shard_{i:0{width}}")
+        path_data = path.joinpath("data", f"shard_{i:0{width}}.json")
+        save_json(JsonShard.generate_uri_config(path_data), uri_file)
+        shards.append(JsonShard(uri=uri_file.as_uri(), path=path_data))
+    uri = path_uri.joinpath("dataset").as_uri()
+    create_vanilla_dataset(
+        shards=create_shard_dict(
+            {SPLIT: create_shard_tuple(shards, uri=path_uri.joinpath(SPLIT, "uri").as_uri())},
+            uri=path_uri.joinpath("shards").as_uri(),
+        ),
+        assets=create_shard_dict({}, uri=path_uri.joinpath("assets").as_uri()),
+        uri=uri,
+    )
+    return uri
+
+
+def measure(
+    func: Callable[..., Any],
+    repeat: int,
+    setup: Callable[[], Sequence[Any]] | None = None,
+) -> list[float]:
+    r"""Measure the execution time of a function.
+
+    The garbage collector is run before each repetition, so the
+    collection of the previous repetition is not measured.
+
+    Args:
+        func: The function to measure.
+        repeat: The number of repetitions.
+        setup: An optional function called before each repetition
+            to create the arguments of ``func``. Its execution time
+            is not measured.
+
+    Returns:
+        The measured times in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        args = () if setup is None else setup()
+        gc.collect()
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def measure_memory(uri: str, num_shards: int) -> OpenMemory:
+    r"""Measure the Python memory used to open a dataset.
+
+    Args:
+        uri: The URI of the dataset.
+        num_shards: The number of shards in the dataset.
+
+    Returns:
+        The memory used by the opened dataset.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        dataset = load_from_uri(uri)
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del dataset
+    return OpenMemory(num_shards=num_shards, nbytes=after - before, peak=peak - before)
+
+
+def benchmark_dataset(uri: str, num_shards: int, repeat: int) -> list[BenchmarkResult]:
+    r"""Benchmark the opening of a dataset and the operations on its
+    shards.
+
+    Args:
+        uri: The URI of the dataset.
+        num_shards: The number of shards in the dataset.
+        repeat: The number of repetitions.
+
+    Returns:
+        The benchmark results, one per operation.
+    """
+    shards = shard.load_from_uri(load_json(sanitize_path(uri))[SHARDS])
+    split = shards.get_shard(SPLIT)
+    split_uri = split.get_uri()
+    cases = {
+        "open": lambda: load_from_uri(uri),
+        "shard_tuple_from_uri": lambda: ShardTuple.from_uri(split_uri),
+        "check_shards": lambda: check_shards(shards),
+        "is_sorted_by_uri": split.is_sorted_by_uri,
+        "get_list_uris": lambda: get_list_uris(split),
+    }
+    results = [
+        BenchmarkResult(operation, "dataset", num_shards, "warm", measure(func, repeat))
+        for operation, func in cases.items()
+    ]
+    # The fingerprints of the shards are cached after the first
+    # comparison, so each repetition compares freshly loaded datasets.
+    times = measure(
+        lambda dataset, other: dataset.equal(other),
+        repeat,
+        setup=lambda: (load_from_uri(uri), load_from_uri(uri)),
+    )
+    results.append(BenchmarkResult("equal", "dataset", num_shards, "warm", times))
+    return results
+
+
+def format_results(results: Sequence[BenchmarkResult], memory: Sequence[OpenMemory]) -> str:
+    r"""Format the results as a table.
+
+    Args:
+        results: The timing results.
+        memory: The memory results.
+
+    Returns:
+        The table, with one line per number of shards and one column
+            per operation.
+    """
+    operations = list(dict.fromkeys(result.operation for result in results))
+    medians = {(result.operation, result.size): result.median for result in results}
+    width = max(len(operation) for operation in [*operations, "bytes/shard"])
+    lines = [f"{'num_shards':>10}  " + "  ".join(f"{name:>{width}}" for name in operations)]
+    lines[0] += f"  {'bytes/shard':>{width}}"
+    for mem in memory:
+        cells = [
+            f"{medians[operation, mem.num_shards] * 1e3:>{width - 3}.2f} ms"
+            for operation in operations
+        ]
+        cells.append(f"{mem.nbytes_per_shard:>{width},.0f}")
+        lines.append(f"{mem.num_shards:>10,}  " + "  ".join(cells))
+    return "\n".join(lines)
+
+
+def plot_results(
+    results: Sequence[BenchmarkResult], memory: Sequence[OpenMemory], path: Path
+) -> None:
+    r"""Plot the scaling curves of the time and memory.
+
+    Args:
+        results: The timing results.
+        memory: The memory results.
+        path: The path to the figure.
+    """
+    if importlib.util.find_spec("matplotlib") is None:
+        logger.warning("matplotlib is not installed, so the scaling curves are not plotted")
+        return
+    # local import because matplotlib is an optional dependency
+    import matplotlib as mpl  # noqa: PLC0415
+
+    mpl.use("Agg")
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
+    fig, (ax_time, ax_memory) = plt.subplots(1, 2, figsize=(12, 5))
+    for operation in dict.fromkeys(result.operation for result in results):
+        points = sorted((r.size, r.median) for r in results if r.operation == operation)
+        ax_time.plot(*zip(*points), marker="o", label=operation)
+    ax_time.set(xscale="log", yscale="log", xlabel="number of shards", ylabel="time (s)")
+    ax_time.legend()
+    ax_time.grid(visible=True, which="both", alpha=0.3)
+
+    points = sorted((mem.num_shards, mem.nbytes_per_shard) for mem in memory)
+    ax_memory.plot(*zip(*points), marker="o")
+    ax_memory.set(xscale="log", xlabel="number of shards", ylabel="Python memory per shard (B)")
+    ax_memory.grid(visible=True, which="both", alpha=0.3)
+
+    fig.tight_layout()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path)
+    plt.close(fig)
+    logger.info(f"scaling curves saved in {path}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    r"""Parse the command line arguments.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", type=Path, default=Path("benchmark-dataset-open.json"))
+    parser.add_argument("--memory-output", type=Path, default=None)
+    parser.add_argument("--plot", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--num-shards", type=int, nargs="+", default=list(DEFAULT_NUM_SHARDS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tmpdir", type=Path, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    r"""Implement the main function.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The exit code: ``1`` if a regression was found, otherwise
+            ``0``.
+    """
+    args = parse_args(argv)
+    results = []
+    memory = []
+    for num_shards in args.num_shards:
+        with tempfile.TemporaryDirectory(dir=args.tmpdir) as tmpdir:
+            logger.info(f"generating a dataset with {num_shards:,} shards")
+            # the generation logs one line per URI file
+            logging.disable(logging.INFO)
+            try:
+                uri = generate_dataset(Path(tmpdir), num_shards)
+            finally:
+                logging.disable(logging.NOTSET)
+            logger.info(f"benchmarking a dataset with {num_shards:,} shards")
+            results.extend(benchmark_dataset(uri, num_shards, args.repeat))
+            memory.append(measure_memory(uri, num_shards))
+
+    logger.info(f"results:\n{format_results(results, memory)}")
+    save_results(results, args.output)
+    logger.info(f"results saved in {args.output}")
+    if args.memory_output is not None:
+        save_json(
+            [asdict(mem) | {"nbytes_per_shard": mem.nbytes_per_shard} for mem in memory],
+            args.memory_output,
+            exist_ok=True,
+        )
+    if args.plot is not None:
+        plot_results(results, memory, args.plot)
+
+    if args.baseline is None:
+        return 0
+    comparisons = compare_results(results, load_results(args.baseline), args.threshold)
+    logger.info(f"comparison with {args.baseline}:\n{format_comparisons(comparisons)}")
+    regressions = [comparison for comparison in comparisons if comparison.is_regression]
+    if regressions:
+        logger.error(f"found {len(regressions):,} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,422 @@
+r"""Benchmark the loaders, savers and shards of every data format for
+several payload sizes, with a warm and a cold page cache.
+
+The results are written in a JSON file and can be compared against a
+stored baseline, for example:
+
+    python -m benchmark.formats --output results.json --baseline baseline.json
+
+The process exits with a non-zero code if a case is slower than the
+baseline by more than the threshold. The timings depend on the
+machine, so the baseline should be generated on the machine that runs
+the comparison, for example before a change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from coola.utils.imports import is_torch_available
+from coola.utils.path import sanitize_path
+
+from benchmark.results import (
+    BenchmarkResult,
+    compare_results,
+    format_comparisons,
+    load_results,
+    save_results,
+)
+from iden import io, shard
+from iden.utils.imports import (
+    is_cloudpickle_available,
+    is_joblib_available,
+    is_safetensors_available,
+    is_yaml_available,
+)
+from iden.utils.time import sync_perf_counter
+
+if is_torch_available():
+    import torch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+KB = 1024
+MB = 1024 * KB
+DEFAULT_SIZES = (KB, MB, 16 * MB)
+
+
+@dataclass
+class FormatCase:
+    r"""Define how to benchmark a data format.
+
+    Args:
+        fmt: The format name.
+        loader: The loader used to read the file.
+        saver: The saver used to write the file.
+        create_shard: The function used to create a shard from data,
+            or ``None`` if the format does not have a shard type.
+        payload: The function that generates a payload of a given size
+            in bytes.
+        extension: The file extension.
+        max_size: The maximum payload size in bytes. The slow text
+            formats are not benchmarked with large payloads.
+    """
+
+    fmt: str
+    loader: io.BaseLoader
+    saver: io.BaseSaver
+    create_shard: Callable[..., shard.BaseShard] | None
+    payload: Callable[[int], Any]
+    extension: str
+    max_size: int = sys.maxsize
+
+
+def numpy_payload(size: int) -> dict[str, np.ndarray]:
+    r"""Generate a dictionary of float32 arrays with the given size.
+
+    Args:
+        size: The payload size in bytes.
+
+    Returns:
+        The payload.
+    """
+    rows = max(size // (4 * 64 * 2), 1)
+    rng = np.random.default_rng(42)
+    return {
+        "key1": rng.random((rows, 64), dtype=np.float32),
+        "key2": rng.random((rows, 64), dtype=np.float32),
+    }
+
+
+def torch_payload(size: int) -> dict[str, Any]:
+    r"""Generate a dictionary of float32 tensors with the given size.
+
+    Args:
+        size: The payload size in bytes.
+
+    Returns:
+        The payload.
+    """
+    return {key: torch.from_numpy(value) for key, value in numpy_payload(size).items()}
+
+
+def list_payload(size: int) -> list[float]:
+    r"""Generate a list of floats whose text representation has roughly
+    the given size.
+
+    Args:
+        size: The payload size in bytes.
+
+    Returns:
+        The payload.
+    """
+    rng = np.random.default_rng(42)
+    return rng.random(max(size // 20, 1)).tolist()
+
+
+def text_payload(size: int) -> str:
+    r"""Generate a string with the given size.
+
+    Args:
+        size: The payload size in bytes.
+
+    Returns:
+        The payload.
+    """
+    return "abcdefghijklmnopqrstuvwxyz\n" * max(size // 27, 1)
+
+
+def get_format_cases() -> list[FormatCase]:
+    r"""Get the benchmark cases of the formats whose dependencies are
+    installed.
+
+    Returns:
+        The benchmark cases.
+    """
+    cases = [
+        FormatCase(
+            fmt="json",
+            loader=io.JsonLoader(),
+            saver=io.JsonSaver(),
+            create_shard=shard.create_json_shard,
+            payload=list_payload,
+            extension=".json",
+            max_size=16 * MB,
+        ),
+        FormatCase(
+            fmt="pickle",
+            loader=io.PickleLoader(),
+            saver=io.PickleSaver(),
+            create_shard=shard.create_pickle_shard,
+            payload=numpy_payload,
+            extension=".pkl",
+        ),
+        FormatCase(
+            fmt="text",
+            loader=io.TextLoader(),
+            saver=io.TextSaver(),
+            create_shard=None,
+            payload=text_payload,
+            extension=".txt",
+        ),
+    ]
+    if is_yaml_available():
+        cases.append(
+            FormatCase(
+                fmt="yaml",
+                loader=io.YamlLoader(),
+                saver=io.YamlSaver(),
+                create_shard=shard.create_yaml_shard,
+                payload=list_payload,
+                extension=".yaml",
+                max_size=MB,
+            )
+        )
+    if is_cloudpickle_available():
+        cases.append(
+            FormatCase(
+                fmt="cloudpickle",
+                loader=io.CloudpickleLoader(),
+                saver=io.CloudpickleSaver(),
+                create_shard=shard.create_cloudpickle_shard,
+                payload=numpy_payload,
+                extension=".pkl",
+            )
+        )
+    if is_joblib_available():
+        cases.append(
+            FormatCase(
+                fmt="joblib",
+                loader=io.JoblibLoader(),
+                saver=io.JoblibSaver(),
+                create_shard=shard.create_joblib_shard,
+                payload=numpy_payload,
+                extension=".joblib",
+            )
+        )
+    if is_torch_available():
+        cases.append(
+            FormatCase(
+                fmt="torch",
+                loader=io.TorchLoader(),
+                saver=io.TorchSaver(),
+                create_shard=shard.create_torch_shard,
+                payload=torch_payload,
+                extension=".pt",
+            )
+        )
+    if is_safetensors_available():
+        # local import because safetensors is an optional dependency
+        from iden.io.safetensors import NumpyLoader, NumpySaver  # noqa: PLC0415
+
+        cases.append(
+            FormatCase(
+                fmt="safetensors-numpy",
+                loader=NumpyLoader(),
+                saver=NumpySaver(),
+                create_shard=shard.create_numpy_safetensors_shard,
+                payload=numpy_payload,
+                extension=".safetensors",
+            )
+        )
+        if is_torch_available():
+            from iden.io.safetensors import TorchLoader, TorchSaver  # noqa: PLC0415
+
+            cases.append(
+                FormatCase(
+                    fmt="safetensors-torch",
+                    loader=TorchLoader(),
+                    saver=TorchSaver(),
+                    create_shard=shard.create_torch_safetensors_shard,
+                    payload=torch_payload,
+                    extension=".safetensors",
+                )
+            )
+    return cases
+
+
+def drop_page_cache(path: Path) -> bool:
+    r"""Evict a file from the page cache.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        ``True`` if the file was evicted, ``False`` if the platform
+            does not support it.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def measure(fn: Callable[[], Any], repeat: int, paths: Sequence[Path], cache: str) -> list[float]:
+    r"""Measure the execution time of a function.
+
+    Args:
+        fn: The function to measure.
+        repeat: The number of repetitions.
+        paths: The paths to the files read by the function.
+        cache: The page cache state: ``'warm'`` or ``'cold'``.
+
+    Returns:
+        The measured times in seconds.
+    """
+    if cache == "warm":
+        fn()
+    times = []
+    for _ in range(repeat):
+        if cache == "cold":
+            for path in paths:
+                drop_page_cache(path)
+        start = sync_perf_counter()
+        fn()
+        times.append(sync_perf_counter() - start)
+    return times
+
+
+def load_shard_data(uri: str) -> Any:
+    r"""Load a shard from its URI and get its data.
+
+    Args:
+        uri: The shard URI.
+
+    Returns:
+        The data in the shard.
+    """
+    return shard.load_from_uri(uri).get_data()
+
+
+def benchmark_case(
+    case: FormatCase, size: int, caches: tuple[str, ...], repeat: int, tmpdir: Path
+) -> list[BenchmarkResult]:
+    r"""Benchmark a format for a payload size.
+
+    Args:
+        case: The format to benchmark.
+        size: The payload size in bytes.
+        caches: The page cache states to benchmark.
+        repeat: The number of repetitions.
+        tmpdir: The directory where the files are written.
+
+    Returns:
+        The benchmark results.
+    """
+    data = case.payload(size)
+    path = tmpdir.joinpath(f"{case.fmt}-{size}{case.extension}")
+    results = []
+
+    times = []
+    for _ in range(repeat):
+        path.unlink(missing_ok=True)
+        start = sync_perf_counter()
+        case.saver.save(data, path)
+        times.append(sync_perf_counter() - start)
+    nbytes = path.stat().st_size
+    results.append(BenchmarkResult("save", case.fmt, size, "warm", times, nbytes))
+
+    for cache in caches:
+        times = measure(partial(case.loader.load, path), repeat, paths=[path], cache=cache)
+        results.append(BenchmarkResult("load", case.fmt, size, cache, times, nbytes))
+
+    if case.create_shard is not None:
+        uri = tmpdir.joinpath(f"uri-{case.fmt}-{size}").as_uri()
+        shard_path = tmpdir.joinpath(f"shard-{case.fmt}-{size}{case.extension}")
+        case.create_shard(data, uri=uri, path=shard_path)
+        # the cold loads also read the URI file of the shard
+        paths = [shard_path, sanitize_path(uri)]
+        for cache in caches:
+            times = measure(partial(load_shard_data, uri), repeat, paths=paths, cache=cache)
+            results.append(BenchmarkResult("shard", case.fmt, size, cache, times, nbytes))
+    path.unlink(missing_ok=True)
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    r"""Parse the command line arguments.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", type=Path, default=Path("benchmark-formats.json"))
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--formats", type=str, nargs="+", default=None)
+    parser.add_argument("--cache", choices=("warm", "cold", "both"), default="both")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tmpdir", type=Path, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    r"""Implement the main function.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The exit code: ``1`` if a regression was found, otherwise
+            ``0``.
+    """
+    args = parse_args(argv)
+    caches = ("warm", "cold") if args.cache == "both" else (args.cache,)
+    if "cold" in caches and not hasattr(os, "posix_fadvise"):
+        logger.warning("the cold page cache is not supported on this platform")
+        caches = tuple(cache for cache in caches if cache != "cold")
+    cases = [
+        case for case in get_format_cases() if args.formats is None or case.fmt in args.formats
+    ]
+
+    results = []
+    with tempfile.TemporaryDirectory(dir=args.tmpdir) as tmpdir:
+        for case in cases:
+            for size in args.sizes:
+                if size > case.max_size:
+                    continue
+                logger.info(f"benchmarking {case.fmt} with {size:,} bytes")
+                results.extend(benchmark_case(case, size, caches, args.repeat, Path(tmpdir)))
+
+    for result in results:
+        logger.info(
+            f"{result.name}: {result.median * 1e3:.3f} ms ({result.throughput / MB:,.1f} MB/s)"
+        )
+    save_results(results, args.output)
+    logger.info(f"results saved in {args.output}")
+
+    if args.baseline is None:
+        return 0
+    comparisons = compare_results(results, load_results(args.baseline), args.threshold)
+    logger.info(f"comparison with {args.baseline}:\n{format_comparisons(comparisons)}")
+    regressions = [comparison for comparison in comparisons if comparison.is_regression]
+    if regressions:
+        logger.error(f"found {len(regressions):,} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,144 @@
+r"""Benchmark the time to import the iden packages in a fresh Python
+process.
+
+Each package is imported several times in a new subprocess, so the
+measured time includes all the imported dependencies. The results
+are written in a JSON file and can be compared against a stored
+baseline, for example:
+
+    python -m benchmark.import_time --output results.json --baseline baseline.json
+
+The process exits with a non-zero code if an import is slower than
+the baseline by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmark.results import (
+    BenchmarkResult,
+    compare_results,
+    format_comparisons,
+    load_results,
+    save_results,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODULES = (
+    "iden",
+    "iden.io",
+    "iden.shard",
+    "iden.shard.loader",
+    "iden.shard.generator",
+    "iden.dataset",
+)
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+print(json.dumps({{"time": duration, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import(module: str) -> tuple[float, list[str]]:
+    r"""Measure the time to import a module in a fresh Python process.
+
+    Args:
+        module: The module to import.
+
+    Returns:
+        The import time in seconds and the names of the modules that
+            are loaded after the import.
+    """
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _SCRIPT.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["time"], result["modules"]
+
+
+def benchmark_module(module: str, repeat: int) -> tuple[BenchmarkResult, list[str]]:
+    r"""Benchmark the import of a module.
+
+    Args:
+        module: The module to import.
+        repeat: The number of repetitions.
+
+    Returns:
+        The benchmark result and the names of the loaded modules.
+    """
+    times = []
+    modules = []
+    for _ in range(repeat):
+        duration, modules = measure_import(module)
+        times.append(duration)
+    return BenchmarkResult("import", module, 0, "cold", times), modules
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    r"""Parse the command line arguments.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", type=Path, default=Path("benchmark-import-time.json"))
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--modules", type=str, nargs="+", default=list(DEFAULT_MODULES))
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    r"""Implement the main function.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The exit code: ``1`` if a regression was found, otherwise
+            ``0``.
+    """
+    args = parse_args(argv)
+    results = []
+    for module in args.modules:
+        result, modules = benchmark_module(module, args.repeat)
+        iden_modules = [name for name in modules if name.split(".")[0] == "iden"]
+        logger.info(
+            f"{module}: {result.median * 1e3:.1f} ms, {len(modules):,} modules loaded "
+            f"({len(iden_modules):,} iden modules)"
+        )
+        results.append(result)
+    save_results(results, args.output)
+    logger.info(f"results saved in {args.output}")
+
+    if args.baseline is None:
+        return 0
+    comparisons = compare_results(results, load_results(args.baseline), args.threshold)
+    logger.info(f"comparison with {args.baseline}:\n{format_comparisons(comparisons)}")
+    regressions = [comparison for comparison in comparisons if comparison.is_regression]
+    if regressions:
+        logger.error(f"found {len(regressions):,} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
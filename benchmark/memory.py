@@ -0,0 +1,382 @@
+r"""Benchmark the peak memory used to load shards for several formats
+and loading strategies.
+
+Each case runs in its own subprocess, so the peak resident set size
+(RSS) of a case is not polluted by the other cases. The benchmark
+reports the peak RSS increase, the peak memory traced by
+``tracemalloc`` and the loading time of each case, for example:
+
+    python -m benchmark.memory --sizes 16777216 --output memory.json
+
+``tracemalloc`` only sees the memory allocated by the Python
+allocator, so it misses most of the tensor buffers. The RSS is the
+reference for the memory-constrained workers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from coola.utils.imports import is_torch_available
+
+from benchmark.formats import MB, numpy_payload, torch_payload
+from iden import shard
+from iden.io import save_json
+from iden.utils.imports import is_safetensors_available
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = (16 * MB, 128 * MB)
+DEFAULT_PREFETCH = (1, 2, 4)
+NUM_PREFETCH_SHARDS = 4
+
+
+@dataclass
+class MemoryResult:
+    r"""Define the result of a memory benchmark case.
+
+    Args:
+        fmt: The data format.
+        mode: The loading mode e.g. ``'full'`` or ``'prefetch-2'``.
+        size: The payload size of a shard in bytes.
+        time: The loading time in seconds.
+        peak_rss: The peak resident set size of the process in bytes.
+        peak_rss_delta: The increase of the peak resident set size
+            during the load in bytes.
+        peak_traced: The peak memory traced by ``tracemalloc`` during
+            the load in bytes.
+    """
+
+    fmt: str
+    mode: str
+    size: int
+    time: float
+    peak_rss: int
+    peak_rss_delta: int
+    peak_traced: int
+
+    @property
+    def name(self) -> str:
+        r"""The unique name of the benchmark case."""
+        return f"memory/{self.fmt}/{self.mode}/{self.size}"
+
+
+def get_formats() -> dict[str, tuple[Any, Any]]:
+    r"""Get the formats whose dependencies are installed.
+
+    Returns:
+        The formats. The values are the function that creates a shard
+            and the function that generates a payload.
+    """
+    formats = {"pickle": (shard.create_pickle_shard, numpy_payload)}
+    if is_torch_available():
+        formats["torch"] = (shard.create_torch_shard, torch_payload)
+    if is_safetensors_available():
+        formats["safetensors-numpy"] = (shard.create_numpy_safetensors_shard, numpy_payload)
+        if is_torch_available():
+            formats["safetensors-torch"] = (shard.create_torch_safetensors_shard, torch_payload)
+    return formats
+
+
+def get_modes(fmt: str, prefetch: tuple[int, ...]) -> list[str]:
+    r"""Get the loading modes supported by a format.
+
+    Args:
+        fmt: The data format.
+        prefetch: The prefetch depths to benchmark.
+
+    Returns:
+        The loading modes.
+    """
+    modes = ["full", "projection"]
+    if fmt == "torch":
+        modes.append("mmap")
+    return modes + [f"prefetch-{depth}" for depth in prefetch]
+
+
+def get_rss() -> int:
+    r"""Get the current resident set size of the process.
+
+    Returns:
+        The resident set size in bytes, or the peak resident set size
+            if the platform does not expose the current value.
+    """
+    statm = Path("/proc/self/statm")
+    if statm.is_file():
+        return int(statm.read_text().split()[1]) * resource.getpagesize()
+    return get_peak_rss()
+
+
+def reset_peak_rss() -> bool:
+    r"""Reset the peak resident set size of the process.
+
+    Returns:
+        ``True`` if the peak was reset, ``False`` if the platform does
+            not support it.
+    """
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        return False
+    return True
+
+
+def get_peak_rss() -> int:
+    r"""Get the peak resident set size of the process.
+
+    Returns:
+        The peak resident set size in bytes.
+    """
+    status = Path("/proc/self/status")
+    if status.is_file():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def touch(data: Any) -> float:
+    r"""Read all the values of the loaded data, like a training step
+    would.
+
+    Args:
+        data: The loaded data.
+
+    Returns:
+        The sum of the values.
+    """
+    return float(sum(value.sum() for value in data.values()))
+
+
+def load(fmt: str, mode: str, shards: list[shard.BaseShard]) -> None:
+    r"""Load the shards with a loading mode.
+
+    Args:
+        fmt: The data format.
+        mode: The loading mode.
+        shards: The shards to load.
+    """
+    if mode == "full":
+        touch(shards[0].get_data())
+    elif mode == "mmap":
+        # local import because torch is an optional dependency
+        import torch  # noqa: PLC0415
+
+        touch(torch.load(shards[0].path, mmap=True))
+    elif mode == "projection":
+        touch(load_projection(fmt, shards[0].path, key="key1"))
+    elif mode.startswith("prefetch-"):
+        # local import to only load the module when it is benchmarked
+        from iden.shard.utils import PrefetchShardIterable  # noqa: PLC0415
+
+        num_prefetch = int(mode.split("-")[1])
+        for data in PrefetchShardIterable(shards, num_prefetch=num_prefetch):
+            touch(data)
+    else:
+        msg = f"Incorrect mode: {mode}"
+        raise ValueError(msg)
+
+
+def load_projection(fmt: str, path: Path, key: str) -> dict[str, Any]:
+    r"""Load a single key of a shard, with the cheapest method of the
+    format.
+
+    Args:
+        fmt: The data format.
+        path: The path to the shard file.
+        key: The key to load.
+
+    Returns:
+        The dictionary with the loaded key.
+    """
+    if fmt.startswith("safetensors"):
+        # local import because safetensors is an optional dependency
+        from safetensors import safe_open  # noqa: PLC0415
+
+        framework = "pt" if fmt == "safetensors-torch" else "numpy"
+        with safe_open(path, framework=framework) as file:
+            return {key: file.get_tensor(key)}
+    if fmt == "torch":
+        import torch  # noqa: PLC0415
+
+        return {key: torch.load(path, mmap=True)[key]}
+    # pickle cannot load a part of a file
+    return {key: load_pickle_key(path, key)}
+
+
+def load_pickle_key(path: Path, key: str) -> Any:
+    r"""Load a pickle file and keep a single key.
+
+    Args:
+        path: The path to the pickle file.
+        key: The key to keep.
+
+    Returns:
+        The value of the key.
+    """
+    # local import to only load the module when it is benchmarked
+    from iden.io import load_pickle  # noqa: PLC0415
+
+    return load_pickle(path)[key]
+
+
+def run_worker(spec: dict[str, Any]) -> dict[str, Any]:
+    r"""Run a benchmark case in the current process.
+
+    Args:
+        spec: The case specification with the format, the mode, the
+            size and the shard URIs.
+
+    Returns:
+        The benchmark result as a dictionary.
+    """
+    # the shards are loaded from their URIs first, so the import of the
+    # format modules is not measured
+    shards = [shard.load_from_uri(uri) for uri in spec["uris"]]
+    reset_peak_rss()
+    rss_before = get_rss()
+    start = time.perf_counter()
+    load(spec["fmt"], spec["mode"], shards)
+    duration = time.perf_counter() - start
+    peak_rss = get_peak_rss()
+
+    # tracemalloc slows down the load, so it is measured in a second run
+    tracemalloc.start()
+    load(spec["fmt"], spec["mode"], shards)
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return asdict(
+        MemoryResult(
+            fmt=spec["fmt"],
+            mode=spec["mode"],
+            size=spec["size"],
+            time=duration,
+            peak_rss=peak_rss,
+            peak_rss_delta=max(peak_rss - rss_before, 0),
+            peak_traced=peak_traced,
+        )
+    )
+
+
+def run_case(spec: dict[str, Any]) -> MemoryResult:
+    r"""Run a benchmark case in a subprocess.
+
+    Args:
+        spec: The case specification.
+
+    Returns:
+        The benchmark result.
+    """
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "benchmark.memory", "--worker", json.dumps(spec)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return MemoryResult(**json.loads(output.strip().splitlines()[-1]))
+
+
+def format_results(results: list[MemoryResult]) -> str:
+    r"""Format the results as a table.
+
+    Args:
+        results: The results to format.
+
+    Returns:
+        The table, with one line per result.
+    """
+    width = max((len(result.name) for result in results), default=4)
+    lines = [
+        (
+            f"{'case':<{width}}  {'time (ms)':>10}  {'peak RSS (MB)':>14}  "
+            f"{'RSS delta (MB)':>14}  {'traced (MB)':>12}"
+        )
+    ]
+    lines.extend(
+        f"{result.name:<{width}}  {result.time * 1e3:>10.1f}  {result.peak_rss / MB:>14.1f}  "
+        f"{result.peak_rss_delta / MB:>14.1f}  {result.peak_traced / MB:>12.1f}"
+        for result in results
+    )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    r"""Parse the command line arguments.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", type=Path, default=Path("benchmark-memory.json"))
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--formats", type=str, nargs="+", default=None)
+    parser.add_argument("--prefetch", type=int, nargs="+", default=list(DEFAULT_PREFETCH))
+    parser.add_argument("--tmpdir", type=Path, default=None)
+    parser.add_argument("--worker", type=str, default=None, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    r"""Implement the main function.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The exit code.
+    """
+    args = parse_args(argv)
+    if args.worker is not None:
+        print(json.dumps(run_worker(json.loads(args.worker))))  # noqa: T201
+        return 0
+
+    formats = {
+        fmt: value
+        for fmt, value in get_formats().items()
+        if args.formats is None or fmt in args.formats
+    }
+    results = []
+    with tempfile.TemporaryDirectory(dir=args.tmpdir) as tmpdir:
+        for fmt, (create_shard, payload) in formats.items():
+            for size in args.sizes:
+                data = payload(size)
+                uris = []
+                for i in range(NUM_PREFETCH_SHARDS):
+                    uri = Path(tmpdir).joinpath(f"{fmt}-{size}-{i}").as_uri()
+                    create_shard(data, uri=uri)
+                    uris.append(uri)
+                del data
+                for mode in get_modes(fmt, tuple(args.prefetch)):
+                    logger.info(f"benchmarking {fmt} ({mode}) with {size:,} bytes")
+                    spec = {"fmt": fmt, "mode": mode, "size": size, "uris": uris}
+                    if not mode.startswith("prefetch-"):
+                        spec["uris"] = uris[:1]
+                    results.append(run_case(spec))
+
+    logger.info(f"results:\n{format_results(results)}")
+    save_json(
+        [asdict(result) | {"name": result.name} for result in results], args.output, exist_ok=True
+    )
+    logger.info(f"results saved in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,216 @@
+r"""Contain functions to store benchmark results and compare them
+against a baseline."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BenchmarkResult",
+    "Comparison",
+    "compare_results",
+    "format_comparisons",
+    "load_results",
+    "save_results",
+]
+
+import platform
+import statistics
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
+
+from iden.io import load_json, save_json
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+
+@dataclass
+class BenchmarkResult:
+    r"""Define the result of a benchmark case.
+
+    Args:
+        operation: The benchmarked operation e.g. ``'load'``,
+            ``'save'`` or ``'shard'``.
+        fmt: The data format e.g. ``'json'`` or ``'torch'``.
+        size: The target payload size in bytes.
+        cache: The page cache state: ``'warm'`` or ``'cold'``.
+        times: The measured times in seconds, one per repetition.
+        nbytes: The size of the file in bytes.
+    """
+
+    operation: str
+    fmt: str
+    size: int
+    cache: str
+    times: list[float] = field(default_factory=list)
+    nbytes: int = 0
+
+    @property
+    def name(self) -> str:
+        r"""The unique name of the benchmark case."""
+        return f"{self.operation}/{self.fmt}/{self.size}/{self.cache}"
+
+    @property
+    def median(self) -> float:
+        r"""The median time in seconds."""
+        return statistics.median(self.times)
+
+    @property
+    def throughput(self) -> float:
+        r"""The throughput in bytes per second, based on the median
+        time."""
+        return self.nbytes / self.median if self.median > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        r"""Convert the result to a JSON-compatible dictionary.
+
+        Returns:
+            The dictionary with the result.
+        """
+        return asdict(self) | {
+            "name": self.name,
+            "median": self.median,
+            "min": min(self.times),
+            "throughput": self.throughput,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchmarkResult:
+        r"""Instantiate a result from its dictionary representation.
+
+        Args:
+            data: The dictionary generated by ``to_dict``.
+
+        Returns:
+            The instantiated result.
+        """
+        return cls(
+            operation=data["operation"],
+            fmt=data["fmt"],
+            size=data["size"],
+            cache=data["cache"],
+            times=list(data["times"]),
+            nbytes=data.get("nbytes", 0),
+        )
+
+
+@dataclass
+class Comparison:
+    r"""Define the comparison of a benchmark case with its baseline.
+
+    Args:
+        name: The name of the benchmark case.
+        baseline: The median time of the baseline in seconds.
+        current: The median time of the current run in seconds.
+        threshold: The relative slowdown above which the case is a
+            regression.
+    """
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        r"""The ratio between the current and baseline times."""
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+    @property
+    def is_regression(self) -> bool:
+        r"""``True`` if the case is slower than the baseline by more
+        than the threshold."""
+        return self.ratio > 1.0 + self.threshold
+
+
+def save_results(results: Sequence[BenchmarkResult], path: Path) -> None:
+    r"""Save benchmark results in a JSON file.
+
+    The file also contains information about the environment, so the
+    results of different machines can be told apart.
+
+    Args:
+        results: The results to save.
+        path: The path to the JSON file.
+    """
+    save_json(
+        {
+            "environment": {
+                "date": datetime.now(tz=timezone.utc).isoformat(),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+                "iden": version("iden"),
+            },
+            "results": [result.to_dict() for result in results],
+        },
+        path,
+        exist_ok=True,
+    )
+
+
+def load_results(path: Path) -> dict[str, BenchmarkResult]:
+    r"""Load benchmark results from a JSON file.
+
+    Args:
+        path: The path to the JSON file.
+
+    Returns:
+        The results indexed by name.
+    """
+    results = [BenchmarkResult.from_dict(item) for item in load_json(path)["results"]]
+    return {result.name: result for result in results}
+
+
+def compare_results(
+    results: Sequence[BenchmarkResult],
+    baseline: dict[str, BenchmarkResult],
+    threshold: float = 0.1,
+) -> list[Comparison]:
+    r"""Compare benchmark results against a baseline.
+
+    The cases that are not in the baseline are ignored.
+
+    Args:
+        results: The results of the current run.
+        baseline: The baseline results indexed by name.
+        threshold: The relative slowdown above which a case is a
+            regression e.g. ``0.1`` means 10% slower.
+
+    Returns:
+        The comparisons, one per case in both the results and the
+            baseline.
+    """
+    return [
+        Comparison(
+            name=result.name,
+            baseline=baseline[result.name].median,
+            current=result.median,
+            threshold=threshold,
+        )
+        for result in results
+        if result.name in baseline
+    ]
+
+
+def format_comparisons(comparisons: Sequence[Comparison]) -> str:
+    r"""Format comparisons as a table.
+
+    Args:
+        comparisons: The comparisons to format.
+
+    Returns:
+        The table, with one line per comparison.
+    """
+    width = max((len(comparison.name) for comparison in comparisons), default=4)
+    lines = [f"{'case':<{width}}  {'baseline (ms)':>13}  {'current (ms)':>13}  {'ratio':>7}"]
+    for comparison in comparisons:
+        flag = "  REGRESSION" if comparison.is_regression else ""
+        lines.append(
+            f"{comparison.name:<{width}}  {comparison.baseline * 1e3:>13.3f}  "
+            f"{comparison.current * 1e3:>13.3f}  {comparison.ratio:>6.2f}x{flag}"
+        )
+    return "\n".join(lines)
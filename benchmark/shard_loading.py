@@ -12,6 +12,7 @@ from coola.utils import str_mapping
 from iden.data.generator import DataGenerator
 from iden.dataset import BaseDataset, load_from_uri
 from iden.dataset.generator import VanillaDatasetGenerator
+from iden.shard.benchmark import benchmark_loading
 from iden.shard.generator import (
     BaseShardGenerator,
     PickleShardGenerator,
@@ -20,9 +21,7 @@ from iden.shard.generator import (
     TorchSafetensorsShardGenerator,
     TorchShardGenerator,
 )
-from iden.shard.utils import ShardIterable
 from iden.utils.format import human_time
-from iden.utils.time import sync_perf_counter
 
 logger = logging.getLogger(__name__)
 
@@ -48,25 +47,31 @@ class DatasetConfig:
     splits: tuple[str, ...] = ("train", "val", "test")
 
 
-def benchmark_data_loading(dataset: BaseDataset) -> float:
+def benchmark_data_loading(
+    dataset: BaseDataset, num_prefetch: int = 0, num_workers: int = 1
+) -> float:
     r"""Benchmark the time to load the data from the dataset.
 
     Args:
         dataset: The dataset to benchmark.
+        num_prefetch: The number of shards loaded ahead by each worker.
+        num_workers: The number of workers that load the shards.
 
     Returns:
         The data loading time in second.
     """
-    start_time = sync_perf_counter()
-    total = 0
-    for split in dataset.get_splits():
-        shards = dataset.get_shards(split)
-        for data in ShardIterable(shards):
-            total += data["key1"].shape[0]
-    end_time = sync_perf_counter()
-    logger.info(f"total: {total:,}")
-    logger.info(f"total time: {human_time(sync_perf_counter() - start_time)}")
-    return end_time - start_time
+    duration = 0.0
+    for split in sorted(dataset.get_splits()):
+        stats = benchmark_loading(
+            dataset.get_shards(split), num_prefetch=num_prefetch, num_workers=num_workers
+        )
+        logger.info(
+            f"{split}: {stats.num_shards:,} shards in {human_time(stats.duration)} "
+            f"({stats.shards_per_second:,.1f} shards/s)"
+        )
+        duration += stats.duration
+    logger.info(f"total time: {human_time(duration)}")
+    return duration
 
 
 def generate_dataset(config: DatasetConfig) -> None:
@@ -0,0 +1,27 @@
+r"""Contain the data caches that store the data of the shards outside
+of the shard objects, and the cache policies that decide how long a
+shard keeps its cached data."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BaseCachePolicy",
+    "BaseDataCache",
+    "FileChangeCachePolicy",
+    "PinnedCachePolicy",
+    "SharedMemoryCache",
+    "TTLCachePolicy",
+    "TranscodingCache",
+    "WeakRefCachePolicy",
+]
+
+from iden.cache.base import BaseDataCache
+from iden.cache.policy import (
+    BaseCachePolicy,
+    FileChangeCachePolicy,
+    PinnedCachePolicy,
+    TTLCachePolicy,
+    WeakRefCachePolicy,
+)
+from iden.cache.shared_memory import SharedMemoryCache
+from iden.cache.transcoding import TranscodingCache
@@ -0,0 +1,115 @@
+r"""Contain the base class to implement a data cache."""
+
+from __future__ import annotations
+
+__all__ = ["BaseDataCache"]
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+
+class BaseDataCache(ABC):
+    r"""Define the base class to implement a data cache.
+
+    A data cache stores the data of the shards outside of the shard
+    objects, so the cached data can be shared between shards,
+    processes or runs. The key of the data of a file shard is the path
+    of the data file. A file shard uses its data cache when the data
+    are loaded with ``get_data(cache=True)``, or for all the loads if
+    the data cache is persistent i.e. it does not keep the data in
+    memory.
+
+    Example:
+        ```pycon
+        >>> from iden.cache import SharedMemoryCache
+        >>> cache = SharedMemoryCache()
+        >>> cache.get_or_load("key", lambda: {"value": 42})
+        {'value': 42}
+        >>> cache.clear()
+
+        ```
+    """
+
+    persistent: bool = False
+
+    @abstractmethod
+    def clear(self) -> None:
+        r"""Remove all the entries of the cache.
+
+        Example:
+            ```pycon
+            >>> from iden.cache import SharedMemoryCache
+            >>> cache = SharedMemoryCache()
+            >>> cache.get_or_load("key", lambda: [1, 2, 3])
+            [1, 2, 3]
+            >>> cache.clear()
+            >>> "key" in cache
+            False
+
+            ```
+        """
+
+    @abstractmethod
+    def get_or_load(self, key: str, load: Callable[[], T]) -> T:
+        r"""Get the data associated to a key, and load and cache them
+        if they are not in the cache.
+
+        Args:
+            key: The key of the data e.g. the path of the data file.
+            load: The function called without argument to load the
+                data if they are not in the cache.
+
+        Returns:
+            The data.
+
+        Example:
+            ```pycon
+            >>> from iden.cache import SharedMemoryCache
+            >>> cache = SharedMemoryCache()
+            >>> cache.get_or_load("key", lambda: [1, 2, 3])
+            [1, 2, 3]
+            >>> cache.get_or_load("key", lambda: [4, 5])
+            [1, 2, 3]
+            >>> cache.clear()
+
+            ```
+        """
+
+    @abstractmethod
+    def remove(self, key: str) -> None:
+        r"""Remove the entry associated to a key.
+
+        Removing a key that is not in the cache has no effect.
+
+        Args:
+            key: The key to remove.
+
+        Example:
+            ```pycon
+            >>> from iden.cache import SharedMemoryCache
+            >>> cache = SharedMemoryCache()
+            >>> cache.get_or_load("key", lambda: [1, 2, 3])
+            [1, 2, 3]
+            >>> cache.remove("key")
+            >>> cache.get_or_load("key", lambda: [4, 5])
+            [4, 5]
+            >>> cache.clear()
+
+            ```
+        """
+
+    @abstractmethod
+    def __contains__(self, key: str) -> bool:
+        r"""Indicate if a key is in the cache.
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            ``True`` if the key is in the cache, otherwise ``False``.
+        """
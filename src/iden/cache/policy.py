@@ -0,0 +1,286 @@
+r"""Contain the cache policies that decide how long a file shard keeps
+its cached data."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BaseCachePolicy",
+    "FileChangeCachePolicy",
+    "PinnedCachePolicy",
+    "TTLCachePolicy",
+    "WeakRefCachePolicy",
+]
+
+import time
+import weakref
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from iden.storage import get_storage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+T = TypeVar("T")
+
+
+class BaseCachePolicy(ABC):
+    r"""Define the base class to implement a cache policy.
+
+    A cache policy decides how long a file shard keeps the data loaded
+    with ``get_data(cache=True)``. When the data are loaded, the
+    policy creates a cache entry that is stored by the shard, and the
+    policy checks the entry each time the shard is accessed. An
+    invalid entry is removed and the data are loaded again. A policy
+    does not store state for the shards, so the same policy can be
+    used by all the shards of a dataset.
+
+    Example:
+        ```pycon
+        >>> from iden.cache import TTLCachePolicy
+        >>> policy = TTLCachePolicy(ttl=60.0)
+        >>> data, entry = policy.load("data.json", lambda: [1, 2, 3])
+        >>> data
+        [1, 2, 3]
+        >>> policy.lookup(entry, "data.json")
+        (True, [1, 2, 3])
+
+        ```
+    """
+
+    @abstractmethod
+    def load(self, path: Path | str, load: Callable[[], T]) -> tuple[T, Any]:
+        r"""Load the data and create their cache entry.
+
+        Args:
+            path: The path to the data file of the shard.
+            load: The function called without argument to load the
+                data.
+
+        Returns:
+            A tuple with the data and the cache entry.
+
+        Example:
+            ```pycon
+            >>> from iden.cache import PinnedCachePolicy
+            >>> policy = PinnedCachePolicy()
+            >>> policy.load("data.json", lambda: [1, 2, 3])
+            ([1, 2, 3], [1, 2, 3])
+
+            ```
+        """
+
+    @abstractmethod
+    def lookup(self, entry: Any, path: Path | str) -> tuple[bool, Any]:
+        r"""Get the data of a cache entry if the entry is valid.
+
+        Args:
+            entry: The cache entry created by ``load``.
+            path: The path to the data file of the shard.
+
+        Returns:
+            A tuple with a boolean that indicates if the entry is
+                valid, and the data or ``None`` if the entry is not
+                valid.
+
+        Example:
+            ```pycon
+            >>> from iden.cache import PinnedCachePolicy
+            >>> policy = PinnedCachePolicy()
+            >>> data, entry = policy.load("data.json", lambda: [1, 2, 3])
+            >>> policy.lookup(entry, "data.json")
+            (True, [1, 2, 3])
+
+            ```
+        """
+
+
+class PinnedCachePolicy(BaseCachePolicy):
+    r"""Implement a cache policy that keeps the data until the cache of
+    the shard is cleared.
+
+    This is the default cache policy of the file shards.
+
+    Example:
+        ```pycon
+        >>> from iden.cache import PinnedCachePolicy
+        >>> policy = PinnedCachePolicy()
+        >>> data, entry = policy.load("data.json", lambda: [1, 2, 3])
+        >>> policy.lookup(entry, "data.json")
+        (True, [1, 2, 3])
+
+        ```
+    """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}()"
+
+    def load(self, path: Path | str, load: Callable[[], T]) -> tuple[T, Any]:  # noqa: ARG002
+        data = load()
+        return data, data
+
+    def lookup(self, entry: Any, path: Path | str) -> tuple[bool, Any]:  # noqa: ARG002
+        return True, entry
+
+
+class WeakRefCachePolicy(BaseCachePolicy):
+    r"""Implement a cache policy that keeps the data only while they are
+    referenced outside of the shard.
+
+    The shard keeps a weak reference to the data, so the data are
+    released as soon as the callers do not use them anymore. This
+    policy only works for the data that support weak references e.g.
+    the numpy arrays, the torch tensors and most of the user-defined
+    objects. The data that do not support weak references e.g.
+    ``list``, ``dict`` or ``str`` are rejected, so use another policy
+    for the shards that store these data.
+
+    Raises:
+        TypeError: if the loaded data do not support weak references.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.cache import WeakRefCachePolicy
+        >>> policy = WeakRefCachePolicy()
+        >>> data, entry = policy.load("data.npy", lambda: np.arange(3))
+        >>> policy.lookup(entry, "data.npy")[0]
+        True
+        >>> del data
+        >>> policy.lookup(entry, "data.npy")
+        (False, None)
+
+        ```
+    """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}()"
+
+    def load(self, path: Path | str, load: Callable[[], T]) -> tuple[T, Any]:
+        data = load()
+        try:
+            return data, weakref.ref(data)
+        except TypeError as exc:
+            msg = (
+                f"the data of type {type(data).__module__}.{type(data).__qualname__} in "
+                f"'{path}' do not support weak references, so they cannot be cached by "
+                f"{self.__class__.__qualname__}"
+            )
+            raise TypeError(msg) from exc
+
+    def lookup(self, entry: Any, path: Path | str) -> tuple[bool, Any]:  # noqa: ARG002
+        data = entry()
+        return data is not None, data
+
+
+class TTLCachePolicy(BaseCachePolicy):
+    r"""Implement a cache policy that keeps the data for a fixed
+    duration after they are loaded.
+
+    The expired data are released the next time the shard is accessed
+    or when its cache is cleared.
+
+    Args:
+        ttl: The time to live of the cached data, in seconds.
+
+    Raises:
+        ValueError: if ``ttl`` is not positive.
+
+    Example:
+        ```pycon
+        >>> from iden.cache import TTLCachePolicy
+        >>> policy = TTLCachePolicy(ttl=60.0)
+        >>> policy
+        TTLCachePolicy(ttl=60.0)
+        >>> data, entry = policy.load("data.json", lambda: [1, 2, 3])
+        >>> policy.lookup(entry, "data.json")
+        (True, [1, 2, 3])
+
+        ```
+    """
+
+    def __init__(self, ttl: float) -> None:
+        if ttl <= 0:
+            msg = f"ttl must be positive but received {ttl}"
+            raise ValueError(msg)
+        self._ttl = ttl
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(ttl={self._ttl})"
+
+    def load(self, path: Path | str, load: Callable[[], T]) -> tuple[T, Any]:  # noqa: ARG002
+        data = load()
+        return data, (data, time.monotonic() + self._ttl)
+
+    def lookup(self, entry: Any, path: Path | str) -> tuple[bool, Any]:  # noqa: ARG002
+        data, expiration = entry
+        if time.monotonic() < expiration:
+            return True, data
+        return False, None
+
+
+class FileChangeCachePolicy(BaseCachePolicy):
+    r"""Implement a cache policy that keeps the data until the data file
+    changes.
+
+    The size and the modification time of the data file are recorded
+    before the data are loaded, and they are checked each time the
+    shard is accessed, so the data are loaded again after the file is
+    rewritten. Checking the file requires a ``stat`` call to the
+    storage backend of the file. If a data cache is set on the shard,
+    the data cache must also be invalidated because it uses the path
+    of the file as key.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.cache import FileChangeCachePolicy
+        >>> from iden.io import load_json, save_json
+        >>> policy = FileChangeCachePolicy()
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("data.json")
+        ...     save_json([1, 2, 3], path)
+        ...     data, entry = policy.load(path, lambda: load_json(path))
+        ...     policy.lookup(entry, path)
+        ...     save_json([1, 2, 3, 4], path, exist_ok=True)
+        ...     policy.lookup(entry, path)
+        ...
+        (True, [1, 2, 3])
+        (False, None)
+
+        ```
+    """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}()"
+
+    def load(self, path: Path | str, load: Callable[[], T]) -> tuple[T, Any]:
+        # The state is recorded before loading, so a change during the
+        # load invalidates the entry.
+        state = self._get_file_state(path)
+        data = load()
+        return data, (data, state)
+
+    def lookup(self, entry: Any, path: Path | str) -> tuple[bool, Any]:
+        data, state = entry
+        if state == self._get_file_state(path):
+            return True, data
+        return False, None
+
+    def _get_file_state(self, path: Path | str) -> tuple[int, int] | None:
+        r"""Get the state of a file.
+
+        Args:
+            path: The path to the file.
+
+        Returns:
+            The size and the modification time in nanoseconds of the
+                file, or ``None`` if the file does not exist.
+        """
+        try:
+            stat = get_storage(path).stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.size, stat.mtime_ns
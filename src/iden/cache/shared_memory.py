@@ -0,0 +1,436 @@
+r"""Contain a data cache backed by shared memory segments, so the
+cached data are shared by all the processes of a machine."""
+
+from __future__ import annotations
+
+__all__ = ["SharedMemoryCache"]
+
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import struct
+import sys
+import threading
+import time
+import uuid
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from iden.cache.base import BaseDataCache
+from iden.cache.utils import pack_data, unpack_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The state segment of a key contains the state of the entry, the ID of
+# the process that loads the data, and the size of its data segment. A
+# new segment is filled with zeros, so a new entry is in the loading
+# state and its process is unknown until the process ID is written.
+_STATE = struct.Struct("<B3xIQ")
+_LOADING, _READY, _FAILED = 0, 1, 2
+
+
+class SharedMemoryCache(BaseDataCache):
+    r"""Implement a data cache backed by shared memory segments.
+
+    The cache can be used by several processes, for example the
+    workers of a ``torch.utils.data.DataLoader``: the first process
+    that asks for a key loads the data and writes them in a shared
+    memory segment, and the other processes wait for the load and
+    read the data from the segment. The contiguous numpy arrays and
+    CPU tensors are not copied: they are views of the shared
+    segment, so they are stored once per machine and an in-place
+    change is seen by all the processes. The other objects are
+    pickled in the segment and unpickled in each process.
+
+    The segment names are derived from the cache name and the key, so
+    the processes do not need a server or a lock to coordinate: the
+    creation of a segment is atomic, and the process that creates the
+    segment of a key loads the data. If this process ends before the
+    data are written, the waiting processes release the entry and one
+    of them loads the data. The cache can be pickled, and the
+    unpickled cache uses the same segments.
+
+    The segments are not released when a process ends, because other
+    processes may still use them. ``remove`` releases the segments of
+    a key and ``clear`` releases the segments of the keys used by the
+    current process. The remaining segments are released by the
+    ``multiprocessing`` resource tracker when the program ends.
+
+    Args:
+        name: The cache name, which is the prefix of the segment
+            names. It should be short because some platforms limit
+            the length of the segment names. A random name is
+            generated if ``None``.
+        timeout: The maximum time in seconds to wait for the load of
+            another process. The data are loaded in the current
+            process, without being cached, if the load takes longer.
+            There is no limit if ``None``.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.cache import SharedMemoryCache
+        >>> cache = SharedMemoryCache()
+        >>> data = cache.get_or_load("key", lambda: {"array": np.arange(5)})
+        >>> data
+        {'array': array([0, 1, 2, 3, 4])}
+        >>> "key" in cache
+        True
+        >>> cache.clear()
+
+        ```
+    """
+
+    def __init__(self, name: str | None = None, timeout: float | None = 600.0) -> None:
+        self._name = name or uuid.uuid4().hex[:8]
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._data: dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(name={self._name!r}, num_local={len(self._data):,})"
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._data:
+            return True
+        segment = _attach(self._get_segment_name(key, "s"))
+        if segment is None:
+            return False
+        try:
+            state, _, _ = _STATE.unpack_from(segment.buf)
+        finally:
+            segment.close()
+        return state == _READY
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"name": self._name, "timeout": self._timeout}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    @property
+    def name(self) -> str:
+        r"""The cache name."""
+        return self._name
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = list(self._data)
+        for key in keys:
+            self.remove(key)
+
+    def get_or_load(self, key: str, load: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._data:
+                return self._data[key]
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout
+        while True:
+            try:
+                state = self._create_state(key)
+            except FileExistsError:
+                data = self._wait_and_read(key, deadline)
+                if data is not _MISSING:
+                    return data
+                if deadline is not None and time.monotonic() >= deadline:
+                    logger.warning(
+                        f"timeout when waiting for the data of {key!r}, "
+                        "so the data are loaded without cache"
+                    )
+                    return load()
+                # the load of the other process failed or the process ended
+                continue
+            return self._load_and_write(key, load, state)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+        for suffix in ("d", "s"):
+            _unlink(self._get_segment_name(key, suffix))
+
+    def _create_state(self, key: str) -> shared_memory.SharedMemory:
+        r"""Create the state segment of a key, in the loading state and
+        owned by the current process.
+
+        Args:
+            key: The key.
+
+        Returns:
+            The state segment.
+
+        Raises:
+            FileExistsError: if the state segment already exists i.e.
+                another process loads or loaded the data.
+        """
+        state = _Segment(name=self._get_segment_name(key, "s"), create=True, size=_STATE.size)
+        _STATE.pack_into(state.buf, 0, _LOADING, os.getpid(), 0)
+        return state
+
+    def _get_segment_name(self, key: str, suffix: str) -> str:
+        r"""Get the name of a segment of a key.
+
+        Args:
+            key: The key.
+            suffix: ``'s'`` for the state segment, ``'d'`` for the
+                data segment, or ``'r'`` for the segment that locks
+                the release of an entry whose process ended.
+
+        Returns:
+            The segment name.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        return f"{self._name}_{digest}{suffix}"
+
+    def _load_and_write(
+        self, key: str, load: Callable[[], T], state: shared_memory.SharedMemory
+    ) -> T:
+        r"""Load the data of a key and write them in a data segment.
+
+        The current process owns the state segment of the key, so the
+        other processes wait until the state is updated.
+
+        Args:
+            key: The key.
+            load: The function to load the data.
+            state: The state segment of the key.
+
+        Returns:
+            The data. The arrays and tensors are views of the data
+                segment if the data could be written.
+        """
+        try:
+            data = load()
+        except BaseException:
+            _release_failed(state)
+            raise
+        name = self._get_segment_name(key, "d")
+        try:
+            try:
+                segment = _write(name, data)
+            except FileExistsError:
+                # the data segment is left over by a process that ended
+                # before updating the state
+                _unlink(name)
+                segment = _write(name, data)
+        except (pickle.PicklingError, TypeError, AttributeError, OSError) as exc:
+            logger.warning(f"the data of {key!r} cannot be stored in shared memory: {exc}")
+            _release_failed(state)
+            return data
+        except BaseException:
+            _release_failed(state)
+            raise
+        _STATE.pack_into(state.buf, 0, _READY, os.getpid(), segment.size)
+        state.close()
+        return self._read(key, segment)
+
+    def _wait_and_read(self, key: str, deadline: float | None) -> Any:
+        r"""Wait until the data of a key are loaded by another process,
+        and read them.
+
+        Args:
+            key: The key.
+            deadline: The time when the wait stops.
+
+        Returns:
+            The data, or ``_MISSING`` if the load failed, took too
+                long, or if the loading process ended.
+        """
+        state = _attach(self._get_segment_name(key, "s"))
+        if state is None:
+            return _MISSING
+        try:
+            delay = 0.001
+            while True:
+                status, pid, _ = _STATE.unpack_from(state.buf)
+                if status == _READY:
+                    break
+                if status == _FAILED or (deadline is not None and time.monotonic() >= deadline):
+                    return _MISSING
+                if pid and not _is_process_alive(pid):
+                    logger.warning(
+                        f"the process {pid} that loads the data of {key!r} ended, "
+                        "so the entry is released"
+                    )
+                    self._release_dead(key, pid)
+                    return _MISSING
+                time.sleep(delay)
+                delay = min(2 * delay, 0.05)
+        finally:
+            state.close()
+        segment = _attach(self._get_segment_name(key, "d"))
+        if segment is None:
+            # the entry was removed in between
+            return _MISSING
+        return self._read(key, segment)
+
+    def _release_dead(self, key: str, pid: int) -> None:
+        r"""Release the entry of a key whose loading process ended, so
+        the data can be loaded by another process.
+
+        Several processes can detect that the loading process ended,
+        so the release is locked by a segment: only the process that
+        creates the lock segment releases the entry, and only if the
+        entry is still owned by the ended process.
+
+        Args:
+            key: The key.
+            pid: The ID of the process that ended.
+        """
+        try:
+            lock = _Segment(name=self._get_segment_name(key, "r"), create=True, size=1)
+        except FileExistsError:
+            # another process releases the entry
+            return
+        try:
+            state = _attach(self._get_segment_name(key, "s"))
+            if state is None:
+                return
+            try:
+                status, owner, _ = _STATE.unpack_from(state.buf)
+            finally:
+                state.close()
+            # the entry may have been released and created again in between
+            if status == _LOADING and owner == pid:
+                for suffix in ("d", "s"):
+                    _unlink(self._get_segment_name(key, suffix))
+        finally:
+            lock.close()
+            lock.unlink()
+
+    def _read(self, key: str, segment: shared_memory.SharedMemory) -> Any:
+        r"""Read the data of a key from its data segment.
+
+        Args:
+            key: The key.
+            segment: The data segment of the key.
+
+        Returns:
+            The data.
+        """
+        with self._lock:
+            if key not in self._data:
+                self._data[key] = unpack_data(segment.buf)
+            data = self._data[key]
+        # The views of the data keep the memory mapping alive, so the
+        # segment can be closed.
+        segment.close()
+        return data
+
+
+class _Missing:
+    r"""Define the sentinel returned when the data are not available."""
+
+
+_MISSING = _Missing()
+
+
+class _Segment(shared_memory.SharedMemory):
+    r"""Implement a shared memory segment that can be closed while the
+    views of its data are used.
+
+    The memory mapping is released when the last view is deleted.
+    """
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        try:
+            super().close()
+        except BufferError:
+            # Only the file descriptor is released because the views
+            # of the data use the memory mapping.
+            fd = getattr(self, "_fd", -1)
+            if fd >= 0:
+                os.close(fd)
+                self._fd = -1
+
+
+def _attach(name: str) -> shared_memory.SharedMemory | None:
+    r"""Attach an existing segment.
+
+    Args:
+        name: The segment name.
+
+    Returns:
+        The segment, or ``None`` if it does not exist.
+    """
+    try:
+        if sys.version_info >= (3, 13):
+            return _Segment(name=name, track=False)
+        return _Segment(name=name)
+    except FileNotFoundError:
+        return None
+
+
+def _is_process_alive(pid: int) -> bool:
+    r"""Indicate if a process is running on the current machine.
+
+    Args:
+        pid: The process ID.
+
+    Returns:
+        ``True`` if the process is running or if it cannot be checked,
+            otherwise ``False``.
+    """
+    if sys.platform == "win32":
+        # os.kill terminates the process on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # the process exists but belongs to another user
+        return True
+    return True
+
+
+def _release_failed(state: shared_memory.SharedMemory) -> None:
+    r"""Mark a load as failed and release its state segment, so
+    another process can load the data.
+
+    Args:
+        state: The state segment of the key.
+    """
+    _STATE.pack_into(state.buf, 0, _FAILED, 0, 0)
+    state.close()
+    state.unlink()
+
+
+def _write(name: str, data: Any) -> shared_memory.SharedMemory:
+    r"""Write data in a new segment.
+
+    Args:
+        name: The segment name.
+        data: The data to write.
+
+    Returns:
+        The segment.
+    """
+    chunks, size = pack_data(data)
+    segment = _Segment(name=name, create=True, size=size)
+    for offset, chunk in chunks:
+        segment.buf[offset : offset + chunk.nbytes] = chunk
+    return segment
+
+
+def _unlink(name: str) -> None:
+    r"""Release a segment if it exists.
+
+    Args:
+        name: The segment name.
+    """
+    segment = _attach(name)
+    if segment is None:
+        return
+    segment.close()
+    # another process may have unlinked the segment in between
+    with contextlib.suppress(FileNotFoundError):
+        segment.unlink()
@@ -0,0 +1,311 @@
+r"""Contain a persistent data cache that stores the decoded data in a
+fast local format."""
+
+from __future__ import annotations
+
+__all__ = ["TranscodingCache"]
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from coola.utils.path import sanitize_path
+
+from iden.cache.base import BaseDataCache
+from iden.cache.utils import pack_data, unpack_data
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_SUFFIX = ".cache"
+
+
+class TranscodingCache(BaseDataCache):
+    r"""Implement a persistent data cache that stores the decoded data
+    in a fast local format.
+
+    The first load of a file decodes it with its loader, and writes
+    the decoded data in a cache file. The next loads, in the same run
+    or in later runs, read the cache file instead of decoding the
+    source file again. The cache files use the pickle protocol 5
+    with the numpy arrays and CPU tensors stored out-of-band, and are
+    memory-mapped: the arrays and tensors are read without decoding
+    or copy, whatever the format of the source file.
+
+    The key of an entry is the path of the source file, and an entry
+    is invalidated when the size or the modification time of the
+    source file changes. The least recently used entries are removed
+    when the cache files use more than the disk budget. The cache is
+    persistent, so a file shard uses it for all the loads, not only
+    the loads with ``get_data(cache=True)``.
+
+    Args:
+        path: The path to the cache directory.
+        max_bytes: The disk budget in bytes. There is no limit if
+            ``None``.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.cache import TranscodingCache
+        >>> from iden.shard import create_pickle_shard
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     cache = TranscodingCache(Path(tmpdir).joinpath("cache"))
+        ...     shard = create_pickle_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+        ...     shard.set_data_cache(cache)
+        ...     shard.get_data()
+        ...     shard.path.as_posix() in cache
+        ...
+        [1, 2, 3]
+        True
+
+        ```
+    """
+
+    persistent = True
+
+    def __init__(self, path: Path | str, max_bytes: int | None = None) -> None:
+        self._path = sanitize_path(path)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # The entries are indexed lazily, from the least to the most
+        # recently used. The values are the sizes in bytes.
+        self._entries: OrderedDict[str, int] | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, max_bytes={self._max_bytes}, "
+            f"nbytes={self.nbytes:,})"
+        )
+
+    def __contains__(self, key: str) -> bool:
+        name = self._get_entry_name(key)
+        return name is not None and self._path.joinpath(name).is_file()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": self._path, "max_bytes": self._max_bytes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    @property
+    def nbytes(self) -> int:
+        r"""The size of the cache files in bytes."""
+        with self._lock:
+            return sum(self._get_entries().values())
+
+    @property
+    def path(self) -> Path:
+        r"""The path to the cache directory."""
+        return self._path
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in self._scan():
+                self._remove_entry(name)
+
+    def get_or_load(self, key: str, load: Callable[[], T]) -> T:
+        name = self._get_entry_name(key)
+        if name is None:
+            # the source is not a file, so the entry cannot be validated
+            return load()
+        data = self._read(name)
+        if data is not _MISSING:
+            return data
+        data = load()
+        try:
+            self._write(name, data)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.warning(f"the data of {key!r} cannot be stored in the transcoding cache: {exc}")
+        return data
+
+    def remove(self, key: str) -> None:
+        prefix = _get_prefix(key)
+        with self._lock:
+            for name in [name for name in self._scan() if name.startswith(prefix)]:
+                self._remove_entry(name)
+
+    def _get_entries(self) -> OrderedDict[str, int]:
+        r"""Get the index of the entries.
+
+        The lock must be held by the caller.
+
+        Returns:
+            The sizes of the entries, from the least to the most
+                recently used.
+        """
+        if self._entries is None:
+            self._entries = self._scan()
+        return self._entries
+
+    def _get_entry_name(self, key: str) -> str | None:
+        r"""Get the name of the cache file of a key.
+
+        The name depends on the size and modification time of the
+        source file, so a changed source file has a new entry.
+
+        Args:
+            key: The path to the source file.
+
+        Returns:
+            The name of the cache file, or ``None`` if the source is
+                not a file.
+        """
+        try:
+            stat = Path(key).stat()
+        except OSError:
+            return None
+        version = hashlib.blake2b(
+            f"{stat.st_size}:{stat.st_mtime_ns}".encode(), digest_size=8
+        ).hexdigest()
+        return f"{_get_prefix(key)}{version}{_SUFFIX}"
+
+    def _read(self, name: str) -> Any:
+        r"""Read the data of an entry and mark it as recently used.
+
+        Args:
+            name: The name of the cache file.
+
+        Returns:
+            The data, or ``_MISSING`` if the entry does not exist.
+        """
+        path = self._path.joinpath(name)
+        try:
+            with path.open(mode="rb") as file:
+                # The private mapping makes the arrays writable without
+                # changing the cache file.
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            # the entry does not exist or was removed in between
+            return _MISSING
+        with self._lock:
+            entries = self._get_entries()
+            if name in entries:
+                entries.move_to_end(name)
+        return unpack_data(memoryview(buffer))
+
+    def _write(self, name: str, data: Any) -> None:
+        r"""Write the data of an entry, and remove the least recently
+        used entries if the disk budget is exceeded.
+
+        The cache file is replaced atomically, so another process
+        never reads a partially written file.
+
+        Args:
+            name: The name of the cache file.
+            data: The data to write.
+        """
+        chunks, size = pack_data(data)
+        self._path.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.joinpath(f".{name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with tmp_path.open(mode="wb") as file:
+                for offset, chunk in chunks:
+                    file.seek(offset)
+                    file.write(chunk)
+                file.truncate(size)
+            tmp_path.replace(self._path.joinpath(name))
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        with self._lock:
+            entries = self._get_entries()
+            # the other versions of the source file are outdated
+            prefix = f"{name.partition('-')[0]}-"
+            for other in [other for other in entries if other.startswith(prefix)]:
+                if other != name:
+                    self._remove_entry(other)
+            entries[name] = size
+            entries.move_to_end(name)
+            if self._max_bytes is not None and sum(entries.values()) > self._max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        r"""Remove the least recently used entries until the cache files
+        fit in the disk budget.
+
+        The index is rebuilt first, because other processes may have
+        added or used entries. The most recently used entry is never
+        removed. The lock must be held by the caller.
+        """
+        entries = self._scan()
+        self._entries = entries
+        nbytes = sum(entries.values())
+        for name in list(entries)[:-1]:
+            if nbytes <= self._max_bytes:
+                break
+            nbytes -= entries[name]
+            self._remove_entry(name)
+
+    def _remove_entry(self, name: str) -> None:
+        r"""Remove an entry.
+
+        The data that were read from the entry are still valid, because
+        the cache file is memory-mapped. The lock must be held by the
+        caller.
+
+        Args:
+            name: The name of the cache file.
+        """
+        self._path.joinpath(name).unlink(missing_ok=True)
+        if self._entries is not None:
+            self._entries.pop(name, None)
+
+    def _scan(self) -> OrderedDict[str, int]:
+        r"""Scan the cache directory.
+
+        The entries are sorted by modification time, which is updated
+        when an entry is read. The modification times can have a coarse
+        resolution, so the ties are broken with the order of the index.
+
+        Returns:
+            The sizes of the entries, from the least to the most
+                recently used.
+        """
+        if not self._path.is_dir():
+            return OrderedDict()
+        ranks = {name: i for i, name in enumerate(self._entries or ())}
+        entries = []
+        for entry in os.scandir(self._path):
+            if not entry.name.endswith(_SUFFIX) or entry.name.startswith("."):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # pragma: no cover
+                # another process removed the entry in between
+                continue
+            entries.append((stat.st_mtime_ns, ranks.get(entry.name, -1), entry.name, stat.st_size))
+        return OrderedDict((name, size) for _, _, name, size in sorted(entries))
+
+
+class _Missing:
+    r"""Define the sentinel returned when an entry does not exist."""
+
+
+_MISSING = _Missing()
+
+
+def _get_prefix(key: str) -> str:
+    r"""Get the prefix of the cache files of a key.
+
+    Args:
+        key: The path to the source file.
+
+    Returns:
+        The prefix, which is shared by all the versions of the source
+            file.
+    """
+    return f"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}-"
@@ -0,0 +1,123 @@
+r"""Contain utility functions to pack data in a flat buffer, where the
+numpy arrays and tensors can be read without copy."""
+
+from __future__ import annotations
+
+__all__ = ["pack_data", "unpack_data"]
+
+import io
+import pickle
+import struct
+import sys
+from typing import Any
+
+_HEADER = struct.Struct("<QQ")
+_ALIGNMENT = 64
+
+
+class _Pickler(pickle.Pickler):
+    r"""Implement a pickler that pickles the CPU tensors as numpy
+    arrays, so their data are stored out-of-band."""
+
+    def reducer_override(self, obj: Any) -> Any:
+        torch = sys.modules.get("torch")
+        if (
+            torch is None
+            or type(obj) is not torch.Tensor
+            or obj.device.type != "cpu"
+            or obj.layout != torch.strided
+        ):
+            return NotImplemented
+        try:
+            array = obj.detach().contiguous().numpy()
+        except TypeError:
+            # numpy does not support some dtypes e.g. bfloat16
+            return NotImplemented
+        return torch.from_numpy, (array,)
+
+
+def pack_data(data: Any) -> tuple[list[tuple[int, memoryview]], int]:
+    r"""Pack data in chunks that are written at fixed offsets of a flat
+    buffer.
+
+    The data are pickled with the protocol 5, and the data of the
+    contiguous numpy arrays and CPU tensors are stored out-of-band.
+    The buffer starts with the size of the pickle payload and the
+    number of out-of-band buffers, followed by the offset and size of
+    each out-of-band buffer, the pickle payload and the out-of-band
+    buffers aligned on 64 bytes.
+
+    Args:
+        data: The data to pack.
+
+    Returns:
+        The chunks as tuples of offset and bytes, and the size of the
+            buffer in bytes.
+
+    Raises:
+        pickle.PicklingError: if the data cannot be pickled.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.cache.utils import pack_data, unpack_data
+        >>> chunks, size = pack_data({"array": np.arange(5)})
+        >>> buffer = bytearray(size)
+        >>> for offset, chunk in chunks:
+        ...     buffer[offset : offset + chunk.nbytes] = chunk
+        ...
+        >>> unpack_data(memoryview(buffer))
+        {'array': array([0, 1, 2, 3, 4])}
+
+        ```
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    stream = io.BytesIO()
+    _Pickler(stream, protocol=5, buffer_callback=buffers.append).dump(data)
+    payload = stream.getbuffer()
+    raws = [buffer.raw() for buffer in buffers]
+
+    header = bytearray(_HEADER.size * (len(raws) + 1))
+    _HEADER.pack_into(header, 0, payload.nbytes, len(raws))
+    chunks = [(0, memoryview(header)), (len(header), payload)]
+    offset = len(header) + payload.nbytes
+    for i, raw in enumerate(raws):
+        offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+        _HEADER.pack_into(header, _HEADER.size * (i + 1), offset, raw.nbytes)
+        chunks.append((offset, raw))
+        offset += raw.nbytes
+    return chunks, offset
+
+
+def unpack_data(buffer: memoryview) -> Any:
+    r"""Unpack the data of a flat buffer written with the chunks of
+    ``pack_data``.
+
+    Args:
+        buffer: The buffer.
+
+    Returns:
+        The data. The numpy arrays and tensors that were stored
+            out-of-band are views of the buffer, so the buffer is
+            kept alive while they are used.
+
+    Example:
+        ```pycon
+        >>> from iden.cache.utils import pack_data, unpack_data
+        >>> chunks, size = pack_data([1, 2, 3])
+        >>> buffer = bytearray(size)
+        >>> for offset, chunk in chunks:
+        ...     buffer[offset : offset + chunk.nbytes] = chunk
+        ...
+        >>> unpack_data(memoryview(buffer))
+        [1, 2, 3]
+
+        ```
+    """
+    size, num_buffers = _HEADER.unpack_from(buffer)
+    layout = [_HEADER.unpack_from(buffer, _HEADER.size * (i + 1)) for i in range(num_buffers)]
+    start = _HEADER.size * (num_buffers + 1)
+    return pickle.loads(  # noqa: S301
+        buffer[start : start + size],
+        buffers=[buffer[offset : offset + nbytes] for offset, nbytes in layout],
+    )
@@ -0,0 +1,338 @@
+r"""Implement the ``iden`` command-line tool.
+
+The tool has three commands:
+
+- ``iden inspect <uri>``: print the splits, assets and sizes of a
+  dataset without loading the data
+- ``iden validate <uri>``: check that the data of all the shards can be
+  loaded
+- ``iden bench <uri>``: measure the loading throughput of each split
+"""
+
+from __future__ import annotations
+
+__all__ = ["bench", "inspect", "main", "validate"]
+
+import argparse
+import logging
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from coola.utils.format import str_human_byte_size
+
+from iden import shard as shard_module
+from iden.constants import ASSETS, SHARDS
+from iden.io import load_json
+from iden.shard import ShardDict, ShardTuple
+from iden.shard.benchmark import LoadingStats, benchmark_loading
+from iden.shard.utils import get_data_nbytes, walk_shards
+from iden.storage import sanitize_location
+from iden.utils.format import human_time
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from iden.shard import BaseShard
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def inspect(uri: str, *, show_shards: bool = False) -> str:
+    r"""Describe the splits and assets of a dataset.
+
+    Only the URI files and the sizes of the data files are read, so
+    the data are not loaded.
+
+    Args:
+        uri: The URI of the dataset.
+        show_shards: If ``True``, the URI and size of each shard are
+            listed, otherwise only the summary of each split.
+
+    Returns:
+        The description of the dataset.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.cli import inspect
+        >>> from iden.dataset import create_vanilla_dataset
+        >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = create_shard_dict(
+        ...         shards={
+        ...             "train": create_shard_tuple(
+        ...                 [create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri())],
+        ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+        ...             ),
+        ...         },
+        ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+        ...     )
+        ...     assets = create_shard_dict(shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri())
+        ...     uri = Path(tmpdir).joinpath("uri").as_uri()
+        ...     dataset = create_vanilla_dataset(uri=uri, shards=shards, assets=assets)
+        ...     print(inspect(uri))
+        ...
+        dataset: file:///.../uri
+        splits:
+          train: 1 shards, 9.00 B (JsonShard: 1)
+        assets:
+        total: 1 shards, 9.00 B
+
+        ```
+    """
+    splits, assets = _load_tree(uri)
+    lines = [f"dataset: {uri}", "splits:"]
+    num_shards, nbytes = 0, 0
+    for split in sorted(splits.get_shard_ids()):
+        shards = _get_leaves(splits.get_shard(split))
+        sizes = [get_data_nbytes(shard) for shard in shards]
+        split_nbytes = sum(sizes)
+        types = Counter(type(shard).__qualname__ for shard in shards)
+        types_str = ", ".join(f"{name}: {count:,}" for name, count in sorted(types.items()))
+        lines.append(
+            f"  {split}: {len(shards):,} shards, {str_human_byte_size(split_nbytes)} ({types_str})"
+        )
+        if show_shards:
+            lines.extend(
+                f"    {shard.get_uri()}  {str_human_byte_size(size)}"
+                for shard, size in zip(shards, sizes)
+            )
+        num_shards += len(shards)
+        nbytes += split_nbytes
+    lines.append("assets:")
+    for asset_id in sorted(assets.get_shard_ids()):
+        asset = assets.get_shard(asset_id)
+        asset_nbytes = sum(get_data_nbytes(shard) for shard in _get_leaves(asset))
+        lines.append(
+            f"  {asset_id}: {type(asset).__qualname__}, {str_human_byte_size(asset_nbytes)}"
+        )
+    lines.append(f"total: {num_shards:,} shards, {str_human_byte_size(nbytes)}")
+    return "\n".join(lines)
+
+
+def validate(uri: str, *, num_workers: int = 1) -> list[tuple[str, str]]:
+    r"""Check that the data of all the shards of a dataset can be
+    loaded.
+
+    The shards of the splits and the assets are checked in parallel
+    by a process pool.
+
+    Args:
+        uri: The URI of the dataset.
+        num_workers: The number of processes that check the shards.
+            The shards are checked in the current process if it is
+            ``1``.
+
+    Returns:
+        The URI and the error of the shards that cannot be loaded.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.cli import validate
+        >>> from iden.dataset import create_vanilla_dataset
+        >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = create_shard_dict(
+        ...         shards={
+        ...             "train": create_shard_tuple(
+        ...                 [create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri())],
+        ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+        ...             ),
+        ...         },
+        ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+        ...     )
+        ...     assets = create_shard_dict(shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri())
+        ...     uri = Path(tmpdir).joinpath("uri").as_uri()
+        ...     dataset = create_vanilla_dataset(uri=uri, shards=shards, assets=assets)
+        ...     validate(uri)
+        ...
+        []
+
+        ```
+    """
+    splits, assets = _load_tree(uri)
+    uris = [shard.get_uri() for shard in _get_leaves(splits) + _get_leaves(assets)]
+    logger.info(f"validating {len(uris):,} shards")
+    if num_workers <= 1:
+        errors = [_validate_shard(shard_uri) for shard_uri in uris]
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            errors = list(executor.map(_validate_shard, uris, chunksize=16))
+    return [(shard_uri, error) for shard_uri, error in zip(uris, errors) if error is not None]
+
+
+def bench(
+    uri: str, *, num_prefetch: int = 0, num_workers: int = 1, splits: Sequence[str] | None = None
+) -> dict[str, LoadingStats]:
+    r"""Measure the loading throughput of the splits of a dataset.
+
+    Args:
+        uri: The URI of the dataset.
+        num_prefetch: The number of shards loaded ahead by each
+            worker.
+        num_workers: The number of workers that load the shards.
+        splits: The splits to measure. All the splits are measured if
+            ``None``.
+
+    Returns:
+        The loading statistics of each split.
+
+    Raises:
+        ValueError: if a split does not exist.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.cli import bench
+        >>> from iden.dataset import create_vanilla_dataset
+        >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = create_shard_dict(
+        ...         shards={
+        ...             "train": create_shard_tuple(
+        ...                 [create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri())],
+        ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+        ...             ),
+        ...         },
+        ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+        ...     )
+        ...     assets = create_shard_dict(shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri())
+        ...     uri = Path(tmpdir).joinpath("uri").as_uri()
+        ...     dataset = create_vanilla_dataset(uri=uri, shards=shards, assets=assets)
+        ...     stats = bench(uri, num_prefetch=2)
+        ...     stats["train"].num_shards
+        ...
+        1
+
+        ```
+    """
+    tree, _ = _load_tree(uri)
+    split_ids = sorted(tree.get_shard_ids()) if splits is None else list(splits)
+    for split in split_ids:
+        if not tree.has_shard(split):
+            msg = f"Incorrect split: {split}. The splits are: {sorted(tree.get_shard_ids())}"
+            raise ValueError(msg)
+    return {
+        split: benchmark_loading(
+            _get_leaves(tree.get_shard(split)), num_prefetch=num_prefetch, num_workers=num_workers
+        )
+        for split in split_ids
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    r"""Implement the ``iden`` command.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The exit code: ``1`` if some shards are invalid, otherwise
+            ``0``.
+    """
+    parser = argparse.ArgumentParser(
+        prog="iden", description="Inspect, validate and benchmark datasets."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_inspect = commands.add_parser("inspect", help="print the splits and sizes of a dataset")
+    parser_inspect.add_argument("uri", help="the URI of the dataset")
+    parser_inspect.add_argument("--shards", action="store_true", help="list each shard")
+
+    parser_validate = commands.add_parser("validate", help="check the shards of a dataset")
+    parser_validate.add_argument("uri", help="the URI of the dataset")
+    parser_validate.add_argument("--workers", type=int, default=1, help="the number of processes")
+
+    parser_bench = commands.add_parser("bench", help="measure the loading throughput")
+    parser_bench.add_argument("uri", help="the URI of the dataset")
+    parser_bench.add_argument("--split", action="append", help="the split to measure")
+    parser_bench.add_argument(
+        "--prefetch", type=int, default=0, help="the number of shards loaded ahead"
+    )
+    parser_bench.add_argument("--workers", type=int, default=1, help="the number of workers")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+    uri = _to_uri(args.uri)
+    if args.command == "inspect":
+        print(inspect(uri, show_shards=args.shards))  # noqa: T201
+        return 0
+    if args.command == "validate":
+        errors = validate(uri, num_workers=args.workers)
+        for shard_uri, error in errors:
+            print(f"invalid shard {shard_uri}: {error}")  # noqa: T201
+        print("OK" if not errors else f"{len(errors):,} invalid shards")  # noqa: T201
+        return int(bool(errors))
+    stats = bench(uri, num_prefetch=args.prefetch, num_workers=args.workers, splits=args.split)
+    for split, split_stats in stats.items():
+        print(  # noqa: T201
+            f"{split}: {split_stats.num_shards:,} shards, "
+            f"{str_human_byte_size(split_stats.nbytes)} in {human_time(split_stats.duration)} | "
+            f"{split_stats.shards_per_second:,.1f} shards/s | "
+            f"{str_human_byte_size(int(split_stats.bytes_per_second))}/s"
+        )
+    return 0
+
+
+def _get_leaves(shard: BaseShard[Any]) -> list[BaseShard[Any]]:
+    r"""Get the shards nested in a shard that are not containers.
+
+    Args:
+        shard: The shard.
+
+    Returns:
+        The nested shards, in depth-first order.
+    """
+    return [item for item in walk_shards(shard) if not isinstance(item, (ShardDict, ShardTuple))]
+
+
+def _load_tree(uri: str) -> tuple[ShardDict[Any], ShardDict[Any]]:
+    r"""Load the shards and assets of a dataset without loading their
+    data.
+
+    Args:
+        uri: The URI of the dataset.
+
+    Returns:
+        The shards and the assets of the dataset.
+    """
+    config = load_json(sanitize_location(uri))
+    return shard_module.load_from_uri(config[SHARDS]), shard_module.load_from_uri(config[ASSETS])
+
+
+def _to_uri(uri: str) -> str:
+    r"""Convert a path to a URI.
+
+    Args:
+        uri: The URI or path.
+
+    Returns:
+        The URI.
+    """
+    return uri if "://" in uri else sanitize_location(uri).as_uri()
+
+
+def _validate_shard(uri: str) -> str | None:
+    r"""Check that the data of a shard can be loaded.
+
+    Args:
+        uri: The URI of the shard.
+
+    Returns:
+        The error, or ``None`` if the shard is valid.
+    """
+    try:
+        shard_module.load_from_uri(uri).get_data()
+    except Exception as exc:  # noqa: BLE001
+        return f"{type(exc).__qualname__}: {exc}"
+    return None
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -2,9 +2,26 @@ r"""Contain the main constants."""
 
 from __future__ import annotations
 
-__all__ = ["ASSETS", "KWARGS", "LOADER", "SHARDS"]
+__all__ = [
+    "ASSETS",
+    "DTYPE",
+    "FEATURES",
+    "KWARGS",
+    "LOADER",
+    "METADATA",
+    "NBYTES",
+    "NUM_RECORDS",
+    "SHAPE",
+    "SHARDS",
+]
 
 ASSETS = "assets"
+DTYPE = "dtype"
+FEATURES = "features"
 KWARGS = "kwargs"
 LOADER = "loader"
+METADATA = "metadata"
+NBYTES = "nbytes"
+NUM_RECORDS = "num_records"
+SHAPE = "shape"
 SHARDS = "shards"
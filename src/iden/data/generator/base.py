@@ -8,10 +8,11 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Generic, TypeVar
 
-from coola.equality.tester import EqualNanEqualityTester, get_default_registry
 from objectory import AbstractFactory
 from objectory.utils import is_object_config
 
+from iden.utils.equality import register_equality_tester
+
 T = TypeVar("T")
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -135,4 +136,4 @@ def setup_data_generator(
     return data_generator
 
 
-get_default_registry().register(BaseDataGenerator, EqualNanEqualityTester(), exist_ok=True)
+register_equality_tester(BaseDataGenerator)
@@ -7,9 +7,8 @@ __all__ = ["DataGenerator"]
 import copy
 from typing import Any, TypeVar
 
-from coola.equality import objects_are_equal
-
 from iden.data.generator.base import BaseDataGenerator
+from iden.utils.equality import objects_are_equal
 
 T = TypeVar("T")
 
@@ -47,6 +46,7 @@ class DataGenerator(BaseDataGenerator[T]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if type(other) is not type(self):
             return False
+
         return (
             objects_are_equal(self._data, other._data, equal_nan=equal_nan)
             and self._copy == other._copy
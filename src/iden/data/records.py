@@ -0,0 +1,500 @@
+r"""Contain utility functions to manipulate the records stored in a
+shard.
+
+A shard stores a batch of records. The records are indexed along the
+first dimension of the data: the items of a list or tuple, the rows
+of a ``numpy.ndarray`` or ``torch.Tensor``, or the rows of each value
+of a dictionary of arrays.
+
+These functions never import ``numpy`` or ``torch``. An array type is
+only recognized if its package was already imported by the caller.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "concat_records",
+    "copy_records",
+    "empty_records",
+    "get_nbytes",
+    "get_num_records",
+    "get_record",
+    "promote_records",
+    "slice_records",
+    "take_records",
+]
+
+import sys
+from collections.abc import Mapping, Sequence
+from itertools import chain
+from typing import Any
+
+
+def get_num_records(data: Any) -> int | None:
+    r"""Get the number of records in the data.
+
+    Args:
+        data: The data.
+
+    Returns:
+        The number of records, or ``None`` if the data do not have a
+            record structure. A dictionary has a record structure if
+            all its values have the same number of records.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.data.records import get_num_records
+        >>> get_num_records([1, 2, 3])
+        3
+        >>> get_num_records({"key1": np.ones((4, 3)), "key2": np.arange(4)})
+        4
+        >>> get_num_records(42)
+
+        ```
+    """
+    if isinstance(data, Mapping):
+        counts = {get_num_records(value) for value in data.values()}
+        if len(counts) != 1:
+            return None
+        return counts.pop()
+    if _is_array(data):
+        if data.ndim == 0:
+            return None
+        return int(data.shape[0])
+    if isinstance(data, (list, tuple)):
+        return len(data)
+    return None
+
+
+def get_nbytes(data: Any) -> int | None:
+    r"""Get the number of bytes used by the array data.
+
+    Args:
+        data: The data.
+
+    Returns:
+        The number of bytes, or ``None`` if the data are not an array
+            or a dictionary of arrays.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.data.records import get_nbytes
+        >>> get_nbytes({"key1": np.ones((4, 3)), "key2": np.arange(4, dtype=np.int32)})
+        112
+        >>> get_nbytes([1, 2, 3])
+
+        ```
+    """
+    if isinstance(data, Mapping):
+        sizes = [get_nbytes(value) for value in data.values()]
+        if not sizes or None in sizes:
+            return None
+        return sum(sizes)
+    if _is_numpy_array(data):
+        return int(data.nbytes)
+    if _is_torch_tensor(data):
+        return data.element_size() * data.numel()
+    return None
+
+
+def get_record(data: Any, index: int) -> Any:
+    r"""Get a record in the data.
+
+    Args:
+        data: The data.
+        index: The index of the record to get.
+
+    Returns:
+        The record at the given index. For a dictionary, the record is
+            a dictionary with the record of each value.
+
+    Raises:
+        TypeError: if the data do not have a record structure.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.data.records import get_record
+        >>> get_record([1, 2, 3, 4], 1)
+        2
+        >>> get_record({"key1": np.ones((4, 2)), "key2": ["a", "b", "c", "d"]}, 2)
+        {'key1': array([1., 1.]), 'key2': 'c'}
+
+        ```
+    """
+    if isinstance(data, Mapping):
+        return {key: get_record(value, index) for key, value in data.items()}
+    if _is_array(data) or isinstance(data, (list, tuple)):
+        return data[index]
+    msg = f"Incorrect data type: {type(data)}. The data do not have a record structure"
+    raise TypeError(msg)
+
+
+def slice_records(data: Any, start: int, stop: int) -> Any:
+    r"""Slice the records in the data.
+
+    Args:
+        data: The data to slice.
+        start: The index of the first record to keep.
+        stop: The index after the last record to keep.
+
+    Returns:
+        The records between ``start`` and ``stop``. For arrays, the
+            output is a view of the input data.
+
+    Raises:
+        TypeError: if the data do not have a record structure.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.data.records import slice_records
+        >>> slice_records([1, 2, 3, 4], 1, 3)
+        [2, 3]
+        >>> slice_records({"key1": np.arange(4), "key2": ["a", "b", "c", "d"]}, 1, 3)
+        {'key1': array([1, 2]), 'key2': ['b', 'c']}
+
+        ```
+    """
+    if isinstance(data, Mapping):
+        return {key: slice_records(value, start, stop) for key, value in data.items()}
+    if _is_array(data) or isinstance(data, (list, tuple)):
+        return data[start:stop]
+    msg = f"Incorrect data type: {type(data)}. The data do not have a record structure"
+    raise TypeError(msg)
+
+
+def take_records(data: Any, indices: Sequence[int]) -> Any:
+    r"""Take the records at the given indices.
+
+    For arrays, the records are gathered with a single indexing
+    operation instead of a Python loop over the records.
+
+    Args:
+        data: The data.
+        indices: The indices of the records to take.
+
+    Returns:
+        The records at the given indices, in the order of the indices.
+
+    Raises:
+        TypeError: if the data do not have a record structure.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.data.records import take_records
+        >>> take_records([1, 2, 3, 4], [3, 0, 2])
+        [4, 1, 3]
+        >>> take_records({"key1": np.arange(4), "key2": ["a", "b", "c", "d"]}, [3, 0])
+        {'key1': array([3, 0]), 'key2': ['d', 'a']}
+
+        ```
+    """
+    if isinstance(data, Mapping):
+        return {key: take_records(value, indices) for key, value in data.items()}
+    if _is_numpy_array(data):
+        return data[sys.modules["numpy"].asarray(indices, dtype=int)]
+    if _is_torch_tensor(data):
+        return data[sys.modules["torch"].as_tensor(indices, dtype=sys.modules["torch"].long)]
+    if isinstance(data, (list, tuple)):
+        return type(data)(data[i] for i in indices)
+    msg = f"Incorrect data type: {type(data)}. The data do not have a record structure"
+    raise TypeError(msg)
+
+
+def concat_records(items: Sequence[Any]) -> Any:
+    r"""Concatenate the records of several data chunks.
+
+    All the chunks must have the same structure.
+
+    Args:
+        items: The data chunks to concatenate.
+
+    Returns:
+        The concatenated records.
+
+    Raises:
+        ValueError: if ``items`` is empty.
+        TypeError: if the data do not have a record structure.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.data.records import concat_records
+        >>> concat_records([[1, 2], [3], [4, 5]])
+        [1, 2, 3, 4, 5]
+        >>> concat_records([{"key": np.arange(2)}, {"key": np.arange(3)}])
+        {'key': array([0, 1, 0, 1, 2])}
+
+        ```
+    """
+    if not items:
+        msg = "Cannot concatenate an empty sequence of data chunks"
+        raise ValueError(msg)
+    first = items[0]
+    if len(items) == 1:
+        return first
+    if isinstance(first, Mapping):
+        return {key: concat_records([item[key] for item in items]) for key in first}
+    if _is_numpy_array(first):
+        return sys.modules["numpy"].concatenate(items)
+    if _is_torch_tensor(first):
+        return sys.modules["torch"].cat(items)
+    if isinstance(first, list):
+        return list(chain.from_iterable(items))
+    if isinstance(first, tuple):
+        return tuple(chain.from_iterable(items))
+    msg = f"Incorrect data type: {type(first)}. The data do not have a record structure"
+    raise TypeError(msg)
+
+
+def empty_records(data: Any, num_records: int) -> Any:
+    r"""Allocate an uninitialized buffer for records like the ones in
+    the data.
+
+    The buffer has the same structure as the data. An array buffer has
+    the same data type, record shape and device as the data array. The
+    buffer can be filled with ``copy_records``.
+
+    Args:
+        data: The data used as a template.
+        num_records: The number of records in the buffer.
+
+    Returns:
+        The uninitialized buffer.
+
+    Raises:
+        TypeError: if the data are not an array, a list, or a
+            dictionary of them. The tuples are not supported because
+            a tuple buffer cannot be filled in-place.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.data.records import empty_records
+        >>> buffer = empty_records({"key1": np.ones((4, 3)), "key2": np.arange(4)}, 8)
+        >>> buffer["key1"].shape, buffer["key1"].dtype, buffer["key2"].shape
+        ((8, 3), dtype('float64'), (8,))
+
+        ```
+    """
+    if isinstance(data, Mapping):
+        return {key: empty_records(value, num_records) for key, value in data.items()}
+    if _is_numpy_array(data):
+        return sys.modules["numpy"].empty((num_records, *data.shape[1:]), dtype=data.dtype)
+    if _is_torch_tensor(data):
+        return sys.modules["torch"].empty(
+            (num_records, *data.shape[1:]), dtype=data.dtype, device=data.device
+        )
+    if isinstance(data, list):
+        return [None] * num_records
+    if isinstance(data, tuple):
+        msg = (
+            "Incorrect data type: <class 'tuple'>. Cannot allocate a buffer for the records "
+            "because a tuple cannot be filled in-place, use a list instead"
+        )
+        raise TypeError(msg)
+    msg = f"Incorrect data type: {type(data)}. Cannot allocate a buffer for the records"
+    raise TypeError(msg)
+
+
+def promote_records(buffer: Any, data: Any, num_records: int) -> Any:
+    r"""Get a buffer that can store the records of the data.
+
+    An array buffer is reused if its data type can store the records
+    of the data, otherwise a new buffer is allocated with the promoted
+    data type, like the one of the concatenated records, and the first
+    records of the buffer are copied in the new buffer. If the buffer
+    does not store records, the new buffer has the data type of the
+    data.
+
+    Args:
+        buffer: The buffer, e.g. allocated with ``empty_records``.
+        data: The data with the records to store in the buffer.
+        num_records: The number of records already stored in the
+            buffer.
+
+    Returns:
+        The buffer, or a new buffer if the data type of an array
+            buffer cannot store the records of the data.
+
+    Raises:
+        TypeError: if the data and the buffer do not have the same
+            structure.
+        ValueError: if the data and the buffer do not have the same
+            keys, the same record shape, or the same device.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.data.records import promote_records
+        >>> buffer = np.array([3, 4, 0])
+        >>> new = promote_records(buffer, np.array([0.5, 1.5]), 2)
+        >>> new.dtype, new[:2]
+        (dtype('float64'), array([3., 4.]))
+        >>> promote_records(buffer, np.array([5, 6]), 2) is buffer
+        True
+
+        ```
+    """
+    if isinstance(buffer, Mapping):
+        if not isinstance(data, Mapping):
+            msg = f"Incorrect data type: {type(data)}. The buffer is a dictionary"
+            raise TypeError(msg)
+        if data.keys() != buffer.keys():
+            msg = (
+                f"The data and the buffer do not have the same keys: "
+                f"{sorted(data.keys())} vs {sorted(buffer.keys())}"
+            )
+            raise ValueError(msg)
+        new = {key: promote_records(value, data[key], num_records) for key, value in buffer.items()}
+        if all(new[key] is value for key, value in buffer.items()):
+            return buffer
+        return new
+    if isinstance(buffer, list):
+        if not isinstance(data, list):
+            msg = f"Incorrect data type: {type(data)}. The buffer is a list"
+            raise TypeError(msg)
+        return buffer
+    if _is_array(buffer):
+        return _promote_array(buffer, data, num_records)
+    msg = f"Incorrect buffer type: {type(buffer)}"
+    raise TypeError(msg)
+
+
+def copy_records(src: Any, src_start: int, dst: Any, dst_start: int, num_records: int) -> None:
+    r"""Copy records from the data to a buffer, in-place.
+
+    The records are copied with a single slice assignment per array,
+    so no intermediate data are allocated.
+
+    Args:
+        src: The data with the records to copy.
+        src_start: The index of the first record to copy.
+        dst: The buffer, e.g. allocated with ``empty_records``.
+        dst_start: The index in the buffer where to copy the first
+            record.
+        num_records: The number of records to copy.
+
+    Raises:
+        TypeError: if the buffer is a dictionary but not the data.
+        ValueError: if the data and the buffer do not have the same
+            keys.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.data.records import copy_records
+        >>> buffer = np.zeros(5, dtype=int)
+        >>> copy_records(np.arange(10), 2, buffer, 1, 3)
+        >>> buffer
+        array([0, 2, 3, 4, 0])
+
+        ```
+    """
+    if isinstance(dst, Mapping):
+        if not isinstance(src, Mapping):
+            msg = f"Incorrect data type: {type(src)}. The buffer is a dictionary"
+            raise TypeError(msg)
+        if src.keys() != dst.keys():
+            msg = (
+                f"The data and the buffer do not have the same keys: "
+                f"{sorted(src.keys())} vs {sorted(dst.keys())}"
+            )
+            raise ValueError(msg)
+        for key, value in dst.items():
+            copy_records(src[key], src_start, value, dst_start, num_records)
+        return
+    dst[dst_start : dst_start + num_records] = src[src_start : src_start + num_records]
+
+
+def _promote_array(buffer: Any, data: Any, num_records: int) -> Any:
+    r"""Get an array buffer that can store the records of an array.
+
+    Args:
+        buffer: The array buffer.
+        data: The array with the records to store in the buffer.
+        num_records: The number of records already stored in the
+            buffer.
+
+    Returns:
+        The buffer, or a new buffer with the promoted data type.
+
+    Raises:
+        TypeError: if the data and the buffer are not the same type
+            of array.
+        ValueError: if the data and the buffer do not have the same
+            record shape or the same device.
+    """
+    if _is_numpy_array(buffer) != _is_numpy_array(data) or not _is_array(data):
+        msg = f"Incorrect data type: {type(data)}. The buffer is a {type(buffer)}"
+        raise TypeError(msg)
+    if tuple(data.shape[1:]) != tuple(buffer.shape[1:]):
+        msg = (
+            f"The data and the buffer do not have the same record shape: "
+            f"{tuple(data.shape[1:])} vs {tuple(buffer.shape[1:])}"
+        )
+        raise ValueError(msg)
+    if _is_numpy_array(buffer):
+        np = sys.modules["numpy"]
+        dtype = np.result_type(buffer.dtype, data.dtype) if num_records > 0 else data.dtype
+        if dtype == buffer.dtype:
+            return buffer
+        new = np.empty(buffer.shape, dtype=dtype)
+    else:
+        if data.device != buffer.device:
+            msg = (
+                f"The data and the buffer are not on the same device: "
+                f"{data.device} vs {buffer.device}"
+            )
+            raise ValueError(msg)
+        torch = sys.modules["torch"]
+        dtype = torch.promote_types(buffer.dtype, data.dtype) if num_records > 0 else data.dtype
+        if dtype == buffer.dtype:
+            return buffer
+        new = torch.empty(buffer.shape, dtype=dtype, device=buffer.device)
+    new[:num_records] = buffer[:num_records]
+    return new
+
+
+def _is_array(data: Any) -> bool:
+    r"""Indicate if the data is a ``numpy.ndarray`` or a
+    ``torch.Tensor``.
+
+    Args:
+        data: The data to check.
+
+    Returns:
+        ``True`` if the data is an array, otherwise ``False``.
+    """
+    return _is_numpy_array(data) or _is_torch_tensor(data)
+
+
+def _is_numpy_array(data: Any) -> bool:
+    r"""Indicate if the data is a ``numpy.ndarray``.
+
+    Args:
+        data: The data to check.
+
+    Returns:
+        ``True`` if the data is a ``numpy.ndarray``, otherwise
+            ``False``.
+    """
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(data, np.ndarray)
+
+
+def _is_torch_tensor(data: Any) -> bool:
+    r"""Indicate if the data is a ``torch.Tensor``.
+
+    Args:
+        data: The data to check.
+
+    Returns:
+        ``True`` if the data is a ``torch.Tensor``, otherwise ``False``.
+    """
+    torch = sys.modules.get("torch")
+    return torch is not None and isinstance(data, torch.Tensor)
@@ -2,8 +2,16 @@ r"""Contain dataset implementations."""
 
 from __future__ import annotations
 
-__all__ = ["BaseDataset", "VanillaDataset", "create_vanilla_dataset", "load_from_uri"]
+__all__ = [
+    "BaseDataset",
+    "VanillaDataset",
+    "convert_dataset",
+    "create_vanilla_dataset",
+    "extend_split",
+    "load_from_uri",
+]
 
 from iden.dataset.base import BaseDataset
+from iden.dataset.convert import convert_dataset
 from iden.dataset.loading import load_from_uri
-from iden.dataset.vanilla import VanillaDataset, create_vanilla_dataset
+from iden.dataset.vanilla import VanillaDataset, create_vanilla_dataset, extend_split
@@ -8,9 +8,11 @@ import logging
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from coola.equality.tester import EqualNanEqualityTester, get_default_registry
+from iden.utils.equality import register_equality_tester
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from iden.shard import BaseShard
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -270,15 +272,26 @@ class BaseDataset(ABC, Generic[T]):
         """
 
     @abstractmethod
-    def get_shards(self, split: str) -> tuple[BaseShard[T], ...]:
+    def get_shards(
+        self, split: str, rank: int | None = None, world_size: int | None = None
+    ) -> Sequence[BaseShard[T]]:
         r"""Get the shards for a given split.
 
+        Args:
+            split: The dataset split.
+            rank: The rank of the current process. If it is set, only
+                the shards assigned to this rank are returned.
+            world_size: The number of processes. It must be set if
+                ``rank`` is set.
+
         Returns:
             The shards for a given split. The shards are
                 sorted by ascending order of URI.
 
         Raises:
             SplitNotFoundError: if the split does not exist.
+            ValueError: if only one of ``rank`` and ``world_size`` is
+                set, or if their values are incorrect.
 
         Example:
             ```pycon
@@ -493,6 +506,22 @@ class BaseDataset(ABC, Generic[T]):
             ```
         """
 
+    def get_fingerprint(self) -> str | None:
+        r"""Get the config fingerprint of the dataset.
+
+        The fingerprint is a stable hash of the dataset type, its URI
+        and the fingerprints of its shards and assets, so it is
+        computed without loading the data. Two datasets with the same
+        fingerprint are equal, so the fingerprint can be used as a
+        cache key or to compare datasets quickly. By default, a
+        dataset does not have a fingerprint.
+
+        Returns:
+            The fingerprint as a hexadecimal string, or ``None`` if
+                the dataset cannot be identified without its data.
+        """
+        return None
+
     @abstractmethod
     def get_uri(self) -> str:
         r"""Get the Uniform Resource Identifier (URI) of the dataset.
@@ -546,4 +575,4 @@ class BaseDataset(ABC, Generic[T]):
         """
 
 
-get_default_registry().register(BaseDataset, EqualNanEqualityTester(), exist_ok=True)
+register_equality_tester(BaseDataset)
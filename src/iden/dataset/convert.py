@@ -0,0 +1,300 @@
+r"""Contain functions to convert the shards of a dataset to another
+data format."""
+
+from __future__ import annotations
+
+__all__ = ["CONVERT_FORMATS", "convert_dataset", "main"]
+
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
+
+from coola.utils.format import str_human_byte_size
+from coola.utils.path import sanitize_path
+
+from iden import shard as shard_module
+from iden.constants import ASSETS, SHARDS
+from iden.dataset.vanilla import VanillaDataset
+from iden.io import load_json, save_json
+from iden.shard import ShardDict, ShardTuple
+from iden.shard.utils import get_data_nbytes
+from iden.storage import sanitize_location
+from iden.utils.format import human_time
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from iden.shard import BaseShard
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The name of the function in ``iden.shard`` that creates a shard of
+# each format.
+CONVERT_FORMATS = {
+    "cloudpickle": "create_cloudpickle_shard",
+    "joblib": "create_joblib_shard",
+    "json": "create_json_shard",
+    "numpy_safetensors": "create_numpy_safetensors_shard",
+    "pickle": "create_pickle_shard",
+    "torch": "create_torch_shard",
+    "torch_safetensors": "create_torch_safetensors_shard",
+    "yaml": "create_yaml_shard",
+}
+
+
+def convert_dataset(
+    uri: str,
+    path: Path | str,
+    fmt: str,
+    *,
+    num_workers: int = 1,
+    resume: bool = True,
+) -> VanillaDataset[Any]:
+    r"""Convert the shards of a dataset to another data format.
+
+    Each shard of each split is loaded and saved in the target format
+    in a new dataset. The new dataset has the same splits, with the
+    shards in the same order, and the same assets. The assets are not
+    converted: the new dataset uses the original asset shards, because
+    they often store data that the target format does not support e.g.
+    statistics in a JSON file. The new dataset has the following
+    layout:
+
+    - ``path/dataset``: the URI of the dataset
+    - ``path/shards`` and ``path/assets``: the URIs of the splits and
+      assets
+    - ``path/splits/{split}/uri``: the URI of the shards of a split
+    - ``path/splits/{split}/{index}``: the URI of a shard and its data
+      file with the extension of the format
+
+    The shards are converted in parallel by a process pool. The URI of
+    a converted shard is written after its data, so an interrupted
+    conversion can be resumed: the shards whose URI exists are not
+    converted again, and the URI files of the splits and the dataset
+    are written again.
+
+    Args:
+        uri: The URI of the dataset to convert.
+        path: The directory of the new dataset.
+        fmt: The target data format. The supported formats are the
+            keys of ``CONVERT_FORMATS``.
+        num_workers: The number of processes that convert the shards.
+            The shards are converted in the current process if it is
+            ``1``.
+        resume: If ``True``, the shards that were already converted
+            are reused and the existing URI files of the splits and
+            the dataset are overwritten, otherwise an existing shard
+            raises an error.
+
+    Returns:
+        The new dataset.
+
+    Raises:
+        ValueError: if the format is not supported.
+        FileExistsError: if a converted shard already exists and
+            ``resume`` is ``False``.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.dataset import create_vanilla_dataset
+        >>> from iden.dataset.convert import convert_dataset
+        >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = create_shard_dict(
+        ...         shards={
+        ...             "train": create_shard_tuple(
+        ...                 [
+        ...                     create_json_shard(
+        ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+        ...                     ),
+        ...                     create_json_shard(
+        ...                         [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+        ...                     ),
+        ...                 ],
+        ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+        ...             ),
+        ...         },
+        ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+        ...     )
+        ...     assets = create_shard_dict(shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri())
+        ...     uri = Path(tmpdir).joinpath("uri").as_uri()
+        ...     dataset = create_vanilla_dataset(uri=uri, shards=shards, assets=assets)
+        ...     new = convert_dataset(uri, Path(tmpdir).joinpath("new"), fmt="pickle")
+        ...     new.get_shards("train")
+        ...
+        (PickleShard(uri=file:///.../new/splits/train/000000001),
+         PickleShard(uri=file:///.../new/splits/train/000000002))
+
+        ```
+    """
+    if fmt not in CONVERT_FORMATS:
+        msg = f"Incorrect format: {fmt}. The supported formats are: {sorted(CONVERT_FORMATS)}"
+        raise ValueError(msg)
+    path = sanitize_path(path)
+    config = load_json(sanitize_location(uri))
+    splits: ShardDict[Any] = shard_module.load_from_uri(config[SHARDS])
+    assets: ShardDict[Any] = shard_module.load_from_uri(config[ASSETS])
+
+    tasks = []
+    for split in sorted(splits.get_shard_ids()):
+        for i, shard in enumerate(splits.get_shard(split)):
+            new_uri = path.joinpath("splits", split, f"{i + 1:09d}").as_uri()
+            tasks.append((split, shard, new_uri))
+    logger.info(f"converting {len(tasks):,} shards to {fmt} in {path}")
+
+    new_shards = _convert_shards(tasks, fmt, num_workers=num_workers, resume=resume)
+    # The URI files are written directly instead of with the creation
+    # functions, so they can be overwritten when a finished or
+    # interrupted conversion is resumed.
+    new_splits = {}
+    for split in splits.get_shard_ids():
+        split_shards = [new_shards[new_uri] for name, _, new_uri in tasks if name == split]
+        split_uri = path.joinpath("splits", split, "uri").as_uri()
+        _save_uri_config(ShardTuple.generate_uri_config(split_shards), split_uri, resume)
+        new_splits[split] = ShardTuple(split_uri, split_shards)
+    shards_uri = path.joinpath("shards").as_uri()
+    _save_uri_config(ShardDict.generate_uri_config(new_splits), shards_uri, resume)
+    new_assets = {asset_id: assets.get_shard(asset_id) for asset_id in assets.get_shard_ids()}
+    assets_uri = path.joinpath("assets").as_uri()
+    _save_uri_config(ShardDict.generate_uri_config(new_assets), assets_uri, resume)
+    shard_dict = ShardDict(shards_uri, new_splits)
+    asset_dict = ShardDict(assets_uri, new_assets)
+    dataset_uri = path.joinpath("dataset").as_uri()
+    _save_uri_config(
+        VanillaDataset.generate_uri_config(shards=shard_dict, assets=asset_dict),
+        dataset_uri,
+        resume,
+    )
+    return VanillaDataset(uri=dataset_uri, shards=shard_dict, assets=asset_dict)
+
+
+def _save_uri_config(config: dict[str, Any], uri: str, exist_ok: bool) -> None:
+    r"""Save the URI file of a shard or a dataset.
+
+    Args:
+        config: The configuration to save.
+        uri: The URI of the shard or dataset.
+        exist_ok: If ``True``, an existing URI file is overwritten,
+            otherwise an existing URI file raises an error.
+    """
+    logger.info(f"Saving URI file {uri}")
+    save_json(config, sanitize_location(uri), exist_ok=exist_ok)
+
+
+def _convert_shards(
+    tasks: list[tuple[str, BaseShard[Any], str]], fmt: str, *, num_workers: int, resume: bool
+) -> dict[str, BaseShard[Any]]:
+    r"""Convert shards and report the throughput.
+
+    Args:
+        tasks: The shards to convert, as tuples of split, shard and
+            new URI.
+        fmt: The target data format.
+        num_workers: The number of processes that convert the shards.
+        resume: If ``True``, the shards that were already converted
+            are reused.
+
+    Returns:
+        The new shards indexed by URI.
+    """
+    start = time.perf_counter()
+    nbytes_read, nbytes_written, num_converted = 0, 0, 0
+    todo = []
+    for _, shard, new_uri in tasks:
+        if sanitize_path(new_uri).is_file():
+            if not resume:
+                msg = f"The shard {new_uri} already exists"
+                raise FileExistsError(msg)
+            continue
+        todo.append((shard.get_uri(), new_uri, get_data_nbytes(shard)))
+    if len(todo) < len(tasks):
+        logger.info(f"resuming: {len(tasks) - len(todo):,} shards are already converted")
+
+    def update(nbytes: tuple[int, int]) -> None:
+        nonlocal nbytes_read, nbytes_written, num_converted
+        nbytes_read += nbytes[0]
+        nbytes_written += nbytes[1]
+        num_converted += 1
+        if num_converted % 100 == 0 or num_converted == len(todo):
+            logger.info(f"converted {num_converted:,}/{len(todo):,} shards")
+
+    if num_workers <= 1:
+        for item in todo:
+            update(_convert_shard(*item, fmt=fmt))
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(_convert_shard, *item, fmt=fmt) for item in todo]
+            for future in as_completed(futures):
+                update(future.result())
+
+    duration = time.perf_counter() - start
+    logger.info(
+        f"converted {num_converted:,} shards in {human_time(duration)}: "
+        f"{num_converted / max(duration, 1e-9):,.1f} shards/s, "
+        f"read {str_human_byte_size(nbytes_read)} "
+        f"({str_human_byte_size(int(nbytes_read / max(duration, 1e-9)))}/s), "
+        f"wrote {str_human_byte_size(nbytes_written)} "
+        f"({str_human_byte_size(int(nbytes_written / max(duration, 1e-9)))}/s)"
+    )
+    return {new_uri: shard_module.load_from_uri(new_uri) for _, _, new_uri in tasks}
+
+
+def _convert_shard(uri: str, new_uri: str, nbytes: int, fmt: str) -> tuple[int, int]:
+    r"""Convert a shard to another data format.
+
+    Args:
+        uri: The URI of the shard to convert.
+        new_uri: The URI of the new shard.
+        nbytes: The size of the data of the shard in bytes.
+        fmt: The target data format.
+
+    Returns:
+        The number of bytes read and written.
+    """
+    # A data file without URI file is left by an interrupted conversion.
+    uri_path = sanitize_path(new_uri)
+    for stale in uri_path.parent.glob(f"{uri_path.name}.*"):
+        stale.unlink()
+    data = shard_module.load_from_uri(uri).get_data()
+    new_shard = getattr(shard_module, CONVERT_FORMATS[fmt])(data, uri=new_uri)
+    return nbytes, get_data_nbytes(new_shard)
+
+
+def main(argv: list[str] | None = None) -> int:
+    r"""Implement the ``iden-convert`` command.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="iden-convert", description="Convert the shards of a dataset to another data format."
+    )
+    parser.add_argument("uri", help="the URI of the dataset to convert")
+    parser.add_argument("path", help="the directory of the new dataset")
+    parser.add_argument("--format", dest="fmt", choices=sorted(CONVERT_FORMATS), required=True)
+    parser.add_argument("--workers", type=int, default=1, help="the number of processes")
+    parser.add_argument(
+        "--no-resume",
+        dest="resume",
+        action="store_false",
+        help="fail if a converted shard already exists",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    dataset = convert_dataset(
+        args.uri, args.path, args.fmt, num_workers=args.workers, resume=args.resume
+    )
+    print(dataset.get_uri())  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
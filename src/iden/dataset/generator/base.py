@@ -8,10 +8,11 @@ import logging
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from coola.equality.tester import EqualNanEqualityTester, get_default_registry
 from objectory import AbstractFactory
 from objectory.utils import is_object_config
 
+from iden.utils.equality import register_equality_tester
+
 if TYPE_CHECKING:
     from iden.dataset import BaseDataset
 
@@ -250,4 +251,4 @@ def setup_dataset_generator(
     return dataset_generator
 
 
-get_default_registry().register(BaseDatasetGenerator, EqualNanEqualityTester(), exist_ok=True)
+register_equality_tester(BaseDatasetGenerator)
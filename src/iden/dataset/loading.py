@@ -7,11 +7,12 @@ __all__ = ["load_from_uri"]
 
 from typing import TYPE_CHECKING, TypeVar
 
-from coola.utils.path import sanitize_path
-
 from iden.constants import LOADER
 from iden.dataset.loader.base import setup_dataset_loader
 from iden.io import load_json
+from iden.observer import LoadEvent, observe_load
+from iden.storage import get_storage, sanitize_location
+from iden.utils.trace import trace_span
 
 if TYPE_CHECKING:
     from iden.dataset import BaseDataset
@@ -96,10 +97,14 @@ def load_from_uri(uri: str) -> BaseDataset[T]:
 
         ```
     """
-    path = sanitize_path(uri)
-    if not path.is_file():
+    path = sanitize_location(uri)
+    if not get_storage(path).exists(path):
         msg = f"uri file does not exist: {path}"
         raise FileNotFoundError(msg)
-    config = load_json(path)
-    loader = setup_dataset_loader(config[LOADER])
-    return loader.load(uri)
+    with (
+        trace_span("load_from_uri", category="uri", uri=uri, type="dataset"),
+        observe_load(LoadEvent(kind="uri", uri=uri, path=path, fmt="dataset")),
+    ):
+        config = load_json(path)
+        loader = setup_dataset_loader(config[LOADER])
+        return loader.load(uri)
@@ -2,22 +2,37 @@ r"""Contain the base class to implement a dataset object."""
 
 from __future__ import annotations
 
-__all__ = ["VanillaDataset", "check_shards", "create_vanilla_dataset"]
+__all__ = ["VanillaDataset", "check_shards", "create_vanilla_dataset", "extend_split"]
 
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from coola.utils.format import repr_indent, repr_mapping, str_indent, str_mapping
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import ASSETS, LOADER, SHARDS
+from iden.constants import ASSETS, LOADER, NBYTES, NUM_RECORDS, SHARDS
 from iden.dataset.base import BaseDataset
 from iden.dataset.exceptions import AssetNotFoundError, SplitNotFoundError
 from iden.io import JsonSaver, load_json
-from iden.shard import ShardDict
+from iden.shard import (
+    CompactShardSequence,
+    CompactShardTuple,
+    FileShard,
+    RecordIndex,
+    ShardDict,
+    extend_shard_tuple,
+)
+from iden.shard.exceptions import ShardExistsError
+from iden.shard.fingerprint import compute_fingerprint
+from iden.shard.partition import select_partition
+from iden.shard.utils import get_list_uris, walk_shards
+from iden.storage import sanitize_location
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from iden.cache import BaseCachePolicy, BaseDataCache
+    from iden.observer import BaseLoadObserver
     from iden.shard import BaseShard, ShardTuple
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -111,6 +126,12 @@ class VanillaDataset(BaseDataset[T]):
         check_shards(shards)
         self._shards = shards
         self._assets = assets
+        self._indices: dict[str, RecordIndex[T]] = {}
+        self._observers: list[BaseLoadObserver] = []
+        self._data_cache: BaseDataCache | None = None
+        self._cache_policy: BaseCachePolicy | None = None
+        self._fingerprint: str | None = None
+        self._has_fingerprint = False
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -139,12 +160,278 @@ class VanillaDataset(BaseDataset[T]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if type(other) is not type(self):
             return False
+        fingerprint, other_fingerprint = self.get_fingerprint(), other.get_fingerprint()
+        if fingerprint is not None and other_fingerprint is not None:
+            return fingerprint == other_fingerprint
         return (
             self.get_uri() == other.get_uri()
             and self._shards.equal(other._shards, equal_nan=equal_nan)
             and self._assets.equal(other._assets, equal_nan=equal_nan)
         )
 
+    def append_shards(self, split: str, shards: Iterable[BaseShard[T]]) -> None:
+        r"""Append shards to an existing dataset split.
+
+        Only the URI file of the split ``ShardTuple`` is rewritten.
+        The shards of the split stay sorted by ascending order of URIs.
+
+        Args:
+            split: The dataset split to extend.
+            shards: The shards to append to the split.
+
+        Raises:
+            SplitNotFoundError: if the split does not exist.
+            ShardExistsError: if one of the new shards is already in
+                the split.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.dataset import create_vanilla_dataset
+            >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = create_shard_dict(
+            ...         shards={
+            ...             "train": create_shard_tuple(
+            ...                 [
+            ...                     create_json_shard(
+            ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+            ...                     ),
+            ...                 ],
+            ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+            ...             ),
+            ...         },
+            ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+            ...     )
+            ...     assets = create_shard_dict(
+            ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+            ...     )
+            ...     dataset = create_vanilla_dataset(
+            ...         shards=shards, assets=assets, uri=Path(tmpdir).joinpath("uri").as_uri()
+            ...     )
+            ...     dataset.append_shards(
+            ...         "train",
+            ...         [create_json_shard([4, 5], uri=Path(tmpdir).joinpath("shard/uri2").as_uri())],
+            ...     )
+            ...     dataset.get_shards("train")
+            ...
+            (JsonShard(uri=file:///.../uri1), JsonShard(uri=file:///.../uri2))
+
+            ```
+        """
+        if split not in self._shards:
+            msg = f"split '{split}' does not exist"
+            raise SplitNotFoundError(msg)
+        splits = self._shards.get_data()
+        splits[split] = extend_shard_tuple(splits[split], shards)
+        self._shards = ShardDict(uri=self._shards.get_uri(), shards=splits)
+        self._indices.pop(split, None)
+        self._has_fingerprint = False
+        self._fingerprint = None
+        for observer in self._observers:
+            self._apply_load_observer(observer, add=True)
+        if self._data_cache is not None:
+            self.set_data_cache(self._data_cache)
+        if self._cache_policy is not None:
+            self.set_cache_policy(self._cache_policy)
+
+    def add_load_observer(self, observer: BaseLoadObserver) -> None:
+        r"""Add a load observer that is notified when the data of the
+        shards or assets of this dataset are loaded.
+
+        The observer is added to all the file shards of the dataset,
+        including the shards appended later with ``append_shards``.
+
+        Args:
+            observer: The observer to add.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.dataset import create_vanilla_dataset
+            >>> from iden.observer import MetricsRegistry
+            >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+            >>> metrics = MetricsRegistry()
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = create_shard_dict(
+            ...         shards={
+            ...             "train": create_shard_tuple(
+            ...                 [
+            ...                     create_json_shard(
+            ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+            ...                     ),
+            ...                 ],
+            ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+            ...             ),
+            ...         },
+            ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+            ...     )
+            ...     assets = create_shard_dict(
+            ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+            ...     )
+            ...     dataset = create_vanilla_dataset(
+            ...         shards=shards, assets=assets, uri=Path(tmpdir).joinpath("uri").as_uri()
+            ...     )
+            ...     dataset.add_load_observer(metrics)
+            ...     dataset.get_sample("train", 1)
+            ...
+            2
+            >>> metrics.get_counters()["shard/json"]["num_loads"]
+            1
+
+            ```
+        """
+        if observer not in self._observers:
+            self._observers.append(observer)
+        self._apply_load_observer(observer, add=True)
+
+    def remove_load_observer(self, observer: BaseLoadObserver) -> None:
+        r"""Remove a load observer from all the shards of the dataset.
+
+        Args:
+            observer: The observer to remove.
+        """
+        self._observers = [obs for obs in self._observers if obs is not observer]
+        self._apply_load_observer(observer, add=False)
+
+    def _apply_load_observer(self, observer: BaseLoadObserver, add: bool) -> None:
+        r"""Add or remove a load observer to all the file shards of the
+        dataset.
+
+        Args:
+            observer: The observer.
+            add: If ``True``, the observer is added, otherwise it is
+                removed.
+        """
+        for shard in self._iter_file_shards():
+            if add:
+                shard.add_load_observer(observer)
+            else:
+                shard.remove_load_observer(observer)
+
+    def _iter_file_shards(self) -> Iterator[FileShard[Any] | CompactShardTuple[Any]]:
+        r"""Iterate over the file shards of the dataset.
+
+        The shards of a ``CompactShardTuple`` are not materialized, and
+        the tuple is returned instead because it sets the load
+        observers, the data cache and the cache policy on its shards.
+
+        Returns:
+            An iterator over the file shards of the splits and assets.
+        """
+        for root in (self._shards, self._assets):
+            for shard in walk_shards(root, materialize=False):
+                if isinstance(shard, (FileShard, CompactShardTuple)):
+                    yield shard
+
+    def set_data_cache(self, cache: BaseDataCache | None) -> None:
+        r"""Set the data cache of all the file shards of the dataset.
+
+        The data cache is used when the data are loaded with
+        ``get_data(cache=True)``, for example to share the assets and
+        the hot shards between the workers of a data loader, or for
+        all the loads if it is persistent. It is also set on the
+        shards appended later with ``append_shards``.
+
+        Args:
+            cache: The data cache, or ``None`` to remove the data
+                cache.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.cache import SharedMemoryCache
+            >>> from iden.dataset import create_vanilla_dataset
+            >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+            >>> cache = SharedMemoryCache()
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = create_shard_dict(
+            ...         shards={
+            ...             "train": create_shard_tuple(
+            ...                 [
+            ...                     create_json_shard(
+            ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+            ...                     ),
+            ...                 ],
+            ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+            ...             ),
+            ...         },
+            ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+            ...     )
+            ...     assets = create_shard_dict(
+            ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+            ...     )
+            ...     dataset = create_vanilla_dataset(
+            ...         shards=shards, assets=assets, uri=Path(tmpdir).joinpath("uri").as_uri()
+            ...     )
+            ...     dataset.set_data_cache(cache)
+            ...     dataset.get_shards("train")[0].get_data(cache=True)
+            ...
+            [1, 2, 3]
+            >>> cache.clear()
+
+            ```
+        """
+        self._data_cache = cache
+        for shard in self._iter_file_shards():
+            shard.set_data_cache(cache)
+
+    def set_cache_policy(self, policy: BaseCachePolicy | None) -> None:
+        r"""Set the cache policy of all the file shards of the dataset.
+
+        The cache policy decides how long the data loaded with
+        ``get_data(cache=True)`` are kept, for example to release the
+        data of a long-running process automatically. It is also set
+        on the shards appended later with ``append_shards``.
+        ``WeakRefCachePolicy`` only works for the shards whose data
+        support weak references e.g. arrays and most objects, and it
+        raises a ``TypeError`` for the ``list`` and ``dict`` data.
+
+        Args:
+            policy: The cache policy, or ``None`` to keep the data
+                until ``clear`` is called.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.cache import TTLCachePolicy
+            >>> from iden.dataset import create_vanilla_dataset
+            >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = create_shard_dict(
+            ...         shards={
+            ...             "train": create_shard_tuple(
+            ...                 [
+            ...                     create_json_shard(
+            ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+            ...                     ),
+            ...                 ],
+            ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+            ...             ),
+            ...         },
+            ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+            ...     )
+            ...     assets = create_shard_dict(
+            ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+            ...     )
+            ...     dataset = create_vanilla_dataset(
+            ...         shards=shards, assets=assets, uri=Path(tmpdir).joinpath("uri").as_uri()
+            ...     )
+            ...     dataset.set_cache_policy(TTLCachePolicy(ttl=60.0))
+            ...     dataset.get_shards("train")[0].get_data(cache=True)
+            ...
+            [1, 2, 3]
+
+            ```
+        """
+        self._cache_policy = policy
+        for shard in self._iter_file_shards():
+            shard.set_cache_policy(policy)
+
     def get_asset(self, asset_id: str) -> BaseShard[Any]:
         if asset_id not in self._assets:
             msg = f"asset '{asset_id}' does not exist"
@@ -154,11 +441,81 @@ class VanillaDataset(BaseDataset[T]):
     def has_asset(self, asset_id: str) -> bool:
         return self._assets.has_shard(asset_id)
 
-    def get_shards(self, split: str) -> tuple[BaseShard[T], ...]:
-        if split not in self._shards:
-            msg = f"split '{split}' does not exist"
-            raise SplitNotFoundError(msg)
-        return self._shards[split].get_data()
+    def get_shards(
+        self, split: str, rank: int | None = None, world_size: int | None = None
+    ) -> Sequence[BaseShard[T]]:
+        r"""Get the shards for a given split.
+
+        The shards of a split stored in a ``CompactShardTuple`` are
+        returned as a ``CompactShardSequence``, so each shard is
+        materialized only when it is accessed.
+
+        If ``rank`` and ``world_size`` are set, the shards are
+        partitioned across the ranks so each rank gets roughly the
+        same number of bytes, based on the sizes recorded in the shard
+        metadata. The partition is deterministic, so all the ranks get
+        disjoint sets of shards.
+
+        Args:
+            split: The dataset split.
+            rank: The rank of the current process. If it is set, only
+                the shards assigned to this rank are returned.
+            world_size: The number of processes. It must be set if
+                ``rank`` is set.
+
+        Returns:
+            The shards for a given split. The shards are
+                sorted by ascending order of URI.
+
+        Raises:
+            SplitNotFoundError: if the split does not exist.
+            ValueError: if only one of ``rank`` and ``world_size`` is
+                set, or if their values are incorrect.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.dataset import create_vanilla_dataset
+            >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = create_shard_dict(
+            ...         shards={
+            ...             "train": create_shard_tuple(
+            ...                 [
+            ...                     create_json_shard(
+            ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+            ...                     ),
+            ...                     create_json_shard(
+            ...                         [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+            ...                     ),
+            ...                 ],
+            ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+            ...             ),
+            ...         },
+            ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+            ...     )
+            ...     assets = create_shard_dict(
+            ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+            ...     )
+            ...     dataset = create_vanilla_dataset(
+            ...         shards=shards, assets=assets, uri=Path(tmpdir).joinpath("uri").as_uri()
+            ...     )
+            ...     dataset.get_shards("train", rank=0, world_size=2)
+            ...     dataset.get_shards("train", rank=1, world_size=2)
+            ...
+            (JsonShard(uri=file:///.../uri2),)
+            (JsonShard(uri=file:///.../uri1),)
+
+            ```
+        """
+        shards = self._get_split_shards(split)
+        if rank is None and world_size is None:
+            return shards
+        if rank is None or world_size is None:
+            msg = f"rank and world_size must be both set (rank={rank}, world_size={world_size})"
+            raise ValueError(msg)
+        return select_partition(shards, rank=rank, world_size=world_size)
 
     def get_num_shards(self, split: str) -> int:
         if split not in self._shards:
@@ -166,15 +523,294 @@ class VanillaDataset(BaseDataset[T]):
             raise SplitNotFoundError(msg)
         return len(self._shards.get_shard(split))
 
+    def get_num_samples(self, split: str) -> int:
+        r"""Get the number of samples in a dataset split.
+
+        The number of samples is computed from the number of records
+        stored in the shard metadata. A shard without this metadata is
+        loaded once to count its records.
+
+        Args:
+            split: The dataset split.
+
+        Returns:
+            The number of samples in the dataset split.
+
+        Raises:
+            SplitNotFoundError: if the split does not exist.
+            TypeError: if the data in a shard do not have a record
+                structure.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.dataset import create_vanilla_dataset
+            >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = create_shard_dict(
+            ...         shards={
+            ...             "train": create_shard_tuple(
+            ...                 [
+            ...                     create_json_shard(
+            ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+            ...                     ),
+            ...                     create_json_shard(
+            ...                         [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+            ...                     ),
+            ...                 ],
+            ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+            ...             ),
+            ...         },
+            ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+            ...     )
+            ...     assets = create_shard_dict(
+            ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+            ...     )
+            ...     dataset = create_vanilla_dataset(
+            ...         shards=shards, assets=assets, uri=Path(tmpdir).joinpath("uri").as_uri()
+            ...     )
+            ...     dataset.get_num_samples("train")
+            ...
+            7
+
+            ```
+        """
+        return len(self._get_index(split))
+
+    def get_sample(self, split: str, index: int) -> Any:
+        r"""Get a sample in a dataset split.
+
+        The samples are numbered across the shards of the split, in
+        the shard order. Only the shard that contains the sample is
+        loaded.
+
+        Args:
+            split: The dataset split.
+            index: The index of the sample. A negative index counts
+                from the end.
+
+        Returns:
+            The sample.
+
+        Raises:
+            SplitNotFoundError: if the split does not exist.
+            IndexError: if the index is out of range.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.dataset import create_vanilla_dataset
+            >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = create_shard_dict(
+            ...         shards={
+            ...             "train": create_shard_tuple(
+            ...                 [
+            ...                     create_json_shard(
+            ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+            ...                     ),
+            ...                     create_json_shard(
+            ...                         [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+            ...                     ),
+            ...                 ],
+            ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+            ...             ),
+            ...         },
+            ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+            ...     )
+            ...     assets = create_shard_dict(
+            ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+            ...     )
+            ...     dataset = create_vanilla_dataset(
+            ...         shards=shards, assets=assets, uri=Path(tmpdir).joinpath("uri").as_uri()
+            ...     )
+            ...     dataset.get_sample("train", 4)
+            ...
+            5
+
+            ```
+        """
+        return self._get_index(split).get_record(index)
+
+    def get_slice(self, split: str, start: int, stop: int) -> Any:
+        r"""Get a contiguous slice of samples in a dataset split.
+
+        Only the shards that contain the samples are loaded, and the
+        samples are concatenated across the shards.
+
+        Args:
+            split: The dataset split.
+            start: The index of the first sample.
+            stop: The index after the last sample.
+
+        Returns:
+            The samples between ``start`` and ``stop``.
+
+        Raises:
+            SplitNotFoundError: if the split does not exist.
+            IndexError: if the split has no shards.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.dataset import create_vanilla_dataset
+            >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = create_shard_dict(
+            ...         shards={
+            ...             "train": create_shard_tuple(
+            ...                 [
+            ...                     create_json_shard(
+            ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+            ...                     ),
+            ...                     create_json_shard(
+            ...                         [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+            ...                     ),
+            ...                 ],
+            ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+            ...             ),
+            ...         },
+            ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+            ...     )
+            ...     assets = create_shard_dict(
+            ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+            ...     )
+            ...     dataset = create_vanilla_dataset(
+            ...         shards=shards, assets=assets, uri=Path(tmpdir).joinpath("uri").as_uri()
+            ...     )
+            ...     dataset.get_slice("train", 1, 5)
+            ...
+            [2, 3, 4, 5]
+
+            ```
+        """
+        return self._get_index(split).get_slice(start, stop)
+
+    def get_split_stats(self, split: str) -> dict[str, int | None]:
+        r"""Get some statistics about a dataset split.
+
+        The statistics are computed from the shard metadata, so the
+        data are not loaded.
+
+        Args:
+            split: The dataset split.
+
+        Returns:
+            The number of shards, the number of records and the number
+                of bytes in the dataset split. The number of records or
+                bytes is ``None`` if it is not recorded in the metadata
+                of one of the shards.
+
+        Raises:
+            SplitNotFoundError: if the split does not exist.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.dataset import create_vanilla_dataset
+            >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = create_shard_dict(
+            ...         shards={
+            ...             "train": create_shard_tuple(
+            ...                 [
+            ...                     create_json_shard(
+            ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+            ...                     ),
+            ...                     create_json_shard(
+            ...                         [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+            ...                     ),
+            ...                 ],
+            ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+            ...             ),
+            ...         },
+            ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+            ...     )
+            ...     assets = create_shard_dict(
+            ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+            ...     )
+            ...     dataset = create_vanilla_dataset(
+            ...         shards=shards, assets=assets, uri=Path(tmpdir).joinpath("uri").as_uri()
+            ...     )
+            ...     dataset.get_split_stats("train")
+            ...
+            {'num_shards': 2, 'num_records': 7, 'nbytes': 21}
+
+            ```
+        """
+        shards = self._get_split_shards(split)
+        if isinstance(shards, CompactShardSequence):
+            metadata = [shards.get_metadata(i) for i in range(len(shards))]
+        else:
+            metadata = [shard.get_metadata() for shard in shards]
+        stats = {"num_shards": len(metadata)}
+        for key in (NUM_RECORDS, NBYTES):
+            values = [item.get(key) for item in metadata]
+            stats[key] = None if None in values else sum(values)
+        return stats
+
     def get_splits(self) -> set[str]:
         return self._shards.get_shard_ids()
 
     def has_split(self, split: str) -> bool:
         return split in self._shards
 
+    def get_fingerprint(self) -> str | None:
+        if not self._has_fingerprint:
+            shards, assets = self._shards.get_fingerprint(), self._assets.get_fingerprint()
+            if shards is not None and assets is not None:
+                self._fingerprint = compute_fingerprint(type(self), [self._uri, shards, assets])
+            self._has_fingerprint = True
+        return self._fingerprint
+
     def get_uri(self) -> str:
         return self._uri
 
+    def _get_index(self, split: str) -> RecordIndex[T]:
+        r"""Get the record index of a dataset split.
+
+        The index is built the first time it is requested.
+
+        Args:
+            split: The dataset split.
+
+        Returns:
+            The record index of the dataset split.
+
+        Raises:
+            SplitNotFoundError: if the split does not exist.
+        """
+        if split not in self._indices:
+            self._indices[split] = RecordIndex(self._get_split_shards(split))
+        return self._indices[split]
+
+    def _get_split_shards(self, split: str) -> Sequence[BaseShard[T]]:
+        r"""Get the shards of a dataset split.
+
+        The shards of a ``CompactShardTuple`` are not materialized, and
+        a ``CompactShardSequence`` is returned instead.
+
+        Args:
+            split: The dataset split.
+
+        Returns:
+            The shards of the dataset split.
+
+        Raises:
+            SplitNotFoundError: if the split does not exist.
+        """
+        if split not in self._shards:
+            msg = f"split '{split}' does not exist"
+            raise SplitNotFoundError(msg)
+        shards = self._shards[split]
+        if isinstance(shards, CompactShardTuple):
+            return shards.get_sequence()
+        return shards.get_data()
+
     @classmethod
     def from_uri(cls, uri: str) -> VanillaDataset[T]:
         r"""Instantiate a shard from its URI.
@@ -254,7 +890,7 @@ class VanillaDataset(BaseDataset[T]):
         # local import to avoid cyclic dependencies
         from iden.shard import load_from_uri  # noqa: PLC0415
 
-        config = load_json(sanitize_path(uri))
+        config = load_json(sanitize_location(uri))
         shards = load_from_uri(config[SHARDS])
         assets = load_from_uri(config[ASSETS])
         return cls(uri=uri, shards=shards, assets=assets)
@@ -419,7 +1055,7 @@ def create_vanilla_dataset(
     """
     logger.info(f"Saving URI file {uri}")
     JsonSaver().save(
-        VanillaDataset.generate_uri_config(shards=shards, assets=assets), sanitize_path(uri)
+        VanillaDataset.generate_uri_config(shards=shards, assets=assets), sanitize_location(uri)
     )
     return VanillaDataset(uri=uri, shards=shards, assets=assets)
 
@@ -443,3 +1079,77 @@ def check_shards(shards: BaseShard[Any]) -> None:
         if not shards.get_shard(shard_id).is_sorted_by_uri():
             msg = f"split '{shard_id}' is not sorted by ascending order of URIs"
             raise RuntimeError(msg)
+
+
+def extend_split(uri: str, split: str, shards: Iterable[BaseShard[Any]]) -> None:
+    r"""Append shards to a split of a dataset stored at the given URI.
+
+    Unlike ``VanillaDataset.append_shards``, this function does not
+    load the dataset. It only reads the URI files on the path to the
+    split, and rewrites the URI file of the split ``ShardTuple``
+    atomically. The cost is proportional to the number of URIs in the
+    split, and none of the existing shards is instantiated.
+
+    Args:
+        uri: The URI of the dataset.
+        split: The dataset split to extend.
+        shards: The shards to append to the split.
+
+    Raises:
+        SplitNotFoundError: if the split does not exist.
+        ShardExistsError: if one of the new shards is already in
+            the split.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.dataset import create_vanilla_dataset, extend_split, load_from_uri
+        >>> from iden.shard import create_json_shard, create_shard_dict, create_shard_tuple
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = create_shard_dict(
+        ...         shards={
+        ...             "train": create_shard_tuple(
+        ...                 [
+        ...                     create_json_shard(
+        ...                         [1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()
+        ...                     ),
+        ...                 ],
+        ...                 uri=Path(tmpdir).joinpath("uri_train").as_uri(),
+        ...             ),
+        ...         },
+        ...         uri=Path(tmpdir).joinpath("uri_shards").as_uri(),
+        ...     )
+        ...     assets = create_shard_dict(
+        ...         shards={}, uri=Path(tmpdir).joinpath("uri_assets").as_uri()
+        ...     )
+        ...     uri = Path(tmpdir).joinpath("uri").as_uri()
+        ...     _ = create_vanilla_dataset(shards=shards, assets=assets, uri=uri)
+        ...     extend_split(
+        ...         uri,
+        ...         split="train",
+        ...         shards=[
+        ...             create_json_shard([4, 5], uri=Path(tmpdir).joinpath("shard/uri2").as_uri())
+        ...         ],
+        ...     )
+        ...     load_from_uri(uri).get_shards("train")
+        ...
+        (JsonShard(uri=file:///.../uri1), JsonShard(uri=file:///.../uri2))
+
+        ```
+    """
+    splits = load_json(sanitize_location(load_json(sanitize_location(uri))[SHARDS]))[SHARDS]
+    if split not in splits:
+        msg = f"split '{split}' does not exist"
+        raise SplitNotFoundError(msg)
+    path = sanitize_location(splits[split])
+    config = load_json(path)
+    uris = set(config[SHARDS])
+    for new_uri in get_list_uris(shards):
+        if new_uri in uris:
+            msg = f"shard `{new_uri}` already exists in `{splits[split]}`"
+            raise ShardExistsError(msg)
+        uris.add(new_uri)
+    config[SHARDS] = sorted(uris)
+    logger.info(f"Saving URI file {splits[split]}")
+    JsonSaver().save(config, path, exist_ok=True)
@@ -21,6 +21,7 @@ __all__ = [
     "TorchSaver",
     "YamlLoader",
     "YamlSaver",
+    "coalesce_ranges",
     "get_default_loader_registry",
     "is_loader_config",
     "is_saver_config",
@@ -32,6 +33,7 @@ __all__ = [
     "load_text",
     "load_torch",
     "load_yaml",
+    "read_ranges",
     "register_loaders",
     "save_cloudpickle",
     "save_joblib",
@@ -44,6 +46,8 @@ __all__ = [
     "setup_saver",
 ]
 
+from typing import TYPE_CHECKING
+
 from iden.io.base import (
     BaseFileSaver,
     BaseLoader,
@@ -53,17 +57,42 @@ from iden.io.base import (
     setup_loader,
     setup_saver,
 )
-from iden.io.cloudpickle import (
-    CloudpickleLoader,
-    CloudpickleSaver,
-    load_cloudpickle,
-    save_cloudpickle,
+from iden.utils.lazy import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from iden.io.cloudpickle import (
+        CloudpickleLoader,
+        CloudpickleSaver,
+        load_cloudpickle,
+        save_cloudpickle,
+    )
+    from iden.io.joblib import JoblibLoader, JoblibSaver, load_joblib, save_joblib
+    from iden.io.json import JsonLoader, JsonSaver, load_json, save_json
+    from iden.io.loading import get_default_loader_registry, load, register_loaders
+    from iden.io.pickle import PickleLoader, PickleSaver, load_pickle, save_pickle
+    from iden.io.ranges import coalesce_ranges, read_ranges
+    from iden.io.registry import LoaderRegistry
+    from iden.io.text import TextLoader, TextSaver, load_text, save_text
+    from iden.io.torch import TorchLoader, TorchSaver, load_torch, save_torch
+    from iden.io.yaml import YamlLoader, YamlSaver, load_yaml, save_yaml
+
+__getattr__, __dir__ = create_lazy_getattr(
+    __name__,
+    {
+        "iden.io.cloudpickle": (
+            "CloudpickleLoader",
+            "CloudpickleSaver",
+            "load_cloudpickle",
+            "save_cloudpickle",
+        ),
+        "iden.io.joblib": ("JoblibLoader", "JoblibSaver", "load_joblib", "save_joblib"),
+        "iden.io.json": ("JsonLoader", "JsonSaver", "load_json", "save_json"),
+        "iden.io.loading": ("get_default_loader_registry", "load", "register_loaders"),
+        "iden.io.pickle": ("PickleLoader", "PickleSaver", "load_pickle", "save_pickle"),
+        "iden.io.ranges": ("coalesce_ranges", "read_ranges"),
+        "iden.io.registry": ("LoaderRegistry",),
+        "iden.io.text": ("TextLoader", "TextSaver", "load_text", "save_text"),
+        "iden.io.torch": ("TorchLoader", "TorchSaver", "load_torch", "save_torch"),
+        "iden.io.yaml": ("YamlLoader", "YamlSaver", "load_yaml", "save_yaml"),
+    },
 )
-from iden.io.joblib import JoblibLoader, JoblibSaver, load_joblib, save_joblib
-from iden.io.json import JsonLoader, JsonSaver, load_json, save_json
-from iden.io.loading import get_default_loader_registry, load, register_loaders
-from iden.io.pickle import PickleLoader, PickleSaver, load_pickle, save_pickle
-from iden.io.registry import LoaderRegistry
-from iden.io.text import TextLoader, TextSaver, load_text, save_text
-from iden.io.torch import TorchLoader, TorchSaver, load_torch, save_torch
-from iden.io.yaml import YamlLoader, YamlSaver, load_yaml, save_yaml
@@ -15,16 +15,16 @@ __all__ = [
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from pathlib import Path
+from typing import Any, Generic, TypeVar
 
-from coola.equality.tester import EqualNanEqualityTester, get_default_registry
 from objectory import AbstractFactory
 from objectory.utils import is_object_config
 
 from iden.io.utils import generate_unique_tmp_path
-
-if TYPE_CHECKING:
-    from pathlib import Path
+from iden.storage import get_storage, sanitize_location
+from iden.utils.equality import register_equality_tester
+from iden.utils.trace import trace_span
 
 T = TypeVar("T")
 
@@ -74,7 +74,7 @@ class BaseLoader(ABC, Generic[T], metaclass=AbstractFactory):
         """
 
     @abstractmethod
-    def load(self, path: Path) -> T:
+    def load(self, path: Path | str) -> T:
         r"""Load the data from the given path.
 
         Args:
@@ -143,7 +143,7 @@ class BaseSaver(ABC, Generic[T], metaclass=AbstractFactory):
         """
 
     @abstractmethod
-    def save(self, to_save: T, path: Path, *, exist_ok: bool = False) -> None:
+    def save(self, to_save: T, path: Path | str, *, exist_ok: bool = False) -> None:
         r"""Save the data into the given path.
 
         Args:
@@ -190,7 +190,7 @@ class BaseFileSaver(BaseSaver[T]):
         ```
     """
 
-    def save(self, to_save: T, path: Path, *, exist_ok: bool = False) -> None:
+    def save(self, to_save: T, path: Path | str, *, exist_ok: bool = False) -> None:
         r"""Save the data into the given path.
 
         Args:
@@ -222,6 +222,11 @@ class BaseFileSaver(BaseSaver[T]):
 
             ```
         """
+        if isinstance(path, str):
+            path = sanitize_location(path)
+        if not isinstance(path, Path):
+            self._save_remote(to_save, path, exist_ok=exist_ok)
+            return
         if path.is_dir():
             msg = f"path ({path}) is a directory"
             raise IsADirectoryError(msg)
@@ -233,17 +238,41 @@ class BaseFileSaver(BaseSaver[T]):
         # Save to tmp, then commit by moving the file in case the job gets
         # interrupted while writing the file
         tmp_path = generate_unique_tmp_path(path)
-        self._save_file(to_save, tmp_path)
-        tmp_path.rename(path)
+        with trace_span(
+            "save", category="io", saver=self.__class__.__qualname__, path=path.as_posix()
+        ):
+            self._save_file(to_save, tmp_path)
+            tmp_path.rename(path)
+
+    def _save_remote(self, to_save: T, location: str, *, exist_ok: bool) -> None:
+        r"""Save the data into a location of a storage backend.
+
+        The storage backends commit the data when the file is closed,
+        so the data are written directly at the location.
+
+        Args:
+            to_save: The data to save.
+            location: The location where to save the data.
+            exist_ok: If ``False``, an exception is raised if the
+                location already exists.
+
+        Raises:
+            FileExistsError: if the location already exists.
+        """
+        if not exist_ok and get_storage(location).exists(location):
+            msg = f"path ({location}) already exists. Use `exist_ok=True` to overwrite the file"
+            raise FileExistsError(msg)
+        with trace_span("save", category="io", saver=self.__class__.__qualname__, path=location):
+            self._save_file(to_save, location)
 
     @abstractmethod
-    def _save_file(self, to_save: T, path: Path) -> None:
+    def _save_file(self, to_save: T, path: Path | str) -> None:
         r"""Save the data into the given file.
 
         Args:
             to_save: The data to save. The data should be compatible
                 with the saving engine.
-            path: The path where to save the data.
+            path: The path or URI where to save the data.
         """
 
 
@@ -359,6 +388,5 @@ def setup_saver(saver: BaseSaver[T] | dict[Any, Any]) -> BaseSaver[T]:
     return saver
 
 
-get_default_registry().register_many(
-    {BaseLoader: EqualNanEqualityTester(), BaseSaver: EqualNanEqualityTester()}, exist_ok=True
-)
+register_equality_tester(BaseLoader)
+register_equality_tester(BaseSaver)
@@ -9,15 +9,18 @@ __all__ = [
     "save_cloudpickle",
 ]
 
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from coola.equality import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
 from iden.io.base import BaseFileSaver, BaseLoader
+from iden.storage import open_file
+from iden.utils.equality import objects_are_equal
 from iden.utils.imports import check_cloudpickle, is_cloudpickle_available
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 if is_cloudpickle_available():
     import cloudpickle
 else:  # pragma: no cover
@@ -53,8 +56,8 @@ class CloudpickleLoader(BaseLoader[Any]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def load(self, path: Path) -> Any:
-        with Path.open(path, mode="rb") as file:
+    def load(self, path: Path | str) -> Any:
+        with open_file(path, mode="rb") as file:
             return cloudpickle.load(file)
 
 
@@ -93,12 +96,12 @@ class CloudpickleSaver(BaseFileSaver[Any]):
             return False
         return objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
 
-    def _save_file(self, to_save: Any, path: Path) -> None:
-        with Path.open(path, mode="wb") as file:
+    def _save_file(self, to_save: Any, path: Path | str) -> None:
+        with open_file(path, mode="wb") as file:
             cloudpickle.dump(to_save, file, **self._kwargs)
 
 
-def load_cloudpickle(path: Path) -> Any:
+def load_cloudpickle(path: Path | str) -> Any:
     r"""Load the data from a given pickle file with cloudpickle.
 
     Args:
@@ -127,7 +130,7 @@ def load_cloudpickle(path: Path) -> Any:
 
 def save_cloudpickle(
     to_save: Any,
-    path: Path,
+    path: Path | str,
     *,
     exist_ok: bool = False,
     **kwargs: Any,
@@ -9,15 +9,18 @@ __all__ = [
     "save_joblib",
 ]
 
-from pathlib import Path
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.equality import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
 from iden.io.base import BaseFileSaver, BaseLoader
+from iden.storage import open_file
+from iden.utils.equality import objects_are_equal
 from iden.utils.imports import check_joblib, is_joblib_available
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 if is_joblib_available():
     import joblib
 else:  # pragma: no cover
@@ -55,8 +58,8 @@ class JoblibLoader(BaseLoader[T]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def load(self, path: Path) -> T:
-        with Path.open(path, mode="rb") as file:
+    def load(self, path: Path | str) -> T:
+        with open_file(path, mode="rb") as file:
             return joblib.load(file)
 
 
@@ -95,12 +98,12 @@ class JoblibSaver(BaseFileSaver[T]):
             return False
         return objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
 
-    def _save_file(self, to_save: T, path: Path) -> None:
-        with Path.open(path, mode="wb") as file:
+    def _save_file(self, to_save: T, path: Path | str) -> None:
+        with open_file(path, mode="wb") as file:
             joblib.dump(to_save, file, **self._kwargs)
 
 
-def load_joblib(path: Path) -> Any:
+def load_joblib(path: Path | str) -> Any:
     r"""Load the data from a given pickle file with joblib.
 
     Args:
@@ -127,7 +130,7 @@ def load_joblib(path: Path) -> Any:
     return JoblibLoader().load(path)
 
 
-def save_joblib(to_save: Any, path: Path, *, exist_ok: bool = False, **kwargs: Any) -> None:
+def save_joblib(to_save: Any, path: Path | str, *, exist_ok: bool = False, **kwargs: Any) -> None:
     r"""Save the given data in a pickle file with joblib.
 
     Args:
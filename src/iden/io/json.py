@@ -5,10 +5,13 @@ from __future__ import annotations
 __all__ = ["JsonLoader", "JsonSaver", "load_json", "save_json"]
 
 import json
-from pathlib import Path
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from iden.io.base import BaseFileSaver, BaseLoader
+from iden.storage import open_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 T = TypeVar("T")
 
@@ -38,8 +41,8 @@ class JsonLoader(BaseLoader[T]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def load(self, path: Path) -> T:
-        with Path.open(path, mode="rb") as file:
+    def load(self, path: Path | str) -> T:
+        with open_file(path, mode="rb") as file:
             return json.load(file)
 
 
@@ -68,12 +71,12 @@ class JsonSaver(BaseFileSaver[T]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def _save_file(self, to_save: T, path: Path) -> None:
-        with Path.open(path, "w") as file:
+    def _save_file(self, to_save: T, path: Path | str) -> None:
+        with open_file(path, mode="w") as file:
             json.dump(to_save, file, sort_keys=False)
 
 
-def load_json(path: Path) -> Any:
+def load_json(path: Path | str) -> Any:
     r"""Load the data from a given JSON file.
 
     Args:
@@ -100,7 +103,7 @@ def load_json(path: Path) -> Any:
     return JsonLoader().load(path)
 
 
-def save_json(to_save: Any, path: Path, *, exist_ok: bool = False) -> None:
+def save_json(to_save: Any, path: Path | str, *, exist_ok: bool = False) -> None:
     r"""Save the given data in a JSON file.
 
     Args:
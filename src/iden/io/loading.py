@@ -6,16 +6,13 @@ __all__ = ["get_default_loader_registry", "load", "register_loaders"]
 
 from typing import TYPE_CHECKING, Any
 
-from coola.utils.imports import is_torch_available
+from objectory import OBJECT_TARGET
 
-from iden.io.joblib import JoblibLoader
 from iden.io.json import JsonLoader
 from iden.io.pickle import PickleLoader
 from iden.io.registry import LoaderRegistry
 from iden.io.text import TextLoader
-from iden.io.torch import TorchLoader
-from iden.io.yaml import YamlLoader
-from iden.utils.imports import is_joblib_available, is_yaml_available
+from iden.utils.imports import is_joblib_available, is_torch_available, is_yaml_available
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -55,7 +52,9 @@ def load(path: Path, registry: LoaderRegistry | None = None) -> Any:
     return registry.load(path)
 
 
-def register_loaders(mapping: Mapping[str, BaseLoader[Any]], exist_ok: bool = False) -> None:
+def register_loaders(
+    mapping: Mapping[str, BaseLoader[Any] | dict[Any, Any]], exist_ok: bool = False
+) -> None:
     r"""Register custom loaders to the default global registry.
 
     This allows users to add support for custom file extensions without
@@ -124,18 +123,19 @@ def _register_default_loaders(registry: LoaderRegistry) -> None:
     """
     pickle_loader = PickleLoader()
 
-    loaders: dict[str, BaseLoader[Any]] = {
+    # The loaders with optional dependencies are registered with their
+    # configuration, so their dependencies are imported when they are used.
+    loaders: dict[str, BaseLoader[Any] | dict[Any, Any]] = {
         "json": JsonLoader(),
         "pkl": pickle_loader,
         "pickle": pickle_loader,
         "txt": TextLoader(),
     }
     if is_joblib_available():
-        loaders["joblib"] = JoblibLoader()
+        loaders["joblib"] = {OBJECT_TARGET: "iden.io.joblib.JoblibLoader"}
     if is_torch_available():
-        loaders["pt"] = TorchLoader()
+        loaders["pt"] = {OBJECT_TARGET: "iden.io.torch.TorchLoader"}
     if is_yaml_available():
-        yaml_loader = YamlLoader()
-        loaders["yaml"] = yaml_loader
-        loaders["yml"] = yaml_loader
+        loaders["yaml"] = {OBJECT_TARGET: "iden.io.yaml.YamlLoader"}
+        loaders["yml"] = {OBJECT_TARGET: "iden.io.yaml.YamlLoader"}
     registry.register_many(loaders)
@@ -5,13 +5,16 @@ from __future__ import annotations
 __all__ = ["PickleLoader", "PickleSaver", "load_pickle", "save_pickle"]
 
 import pickle
-from pathlib import Path
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.equality import objects_are_equal
 from coola.utils.format import repr_mapping_line
 
 from iden.io.base import BaseFileSaver, BaseLoader
+from iden.storage import open_file
+from iden.utils.equality import objects_are_equal
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 T = TypeVar("T")
 
@@ -41,8 +44,8 @@ class PickleLoader(BaseLoader[T]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def load(self, path: Path) -> T:
-        with Path.open(path, mode="rb") as file:
+    def load(self, path: Path | str) -> T:
+        with open_file(path, mode="rb") as file:
             return pickle.load(file)  # noqa: S301
 
 
@@ -79,12 +82,12 @@ class PickleSaver(BaseFileSaver[T]):
             return False
         return objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
 
-    def _save_file(self, to_save: T, path: Path) -> None:
-        with Path.open(path, mode="wb") as file:
+    def _save_file(self, to_save: T, path: Path | str) -> None:
+        with open_file(path, mode="wb") as file:
             pickle.dump(to_save, file, **self._kwargs)
 
 
-def load_pickle(path: Path) -> Any:
+def load_pickle(path: Path | str) -> Any:
     r"""Load the data from a given pickle file.
 
     Args:
@@ -111,7 +114,7 @@ def load_pickle(path: Path) -> Any:
     return PickleLoader().load(path)
 
 
-def save_pickle(to_save: Any, path: Path, *, exist_ok: bool = False, **kwargs: Any) -> None:
+def save_pickle(to_save: Any, path: Path | str, *, exist_ok: bool = False, **kwargs: Any) -> None:
     r"""Save the given data in a pickle file.
 
     Args:
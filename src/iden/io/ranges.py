@@ -0,0 +1,123 @@
+r"""Contain functions to read byte ranges of files."""
+
+from __future__ import annotations
+
+__all__ = ["coalesce_ranges", "read_ranges"]
+
+import bisect
+from typing import TYPE_CHECKING
+
+from iden.storage import get_storage, sanitize_location
+from iden.utils.trace import trace_span
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+
+def coalesce_ranges(ranges: Sequence[tuple[int, int]], max_gap: int = 0) -> list[tuple[int, int]]:
+    r"""Coalesce byte ranges that are adjacent or close to each other.
+
+    Two ranges are merged if the gap between them is lower than or
+    equal to ``max_gap`` bytes, so reading the merged range reads at
+    most ``max_gap`` unused bytes per merge. The empty ranges are
+    ignored.
+
+    Args:
+        ranges: The byte ranges as ``(offset, length)`` tuples. The
+            ranges can be unsorted and can overlap.
+        max_gap: The maximum number of bytes between two ranges to
+            merge them.
+
+    Returns:
+        The sorted and coalesced byte ranges.
+
+    Example:
+        ```pycon
+        >>> from iden.io.ranges import coalesce_ranges
+        >>> coalesce_ranges([(10, 5), (0, 10), (20, 5)])
+        [(0, 15), (20, 5)]
+        >>> coalesce_ranges([(10, 5), (0, 10), (20, 5)], max_gap=5)
+        [(0, 25)]
+
+        ```
+    """
+    coalesced = []
+    for offset, length in sorted(ranges):
+        if length <= 0:
+            continue
+        if coalesced and offset - sum(coalesced[-1]) <= max_gap:
+            start, last = coalesced[-1]
+            coalesced[-1] = (start, max(last, offset + length - start))
+        else:
+            coalesced.append((offset, length))
+    return coalesced
+
+
+def read_ranges(
+    path: Path | str, ranges: Sequence[tuple[int, int]], max_gap: int = 0
+) -> list[memoryview]:
+    r"""Read several byte ranges of a file.
+
+    The ranges are coalesced before reading, so the adjacent ranges
+    are read with a single request to the storage backend. The
+    returned buffers are writable views on the coalesced reads, so the
+    bytes are not copied again for each range.
+
+    Args:
+        path: The path or URI to the file.
+        ranges: The byte ranges to read as ``(offset, length)``
+            tuples.
+        max_gap: The maximum number of bytes between two ranges to
+            read them with a single request.
+
+    Returns:
+        The buffers of the byte ranges, in the same order as
+            ``ranges``. A buffer is shorter than the range if the
+            range ends after the end of the file.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.io.ranges import read_ranges
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("data.bin")
+        ...     _ = path.write_bytes(b"abcdefghij")
+        ...     [bytes(buf) for buf in read_ranges(path, [(6, 2), (0, 3), (3, 2)])]
+        ...
+        [b'gh', b'abc', b'de']
+
+        ```
+    """
+    path = sanitize_location(path)
+    storage = get_storage(path)
+    chunks = []
+    with trace_span("read_ranges", category="io", num_ranges=len(ranges)):
+        for offset, length in coalesce_ranges(ranges, max_gap=max_gap):
+            data = bytearray(storage.read_range(path, offset=offset, length=length))
+            chunks.append((offset, memoryview(data)))
+    starts = [start for start, _ in chunks]
+    return [_find_buffer(chunks, starts, offset, length) for offset, length in ranges]
+
+
+def _find_buffer(
+    chunks: Sequence[tuple[int, memoryview]], starts: Sequence[int], offset: int, length: int
+) -> memoryview:
+    r"""Find the buffer of a byte range in the coalesced reads.
+
+    Args:
+        chunks: The coalesced reads as ``(offset, buffer)`` tuples,
+            sorted by offset.
+        starts: The offsets of the coalesced reads.
+        offset: The offset of the byte range.
+        length: The length of the byte range.
+
+    Returns:
+        The buffer of the byte range.
+    """
+    index = bisect.bisect_right(starts, offset) - 1
+    if index < 0 or length <= 0:
+        return memoryview(b"")
+    start, chunk = chunks[index]
+    return chunk[offset - start : offset - start + length]
@@ -13,7 +13,10 @@ from typing import TYPE_CHECKING, Any
 
 from coola.utils.format import repr_indent, repr_mapping, str_indent, str_mapping
 
-from iden.io.base import BaseLoader
+from iden.io.base import BaseLoader, setup_loader
+from iden.observer import LoadEvent, has_load_observers, observe_load
+from iden.storage import get_extension, get_storage
+from iden.utils.trace import trace_span
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -28,9 +31,15 @@ class LoaderRegistry(BaseLoader[Any]):
     that handle loading files with those extensions. It provides automatic
     dispatching to the appropriate loader based on a file's extension.
 
+    A loader can be registered with its configuration, which is
+    instantiated the first time a file with this extension is loaded.
+    The module of the loader is not imported before, so the optional
+    dependencies of the formats that are not used are not imported.
+
     Args:
-        registry: Optional initial mapping of extensions to loaders. If provided,
-            the registry is copied to prevent external mutations.
+        registry: Optional initial mapping of extensions to loaders or
+            loader configurations. If provided, the registry is copied
+            to prevent external mutations.
 
     Attributes:
         _registry: Internal mapping of registered extensions to loaders
@@ -59,8 +68,10 @@ class LoaderRegistry(BaseLoader[Any]):
         ```
     """
 
-    def __init__(self, registry: dict[str, BaseLoader[Any]] | None = None) -> None:
-        self._registry: dict[str, BaseLoader[Any]] = registry.copy() if registry else {}
+    def __init__(self, registry: dict[str, BaseLoader[Any] | dict[Any, Any]] | None = None) -> None:
+        self._registry: dict[str, BaseLoader[Any] | dict[Any, Any]] = (
+            registry.copy() if registry else {}
+        )
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(\n  {repr_indent(repr_mapping(self._registry))}\n)"
@@ -71,15 +82,21 @@ class LoaderRegistry(BaseLoader[Any]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def load(self, path: Path) -> Any:
-        extension = "".join(path.suffixes)[1:]
+    def load(self, path: Path | str) -> Any:
+        extension = get_extension(path)
         loader = self.find_loader(extension)
-        return loader.load(path)
+        with trace_span("load", category="io", loader=loader.__class__.__qualname__):
+            if not has_load_observers():
+                return loader.load(path)
+            storage = get_storage(path)
+            nbytes = storage.stat(path).size if storage.exists(path) else None
+            with observe_load(LoadEvent(kind="file", path=path, fmt=extension, nbytes=nbytes)):
+                return loader.load(path)
 
     def register(
         self,
         extension: str,
-        loader: BaseLoader[Any],
+        loader: BaseLoader[Any] | dict[Any, Any],
         exist_ok: bool = False,
     ) -> None:
         r"""Register a loader for a given file extension.
@@ -89,7 +106,9 @@ class LoaderRegistry(BaseLoader[Any]):
 
         Args:
             extension: The file extension to register (e.g., "json", "txt")
-            loader: The loader instance that handles files with this extension
+            loader: The loader instance that handles files with this extension,
+                or its configuration. The configuration is instantiated the
+                first time the loader is needed.
             exist_ok: If False (default), raises an error if the extension is already
                 registered. If True, overwrites the existing registration silently.
 
@@ -105,6 +124,9 @@ class LoaderRegistry(BaseLoader[Any]):
             LoaderRegistry(
               (json): JsonLoader()
             )
+            >>> registry.register("txt", {"_target_": "iden.io.TextLoader"})
+            >>> registry.find_loader("txt")
+            TextLoader(encoding=utf-8)
 
             ```
         """
@@ -118,7 +140,7 @@ class LoaderRegistry(BaseLoader[Any]):
 
     def register_many(
         self,
-        mapping: Mapping[str, BaseLoader[Any]],
+        mapping: Mapping[str, BaseLoader[Any] | dict[Any, Any]],
         exist_ok: bool = False,
     ) -> None:
         r"""Register multiple loaders at once.
@@ -128,6 +150,7 @@ class LoaderRegistry(BaseLoader[Any]):
 
         Args:
             mapping: Dictionary mapping file extensions to loader instances
+                or configurations
             exist_ok: If False (default), raises an error if any extension is already
                 registered. If True, overwrites existing registrations silently.
 
@@ -197,6 +220,8 @@ class LoaderRegistry(BaseLoader[Any]):
             ```
         """
         if (loader := self._registry.get(extension, None)) is not None:
+            if isinstance(loader, dict):
+                loader = self._registry[extension] = setup_loader(loader)
             return loader
         msg = f"Incorrect extension: {extension}"
         raise ValueError(msg)
@@ -7,6 +7,7 @@ __all__ = [
     "NumpySafetensorsLoader",
     "NumpySafetensorsSaver",
     "NumpySaver",
+    "SafetensorsReader",
     "TorchLoader",
     "TorchSafetensorsLoader",
     "TorchSafetensorsSaver",
@@ -17,6 +18,7 @@ from iden.io.safetensors.loaders import NumpySafetensorsLoader
 from iden.io.safetensors.loaders import NumpySafetensorsLoader as NumpyLoader
 from iden.io.safetensors.loaders import TorchSafetensorsLoader
 from iden.io.safetensors.loaders import TorchSafetensorsLoader as TorchLoader
+from iden.io.safetensors.reader import SafetensorsReader
 from iden.io.safetensors.savers import NumpySafetensorsSaver
 from iden.io.safetensors.savers import NumpySafetensorsSaver as NumpySaver
 from iden.io.safetensors.savers import TorchSafetensorsSaver
@@ -4,23 +4,24 @@ from __future__ import annotations
 
 __all__ = ["NumpySafetensorsLoader", "TorchSafetensorsLoader"]
 
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from coola.equality import objects_are_equal
 from coola.utils.imports import (
     check_numpy,
     check_torch,
     is_numpy_available,
     is_torch_available,
 )
-from coola.utils.path import sanitize_path
 
 from iden.io.base import BaseLoader
+from iden.io.safetensors.reader import SafetensorsReader
+from iden.storage import open_file, sanitize_location
+from iden.utils.equality import objects_are_equal
 from iden.utils.imports import check_safetensors, is_safetensors_available
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
+    from collections.abc import Sequence
 
 if TYPE_CHECKING or (is_safetensors_available() and is_numpy_available()):
     import numpy as np
@@ -56,8 +57,46 @@ class NumpySafetensorsLoader(BaseLoader[dict[str, np.ndarray]]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def load(self, path: Path) -> dict[str, np.ndarray]:
-        return sn.load_file(sanitize_path(path))
+    def load(self, path: Path | str) -> dict[str, np.ndarray]:
+        path = sanitize_location(path)
+        if isinstance(path, Path):
+            return sn.load_file(path)
+        with open_file(path, mode="rb") as file:
+            return sn.load(file.read())
+
+    def load_keys(self, path: Path | str, keys: Sequence[str]) -> dict[str, np.ndarray]:
+        r"""Load some arrays of a safetensors file.
+
+        Only the header and the byte ranges of the requested arrays are
+        read, so loading one array of a large file does not read the
+        whole file.
+
+        Args:
+            path: The path or URI to the safetensors file.
+            keys: The keys of the arrays to load.
+
+        Returns:
+            The arrays.
+
+        Raises:
+            KeyError: if a key does not exist in the file.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> import numpy as np
+            >>> from pathlib import Path
+            >>> from iden.io.safetensors import NumpyLoader, NumpySaver
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     path = Path(tmpdir).joinpath("data.safetensors")
+            ...     NumpySaver().save({"key1": np.ones((2, 3)), "key2": np.arange(5)}, path)
+            ...     NumpyLoader().load_keys(path, ["key2"])
+            ...
+            {'key2': array([0, 1, 2, 3, 4])}
+
+            ```
+        """
+        return SafetensorsReader(path).read_numpy(keys)
 
 
 class TorchSafetensorsLoader(BaseLoader[dict[str, torch.Tensor]]):
@@ -80,5 +119,44 @@ class TorchSafetensorsLoader(BaseLoader[dict[str, torch.Tensor]]):
             return False
         return objects_are_equal(self._device, other._device, equal_nan=equal_nan)
 
-    def load(self, path: Path) -> dict[str, torch.Tensor]:
-        return st.load_file(sanitize_path(path), device=self._device)
+    def load(self, path: Path | str) -> dict[str, torch.Tensor]:
+        path = sanitize_location(path)
+        if isinstance(path, Path):
+            return st.load_file(path, device=self._device)
+        with open_file(path, mode="rb") as file:
+            data = st.load(file.read())
+        return {key: value.to(self._device) for key, value in data.items()}
+
+    def load_keys(self, path: Path | str, keys: Sequence[str]) -> dict[str, torch.Tensor]:
+        r"""Load some tensors of a safetensors file.
+
+        Only the header and the byte ranges of the requested tensors
+        are read, so loading one tensor of a large file does not read
+        the whole file.
+
+        Args:
+            path: The path or URI to the safetensors file.
+            keys: The keys of the tensors to load.
+
+        Returns:
+            The tensors.
+
+        Raises:
+            KeyError: if a key does not exist in the file.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> import torch
+            >>> from pathlib import Path
+            >>> from iden.io.safetensors import TorchLoader, TorchSaver
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     path = Path(tmpdir).joinpath("data.safetensors")
+            ...     TorchSaver().save({"key1": torch.ones(2, 3), "key2": torch.arange(5)}, path)
+            ...     TorchLoader().load_keys(path, ["key2"])
+            ...
+            {'key2': tensor([0, 1, 2, 3, 4])}
+
+            ```
+        """
+        return SafetensorsReader(path).read_torch(keys, device=self._device)
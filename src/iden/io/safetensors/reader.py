@@ -0,0 +1,340 @@
+r"""Contain a reader to load some tensors of a safetensors file without
+reading the whole file."""
+
+from __future__ import annotations
+
+__all__ = ["SafetensorsReader"]
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from coola.utils.imports import (
+    check_numpy,
+    check_torch,
+    is_numpy_available,
+    is_torch_available,
+)
+
+from iden.io.ranges import read_ranges
+from iden.storage import get_storage, location_to_str, sanitize_location
+
+if TYPE_CHECKING or is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    from coola.utils.fallback.numpy import numpy as np
+
+if TYPE_CHECKING or is_torch_available():
+    import torch
+else:  # pragma: no cover
+    from coola.utils.fallback.torch import torch
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+# The safetensors files start with the size of the JSON header, encoded
+# as a little-endian unsigned 64-bit integer.
+_HEADER_SIZE_NBYTES = 8
+_METADATA_KEY = "__metadata__"
+
+_NUMPY_DTYPES = {
+    "BOOL": "bool",
+    "U8": "uint8",
+    "I8": "int8",
+    "U16": "<u2",
+    "I16": "<i2",
+    "F16": "<f2",
+    "U32": "<u4",
+    "I32": "<i4",
+    "F32": "<f4",
+    "U64": "<u8",
+    "I64": "<i8",
+    "F64": "<f8",
+}
+
+# The names of the torch dtypes. Some dtypes are not available in the
+# old versions of torch.
+_TORCH_DTYPES = {
+    "BOOL": "bool",
+    "U8": "uint8",
+    "I8": "int8",
+    "U16": "uint16",
+    "I16": "int16",
+    "F16": "float16",
+    "BF16": "bfloat16",
+    "U32": "uint32",
+    "I32": "int32",
+    "F32": "float32",
+    "U64": "uint64",
+    "I64": "int64",
+    "F64": "float64",
+    "F8_E4M3": "float8_e4m3fn",
+    "F8_E5M2": "float8_e5m2",
+}
+
+
+class SafetensorsReader:
+    r"""Implement a reader to load some tensors of a safetensors file.
+
+    The reader reads the header of the file first, which gives the
+    byte offsets of each tensor, and then only reads the byte ranges
+    of the requested tensors. The byte ranges of the tensors are
+    coalesced, so the adjacent tensors are read with a single request
+    to the storage backend. Reading one tensor of a large file on a
+    remote storage costs the header and the bytes of this tensor. The
+    header is read once and cached by the reader.
+
+    Args:
+        path: The path or URI to the safetensors file.
+        max_gap: The maximum number of bytes between two tensors to
+            read them with a single request. Increasing it reduces the
+            number of requests on remote storage, at the cost of
+            reading some unused bytes.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> import numpy as np
+        >>> from pathlib import Path
+        >>> from iden.io.safetensors import NumpySaver, SafetensorsReader
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("data.safetensors")
+        ...     NumpySaver().save({"key1": np.ones((2, 3)), "key2": np.arange(5)}, path)
+        ...     reader = SafetensorsReader(path)
+        ...     reader.keys()
+        ...     reader.read_numpy(["key2"])
+        ...
+        ['key1', 'key2']
+        {'key2': array([0, 1, 2, 3, 4])}
+
+        ```
+    """
+
+    def __init__(self, path: Path | str, max_gap: int = 0) -> None:
+        self._path = sanitize_location(path)
+        self._max_gap = max_gap
+        self._header: dict[str, Any] | None = None
+        self._data_offset = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={location_to_str(self._path)}, "
+            f"max_gap={self._max_gap:,})"
+        )
+
+    @property
+    def path(self) -> Path | str:
+        r"""The path to the safetensors file."""
+        return self._path
+
+    def get_header(self) -> dict[str, dict[str, Any]]:
+        r"""Get the information about the tensors in the file.
+
+        Returns:
+            The dictionary with the dtype, the shape and the byte
+                offsets (relative to the start of the data) of each
+                tensor.
+
+        Raises:
+            ValueError: if the header is invalid.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> import numpy as np
+            >>> from pathlib import Path
+            >>> from iden.io.safetensors import NumpySaver, SafetensorsReader
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     path = Path(tmpdir).joinpath("data.safetensors")
+            ...     NumpySaver().save({"key": np.arange(5)}, path)
+            ...     SafetensorsReader(path).get_header()
+            ...
+            {'key': {'dtype': 'I64', 'shape': [5], 'data_offsets': [0, 40]}}
+
+            ```
+        """
+        return {key: info for key, info in self._get_header().items() if key != _METADATA_KEY}
+
+    def get_metadata(self) -> dict[str, str]:
+        r"""Get the metadata stored in the header of the file.
+
+        Returns:
+            The metadata. The dictionary is empty if the file does not
+                have metadata.
+
+        Raises:
+            ValueError: if the header is invalid.
+        """
+        return dict(self._get_header().get(_METADATA_KEY) or {})
+
+    def keys(self) -> list[str]:
+        r"""Get the keys of the tensors in the file.
+
+        Returns:
+            The sorted keys.
+
+        Raises:
+            ValueError: if the header is invalid.
+        """
+        return sorted(self.get_header())
+
+    def read_numpy(self, keys: Sequence[str] | None = None) -> dict[str, np.ndarray]:
+        r"""Read some tensors as ``numpy.ndarray``s.
+
+        Args:
+            keys: The keys of the tensors to read. If ``None``, all
+                the tensors are read.
+
+        Returns:
+            The arrays.
+
+        Raises:
+            KeyError: if a key does not exist in the file.
+            RuntimeError: if ``numpy`` is not installed.
+            ValueError: if a tensor has a dtype that is not supported
+                by ``numpy`` or if the file is truncated.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> import numpy as np
+            >>> from pathlib import Path
+            >>> from iden.io.safetensors import NumpySaver, SafetensorsReader
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     path = Path(tmpdir).joinpath("data.safetensors")
+            ...     NumpySaver().save({"key1": np.ones((2, 3)), "key2": np.arange(5)}, path)
+            ...     SafetensorsReader(path).read_numpy(["key1"])
+            ...
+            {'key1': array([[1., 1., 1.], [1., 1., 1.]])}
+
+            ```
+        """
+        check_numpy()
+        arrays = {}
+        for key, (info, buffer) in self._read_buffers(keys).items():
+            dtype = _NUMPY_DTYPES.get(info["dtype"])
+            if dtype is None:
+                msg = f"Tensor {key!r} has a dtype ({info['dtype']}) that is not supported by numpy"
+                raise ValueError(msg)
+            dtype = np.dtype(dtype)
+            if len(buffer) == 0:
+                arrays[key] = np.empty(info["shape"], dtype=dtype)
+            else:
+                arrays[key] = np.frombuffer(buffer, dtype=dtype).reshape(info["shape"])
+        return arrays
+
+    def read_torch(
+        self, keys: Sequence[str] | None = None, device: str | int = "cpu"
+    ) -> dict[str, torch.Tensor]:
+        r"""Read some tensors as ``torch.Tensor``s.
+
+        Args:
+            keys: The keys of the tensors to read. If ``None``, all
+                the tensors are read.
+            device: The device where to put the tensors.
+
+        Returns:
+            The tensors.
+
+        Raises:
+            KeyError: if a key does not exist in the file.
+            RuntimeError: if ``torch`` is not installed.
+            ValueError: if a tensor has a dtype that is not supported
+                by ``torch`` or if the file is truncated.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> import torch
+            >>> from pathlib import Path
+            >>> from iden.io.safetensors import TorchSaver, SafetensorsReader
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     path = Path(tmpdir).joinpath("data.safetensors")
+            ...     TorchSaver().save({"key1": torch.ones(2, 3), "key2": torch.arange(5)}, path)
+            ...     SafetensorsReader(path).read_torch(["key2"])
+            ...
+            {'key2': tensor([0, 1, 2, 3, 4])}
+
+            ```
+        """
+        check_torch()
+        tensors = {}
+        for key, (info, buffer) in self._read_buffers(keys).items():
+            name = _TORCH_DTYPES.get(info["dtype"])
+            dtype = getattr(torch, name, None) if name is not None else None
+            if dtype is None:
+                msg = f"Tensor {key!r} has a dtype ({info['dtype']}) that is not supported by torch"
+                raise ValueError(msg)
+            if len(buffer) == 0:
+                tensor = torch.empty(info["shape"], dtype=dtype)
+            else:
+                tensor = torch.frombuffer(buffer, dtype=dtype).reshape(info["shape"])
+            tensors[key] = tensor.to(device)
+        return tensors
+
+    def _get_header(self) -> dict[str, Any]:
+        r"""Get the header of the file, and read it if it is not cached.
+
+        Returns:
+            The header, including the metadata.
+
+        Raises:
+            ValueError: if the header is invalid.
+        """
+        if self._header is None:
+            storage = get_storage(self._path)
+            data = storage.read_range(self._path, offset=0, length=_HEADER_SIZE_NBYTES)
+            if len(data) < _HEADER_SIZE_NBYTES:
+                msg = f"Invalid safetensors file {location_to_str(self._path)}: missing header"
+                raise ValueError(msg)
+            size = int.from_bytes(data, byteorder="little")
+            data = storage.read_range(self._path, offset=_HEADER_SIZE_NBYTES, length=size)
+            if len(data) < size:
+                msg = f"Invalid safetensors file {location_to_str(self._path)}: truncated header"
+                raise ValueError(msg)
+            try:
+                header = json.loads(data)
+            except ValueError as exc:
+                msg = f"Invalid safetensors file {location_to_str(self._path)}: {exc}"
+                raise ValueError(msg) from exc
+            if not isinstance(header, dict):
+                msg = f"Invalid safetensors file {location_to_str(self._path)}: incorrect header"
+                raise ValueError(msg)
+            self._header = header
+            self._data_offset = _HEADER_SIZE_NBYTES + size
+        return self._header
+
+    def _read_buffers(
+        self, keys: Sequence[str] | None
+    ) -> dict[str, tuple[dict[str, Any], memoryview]]:
+        r"""Read the buffers of some tensors.
+
+        Args:
+            keys: The keys of the tensors to read. If ``None``, all
+                the tensors are read.
+
+        Returns:
+            The information and the buffer of each tensor.
+
+        Raises:
+            KeyError: if a key does not exist in the file.
+            ValueError: if the file is truncated.
+        """
+        header = self.get_header()
+        if keys is None:
+            keys = sorted(header)
+        missing = [key for key in keys if key not in header]
+        if missing:
+            msg = f"Keys {missing} do not exist in {location_to_str(self._path)}"
+            raise KeyError(msg)
+        infos = [header[key] for key in keys]
+        ranges = [
+            (self._data_offset + start, end - start)
+            for start, end in (info["data_offsets"] for info in infos)
+        ]
+        buffers = read_ranges(self._path, ranges, max_gap=self._max_gap)
+        for key, (_, length), buffer in zip(keys, ranges, buffers):
+            if len(buffer) != length:
+                msg = f"Invalid safetensors file {location_to_str(self._path)}: tensor {key!r} is truncated"
+                raise ValueError(msg)
+        return {key: (info, buffer) for key, info, buffer in zip(keys, infos, buffers)}
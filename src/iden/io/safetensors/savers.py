@@ -4,6 +4,7 @@ from __future__ import annotations
 
 __all__ = ["NumpySafetensorsSaver", "TorchSafetensorsSaver"]
 
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from coola.utils.imports import (
@@ -14,12 +15,9 @@ from coola.utils.imports import (
 )
 
 from iden.io.base import BaseFileSaver
+from iden.storage import open_file
 from iden.utils.imports import check_safetensors, is_safetensors_available
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
-
 if TYPE_CHECKING or (is_safetensors_available() and is_numpy_available()):
     import numpy as np
     from safetensors import numpy as sn
@@ -56,8 +54,12 @@ class NumpySafetensorsSaver(BaseFileSaver[dict[str, np.ndarray]]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def _save_file(self, to_save: dict[str, np.ndarray], path: Path) -> None:
-        sn.save_file(to_save, path)
+    def _save_file(self, to_save: dict[str, np.ndarray], path: Path | str) -> None:
+        if isinstance(path, Path):
+            sn.save_file(to_save, path)
+            return
+        with open_file(path, mode="wb") as file:
+            file.write(sn.save(to_save))
 
 
 class TorchSafetensorsSaver(BaseFileSaver[dict[str, torch.Tensor]]):
@@ -79,5 +81,9 @@ class TorchSafetensorsSaver(BaseFileSaver[dict[str, torch.Tensor]]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def _save_file(self, to_save: dict[str, torch.Tensor], path: Path) -> None:
-        st.save_file(to_save, path)
+    def _save_file(self, to_save: dict[str, torch.Tensor], path: Path | str) -> None:
+        if isinstance(path, Path):
+            st.save_file(to_save, path)
+            return
+        with open_file(path, mode="wb") as file:
+            file.write(st.save(to_save))
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 __all__ = ["TextLoader", "TextSaver", "load_text", "save_text"]
 
-from pathlib import Path
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from iden.io.base import BaseFileSaver, BaseLoader
+from iden.storage import open_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 T = TypeVar("T")
 
@@ -48,8 +51,8 @@ class TextLoader(BaseLoader[str]):
             return False
         return self._encoding == other._encoding
 
-    def load(self, path: Path) -> str:
-        with Path.open(path, encoding=self._encoding) as file:
+    def load(self, path: Path | str) -> str:
+        with open_file(path, mode="r", encoding=self._encoding) as file:
             return file.read()
 
 
@@ -91,12 +94,12 @@ class TextSaver(BaseFileSaver[str]):
             return False
         return self._encoding == other._encoding
 
-    def _save_file(self, to_save: str, path: Path) -> None:
-        with Path.open(path, mode="w", encoding=self._encoding) as file:
+    def _save_file(self, to_save: str, path: Path | str) -> None:
+        with open_file(path, mode="w", encoding=self._encoding) as file:
             file.write(str(to_save))
 
 
-def load_text(path: Path, encoding: str = DEFAULT_ENCODING) -> str:
+def load_text(path: Path | str, encoding: str = DEFAULT_ENCODING) -> str:
     r"""Load the data from a given text file.
 
     Args:
@@ -127,7 +130,7 @@ def load_text(path: Path, encoding: str = DEFAULT_ENCODING) -> str:
 
 def save_text(
     to_save: Any,
-    path: Path,
+    path: Path | str,
     *,
     encoding: str = DEFAULT_ENCODING,
     exist_ok: bool = False,
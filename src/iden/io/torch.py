@@ -4,22 +4,22 @@ from __future__ import annotations
 
 __all__ = ["TorchLoader", "TorchSaver", "load_torch", "save_torch"]
 
-from typing import TYPE_CHECKING, Any, TypeVar
+import io
+from pathlib import Path
+from typing import Any, TypeVar
 
-from coola.equality import objects_are_equal
 from coola.utils.format import repr_mapping_line
 from coola.utils.imports import check_torch, is_torch_available
 
 from iden.io.base import BaseFileSaver, BaseLoader
+from iden.storage import open_file, sanitize_location
+from iden.utils.equality import objects_are_equal
 
 if is_torch_available():
     import torch
 else:  # pragma: no cover
     from coola.utils.fallback.torch import torch
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 T = TypeVar("T")
 
 
@@ -57,8 +57,12 @@ class TorchLoader(BaseLoader[T]):
             return False
         return objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
 
-    def load(self, path: Path) -> T:
-        return torch.load(path, **self._kwargs)
+    def load(self, path: Path | str) -> T:
+        path = sanitize_location(path)
+        if isinstance(path, Path):
+            return torch.load(path, **self._kwargs)
+        with open_file(path, mode="rb") as file:
+            return torch.load(io.BytesIO(file.read()), **self._kwargs)
 
 
 class TorchSaver(BaseFileSaver[T]):
@@ -95,11 +99,15 @@ class TorchSaver(BaseFileSaver[T]):
             return False
         return objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
 
-    def _save_file(self, to_save: T, path: Path) -> None:
-        torch.save(to_save, path, **self._kwargs)
+    def _save_file(self, to_save: T, path: Path | str) -> None:
+        if isinstance(path, Path):
+            torch.save(to_save, path, **self._kwargs)
+            return
+        with open_file(path, mode="wb") as file:
+            torch.save(to_save, file, **self._kwargs)
 
 
-def load_torch(path: Path, **kwargs: Any) -> Any:
+def load_torch(path: Path | str, **kwargs: Any) -> Any:
     r"""Load the data from a given PyTorch file.
 
     Args:
@@ -127,7 +135,7 @@ def load_torch(path: Path, **kwargs: Any) -> Any:
     return TorchLoader(**kwargs).load(path)
 
 
-def save_torch(to_save: Any, path: Path, *, exist_ok: bool = False, **kwargs: Any) -> None:
+def save_torch(to_save: Any, path: Path | str, *, exist_ok: bool = False, **kwargs: Any) -> None:
     r"""Save the given data in a PyTorch file.
 
     Args:
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 __all__ = ["YamlLoader", "YamlSaver", "load_yaml", "save_yaml"]
 
-from pathlib import Path
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from iden.io.base import BaseFileSaver, BaseLoader
+from iden.storage import open_file
 from iden.utils.imports import check_yaml, is_yaml_available
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 if is_yaml_available():
     import yaml
 else:  # pragma: no cover
@@ -47,8 +50,8 @@ class YamlLoader(BaseLoader[T]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def load(self, path: Path) -> T:
-        with Path.open(path, mode="rb") as file:
+    def load(self, path: Path | str) -> T:
+        with open_file(path, mode="rb") as file:
             return yaml.safe_load(file)
 
 
@@ -80,12 +83,12 @@ class YamlSaver(BaseFileSaver[T]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         return type(other) is type(self)
 
-    def _save_file(self, to_save: T, path: Path) -> None:
-        with Path.open(path, mode="w") as file:
+    def _save_file(self, to_save: T, path: Path | str) -> None:
+        with open_file(path, mode="w") as file:
             yaml.dump(to_save, file, Dumper=yaml.Dumper)
 
 
-def load_yaml(path: Path) -> Any:
+def load_yaml(path: Path | str) -> Any:
     r"""Load the data from a given YAML file.
 
     Args:
@@ -112,7 +115,7 @@ def load_yaml(path: Path) -> Any:
     return YamlLoader().load(path)
 
 
-def save_yaml(to_save: Any, path: Path, *, exist_ok: bool = False) -> None:
+def save_yaml(to_save: Any, path: Path | str, *, exist_ok: bool = False) -> None:
     r"""Save the given data in a YAML file.
 
     Args:
@@ -0,0 +1,26 @@
+r"""Contain the load observers used to instrument the loads of shards
+and datasets."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BaseLoadObserver",
+    "LatencyHistogram",
+    "LoadEvent",
+    "MetricsRegistry",
+    "get_load_observers",
+    "has_load_observers",
+    "observe_load",
+    "register_load_observer",
+    "unregister_load_observer",
+]
+
+from iden.observer.base import BaseLoadObserver, LoadEvent
+from iden.observer.metrics import LatencyHistogram, MetricsRegistry
+from iden.observer.registry import (
+    get_load_observers,
+    has_load_observers,
+    observe_load,
+    register_load_observer,
+    unregister_load_observer,
+)
@@ -0,0 +1,96 @@
+r"""Contain the base class to implement a load observer and the load
+event."""
+
+from __future__ import annotations
+
+__all__ = ["BaseLoadObserver", "LoadEvent"]
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass(frozen=True)
+class LoadEvent:
+    r"""Define an event sent to the load observers.
+
+    The same event is sent when the load starts and when it ends.
+    ``duration`` and ``error`` are only set in the end event.
+
+    Args:
+        kind: The kind of load. ``'shard'`` means the data of a shard
+            are loaded, ``'file'`` means a file is loaded by a loader
+            registry, and ``'uri'`` means a shard or a dataset is
+            loaded from its URI.
+        uri: The URI of the shard or dataset, if any.
+        path: The path to the file that is read, if any.
+        fmt: The data format. It is the file extension without the
+            leading dot e.g. ``'json'`` or ``'safetensors'``, or
+            ``'shard'``/``'dataset'`` for the ``'uri'`` loads.
+        nbytes: The number of bytes of the file, if known.
+        cached: ``True`` if the data were served by the shard cache,
+            ``False`` if they were read, ``None`` if the load does not
+            use a cache.
+        duration: The duration of the load in seconds.
+        error: The exception raised by the load, if any.
+
+    Example:
+        ```pycon
+        >>> from iden.observer import LoadEvent
+        >>> event = LoadEvent(kind="shard", uri="file:///data/uri", fmt="json", nbytes=9)
+        >>> event.kind, event.fmt, event.nbytes
+        ('shard', 'json', 9)
+
+        ```
+    """
+
+    kind: str
+    uri: str | None = None
+    path: Path | str | None = None
+    fmt: str | None = None
+    nbytes: int | None = None
+    cached: bool | None = None
+    duration: float | None = None
+    error: BaseException | None = None
+
+
+class BaseLoadObserver:
+    r"""Define the base class to implement a load observer.
+
+    A load observer is notified when a load starts and ends. The
+    default implementation of the hooks does nothing, so a child class
+    only needs to implement the hooks it uses. The hooks are called in
+    the thread that loads the data, so they should be fast and
+    thread-safe. An exception raised by a hook is logged and does not
+    stop the load.
+
+    Example:
+        ```pycon
+        >>> from iden.observer import BaseLoadObserver, LoadEvent
+        >>> class PrintObserver(BaseLoadObserver):
+        ...     def on_load_end(self, event: LoadEvent) -> None:
+        ...         print(event.kind, event.uri)
+        ...
+        >>> observer = PrintObserver()
+        >>> observer.on_load_end(LoadEvent(kind="shard", uri="file:///data/uri"))
+        shard file:///data/uri
+
+        ```
+    """
+
+    def on_load_start(self, event: LoadEvent) -> None:
+        r"""Call the hook when a load starts.
+
+        Args:
+            event: The load event.
+        """
+
+    def on_load_end(self, event: LoadEvent) -> None:
+        r"""Call the hook when a load ends, successfully or not.
+
+        Args:
+            event: The load event, with the duration and the
+                exception raised by the load if any.
+        """
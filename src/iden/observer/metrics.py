@@ -0,0 +1,300 @@
+r"""Contain an in-process metrics registry that aggregates the load
+events."""
+
+from __future__ import annotations
+
+__all__ = ["DEFAULT_LATENCY_BUCKETS", "LatencyHistogram", "MetricsRegistry"]
+
+import bisect
+import copy
+import heapq
+import threading
+from typing import TYPE_CHECKING, Any
+
+from iden.observer.base import BaseLoadObserver
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from iden.observer.base import LoadEvent
+
+# The upper bounds of the latency buckets in seconds, from 100us to 10s.
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class LatencyHistogram:
+    r"""Implement a latency histogram with fixed buckets.
+
+    Args:
+        buckets: The upper bounds of the buckets in seconds, in
+            ascending order. An extra bucket counts the values above
+            the last bound.
+
+    Raises:
+        ValueError: if the bounds are empty or not sorted.
+
+    Example:
+        ```pycon
+        >>> from iden.observer import LatencyHistogram
+        >>> histogram = LatencyHistogram(buckets=[0.1, 1.0])
+        >>> for value in [0.05, 0.2, 0.3, 2.0]:
+        ...     histogram.observe(value)
+        ...
+        >>> histogram
+        LatencyHistogram(count=4, total=2.55, buckets=(0.1, 1.0))
+        >>> histogram.get_counts()
+        {0.1: 1, 1.0: 2, inf: 1}
+        >>> histogram.quantile(0.5)
+        1.0
+
+        ```
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        buckets = tuple(float(bound) for bound in buckets)
+        if not buckets or list(buckets) != sorted(buckets):
+            msg = f"buckets must be a non-empty sequence in ascending order: {buckets}"
+            raise ValueError(msg)
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._total = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(count={self._count:,}, total={self._total:.6g}, "
+            f"buckets={self._buckets})"
+        )
+
+    @property
+    def count(self) -> int:
+        r"""The number of observed values."""
+        return self._count
+
+    @property
+    def total(self) -> float:
+        r"""The sum of the observed values."""
+        return self._total
+
+    def get_counts(self) -> dict[float, int]:
+        r"""Get the number of values in each bucket.
+
+        Returns:
+            The number of values in each bucket. The keys are the
+                upper bounds of the buckets, and the last key is
+                ``inf``.
+        """
+        return dict(zip((*self._buckets, float("inf")), self._counts))
+
+    def observe(self, value: float) -> None:
+        r"""Add a value to the histogram.
+
+        Args:
+            value: The value in seconds.
+        """
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._total += value
+
+    def quantile(self, q: float) -> float:
+        r"""Estimate a quantile of the observed values.
+
+        The estimate is the upper bound of the bucket that contains
+        the quantile, so it is an upper bound of the true quantile.
+
+        Args:
+            q: The quantile, in ``[0, 1]``.
+
+        Returns:
+            The estimated quantile, ``inf`` if it is above the last
+                bound, or ``nan`` if the histogram is empty.
+        """
+        if self._count == 0:
+            return float("nan")
+        rank = q * self._count
+        cumulative = 0
+        for bound, count in zip((*self._buckets, float("inf")), self._counts):
+            cumulative += count
+            if cumulative >= rank and cumulative > 0:
+                return bound
+        return float("inf")  # pragma: no cover
+
+
+class MetricsRegistry(BaseLoadObserver):
+    r"""Implement a load observer that aggregates the load events into
+    counters and latency histograms.
+
+    The metrics are grouped by ``'<kind>/<fmt>'`` e.g.
+    ``'shard/json'``. The observer is thread-safe, so it can observe
+    the loads of background threads.
+
+    Args:
+        buckets: The upper bounds of the latency buckets in seconds.
+        num_slowest: The number of slowest loads to keep.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.observer import MetricsRegistry
+        >>> from iden.shard import create_json_shard
+        >>> metrics = MetricsRegistry()
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shard = create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+        ...     shard.add_load_observer(metrics)
+        ...     data = shard.get_data(cache=True)
+        ...     data = shard.get_data(cache=True)
+        ...
+        >>> metrics.get_counters()
+        {'shard/json': {'num_loads': 2, 'num_errors': 0, 'cache_hits': 1, 'cache_misses': 1, 'nbytes': 9}}
+
+        ```
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, num_slowest: int = 10
+    ) -> None:
+        self._buckets = tuple(buckets)
+        self._num_slowest = num_slowest
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, int]] = {}
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._slowest: list[tuple[float, int, LoadEvent]] = []
+        self._num_events = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(num_keys={len(self._counters):,})"
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The lock is specific to the current process, so it is not
+        # pickled, and the metrics are copied under the lock.
+        with self._lock:
+            state = {key: value for key, value in self.__dict__.items() if key != "_lock"}
+            state["_counters"] = {key: dict(value) for key, value in self._counters.items()}
+            state["_histograms"] = copy.deepcopy(self._histograms)
+            state["_slowest"] = list(self._slowest)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def on_load_end(self, event: LoadEvent) -> None:
+        key = f"{event.kind}/{event.fmt}"
+        duration = event.duration or 0.0
+        with self._lock:
+            if key not in self._counters:
+                self._counters[key] = {
+                    "num_loads": 0,
+                    "num_errors": 0,
+                    "cache_hits": 0,
+                    "cache_misses": 0,
+                    "nbytes": 0,
+                }
+                self._histograms[key] = LatencyHistogram(self._buckets)
+            counters = self._counters[key]
+            counters["num_loads"] += 1
+            if event.error is not None:
+                counters["num_errors"] += 1
+            if event.cached:
+                counters["cache_hits"] += 1
+            else:
+                if event.cached is False:
+                    counters["cache_misses"] += 1
+                counters["nbytes"] += event.nbytes or 0
+            self._histograms[key].observe(duration)
+
+            if not event.cached and self._num_slowest > 0:
+                self._num_events += 1
+                item = (duration, self._num_events, event)
+                if len(self._slowest) < self._num_slowest:
+                    heapq.heappush(self._slowest, item)
+                else:
+                    heapq.heappushpop(self._slowest, item)
+
+    def get_counters(self) -> dict[str, dict[str, int]]:
+        r"""Get the counters.
+
+        Returns:
+            The counters of each ``'<kind>/<fmt>'`` key: the number of
+                loads, errors, cache hits and cache misses, and the
+                number of bytes read. The cache hits do not read any
+                byte.
+        """
+        with self._lock:
+            return {key: dict(counters) for key, counters in self._counters.items()}
+
+    def get_histograms(self) -> dict[str, LatencyHistogram]:
+        r"""Get the latency histograms.
+
+        Returns:
+            The latency histogram of each ``'<kind>/<fmt>'`` key.
+        """
+        with self._lock:
+            return dict(self._histograms)
+
+    def get_slowest(self) -> list[LoadEvent]:
+        r"""Get the slowest loads that were not served by a cache.
+
+        Returns:
+            The end events of the slowest loads, from the slowest to
+                the fastest.
+        """
+        with self._lock:
+            return [event for _, _, event in sorted(self._slowest, reverse=True)]
+
+    def get_summary(self) -> dict[str, dict[str, Any]]:
+        r"""Get a summary of the metrics.
+
+        Returns:
+            The counters of each ``'<kind>/<fmt>'`` key, with the
+                total and mean latency, and the estimated 50th, 90th
+                and 99th latency percentiles in seconds.
+
+        Example:
+            ```pycon
+            >>> from iden.observer import LoadEvent, MetricsRegistry
+            >>> metrics = MetricsRegistry(buckets=[0.1, 1.0])
+            >>> metrics.on_load_end(LoadEvent(kind="file", fmt="json", nbytes=9, duration=0.05))
+            >>> metrics.get_summary()["file/json"]["p50"]
+            0.1
+
+            ```
+        """
+        with self._lock:
+            summary = {}
+            for key, counters in self._counters.items():
+                histogram = self._histograms[key]
+                summary[key] = counters | {
+                    "total_time": histogram.total,
+                    "mean_time": histogram.total / histogram.count,
+                    "p50": histogram.quantile(0.5),
+                    "p90": histogram.quantile(0.9),
+                    "p99": histogram.quantile(0.99),
+                }
+            return summary
+
+    def reset(self) -> None:
+        r"""Reset all the metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._slowest.clear()
+            self._num_events = 0
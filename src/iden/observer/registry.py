@@ -0,0 +1,193 @@
+r"""Contain functions to register the global load observers and to
+notify the observers of a load."""
+
+from __future__ import annotations
+
+__all__ = [
+    "get_load_observers",
+    "has_load_observers",
+    "observe_load",
+    "register_load_observer",
+    "unregister_load_observer",
+]
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+    from iden.observer.base import BaseLoadObserver, LoadEvent
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The tuple is replaced on each change, so it can be read without lock.
+_observers: tuple[BaseLoadObserver, ...] = ()
+_lock = threading.Lock()
+
+
+def register_load_observer(observer: BaseLoadObserver) -> None:
+    r"""Register a global load observer.
+
+    A global observer is notified of all the loads. Registering the
+    same observer several times has no effect.
+
+    Args:
+        observer: The observer to register.
+
+    Example:
+        ```pycon
+        >>> from iden.observer import (
+        ...     MetricsRegistry,
+        ...     get_load_observers,
+        ...     register_load_observer,
+        ...     unregister_load_observer,
+        ... )
+        >>> metrics = MetricsRegistry()
+        >>> register_load_observer(metrics)
+        >>> metrics in get_load_observers()
+        True
+        >>> unregister_load_observer(metrics)
+
+        ```
+    """
+    global _observers  # noqa: PLW0603
+    with _lock:
+        if observer not in _observers:
+            _observers = (*_observers, observer)
+
+
+def unregister_load_observer(observer: BaseLoadObserver) -> None:
+    r"""Unregister a global load observer.
+
+    Unregistering an observer that is not registered has no effect.
+
+    Args:
+        observer: The observer to unregister.
+
+    Example:
+        ```pycon
+        >>> from iden.observer import (
+        ...     MetricsRegistry,
+        ...     get_load_observers,
+        ...     register_load_observer,
+        ...     unregister_load_observer,
+        ... )
+        >>> metrics = MetricsRegistry()
+        >>> register_load_observer(metrics)
+        >>> unregister_load_observer(metrics)
+        >>> metrics in get_load_observers()
+        False
+
+        ```
+    """
+    global _observers  # noqa: PLW0603
+    with _lock:
+        _observers = tuple(obs for obs in _observers if obs is not observer)
+
+
+def get_load_observers() -> tuple[BaseLoadObserver, ...]:
+    r"""Get the global load observers.
+
+    Returns:
+        The global load observers, in registration order.
+
+    Example:
+        ```pycon
+        >>> from iden.observer import get_load_observers
+        >>> get_load_observers()
+        ()
+
+        ```
+    """
+    return _observers
+
+
+def has_load_observers() -> bool:
+    r"""Indicate if at least one global load observer is registered.
+
+    The instrumented code uses this function to skip the creation of
+    the events when nobody observes the loads.
+
+    Returns:
+        ``True`` if at least one global load observer is registered,
+            otherwise ``False``.
+
+    Example:
+        ```pycon
+        >>> from iden.observer import has_load_observers
+        >>> has_load_observers()
+        False
+
+        ```
+    """
+    return bool(_observers)
+
+
+@contextmanager
+def observe_load(
+    event: LoadEvent, observers: Sequence[BaseLoadObserver] = ()
+) -> Generator[None, None, None]:
+    r"""Implement a context manager to notify the observers of a load.
+
+    The start event is sent when entering the context, and the end
+    event, with the duration and the exception if any, is sent when
+    exiting the context. The exceptions of the load are propagated.
+
+    Args:
+        event: The load event.
+        observers: Some extra observers to notify in addition to the
+            global observers, for example the observers of a dataset.
+            An observer is notified once even if it is also a global
+            observer.
+
+    Example:
+        ```pycon
+        >>> from iden.observer import LoadEvent, MetricsRegistry, observe_load
+        >>> metrics = MetricsRegistry()
+        >>> with observe_load(LoadEvent(kind="file", fmt="json"), observers=[metrics]):
+        ...     data = [1, 2, 3]
+        ...
+        >>> metrics.get_counters()["file/json"]["num_loads"]
+        1
+
+        ```
+    """
+    if observers:
+        # an observer registered globally and on a dataset is notified once
+        observers = tuple({id(obs): obs for obs in (*_observers, *observers)}.values())
+    else:
+        observers = _observers
+    if not observers:
+        yield
+        return
+    _notify(observers, "on_load_start", event)
+    error = None
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        end_event = replace(event, duration=time.perf_counter() - start, error=error)
+        _notify(observers, "on_load_end", end_event)
+
+
+def _notify(observers: Sequence[BaseLoadObserver], hook: str, event: LoadEvent) -> None:
+    r"""Call a hook of the observers.
+
+    Args:
+        observers: The observers to notify.
+        hook: The name of the hook to call.
+        event: The load event.
+    """
+    for observer in observers:
+        try:
+            getattr(observer, hook)(event)
+        except Exception:  # noqa: PERF203
+            logger.exception(f"{hook} of {observer!r} failed")
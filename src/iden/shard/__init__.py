@@ -5,18 +5,22 @@ from __future__ import annotations
 __all__ = [
     "BaseShard",
     "CloudpickleShard",
+    "CompactShardSequence",
+    "CompactShardTuple",
     "FileShard",
     "InMemoryShard",
     "JoblibShard",
     "JsonShard",
     "NumpySafetensorsShard",
     "PickleShard",
+    "RecordIndex",
     "ShardDict",
     "ShardTuple",
     "TorchSafetensorsShard",
     "TorchShard",
     "YamlShard",
     "create_cloudpickle_shard",
+    "create_compact_shard_tuple",
     "create_joblib_shard",
     "create_json_shard",
     "create_numpy_safetensors_shard",
@@ -26,28 +30,72 @@ __all__ = [
     "create_torch_safetensors_shard",
     "create_torch_shard",
     "create_yaml_shard",
+    "extend_shard_tuple",
     "get_dict_uris",
     "get_list_uris",
     "load_from_uri",
+    "reshard",
     "sort_by_uri",
 ]
 
+from typing import TYPE_CHECKING
+
 from iden.shard.base import BaseShard
-from iden.shard.cloudpickle import CloudpickleShard, create_cloudpickle_shard
-from iden.shard.dict import ShardDict, create_shard_dict
-from iden.shard.file import FileShard
-from iden.shard.in_memory import InMemoryShard
-from iden.shard.joblib import JoblibShard, create_joblib_shard
-from iden.shard.json import JsonShard, create_json_shard
-from iden.shard.loading import load_from_uri
-from iden.shard.pickle import PickleShard, create_pickle_shard
-from iden.shard.safetensors import (
-    NumpySafetensorsShard,
-    TorchSafetensorsShard,
-    create_numpy_safetensors_shard,
-    create_torch_safetensors_shard,
+from iden.shard.reshard import reshard
+from iden.utils.lazy import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from iden.shard.cloudpickle import CloudpickleShard, create_cloudpickle_shard
+    from iden.shard.compact import (
+        CompactShardSequence,
+        CompactShardTuple,
+        create_compact_shard_tuple,
+    )
+    from iden.shard.dict import ShardDict, create_shard_dict
+    from iden.shard.file import FileShard
+    from iden.shard.in_memory import InMemoryShard
+    from iden.shard.index import RecordIndex
+    from iden.shard.joblib import JoblibShard, create_joblib_shard
+    from iden.shard.json import JsonShard, create_json_shard
+    from iden.shard.loading import load_from_uri
+    from iden.shard.pickle import PickleShard, create_pickle_shard
+    from iden.shard.safetensors import (
+        NumpySafetensorsShard,
+        TorchSafetensorsShard,
+        create_numpy_safetensors_shard,
+        create_torch_safetensors_shard,
+    )
+    from iden.shard.torch import TorchShard, create_torch_shard
+    from iden.shard.tuple import ShardTuple, create_shard_tuple, extend_shard_tuple
+    from iden.shard.utils import get_dict_uris, get_list_uris, sort_by_uri
+    from iden.shard.yaml import YamlShard, create_yaml_shard
+
+__getattr__, __dir__ = create_lazy_getattr(
+    __name__,
+    {
+        "iden.shard.cloudpickle": ("CloudpickleShard", "create_cloudpickle_shard"),
+        "iden.shard.compact": (
+            "CompactShardSequence",
+            "CompactShardTuple",
+            "create_compact_shard_tuple",
+        ),
+        "iden.shard.dict": ("ShardDict", "create_shard_dict"),
+        "iden.shard.file": ("FileShard",),
+        "iden.shard.in_memory": ("InMemoryShard",),
+        "iden.shard.index": ("RecordIndex",),
+        "iden.shard.joblib": ("JoblibShard", "create_joblib_shard"),
+        "iden.shard.json": ("JsonShard", "create_json_shard"),
+        "iden.shard.loading": ("load_from_uri",),
+        "iden.shard.pickle": ("PickleShard", "create_pickle_shard"),
+        "iden.shard.safetensors": (
+            "NumpySafetensorsShard",
+            "TorchSafetensorsShard",
+            "create_numpy_safetensors_shard",
+            "create_torch_safetensors_shard",
+        ),
+        "iden.shard.torch": ("TorchShard", "create_torch_shard"),
+        "iden.shard.tuple": ("ShardTuple", "create_shard_tuple", "extend_shard_tuple"),
+        "iden.shard.utils": ("get_dict_uris", "get_list_uris", "sort_by_uri"),
+        "iden.shard.yaml": ("YamlShard", "create_yaml_shard"),
+    },
 )
-from iden.shard.torch import TorchShard, create_torch_shard
-from iden.shard.tuple import ShardTuple, create_shard_tuple
-from iden.shard.utils import get_dict_uris, get_list_uris, sort_by_uri
-from iden.shard.yaml import YamlShard, create_yaml_shard
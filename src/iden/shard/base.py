@@ -7,7 +7,7 @@ __all__ = ["BaseShard"]
 from abc import ABC, abstractmethod
 from typing import Any, Generic, TypeVar
 
-from coola.equality.tester import EqualNanEqualityTester, get_default_registry
+from iden.utils.equality import register_equality_tester
 
 T = TypeVar("T")
 
@@ -33,6 +33,8 @@ class BaseShard(ABC, Generic[T]):
         ```
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def clear(self) -> None:
         r"""Clear the current shard cache i.e. remove from memory the
@@ -126,6 +128,63 @@ class BaseShard(ABC, Generic[T]):
             ```
         """
 
+    def get_metadata(self) -> dict[str, Any]:
+        r"""Get the shard metadata.
+
+        The metadata describe the data in the shard e.g. the number of
+        records or the number of bytes, and can be read without
+        loading the data. By default, a shard does not have metadata.
+
+        Returns:
+            The shard metadata.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import create_json_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     uri = Path(tmpdir).joinpath("uri/0001").as_uri()
+            ...     shard = create_json_shard([1, 2, 3], uri=uri)
+            ...     shard.get_metadata()
+            ...
+            {'num_records': 3, 'nbytes': 9}
+
+            ```
+        """
+        return {}
+
+    def get_fingerprint(self) -> str | None:
+        r"""Get the config fingerprint of the shard.
+
+        The fingerprint is a stable hash of the shard type and of its
+        URI config, so it is computed without loading the data. Two
+        shards with the same fingerprint are equal, so the fingerprint
+        can be used as a cache key or to compare shards quickly. It is
+        computed once and cached. By default, a shard does not have a
+        fingerprint.
+
+        Returns:
+            The fingerprint as a hexadecimal string, or ``None`` if
+                the shard cannot be identified without its data.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import InMemoryShard, create_json_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     uri = Path(tmpdir).joinpath("uri/0001").as_uri()
+            ...     shard = create_json_shard([1, 2, 3], uri=uri)
+            ...     len(shard.get_fingerprint())
+            ...
+            64
+            >>> InMemoryShard([1, 2, 3]).get_fingerprint()
+
+            ```
+        """
+        return None
+
     @abstractmethod
     def get_uri(self) -> str | None:
         r"""Get the Uniform Resource Identifier (URI) of the shard.
@@ -183,4 +242,4 @@ class BaseShard(ABC, Generic[T]):
         """
 
 
-get_default_registry().register(BaseShard, EqualNanEqualityTester(), exist_ok=True)
+register_equality_tester(BaseShard)
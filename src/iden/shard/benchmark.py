@@ -0,0 +1,124 @@
+r"""Contain functions to measure the loading throughput of shards."""
+
+from __future__ import annotations
+
+__all__ = ["LoadingStats", "benchmark_loading"]
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from iden.shard.utils import PrefetchShardIterable, ShardIterable, get_data_nbytes
+from iden.utils.time import sync_perf_counter
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from iden.shard import BaseShard
+
+
+@dataclass(frozen=True)
+class LoadingStats:
+    r"""Define the statistics of the loading of shards.
+
+    Args:
+        num_shards: The number of loaded shards.
+        nbytes: The size of the data files of the loaded shards in
+            bytes.
+        duration: The loading time in seconds.
+
+    Example:
+        ```pycon
+        >>> from iden.shard.benchmark import LoadingStats
+        >>> stats = LoadingStats(num_shards=10, nbytes=2000, duration=2.0)
+        >>> stats.shards_per_second, stats.bytes_per_second
+        (5.0, 1000.0)
+
+        ```
+    """
+
+    num_shards: int
+    nbytes: int
+    duration: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        r"""The number of bytes loaded per second."""
+        return self.nbytes / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def shards_per_second(self) -> float:
+        r"""The number of shards loaded per second."""
+        return self.num_shards / self.duration if self.duration > 0 else 0.0
+
+
+def benchmark_loading(
+    shards: Sequence[BaseShard[Any]], *, num_prefetch: int = 0, num_workers: int = 1
+) -> LoadingStats:
+    r"""Measure the time to load the data of shards.
+
+    The shards are iterated like in a training loop: the data of each
+    shard are loaded, then released. With several workers, each
+    worker iterates over an interleaved subset of the shards in a
+    thread, like the workers of a data loader.
+
+    Args:
+        shards: The shards to load.
+        num_prefetch: The number of shards loaded ahead in background
+            threads by each worker. The shards are loaded one after
+            the other if ``0``.
+        num_workers: The number of workers that load the shards.
+
+    Returns:
+        The loading statistics.
+
+    Raises:
+        ValueError: if ``num_prefetch`` is negative or ``num_workers``
+            is not positive.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard
+        >>> from iden.shard.benchmark import benchmark_loading
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+        ...         create_json_shard([4, 5, 6, 7], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+        ...     ]
+        ...     stats = benchmark_loading(shards, num_prefetch=1)
+        ...     stats.num_shards, stats.nbytes
+        ...
+        (2, 21)
+
+        ```
+    """
+    if num_prefetch < 0:
+        msg = f"num_prefetch must be non-negative but received {num_prefetch}"
+        raise ValueError(msg)
+    if num_workers <= 0:
+        msg = f"num_workers must be positive but received {num_workers}"
+        raise ValueError(msg)
+
+    def load(subset: Sequence[BaseShard[Any]]) -> int:
+        iterable = (
+            PrefetchShardIterable(subset, num_prefetch=num_prefetch)
+            if num_prefetch
+            else ShardIterable(subset)
+        )
+        return sum(1 for _ in iterable)
+
+    start = sync_perf_counter()
+    if num_workers == 1:
+        num_shards = load(shards)
+    else:
+        with ThreadPoolExecutor(num_workers) as executor:
+            subsets = [shards[i::num_workers] for i in range(num_workers)]
+            num_shards = sum(executor.map(load, subsets))
+    duration = sync_perf_counter() - start
+    return LoadingStats(
+        num_shards=num_shards,
+        nbytes=sum(get_data_nbytes(shard) for shard in shards),
+        duration=duration,
+    )
@@ -7,12 +7,13 @@ __all__ = ["CloudpickleShard", "create_cloudpickle_shard"]
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA
 from iden.io import CloudpickleLoader, CloudpickleSaver, JsonSaver
 from iden.shard.file import FileShard
+from iden.shard.metadata import generate_metadata
+from iden.storage import location_to_str, sanitize_location
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -33,6 +34,8 @@ class CloudpickleShard(FileShard[T]):
     Args:
         uri: The shard's URI.
         path: The path to the cloudpickle file.
+        metadata: The shard metadata e.g. the number of records or
+            the file size.
 
     Raises:
         RuntimeError: if ``cloudpickle`` is not installed.
@@ -54,11 +57,15 @@ class CloudpickleShard(FileShard[T]):
         ```
     """
 
-    def __init__(self, uri: str, path: Path | str) -> None:
-        super().__init__(uri, path, loader=CloudpickleLoader())
+    __slots__ = ()
+
+    def __init__(self, uri: str, path: Path | str, metadata: dict[str, Any] | None = None) -> None:
+        super().__init__(uri, path, loader=CloudpickleLoader(), metadata=metadata)
 
     @classmethod
-    def generate_uri_config(cls, path: Path) -> dict[str, Any]:
+    def generate_uri_config(
+        cls, path: Path | str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         r"""Generate the minimal config that is used to load the shard
         from its URI.
 
@@ -66,6 +73,8 @@ class CloudpickleShard(FileShard[T]):
 
         Args:
             path: The path to the pickle file.
+            metadata: The shard metadata. It is not added to the
+                config if it is empty.
 
         Returns:
             The minimal config to load the shard from its URI.
@@ -84,13 +93,15 @@ class CloudpickleShard(FileShard[T]):
 
             ```
         """
-        return {
-            KWARGS: {"path": sanitize_path(path).as_posix()},
-            LOADER: {OBJECT_TARGET: "iden.shard.loader.CloudpickleShardLoader"},
-        }
+        kwargs = {"path": location_to_str(sanitize_location(path))}
+        if metadata:
+            kwargs[METADATA] = metadata
+        return {KWARGS: kwargs, LOADER: {OBJECT_TARGET: "iden.shard.loader.CloudpickleShardLoader"}}
 
 
-def create_cloudpickle_shard(data: T, uri: str, path: Path | None = None) -> CloudpickleShard[T]:
+def create_cloudpickle_shard(
+    data: T, uri: str, path: Path | str | None = None
+) -> CloudpickleShard[T]:
     r"""Create a ``CloudpickleShard`` from data.
 
     Note:
@@ -124,9 +135,12 @@ def create_cloudpickle_shard(data: T, uri: str, path: Path | None = None) -> Clo
         ```
     """
     if path is None:
-        path = sanitize_path(uri + ".pkl")
-    logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(CloudpickleShard.generate_uri_config(path), sanitize_path(uri))
+        path = sanitize_location(uri + ".pkl")
     logger.info(f"Saving data in file {path}")
     CloudpickleSaver().save(data, path)
-    return CloudpickleShard(uri, path)
+    metadata = generate_metadata(data, path=path)
+    logger.info(f"Saving URI file {uri}")
+    JsonSaver().save(
+        CloudpickleShard.generate_uri_config(path, metadata=metadata), sanitize_location(uri)
+    )
+    return CloudpickleShard(uri, path, metadata=metadata)
@@ -0,0 +1,528 @@
+r"""Contain a compact shard to manage a large tuple of file shards."""
+
+from __future__ import annotations
+
+__all__ = ["CompactShardSequence", "CompactShardTuple", "create_compact_shard_tuple"]
+
+import json
+import logging
+import threading
+import weakref
+from array import array
+from collections.abc import Sequence
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar, overload
+
+from objectory import OBJECT_TARGET
+
+from iden.constants import LOADER, SHARDS
+from iden.io import JsonSaver
+from iden.shard.file import FileShard
+from iden.shard.fingerprint import compute_fingerprint
+from iden.shard.tuple import ShardTuple
+from iden.shard.utils import get_list_uris
+from iden.storage import location_to_str, sanitize_location
+from iden.utils.packed import PackedStringArray
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from iden.cache import BaseCachePolicy, BaseDataCache
+    from iden.io import BaseLoader
+    from iden.observer import BaseLoadObserver
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class CompactShardTuple(ShardTuple[T]):
+    r"""Implement a compact data structure to manage a large tuple of
+    file shards.
+
+    A ``ShardTuple`` keeps one Python object per shard, which can use
+    gigabytes of memory for millions of shards. This tuple stores the
+    URIs, the paths and the metadata of the shards in packed string
+    arrays, and only one loader per shard type. The shard objects are
+    materialized on demand when they are accessed. A materialized
+    shard is kept as long as it is referenced outside of the tuple, so
+    accessing the same shard twice returns the same object, and its
+    cached data are kept. This is also true when the shards are
+    accessed from several threads.
+
+    The state of the input shards i.e. the cached data, the load
+    observers and the data cache, is not kept. The load observers and
+    the data cache are set on the tuple, and they are set on each
+    materialized shard.
+
+    Args:
+        uri: The shard's URI.
+        shards: The file shards.
+
+    Raises:
+        TypeError: if a shard is not a ``FileShard``.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import CompactShardTuple, create_json_shard
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("shards/uri1").as_uri()),
+        ...         create_json_shard(
+        ...             [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shards/uri2").as_uri()
+        ...         ),
+        ...     ]
+        ...     sl = CompactShardTuple(uri=Path(tmpdir).joinpath("uri").as_uri(), shards=shards)
+        ...     sl
+        ...     sl[1].get_data()
+        ...
+        CompactShardTuple(
+          (uri): file:///.../uri
+          (shards):
+            (0): JsonShard(uri=file:///.../shards/uri1)
+            (1): JsonShard(uri=file:///.../shards/uri2)
+        )
+        [4, 5, 6, 7]
+
+        ```
+    """
+
+    def __init__(self, uri: str, shards: Iterable[FileShard[T]]) -> None:
+        self._uri = uri
+        self._uris = PackedStringArray()
+        self._paths = PackedStringArray()
+        self._metadata = PackedStringArray()
+        # The index of the shard type and loader in ``_formats`` and a
+        # flag to indicate if the path is a local path for each shard.
+        self._format_ids = array("H")
+        self._is_local = array("B")
+        self._formats: list[tuple[type[FileShard[T]], BaseLoader[T]]] = []
+        self._observers: tuple[BaseLoadObserver, ...] = ()
+        self._data_cache: BaseDataCache | None = None
+        self._cache_policy: BaseCachePolicy | None = None
+        self._materialized: weakref.WeakValueDictionary[int, FileShard[T]] = (
+            weakref.WeakValueDictionary()
+        )
+        self._fingerprint: str | None = None
+        self._has_fingerprint = False
+        self._lock = threading.Lock()
+        for shard in shards:
+            self._append(shard)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        del state["_materialized"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._materialized = weakref.WeakValueDictionary()
+
+    def __getitem__(self, index: int) -> FileShard[T]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = f"index {index} is out of range"
+            raise IndexError(msg)
+        with self._lock:
+            shard = self._materialized.get(index)
+            if shard is None:
+                shard = self._materialize(index)
+                self._materialized[index] = shard
+        return shard
+
+    def __len__(self) -> int:
+        return len(self._format_ids)
+
+    @property
+    def nbytes(self) -> int:
+        r"""The number of bytes used to store the URIs, the paths and
+        the metadata of the shards."""
+        return (
+            self._uris.nbytes
+            + self._paths.nbytes
+            + self._metadata.nbytes
+            + self._format_ids.itemsize * len(self._format_ids)
+            + self._is_local.itemsize * len(self._is_local)
+        )
+
+    def add_load_observer(self, observer: BaseLoadObserver) -> None:
+        r"""Add a load observer to all the shards of the tuple.
+
+        Adding the same observer several times has no effect.
+
+        Args:
+            observer: The observer to add.
+        """
+        if observer not in self._observers:
+            self._observers = (*self._observers, observer)
+        for shard in self._materialized.values():
+            shard.add_load_observer(observer)
+
+    def remove_load_observer(self, observer: BaseLoadObserver) -> None:
+        r"""Remove a load observer from all the shards of the tuple.
+
+        Args:
+            observer: The observer to remove.
+        """
+        self._observers = tuple(obs for obs in self._observers if obs is not observer)
+        for shard in self._materialized.values():
+            shard.remove_load_observer(observer)
+
+    def set_data_cache(self, cache: BaseDataCache | None) -> None:
+        r"""Set the data cache of all the shards of the tuple.
+
+        Args:
+            cache: The data cache, or ``None`` to remove the data
+                cache.
+        """
+        self._data_cache = cache
+        for shard in self._materialized.values():
+            shard.set_data_cache(cache)
+
+    def set_cache_policy(self, policy: BaseCachePolicy | None) -> None:
+        r"""Set the cache policy of all the shards of the tuple.
+
+        Args:
+            policy: The cache policy, or ``None`` to keep the data
+                until ``clear`` is called.
+        """
+        self._cache_policy = policy
+        for shard in self._materialized.values():
+            shard.set_cache_policy(policy)
+
+    def clear(self) -> None:
+        for shard in self._materialized.values():
+            shard.clear()
+
+    def get_data(self, cache: bool = False) -> tuple[FileShard[T], ...]:  # noqa: ARG002
+        return tuple(self[i] for i in range(len(self)))
+
+    def get_sequence(self) -> CompactShardSequence[T]:
+        r"""Get a read-only sequence of the shards that materializes
+        each shard only when it is accessed.
+
+        Unlike ``get_data``, the shards are not all materialized, so
+        the memory usage stays small for millions of shards.
+
+        Returns:
+            The sequence of shards.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import CompactShardTuple, create_json_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = [
+            ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+            ...         create_json_shard([4, 5], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+            ...     ]
+            ...     sequence = CompactShardTuple(
+            ...         uri=Path(tmpdir).joinpath("uri").as_uri(), shards=shards
+            ...     ).get_sequence()
+            ...     len(sequence), sequence[-1]
+            ...
+            (2, JsonShard(uri=file:///.../uri2))
+
+            ```
+        """
+        return CompactShardSequence(self)
+
+    def get_shard_metadata(self, index: int) -> dict[str, Any]:
+        r"""Get the metadata of a shard without materializing it.
+
+        Args:
+            index: The index of the shard. A negative index counts
+                from the end.
+
+        Returns:
+            The metadata of the shard.
+
+        Raises:
+            IndexError: if the index is out of range.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import CompactShardTuple, create_json_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = [
+            ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+            ...         create_json_shard([4, 5], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+            ...     ]
+            ...     CompactShardTuple(
+            ...         uri=Path(tmpdir).joinpath("uri").as_uri(), shards=shards
+            ...     ).get_shard_metadata(1)
+            ...
+            {'num_records': 2, 'nbytes': 6}
+
+            ```
+        """
+        metadata = self._metadata[index]
+        return json.loads(metadata) if metadata else {}
+
+    def get_uris(self) -> list[str]:
+        r"""Get the URIs of the shards without materializing them.
+
+        Returns:
+            The URIs of the shards.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import CompactShardTuple, create_json_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = [
+            ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+            ...         create_json_shard([4, 5], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+            ...     ]
+            ...     CompactShardTuple(uri=Path(tmpdir).joinpath("uri").as_uri(), shards=shards).get_uris()
+            ...
+            ['file:///.../uri1', 'file:///.../uri2']
+
+            ```
+        """
+        return list(self._uris)
+
+    def is_cached(self) -> bool:
+        return any(shard.is_cached() for shard in self._materialized.values())
+
+    def is_sorted_by_uri(self) -> bool:
+        return all(uri1 <= uri2 for uri1, uri2 in zip(self._uris, islice(self._uris, 1, None)))
+
+    @classmethod
+    def generate_uri_config(cls, shards: Iterable[FileShard[T]]) -> dict[str, Any]:
+        r"""Generate the minimal config that is used to load the shard
+        from its URI.
+
+        The config must be compatible with the JSON format.
+
+        Args:
+            shards: The sequence of shards to include in the
+                configuration. The shards of a ``CompactShardTuple``
+                are not materialized.
+
+        Returns:
+            The minimal config to load the shard from its URI.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import CompactShardTuple, create_json_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shards = [
+            ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()),
+            ...         create_json_shard(
+            ...             [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+            ...         ),
+            ...     ]
+            ...     CompactShardTuple.generate_uri_config(shards)
+            ...
+            {'shards': ['file:///.../shard/uri1', 'file:///.../shard/uri2'],
+             'loader': {'_target_': 'iden.shard.loader.CompactShardTupleLoader'}}
+
+            ```
+        """
+        uris = shards.get_uris() if isinstance(shards, CompactShardTuple) else get_list_uris(shards)
+        return {
+            SHARDS: uris,
+            LOADER: {OBJECT_TARGET: "iden.shard.loader.CompactShardTupleLoader"},
+        }
+
+    def _append(self, shard: FileShard[T]) -> None:
+        r"""Append a shard to the packed arrays.
+
+        Args:
+            shard: The shard to append.
+
+        Raises:
+            TypeError: if the shard is not a ``FileShard``.
+        """
+        if not isinstance(shard, FileShard):
+            msg = f"{self.__class__.__qualname__} only supports FileShard but received {shard}"
+            raise TypeError(msg)
+        self._uris.append(shard.get_uri())
+        self._paths.append(location_to_str(shard.path))
+        metadata = shard.get_metadata()
+        self._metadata.append(json.dumps(metadata, separators=(",", ":")) if metadata else "")
+        self._format_ids.append(self._get_format_id(shard))
+        self._is_local.append(isinstance(shard.path, Path))
+
+    def _compute_fingerprint(self) -> str:
+        r"""Compute the fingerprint of the tuple without materializing
+        the shards.
+
+        Returns:
+            The fingerprint.
+        """
+        fingerprints = [
+            compute_fingerprint(self._formats[format_id][0], [uri, path])
+            for format_id, uri, path in zip(self._format_ids, self._uris, self._paths)
+        ]
+        return compute_fingerprint(type(self), [self._uri, *fingerprints])
+
+    def _get_format_id(self, shard: FileShard[T]) -> int:
+        r"""Get the index of the shard type and loader of a shard, and
+        register them if they are new.
+
+        Args:
+            shard: The shard.
+
+        Returns:
+            The index in ``_formats``.
+        """
+        loader = shard.loader
+        for index, (cls, shared_loader) in enumerate(self._formats):
+            if cls is type(shard) and (shared_loader is loader or shared_loader.equal(loader)):
+                return index
+        self._formats.append((type(shard), loader))
+        return len(self._formats) - 1
+
+    def _materialize(self, index: int) -> FileShard[T]:
+        r"""Create the shard object at a given index.
+
+        Args:
+            index: The index of the shard.
+
+        Returns:
+            The shard.
+        """
+        cls, loader = self._formats[self._format_ids[index]]
+        path = self._paths[index]
+        metadata = self._metadata[index]
+        shard = cls.from_parts(
+            uri=self._uris[index],
+            path=Path(path) if self._is_local[index] else path,
+            loader=loader,
+            metadata=json.loads(metadata) if metadata else None,
+        )
+        for observer in self._observers:
+            shard.add_load_observer(observer)
+        shard.set_data_cache(self._data_cache)
+        if self._cache_policy is not None:
+            shard.set_cache_policy(self._cache_policy)
+        return shard
+
+
+class CompactShardSequence(Sequence[FileShard[T]]):
+    r"""Implement a read-only sequence of the shards of a
+    ``CompactShardTuple``.
+
+    A shard is materialized only when it is accessed, and the metadata
+    of the shards are read from the packed arrays of the tuple, so the
+    shards do not need to be in memory at the same time.
+
+    Args:
+        shards: The compact shard tuple.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import CompactShardSequence, CompactShardTuple, create_json_shard
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+        ...         create_json_shard([4, 5], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+        ...     ]
+        ...     sequence = CompactShardSequence(
+        ...         CompactShardTuple(uri=Path(tmpdir).joinpath("uri").as_uri(), shards=shards)
+        ...     )
+        ...     sequence
+        ...     sequence.get_metadata(0)
+        ...
+        CompactShardSequence(num_shards=2)
+        {'num_records': 3, 'nbytes': 9}
+
+        ```
+    """
+
+    def __init__(self, shards: CompactShardTuple[T]) -> None:
+        self._shards = shards
+
+    @overload
+    def __getitem__(self, index: int) -> FileShard[T]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[FileShard[T], ...]: ...
+
+    def __getitem__(self, index: int | slice) -> FileShard[T] | tuple[FileShard[T], ...]:
+        if isinstance(index, slice):
+            return tuple(self._shards[i] for i in range(*index.indices(len(self))))
+        return self._shards[index]
+
+    def __len__(self) -> int:
+        return len(self._shards)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(num_shards={len(self):,})"
+
+    def get_metadata(self, index: int) -> dict[str, Any]:
+        r"""Get the metadata of a shard without materializing it.
+
+        Args:
+            index: The index of the shard. A negative index counts
+                from the end.
+
+        Returns:
+            The metadata of the shard.
+
+        Raises:
+            IndexError: if the index is out of range.
+        """
+        return self._shards.get_shard_metadata(index)
+
+
+def create_compact_shard_tuple(shards: Iterable[FileShard[T]], uri: str) -> CompactShardTuple[T]:
+    r"""Create a ``CompactShardTuple`` from a sequence of file shards.
+
+    Args:
+        shards: The sequence of file shards to include in the tuple.
+            It can be a generator, so the shards do not need to be in
+            memory at the same time.
+        uri: The Uniform Resource Identifier (URI) for the shard
+            tuple.
+
+    Returns:
+        The ``CompactShardTuple`` object.
+
+    Raises:
+        TypeError: if a shard is not a ``FileShard``.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_compact_shard_tuple, create_json_shard
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()),
+        ...         create_json_shard(
+        ...             [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+        ...         ),
+        ...     ]
+        ...     shard = create_compact_shard_tuple(shards, uri=Path(tmpdir).joinpath("uri").as_uri())
+        ...     shard
+        ...
+        CompactShardTuple(
+          (uri): file:///.../uri
+          (shards):
+            (0): JsonShard(uri=file:///.../shard/uri1)
+            (1): JsonShard(uri=file:///.../shard/uri2)
+        )
+
+        ```
+    """
+    shard = CompactShardTuple(uri, shards)
+    logger.info(f"Saving URI file {uri}")
+    JsonSaver().save(CompactShardTuple.generate_uri_config(shard), sanitize_location(uri))
+    return shard
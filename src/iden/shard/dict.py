@@ -7,16 +7,17 @@ __all__ = ["ShardDict", "create_shard_dict"]
 import logging
 from typing import Any, TypeVar
 
-from coola.equality import objects_are_equal
 from coola.utils.format import repr_indent, repr_mapping, str_indent, str_mapping
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
 from iden.constants import LOADER, SHARDS
 from iden.io import JsonSaver, load_json
 from iden.shard.base import BaseShard
 from iden.shard.exceptions import ShardNotFoundError
+from iden.shard.fingerprint import compute_fingerprint
 from iden.shard.utils import get_dict_uris
+from iden.storage import sanitize_location
+from iden.utils.equality import objects_are_equal
 
 T = TypeVar("T")
 
@@ -61,6 +62,8 @@ class ShardDict(BaseShard[T]):
     def __init__(self, uri: str, shards: dict[str, BaseShard[T]]) -> None:
         self._uri = uri
         self._shards = shards.copy()
+        self._fingerprint: str | None = None
+        self._has_fingerprint = False
 
     def __contains__(self, item: str) -> bool:
         return item in self._shards
@@ -88,6 +91,9 @@ class ShardDict(BaseShard[T]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if type(other) is not type(self):
             return False
+        fingerprint, other_fingerprint = self.get_fingerprint(), other.get_fingerprint()
+        if fingerprint is not None and other_fingerprint is not None:
+            return fingerprint == other_fingerprint
         return self.get_uri() == other.get_uri() and objects_are_equal(
             self.get_data(), other.get_data(), equal_nan=equal_nan
         )
@@ -95,6 +101,12 @@ class ShardDict(BaseShard[T]):
     def get_data(self, cache: bool = False) -> dict[str, BaseShard[T]]:  # noqa: ARG002
         return self._shards.copy()
 
+    def get_fingerprint(self) -> str | None:
+        if not self._has_fingerprint:
+            self._fingerprint = self._compute_fingerprint()
+            self._has_fingerprint = True
+        return self._fingerprint
+
     def get_uri(self) -> str:
         return self._uri
 
@@ -203,6 +215,22 @@ class ShardDict(BaseShard[T]):
     def is_cached(self) -> bool:
         return any(shard.is_cached() for shard in self._shards.values())
 
+    def _compute_fingerprint(self) -> str | None:
+        r"""Compute the fingerprint of the dictionary from the keys and
+        the fingerprints of its shards.
+
+        Returns:
+            The fingerprint, or ``None`` if a shard does not have a
+                fingerprint.
+        """
+        parts = [self._uri]
+        for key, shard in sorted(self._shards.items()):
+            fingerprint = shard.get_fingerprint()
+            if fingerprint is None:
+                return None
+            parts.extend([key, fingerprint])
+        return compute_fingerprint(type(self), parts)
+
     @classmethod
     def from_uri(cls, uri: str) -> ShardDict[T]:
         r"""Instantiate a shard from its URI.
@@ -245,7 +273,7 @@ class ShardDict(BaseShard[T]):
         # local import to avoid cyclic dependencies
         from iden.shard import load_from_uri  # noqa: PLC0415
 
-        config = load_json(sanitize_path(uri))
+        config = load_json(sanitize_location(uri))
         shards = {key: load_from_uri(shard) for key, shard in config[SHARDS].items()}
         return cls(uri=uri, shards=shards)
 
@@ -334,5 +362,5 @@ def create_shard_dict(shards: dict[str, BaseShard[T]], uri: str) -> ShardDict[T]
     ```
     """
     logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(ShardDict.generate_uri_config(shards), sanitize_path(uri))
+    JsonSaver().save(ShardDict.generate_uri_config(shards), sanitize_location(uri))
     return ShardDict(uri, shards)
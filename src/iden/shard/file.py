@@ -4,26 +4,37 @@ from __future__ import annotations
 
 __all__ = ["FileShard"]
 
+import threading
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.cache.policy import PinnedCachePolicy
+from iden.constants import KWARGS, LOADER, METADATA, NBYTES
 from iden.io import (
     BaseLoader,
     get_default_loader_registry,
     load_json,
     setup_loader,
 )
+from iden.observer import LoadEvent, has_load_observers, observe_load
 from iden.shard.base import BaseShard
+from iden.shard.fingerprint import compute_fingerprint
+from iden.storage import get_extension, get_storage, location_to_str, sanitize_location
+from iden.utils.trace import trace_instant, trace_span
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from iden.cache import BaseCachePolicy, BaseDataCache
+    from iden.observer import BaseLoadObserver
+
 S = TypeVar("S", bound="BaseShard")
 T = TypeVar("T")
 
+_DEFAULT_CACHE_POLICY = PinnedCachePolicy()
+
 
 class FileShard(BaseShard[T]):
     r"""Implement a generic shard where the data are stored in a single
@@ -33,6 +44,7 @@ class FileShard(BaseShard[T]):
         uri: The shard's URI.
         path: The path to the pickle file.
         loader: The data loader or its configuration.
+        metadata: The shard metadata e.g. the number of records.
 
     Example:
         ```pycon
@@ -50,29 +62,232 @@ class FileShard(BaseShard[T]):
         [1, 2, 3]
 
         ```
+
+    The data cached with ``get_data(cache=True)`` are loaded once even
+    if several threads request them at the same time: the first thread
+    loads the data and the other threads wait for its result. By
+    default, the cached data are kept until ``clear`` is called, and
+    ``set_cache_policy`` can be used to release them automatically.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_cache_policy",
+        "_data",
+        "_data_cache",
+        "_fingerprint",
+        "_inflight",
+        "_is_cached",
+        "_loader",
+        "_lock",
+        "_metadata",
+        "_observers",
+        "_path",
+        "_uri",
+    )
+
     def __init__(
-        self, uri: str, path: Path | str, loader: BaseLoader[T] | dict[Any, Any] | None = None
+        self,
+        uri: str,
+        path: Path | str,
+        loader: BaseLoader[T] | dict[Any, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
     ) -> None:
-        self._uri = uri
-        self._path = sanitize_path(path)
-        self._loader = setup_loader(loader or get_default_loader_registry())
+        self._init_fields(
+            uri=uri,
+            path=sanitize_location(path),
+            loader=setup_loader(loader or get_default_loader_registry()),
+            metadata=metadata or {},
+        )
+
+    def _init_fields(
+        self, uri: str, path: Path | str, loader: BaseLoader[T], metadata: dict[str, Any]
+    ) -> None:
+        r"""Initialize the fields of the shard.
 
+        Args:
+            uri: The shard's URI.
+            path: The sanitized path to the file.
+            loader: The data loader.
+            metadata: The shard metadata.
+        """
+        self._uri = uri
+        self._path = path
+        self._loader = loader
+        self._metadata = metadata
+        self._observers: tuple[BaseLoadObserver, ...] = ()
+        self._data_cache: BaseDataCache | None = None
+        self._cache_policy: BaseCachePolicy = _DEFAULT_CACHE_POLICY
+        self._fingerprint: str | None = None
+
+        self._lock = threading.Lock()
+        self._inflight: _InflightLoad | None = None
         self._is_cached = False
         self._data = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(uri={self.get_uri()})"
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = {
+            name: getattr(self, name)
+            for name in _get_state_slots(type(self))
+            if hasattr(self, name)
+        }
+        # the attributes of the subclasses without ``__slots__``
+        state.update(getattr(self, "__dict__", {}))
+        if not isinstance(self._cache_policy, PinnedCachePolicy):
+            # The cache entries of the other policies are only valid in
+            # the current process e.g. weak references.
+            state["_is_cached"] = False
+            state["_data"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._lock = threading.Lock()
+        self._inflight = None
+
     @property
-    def path(self) -> Path:
-        r"""The path to the file with data."""
+    def path(self) -> Path | str:
+        r"""The path to the file with data.
+
+        The path of a local file is a ``Path`` object, and the location
+        of a file in another storage backend is its URI.
+        """
         return self._path
 
+    @property
+    def loader(self) -> BaseLoader[T]:
+        r"""The data loader used to load the data file."""
+        return self._loader
+
+    def add_load_observer(self, observer: BaseLoadObserver) -> None:
+        r"""Add a load observer that is notified when the data of this
+        shard are loaded.
+
+        Adding the same observer several times has no effect.
+
+        Args:
+            observer: The observer to add.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.observer import MetricsRegistry
+            >>> from iden.shard import create_json_shard
+            >>> metrics = MetricsRegistry()
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shard = create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+            ...     shard.add_load_observer(metrics)
+            ...     data = shard.get_data()
+            ...
+            >>> metrics.get_counters()["shard/json"]["num_loads"]
+            1
+
+            ```
+        """
+        if observer not in self._observers:
+            self._observers = (*self._observers, observer)
+
+    def remove_load_observer(self, observer: BaseLoadObserver) -> None:
+        r"""Remove a load observer.
+
+        Removing an observer that was not added has no effect.
+
+        Args:
+            observer: The observer to remove.
+        """
+        self._observers = tuple(obs for obs in self._observers if obs is not observer)
+
+    def set_data_cache(self, cache: BaseDataCache | None) -> None:
+        r"""Set the data cache used when the data are loaded with
+        ``get_data(cache=True)``.
+
+        The data cache can share the data between the shards that
+        read the same file, between processes or between runs. It is
+        used for the loads with ``get_data(cache=True)``, or for all
+        the loads if it is persistent. The data are still kept by the
+        shard until ``clear`` is called, but ``clear`` does not remove
+        them from the data cache.
+
+        Args:
+            cache: The data cache, or ``None`` to only use the cache
+                of the shard. The key of the data is the path of the
+                data file.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.cache import SharedMemoryCache
+            >>> from iden.shard import create_json_shard
+            >>> cache = SharedMemoryCache()
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shard = create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+            ...     shard.set_data_cache(cache)
+            ...     shard.get_data(cache=True)
+            ...     shard.path.as_posix() in cache
+            ...
+            [1, 2, 3]
+            True
+            >>> cache.clear()
+
+            ```
+        """
+        self._data_cache = cache
+
+    def set_cache_policy(self, policy: BaseCachePolicy | None) -> None:
+        r"""Set the cache policy that decides how long the data loaded
+        with ``get_data(cache=True)`` are kept.
+
+        The cached data are removed when the cache policy is changed.
+        ``WeakRefCachePolicy`` only works for the data that support
+        weak references e.g. arrays and most objects, and it raises a
+        ``TypeError`` for the ``list`` and ``dict`` data.
+
+        Args:
+            policy: The cache policy, or ``None`` to keep the data
+                until ``clear`` is called.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.cache import FileChangeCachePolicy
+            >>> from iden.io import save_json
+            >>> from iden.shard import create_json_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     shard = create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+            ...     shard.set_cache_policy(FileChangeCachePolicy())
+            ...     shard.get_data(cache=True)
+            ...     save_json([1, 2, 3, 4], shard.path, exist_ok=True)
+            ...     shard.get_data(cache=True)
+            ...
+            [1, 2, 3]
+            [1, 2, 3, 4]
+
+            ```
+        """
+        policy = policy or _DEFAULT_CACHE_POLICY
+        if policy is self._cache_policy:
+            return
+        with self._lock:
+            self._cache_policy = policy
+            self._is_cached = False
+            self._data = None
+            self._inflight = None
+
     def clear(self) -> None:
-        self._is_cached = False
-        self._data = None
+        with self._lock:
+            if self._is_cached:
+                trace_instant("cache_clear", category="cache", uri=self._uri)
+            self._is_cached = False
+            self._data = None
+            # the data of an ongoing load are not cached
+            self._inflight = None
 
     def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
         if type(other) is not type(self):
@@ -80,20 +295,190 @@ class FileShard(BaseShard[T]):
         return self.get_uri() == other.get_uri() and self.path == other.path
 
     def get_data(self, cache: bool = False) -> T:
-        if not self._is_cached:
-            data = self._loader.load(self._path)
-            if cache:
-                self._data = data
+        if not self._observers and not has_load_observers():
+            return self._get_data(cache)
+        cached = self.is_cached()
+        nbytes = self._metadata.get(NBYTES)
+        if nbytes is None and not cached:
+            storage = get_storage(self._path)
+            if storage.exists(self._path):
+                nbytes = storage.stat(self._path).size
+        event = LoadEvent(
+            kind="shard",
+            uri=self._uri,
+            path=self._path,
+            fmt=get_extension(self._path),
+            nbytes=nbytes,
+            cached=cached,
+        )
+        with observe_load(event, observers=self._observers):
+            return self._get_data(cache)
+
+    def _get_data(self, cache: bool) -> T:
+        r"""Get the data in the shard, from the cache if possible.
+
+        If the data are not cached and ``cache=True``, only one thread
+        loads the data and the other threads wait for its result. If
+        the load fails, a waiting thread loads the data again.
+
+        Args:
+            cache: If ``True``, the data are cached after loading.
+
+        Returns:
+            The data in the shard.
+        """
+        while True:
+            with self._lock:
+                if self._is_cached:
+                    is_valid, data = self._cache_policy.lookup(self._data, self._path)
+                    if is_valid:
+                        trace_instant("cache_hit", category="cache", uri=self._uri)
+                        return data
+                    trace_instant("cache_expire", category="cache", uri=self._uri)
+                    self._is_cached = False
+                    self._data = None
+                inflight = self._inflight
+                is_owner = cache and inflight is None
+                if is_owner:
+                    inflight = self._inflight = _InflightLoad()
+            if is_owner:
+                return self._load_inflight(inflight)
+            if not cache:
+                return self._load()
+            if inflight.wait():
+                trace_instant("cache_wait", category="cache", uri=self._uri)
+                return inflight.data
+
+    def _load_inflight(self, inflight: _InflightLoad) -> T:
+        r"""Load the data, cache them and share them with the threads
+        that wait for this load.
+
+        The data are not cached if ``clear`` or ``set_cache_policy`` is
+        called during the load.
+
+        Args:
+            inflight: The load that the other threads wait for.
+
+        Returns:
+            The data in the shard.
+        """
+        try:
+            data, entry = self._cache_policy.load(self._path, partial(self._load, cache=True))
+        except BaseException:
+            with self._lock:
+                if self._inflight is inflight:
+                    self._inflight = None
+            inflight.set_failed()
+            raise
+        with self._lock:
+            if self._inflight is inflight:
+                self._inflight = None
+                self._data = entry
                 self._is_cached = True
-        else:
-            data = self._data
+                trace_instant("cache_store", category="cache", uri=self._uri)
+        inflight.set_result(data)
         return data
 
+    def _load(self, cache: bool = False) -> T:
+        r"""Load the data from the file.
+
+        Args:
+            cache: If ``True``, the data cache is used if it is set.
+
+        Returns:
+            The data in the shard.
+        """
+        path = location_to_str(self._path)
+        with trace_span("load", category="io", uri=self._uri, path=path):
+            if self._data_cache is not None and (cache or self._data_cache.persistent):
+                return self._data_cache.get_or_load(path, partial(self._loader.load, self._path))
+            return self._loader.load(self._path)
+
+    def get_metadata(self) -> dict[str, Any]:
+        r"""Get the shard metadata.
+
+        The metadata are computed when the shard is created and are
+        stored in the URI file, so they can be read without loading
+        the data.
+
+        Returns:
+            The shard metadata. The dictionary is empty if no metadata
+                were recorded.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import create_json_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     uri = Path(tmpdir).joinpath("my_uri").as_uri()
+            ...     shard = create_json_shard([1, 2, 3], uri=uri)
+            ...     shard.get_metadata()
+            ...
+            {'num_records': 3, 'nbytes': 9}
+
+            ```
+        """
+        return dict(self._metadata)
+
+    def get_fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = compute_fingerprint(
+                type(self), [self._uri, location_to_str(self._path)]
+            )
+        return self._fingerprint
+
     def get_uri(self) -> str:
         return self._uri
 
     def is_cached(self) -> bool:
-        return self._is_cached
+        with self._lock:
+            return self._is_cached and self._cache_policy.lookup(self._data, self._path)[0]
+
+    @classmethod
+    def from_parts(
+        cls,
+        uri: str,
+        path: Path | str,
+        loader: BaseLoader[T],
+        metadata: dict[str, Any] | None = None,
+    ) -> S:
+        r"""Instantiate a shard from its parts, without sanitizing them.
+
+        This is a lightweight alternative to the constructor to create
+        many shards, for example to share the same loader between the
+        shards. The path is not sanitized, so it must be a ``Path``
+        object for a local file or a URI.
+
+        Args:
+            uri: The shard's URI.
+            path: The sanitized path to the file.
+            loader: The data loader. It can be shared with other
+                shards.
+            metadata: The shard metadata.
+
+        Returns:
+            The instantiated shard.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.io import JsonLoader, save_json
+            >>> from iden.shard import JsonShard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     file = Path(tmpdir).joinpath("data.json")
+            ...     save_json([1, 2, 3], file)
+            ...     shard = JsonShard.from_parts(uri="file:///data/uri", path=file, loader=JsonLoader())
+            ...     shard.get_data()
+            ...
+            [1, 2, 3]
+
+            ```
+        """
+        shard = cls.__new__(cls)
+        shard._init_fields(uri=uri, path=path, loader=loader, metadata=metadata or {})
+        return shard
 
     @classmethod
     def from_uri(cls, uri: str) -> S:
@@ -121,11 +506,13 @@ class FileShard(BaseShard[T]):
 
             ```
         """
-        config = load_json(sanitize_path(uri))
+        config = load_json(sanitize_location(uri))
         return cls(uri=uri, **config[KWARGS])
 
     @classmethod
-    def generate_uri_config(cls, path: Path) -> dict[str, Any]:
+    def generate_uri_config(
+        cls, path: Path | str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         r"""Generate the minimal config that is used to load the shard
         from its URI.
 
@@ -133,6 +520,8 @@ class FileShard(BaseShard[T]):
 
         Args:
             path: The path to the json file.
+            metadata: The shard metadata. It is not added to the
+                config if it is empty.
 
         Returns:
             The minimal config to load the shard from its URI.
@@ -151,7 +540,69 @@ class FileShard(BaseShard[T]):
 
             ```
         """
-        return {
-            KWARGS: {"path": sanitize_path(path).as_posix()},
-            LOADER: {OBJECT_TARGET: "iden.shard.loader.FileShardLoader"},
-        }
+        kwargs = {"path": location_to_str(sanitize_location(path))}
+        if metadata:
+            kwargs[METADATA] = metadata
+        return {KWARGS: kwargs, LOADER: {OBJECT_TARGET: "iden.shard.loader.FileShardLoader"}}
+
+
+class _InflightLoad:
+    r"""Implement a load of the data of a shard that other threads can
+    wait for."""
+
+    __slots__ = ("_event", "data", "failed")
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self.data = None
+        self.failed = False
+
+    def set_failed(self) -> None:
+        r"""Indicate that the load failed and wake up the waiting
+        threads."""
+        self.failed = True
+        self._event.set()
+
+    def set_result(self, data: Any) -> None:
+        r"""Set the loaded data and wake up the waiting threads.
+
+        Args:
+            data: The loaded data.
+        """
+        self.data = data
+        self._event.set()
+
+    def wait(self) -> bool:
+        r"""Wait until the load is done.
+
+        Returns:
+            ``True`` if the data were loaded, or ``False`` if the load
+                failed.
+        """
+        self._event.wait()
+        return not self.failed
+
+
+@cache
+def _get_state_slots(cls: type) -> tuple[str, ...]:
+    r"""Get the slots of a file shard class that are pickled.
+
+    The lock and the ongoing load are specific to the current process,
+    so they are not pickled.
+
+    Args:
+        cls: The file shard class.
+
+    Returns:
+        The names of the slots declared by the class and its parents.
+    """
+    excluded = {"__dict__", "__weakref__", "_inflight", "_lock"}
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        for name in [slots] if isinstance(slots, str) else slots:
+            # the private names are mangled with the class name
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{klass.__name__.lstrip('_')}{name}"  # noqa: PLW2901
+            names.append(name)
+    return tuple(name for name in dict.fromkeys(names) if name not in excluded)
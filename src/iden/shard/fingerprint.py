@@ -0,0 +1,147 @@
+r"""Contain functions to compute the fingerprints of the shards.
+
+A fingerprint is a stable hash that identifies a shard. The config
+fingerprint of a shard is computed from its type and its URI config
+e.g. the path of the data file, so it does not require loading the
+data. Two shards with the same config fingerprint are equal. The
+content fingerprint also depends on the files of the shard e.g. their
+size and modification time, so it changes when the files are
+rewritten.
+"""
+
+from __future__ import annotations
+
+__all__ = ["compute_fingerprint", "get_content_fingerprint"]
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from iden.storage import get_storage, open_file
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from iden.shard.base import BaseShard
+
+_CHUNK_SIZE = 1024 * 1024
+_METHODS = ("digest", "stat")
+
+
+def compute_fingerprint(cls: type, parts: Iterable[str]) -> str:
+    r"""Compute a fingerprint from a type and a sequence of strings.
+
+    The fingerprint is the SHA-256 hash of the qualified name of the
+    type and of the strings. Each string is prefixed by its length, so
+    two different sequences of strings have different fingerprints.
+
+    Args:
+        cls: The type of the fingerprinted object.
+        parts: The strings that identify the object.
+
+    Returns:
+        The fingerprint as a hexadecimal string.
+
+    Example:
+        ```pycon
+        >>> from iden.shard.fingerprint import compute_fingerprint
+        >>> fingerprint = compute_fingerprint(dict, ["abc", "de"])
+        >>> len(fingerprint)
+        64
+        >>> fingerprint == compute_fingerprint(dict, ["abc", "de"])
+        True
+        >>> fingerprint == compute_fingerprint(dict, ["ab", "cde"])
+        False
+
+        ```
+    """
+    digest = hashlib.sha256()
+    for part in (f"{cls.__module__}.{cls.__qualname__}", *parts):
+        data = part.encode()
+        digest.update(len(data).to_bytes(8, byteorder="little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def get_content_fingerprint(shard: BaseShard[Any], method: str = "stat") -> str | None:
+    r"""Compute the content fingerprint of a shard.
+
+    The content fingerprint combines the config fingerprint of the
+    shard and the state of its files, so it can be used as a cache key
+    that is invalidated when the files are rewritten. The content
+    fingerprint is not cached because the files can change.
+
+    Args:
+        shard: The shard. The content fingerprint of a ``ShardTuple``
+            or a ``ShardDict`` is computed from the content
+            fingerprints of its shards.
+        method: The method to fingerprint the files. ``'stat'`` uses
+            the size and the modification time of the files, and
+            ``'digest'`` uses the SHA-256 hash of their bytes, which
+            reads the files.
+
+    Returns:
+        The content fingerprint, or ``None`` if the shard does not
+            have a config fingerprint e.g. an ``InMemoryShard``.
+
+    Raises:
+        ValueError: if the method is not supported.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.io import save_json
+        >>> from iden.shard import create_json_shard
+        >>> from iden.shard.fingerprint import get_content_fingerprint
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shard = create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+        ...     fingerprint = get_content_fingerprint(shard, method="digest")
+        ...     save_json([1, 2], shard.path, exist_ok=True)
+        ...     fingerprint == get_content_fingerprint(shard, method="digest")
+        ...
+        False
+
+        ```
+    """
+    if method not in _METHODS:
+        msg = f"Incorrect method: {method}. The supported methods are {_METHODS}"
+        raise ValueError(msg)
+    # local import to avoid cyclic dependencies
+    from iden.shard import FileShard, ShardDict, ShardTuple  # noqa: PLC0415
+
+    fingerprint = shard.get_fingerprint()
+    if fingerprint is None:
+        return None
+    if isinstance(shard, FileShard):
+        if method == "digest":
+            parts = [method, _get_file_digest(shard.path)]
+        else:
+            stat = get_storage(shard.path).stat(shard.path)
+            parts = [method, str(stat.size), str(stat.mtime_ns)]
+        return compute_fingerprint(type(shard), [fingerprint, *parts])
+    if isinstance(shard, ShardTuple):
+        children = [get_content_fingerprint(child, method) for child in shard.get_data()]
+    elif isinstance(shard, ShardDict):
+        children = []
+        for key, child in sorted(shard.get_data().items()):
+            children.extend([key, get_content_fingerprint(child, method)])
+    else:
+        return fingerprint
+    return compute_fingerprint(type(shard), [fingerprint, *children])
+
+
+def _get_file_digest(path: Path | str) -> str:
+    r"""Compute the SHA-256 hash of the bytes of a file.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The hash as a hexadecimal string.
+    """
+    digest = hashlib.sha256()
+    with open_file(path, mode="rb") as file:
+        while chunk := file.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -18,20 +18,43 @@ __all__ = [
     "setup_shard_generator",
 ]
 
+from typing import TYPE_CHECKING
+
 from iden.shard.generator.base import (
     BaseShardGenerator,
     is_shard_generator_config,
     setup_shard_generator,
 )
-from iden.shard.generator.cloudpickle import CloudpickleShardGenerator
-from iden.shard.generator.dict import ShardDictGenerator
-from iden.shard.generator.joblib import JoblibShardGenerator
-from iden.shard.generator.json import JsonShardGenerator
-from iden.shard.generator.pickle import PickleShardGenerator
-from iden.shard.generator.safetensors import (
-    NumpySafetensorsShardGenerator,
-    TorchSafetensorsShardGenerator,
+from iden.utils.lazy import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from iden.shard.generator.cloudpickle import CloudpickleShardGenerator
+    from iden.shard.generator.dict import ShardDictGenerator
+    from iden.shard.generator.joblib import JoblibShardGenerator
+    from iden.shard.generator.json import JsonShardGenerator
+    from iden.shard.generator.pickle import PickleShardGenerator
+    from iden.shard.generator.safetensors import (
+        NumpySafetensorsShardGenerator,
+        TorchSafetensorsShardGenerator,
+    )
+    from iden.shard.generator.torch import TorchShardGenerator
+    from iden.shard.generator.tuple import ShardTupleGenerator
+    from iden.shard.generator.yaml import YamlShardGenerator
+
+__getattr__, __dir__ = create_lazy_getattr(
+    __name__,
+    {
+        "iden.shard.generator.cloudpickle": ("CloudpickleShardGenerator",),
+        "iden.shard.generator.dict": ("ShardDictGenerator",),
+        "iden.shard.generator.joblib": ("JoblibShardGenerator",),
+        "iden.shard.generator.json": ("JsonShardGenerator",),
+        "iden.shard.generator.pickle": ("PickleShardGenerator",),
+        "iden.shard.generator.safetensors": (
+            "NumpySafetensorsShardGenerator",
+            "TorchSafetensorsShardGenerator",
+        ),
+        "iden.shard.generator.torch": ("TorchShardGenerator",),
+        "iden.shard.generator.tuple": ("ShardTupleGenerator",),
+        "iden.shard.generator.yaml": ("YamlShardGenerator",),
+    },
 )
-from iden.shard.generator.torch import TorchShardGenerator
-from iden.shard.generator.tuple import ShardTupleGenerator
-from iden.shard.generator.yaml import YamlShardGenerator
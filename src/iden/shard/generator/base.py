@@ -8,10 +8,11 @@ import logging
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from coola.equality.tester import EqualNanEqualityTester, get_default_registry
 from objectory import AbstractFactory
 from objectory.utils import is_object_config
 
+from iden.utils.equality import register_equality_tester
+
 if TYPE_CHECKING:
     from iden.shard import BaseShard
 
@@ -198,4 +199,4 @@ def setup_shard_generator(
     return shard_generator
 
 
-get_default_registry().register(BaseShardGenerator, EqualNanEqualityTester(), exist_ok=True)
+register_equality_tester(BaseShardGenerator)
@@ -6,11 +6,11 @@ __all__ = ["ShardDictGenerator"]
 
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.equality import objects_are_equal
 from coola.utils.format import repr_indent, repr_mapping, str_indent, str_mapping
 
 from iden.shard import BaseShard, ShardDict, create_shard_dict
 from iden.shard.generator.base import BaseShardGenerator, setup_shard_generator
+from iden.utils.equality import objects_are_equal
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -100,6 +100,7 @@ class ShardDictGenerator(BaseShardGenerator[dict[str, BaseShard[T]]]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if type(other) is not type(self):
             return False
+
         return (
             objects_are_equal(self._shards, other._shards, equal_nan=equal_nan)
             and self._path_uri == other._path_uri
@@ -90,6 +90,41 @@ class BaseFileShardGenerator(BaseShardGenerator[T]):
         data = self._data.generate()
         return self._generate(data=data, shard_id=shard_id)
 
+    def generate_from_data(self, data: T, shard_id: str) -> BaseShard[T]:
+        r"""Generate a shard with the given data instead of the data
+        from the data generator.
+
+        The shard is saved with the same layout as the shards created
+        by ``generate``.
+
+        Args:
+            data: The data to save in the shard.
+            shard_id: The shard ID.
+
+        Returns:
+            The generated shard.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.data.generator import DataGenerator
+            >>> from iden.shard.generator import JsonShardGenerator
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     generator = JsonShardGenerator(
+            ...         data=DataGenerator([1, 2, 3]),
+            ...         path_uri=Path(tmpdir).joinpath("uri"),
+            ...         path_shard=Path(tmpdir).joinpath("data"),
+            ...     )
+            ...     shard = generator.generate_from_data([4, 5], "shard1")
+            ...     shard.get_data()
+            ...
+            [4, 5]
+
+            ```
+        """
+        return self._generate(data=data, shard_id=shard_id)
+
     @abstractmethod
     def _generate(self, data: T, shard_id: str) -> BaseShard[T]:
         r"""Generate a shard based on the data and shard ID.
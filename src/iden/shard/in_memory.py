@@ -6,9 +6,9 @@ __all__ = ["InMemoryShard"]
 
 from typing import Any, TypeVar
 
-from coola.equality import objects_are_equal
-
 from iden.shard.base import BaseShard
+from iden.shard.metadata import generate_metadata
+from iden.utils.equality import objects_are_equal
 
 T = TypeVar("T")
 
@@ -46,6 +46,9 @@ class InMemoryShard(BaseShard[T]):
     def get_data(self, cache: bool = False) -> T:  # noqa: ARG002
         return self._data
 
+    def get_metadata(self) -> dict[str, Any]:
+        return generate_metadata(self._data)
+
     def get_uri(self) -> str | None:
         return None
 
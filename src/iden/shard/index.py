@@ -0,0 +1,263 @@
+r"""Contain an index to access the records stored in a sequence of
+shards."""
+
+from __future__ import annotations
+
+__all__ = ["RecordIndex"]
+
+from bisect import bisect_right
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from iden.constants import NUM_RECORDS
+from iden.data.records import concat_records, get_record, slice_records
+from iden.shard.compact import CompactShardSequence
+from iden.shard.metadata import get_shard_num_records
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from iden.shard.base import BaseShard
+
+T = TypeVar("T")
+
+
+class RecordIndex(Generic[T]):
+    r"""Implement an index to access the records stored in a sequence
+    of shards.
+
+    The index stores the cumulative number of records of the shards,
+    so the shard that contains a record is found with a binary search.
+    Only the shards that contain the requested records are loaded.
+    The number of records of a shard is read from its metadata if it
+    is available, otherwise the shard is loaded once to count its
+    records. The data of the last loaded shard are kept, so the
+    sequential reads load each shard once. The shards of a
+    ``CompactShardSequence`` are not copied,
+    and their number of records is read from the packed metadata, so
+    only the loaded shards are materialized.
+
+    Args:
+        shards: The shards to index.
+
+    Raises:
+        TypeError: if the data in a shard do not have a record
+            structure.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard
+        >>> from iden.shard.index import RecordIndex
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     index = RecordIndex(
+        ...         [
+        ...             create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+        ...             create_json_shard([4, 5, 6, 7], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+        ...         ]
+        ...     )
+        ...     len(index), index.get_record(4), index.get_slice(1, 5)
+        ...
+        (7, 5, [2, 3, 4, 5])
+
+        ```
+    """
+
+    def __init__(self, shards: Sequence[BaseShard[T]]) -> None:
+        self._shards = shards if isinstance(shards, CompactShardSequence) else tuple(shards)
+        self._offsets = list(
+            accumulate(
+                (_get_num_records(self._shards, i) for i in range(len(self._shards))), initial=0
+            )
+        )
+        # The position and the data of the last loaded shard.
+        self._last: tuple[int, Any] | None = None
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(num_shards={len(self._shards):,}, "
+            f"num_records={len(self):,})"
+        )
+
+    def find(self, index: int) -> tuple[int, int]:
+        r"""Find the shard that contains a record.
+
+        Args:
+            index: The index of the record. A negative index counts
+                from the end.
+
+        Returns:
+            A tuple with the position of the shard and the index of
+                the record in this shard.
+
+        Raises:
+            IndexError: if the index is out of range.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import create_json_shard
+            >>> from iden.shard.index import RecordIndex
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     index = RecordIndex(
+            ...         [
+            ...             create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+            ...             create_json_shard([4, 5, 6], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+            ...         ]
+            ...     )
+            ...     index.find(4)
+            ...
+            (1, 1)
+
+            ```
+        """
+        num_records = len(self)
+        if index < 0:
+            index += num_records
+        if not 0 <= index < num_records:
+            msg = f"record index out of range (num_records={num_records:,})"
+            raise IndexError(msg)
+        position = bisect_right(self._offsets, index) - 1
+        return position, index - self._offsets[position]
+
+    def get_record(self, index: int) -> Any:
+        r"""Get a record.
+
+        Only the shard that contains the record is loaded.
+
+        Args:
+            index: The index of the record. A negative index counts
+                from the end.
+
+        Returns:
+            The record.
+
+        Raises:
+            IndexError: if the index is out of range.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import create_json_shard
+            >>> from iden.shard.index import RecordIndex
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     index = RecordIndex(
+            ...         [
+            ...             create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+            ...             create_json_shard([4, 5, 6], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+            ...         ]
+            ...     )
+            ...     index.get_record(-1)
+            ...
+            6
+
+            ```
+        """
+        position, local = self.find(index)
+        return get_record(self._get_data(position), local)
+
+    def get_slice(self, start: int, stop: int) -> Any:
+        r"""Get a contiguous slice of records.
+
+        Only the shards that contain the records are loaded. The
+        indices follow the same rules as the Python slices. An empty
+        slice is taken from the data of the last loaded shard, so
+        only the first shard is loaded if no shard was loaded before.
+
+        Args:
+            start: The index of the first record.
+            stop: The index after the last record.
+
+        Returns:
+            The records between ``start`` and ``stop``, concatenated
+                across the shards.
+
+        Raises:
+            IndexError: if the index is empty.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.shard import create_json_shard
+            >>> from iden.shard.index import RecordIndex
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     index = RecordIndex(
+            ...         [
+            ...             create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+            ...             create_json_shard([4, 5, 6], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+            ...         ]
+            ...     )
+            ...     index.get_slice(2, 5)
+            ...
+            [3, 4, 5]
+
+            ```
+        """
+        if not self._shards:
+            msg = "cannot slice an empty record index"
+            raise IndexError(msg)
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if stop <= start:
+            last = self._last
+            data = self._get_data(0) if last is None else last[1]
+            return slice_records(data, 0, 0)
+        first = bisect_right(self._offsets, start) - 1
+        chunks = []
+        for position in range(first, len(self._shards)):
+            offset = self._offsets[position]
+            if offset >= stop:
+                break
+            chunks.append(
+                slice_records(
+                    self._get_data(position),
+                    max(start - offset, 0),
+                    min(stop, self._offsets[position + 1]) - offset,
+                )
+            )
+        return concat_records(chunks)
+
+    def _get_data(self, position: int) -> Any:
+        r"""Get the data of a shard.
+
+        The data of the last loaded shard are reused, so the shard is
+        not loaded again.
+
+        Args:
+            position: The position of the shard.
+
+        Returns:
+            The data of the shard.
+        """
+        last = self._last
+        if last is not None and last[0] == position:
+            return last[1]
+        data = self._shards[position].get_data()
+        self._last = (position, data)
+        return data
+
+
+def _get_num_records(shards: Sequence[BaseShard[Any]], index: int) -> int:
+    r"""Get the number of records in a shard of a sequence.
+
+    The number of records of a shard in a ``CompactShardSequence`` is
+    read from the packed metadata, so the shard is not materialized.
+
+    Args:
+        shards: The shards.
+        index: The index of the shard.
+
+    Returns:
+        The number of records in the shard.
+    """
+    if isinstance(shards, CompactShardSequence):
+        num_records = shards.get_metadata(index).get(NUM_RECORDS)
+        if num_records is not None:
+            return num_records
+    return get_shard_num_records(shards[index])
@@ -7,12 +7,13 @@ __all__ = ["JoblibShard", "create_joblib_shard"]
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA
 from iden.io import JoblibLoader, JoblibSaver, JsonSaver
 from iden.shard.file import FileShard
+from iden.shard.metadata import generate_metadata
+from iden.storage import location_to_str, sanitize_location
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -33,6 +34,8 @@ class JoblibShard(FileShard[T]):
     Args:
         uri: The shard's URI.
         path: The path to the joblib file.
+        metadata: The shard metadata e.g. the number of records or
+            the file size.
 
     Raises:
         RuntimeError: if ``joblib`` is not installed.
@@ -54,11 +57,15 @@ class JoblibShard(FileShard[T]):
         ```
     """
 
-    def __init__(self, uri: str, path: Path | str) -> None:
-        super().__init__(uri, path, loader=JoblibLoader())
+    __slots__ = ()
+
+    def __init__(self, uri: str, path: Path | str, metadata: dict[str, Any] | None = None) -> None:
+        super().__init__(uri, path, loader=JoblibLoader(), metadata=metadata)
 
     @classmethod
-    def generate_uri_config(cls, path: Path) -> dict[str, Any]:
+    def generate_uri_config(
+        cls, path: Path | str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         r"""Generate the minimal config that is used to load the shard
         from its URI.
 
@@ -66,6 +73,8 @@ class JoblibShard(FileShard[T]):
 
         Args:
             path: The path to the pickle file.
+            metadata: The shard metadata. It is not added to the
+                config if it is empty.
 
         Returns:
             The minimal config to load the shard from its URI.
@@ -84,13 +93,13 @@ class JoblibShard(FileShard[T]):
 
             ```
         """
-        return {
-            KWARGS: {"path": sanitize_path(path).as_posix()},
-            LOADER: {OBJECT_TARGET: "iden.shard.loader.JoblibShardLoader"},
-        }
+        kwargs = {"path": location_to_str(sanitize_location(path))}
+        if metadata:
+            kwargs[METADATA] = metadata
+        return {KWARGS: kwargs, LOADER: {OBJECT_TARGET: "iden.shard.loader.JoblibShardLoader"}}
 
 
-def create_joblib_shard(data: T, uri: str, path: Path | None = None) -> JoblibShard[T]:
+def create_joblib_shard(data: T, uri: str, path: Path | str | None = None) -> JoblibShard[T]:
     r"""Create a ``JoblibShard`` from data.
 
     Note:
@@ -124,9 +133,12 @@ def create_joblib_shard(data: T, uri: str, path: Path | None = None) -> JoblibSh
         ```
     """
     if path is None:
-        path = sanitize_path(uri + ".joblib")
-    logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(JoblibShard.generate_uri_config(path), sanitize_path(uri))
+        path = sanitize_location(uri + ".joblib")
     logger.info(f"Saving data in file {path}")
     JoblibSaver().save(data, path)
-    return JoblibShard(uri, path)
+    metadata = generate_metadata(data, path=path)
+    logger.info(f"Saving URI file {uri}")
+    JsonSaver().save(
+        JoblibShard.generate_uri_config(path, metadata=metadata), sanitize_location(uri)
+    )
+    return JoblibShard(uri, path, metadata=metadata)
@@ -7,12 +7,13 @@ __all__ = ["JsonShard", "create_json_shard"]
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA
 from iden.io import JsonLoader, JsonSaver
 from iden.shard.file import FileShard
+from iden.shard.metadata import generate_metadata
+from iden.storage import location_to_str, sanitize_location
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -32,6 +33,8 @@ class JsonShard(FileShard[T]):
     Args:
         uri: The shard's URI.
         path: The path to the JSON file.
+        metadata: The shard metadata e.g. the number of records or
+            the file size.
 
     Example:
         ```pycon
@@ -50,11 +53,15 @@ class JsonShard(FileShard[T]):
         ```
     """
 
-    def __init__(self, uri: str, path: Path | str) -> None:
-        super().__init__(uri, path, loader=JsonLoader())
+    __slots__ = ()
+
+    def __init__(self, uri: str, path: Path | str, metadata: dict[str, Any] | None = None) -> None:
+        super().__init__(uri, path, loader=JsonLoader(), metadata=metadata)
 
     @classmethod
-    def generate_uri_config(cls, path: Path) -> dict[str, Any]:
+    def generate_uri_config(
+        cls, path: Path | str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         r"""Generate the minimal config that is used to load the shard
         from its URI.
 
@@ -62,6 +69,8 @@ class JsonShard(FileShard[T]):
 
         Args:
             path: The path to the json file.
+            metadata: The shard metadata. It is not added to the
+                config if it is empty.
 
         Returns:
             The minimal config to load the shard from its URI.
@@ -80,13 +89,13 @@ class JsonShard(FileShard[T]):
 
             ```
         """
-        return {
-            KWARGS: {"path": sanitize_path(path).as_posix()},
-            LOADER: {OBJECT_TARGET: "iden.shard.loader.JsonShardLoader"},
-        }
+        kwargs = {"path": location_to_str(sanitize_location(path))}
+        if metadata:
+            kwargs[METADATA] = metadata
+        return {KWARGS: kwargs, LOADER: {OBJECT_TARGET: "iden.shard.loader.JsonShardLoader"}}
 
 
-def create_json_shard(data: T, uri: str, path: Path | None = None) -> JsonShard[T]:
+def create_json_shard(data: T, uri: str, path: Path | str | None = None) -> JsonShard[T]:
     r"""Create a ``JsonShard`` from data.
 
     Note:
@@ -117,9 +126,10 @@ def create_json_shard(data: T, uri: str, path: Path | None = None) -> JsonShard[
         ```
     """
     if path is None:
-        path = sanitize_path(uri + ".json")
-    logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(JsonShard.generate_uri_config(path), sanitize_path(uri))
+        path = sanitize_location(uri + ".json")
     logger.info(f"Saving data in file {path}")
     JsonSaver().save(data, path)
-    return JsonShard(uri, path)
+    metadata = generate_metadata(data, path=path)
+    logger.info(f"Saving URI file {uri}")
+    JsonSaver().save(JsonShard.generate_uri_config(path, metadata=metadata), sanitize_location(uri))
+    return JsonShard(uri, path, metadata=metadata)
@@ -5,6 +5,7 @@ from __future__ import annotations
 __all__ = [
     "BaseShardLoader",
     "CloudpickleShardLoader",
+    "CompactShardTupleLoader",
     "FileShardLoader",
     "JoblibShardLoader",
     "JsonShardLoader",
@@ -19,21 +20,45 @@ __all__ = [
     "setup_shard_loader",
 ]
 
+from typing import TYPE_CHECKING
+
 from iden.shard.loader.base import (
     BaseShardLoader,
     is_shard_loader_config,
     setup_shard_loader,
 )
-from iden.shard.loader.cloudpickle import CloudpickleShardLoader
-from iden.shard.loader.dict import ShardDictLoader
-from iden.shard.loader.file import FileShardLoader
-from iden.shard.loader.joblib import JoblibShardLoader
-from iden.shard.loader.json import JsonShardLoader
-from iden.shard.loader.pickle import PickleShardLoader
-from iden.shard.loader.safetensors import (
-    NumpySafetensorsShardLoader,
-    TorchSafetensorsShardLoader,
+from iden.utils.lazy import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from iden.shard.loader.cloudpickle import CloudpickleShardLoader
+    from iden.shard.loader.dict import ShardDictLoader
+    from iden.shard.loader.file import FileShardLoader
+    from iden.shard.loader.joblib import JoblibShardLoader
+    from iden.shard.loader.json import JsonShardLoader
+    from iden.shard.loader.pickle import PickleShardLoader
+    from iden.shard.loader.safetensors import (
+        NumpySafetensorsShardLoader,
+        TorchSafetensorsShardLoader,
+    )
+    from iden.shard.loader.torch import TorchShardLoader
+    from iden.shard.loader.tuple import CompactShardTupleLoader, ShardTupleLoader
+    from iden.shard.loader.yaml import YamlShardLoader
+
+__getattr__, __dir__ = create_lazy_getattr(
+    __name__,
+    {
+        "iden.shard.loader.cloudpickle": ("CloudpickleShardLoader",),
+        "iden.shard.loader.dict": ("ShardDictLoader",),
+        "iden.shard.loader.file": ("FileShardLoader",),
+        "iden.shard.loader.joblib": ("JoblibShardLoader",),
+        "iden.shard.loader.json": ("JsonShardLoader",),
+        "iden.shard.loader.pickle": ("PickleShardLoader",),
+        "iden.shard.loader.safetensors": (
+            "NumpySafetensorsShardLoader",
+            "TorchSafetensorsShardLoader",
+        ),
+        "iden.shard.loader.torch": ("TorchShardLoader",),
+        "iden.shard.loader.tuple": ("CompactShardTupleLoader", "ShardTupleLoader"),
+        "iden.shard.loader.yaml": ("YamlShardLoader",),
+    },
 )
-from iden.shard.loader.torch import TorchShardLoader
-from iden.shard.loader.tuple import ShardTupleLoader
-from iden.shard.loader.yaml import YamlShardLoader
@@ -2,11 +2,12 @@ r"""Contain shard loader implementations."""
 
 from __future__ import annotations
 
-__all__ = ["ShardTupleLoader"]
+__all__ = ["CompactShardTupleLoader", "ShardTupleLoader"]
 
 from typing import Any, TypeVar
 
 from iden.shard.base import BaseShard
+from iden.shard.compact import CompactShardTuple
 from iden.shard.loader.base import BaseShardLoader
 from iden.shard.tuple import ShardTuple
 
@@ -57,3 +58,48 @@ class ShardTupleLoader(BaseShardLoader[tuple[BaseShard[T], ...]]):
 
     def load(self, uri: str) -> ShardTuple[T]:
         return ShardTuple.from_uri(uri)
+
+
+class CompactShardTupleLoader(BaseShardLoader[tuple[BaseShard[T], ...]]):
+    r"""Implement a loader for the compact tuples of file shards.
+
+    This loader reads shard configuration from a URI and instantiates a
+    ``CompactShardTuple``.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_compact_shard_tuple, create_json_shard
+        >>> from iden.shard.loader import CompactShardTupleLoader
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     uri = Path(tmpdir).joinpath("uri").as_uri()
+        ...     shards = [
+        ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()),
+        ...         create_json_shard(
+        ...             [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+        ...         ),
+        ...     ]
+        ...     create_compact_shard_tuple(shards, uri=uri)
+        ...     loader = CompactShardTupleLoader()
+        ...     shard = loader.load(uri)
+        ...     shard
+        ...
+        CompactShardTuple(
+          (uri): file:///.../uri
+          (shards):
+            (0): JsonShard(uri=file:///.../shard/uri1)
+            (1): JsonShard(uri=file:///.../shard/uri2)
+        )
+
+        ```
+    """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}()"
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
+        return type(other) is type(self)
+
+    def load(self, uri: str) -> CompactShardTuple[T]:
+        return CompactShardTuple.from_uri(uri)
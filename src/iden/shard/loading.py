@@ -7,11 +7,12 @@ __all__ = ["load_from_uri"]
 
 from typing import TYPE_CHECKING, Any
 
-from coola.utils.path import sanitize_path
-
 from iden.constants import LOADER
 from iden.io import load_json
+from iden.observer import LoadEvent, observe_load
 from iden.shard.loader import setup_shard_loader
+from iden.storage import get_storage, sanitize_location
+from iden.utils.trace import trace_span
 
 if TYPE_CHECKING:
     from iden.shard import BaseShard
@@ -44,10 +45,14 @@ def load_from_uri(uri: str) -> BaseShard[Any]:
 
         ```
     """
-    path = sanitize_path(uri)
-    if not path.is_file():
+    path = sanitize_location(uri)
+    if not get_storage(path).exists(path):
         msg = f"uri file does not exist: {path}"
         raise FileNotFoundError(msg)
-    config = load_json(path)
-    loader = setup_shard_loader(config[LOADER])
-    return loader.load(uri)
+    with (
+        trace_span("load_from_uri", category="uri", uri=uri, type="shard"),
+        observe_load(LoadEvent(kind="uri", uri=uri, path=path, fmt="shard")),
+    ):
+        config = load_json(path)
+        loader = setup_shard_loader(config[LOADER])
+        return loader.load(uri)
@@ -0,0 +1,142 @@
+r"""Contain utility functions to manage the shard metadata."""
+
+from __future__ import annotations
+
+__all__ = ["generate_metadata", "get_shard_num_records"]
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from iden.constants import DTYPE, FEATURES, NBYTES, NUM_RECORDS, SHAPE
+from iden.data.records import get_nbytes, get_num_records
+from iden.storage import get_storage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from iden.shard.base import BaseShard
+
+
+def generate_metadata(data: Any, path: Path | str | None = None) -> dict[str, Any]:
+    r"""Generate the metadata of the data stored in a shard.
+
+    The metadata can contain:
+
+    - ``num_records``: the number of records, if the data have a
+        record structure.
+    - ``nbytes``: the size of the file if ``path`` is given, otherwise
+        the size of the arrays in memory.
+    - ``shape`` and ``dtype``: the shape and data type of the array,
+        if the data are an array.
+    - ``features``: the shape and data type of each array, if the
+        data are a dictionary with arrays.
+
+    The metadata are stored in the shard's URI file, so they must be
+    compatible with the JSON format.
+
+    Args:
+        data: The data stored in the shard.
+        path: The path to the file where the data are stored.
+
+    Returns:
+        The metadata.
+
+    Example:
+        ```pycon
+        >>> import numpy as np
+        >>> from iden.shard.metadata import generate_metadata
+        >>> generate_metadata([1, 2, 3])
+        {'num_records': 3}
+        >>> generate_metadata({"key1": [1, 2, 3], "key2": "abc"})
+        {}
+        >>> generate_metadata({"key1": np.ones((4, 3), dtype=np.float32), "key2": np.arange(4)})
+        {'num_records': 4, 'nbytes': 80,
+         'features': {'key1': {'shape': [4, 3], 'dtype': 'float32'},
+                      'key2': {'shape': [4], 'dtype': 'int64'}}}
+
+        ```
+    """
+    metadata = {}
+    num_records = get_num_records(data)
+    if num_records is not None:
+        metadata[NUM_RECORDS] = num_records
+    nbytes = get_storage(path).stat(path).size if path is not None else get_nbytes(data)
+    if nbytes is not None:
+        metadata[NBYTES] = nbytes
+    if _is_array(data):
+        metadata.update(_get_array_metadata(data))
+    elif isinstance(data, Mapping):
+        features = {
+            str(key): _get_array_metadata(value) for key, value in data.items() if _is_array(value)
+        }
+        if features:
+            metadata[FEATURES] = features
+    return metadata
+
+
+def get_shard_num_records(shard: BaseShard[Any]) -> int:
+    r"""Get the number of records in a shard.
+
+    The number of records is read from the shard metadata if it is
+    available, otherwise the shard data are loaded to count the
+    records.
+
+    Args:
+        shard: The shard.
+
+    Returns:
+        The number of records in the shard.
+
+    Raises:
+        TypeError: if the data in the shard do not have a record
+            structure.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard
+        >>> from iden.shard.metadata import get_shard_num_records
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shard = create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+        ...     get_shard_num_records(shard)
+        ...
+        3
+
+        ```
+    """
+    num_records = shard.get_metadata().get(NUM_RECORDS)
+    if num_records is not None:
+        return num_records
+    data = shard.get_data()
+    num_records = get_num_records(data)
+    if num_records is None:
+        msg = f"Incorrect data type: {type(data)}. The data do not have a record structure"
+        raise TypeError(msg)
+    return num_records
+
+
+def _is_array(data: Any) -> bool:
+    r"""Indicate if the data is an array with a shape and a data type.
+
+    Args:
+        data: The data to check.
+
+    Returns:
+        ``True`` if the data is an array, otherwise ``False``.
+    """
+    return hasattr(data, "shape") and hasattr(data, "dtype")
+
+
+def _get_array_metadata(array: Any) -> dict[str, Any]:
+    r"""Get the metadata of an array.
+
+    Args:
+        array: The array e.g. a ``numpy.ndarray`` or a
+            ``torch.Tensor``.
+
+    Returns:
+        The shape and data type of the array. The data type is the
+            name without the package prefix e.g. ``'float32'``.
+    """
+    return {SHAPE: list(array.shape), DTYPE: str(array.dtype).rsplit(".", maxsplit=1)[-1]}
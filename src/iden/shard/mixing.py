@@ -0,0 +1,266 @@
+r"""Contain code to interleave the shards or records of several sources
+with sampling weights."""
+
+from __future__ import annotations
+
+__all__ = ["MixtureShardIterable"]
+
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from coola.utils.format import repr_indent, repr_mapping
+
+from iden.data.records import get_num_records, get_record
+from iden.shard.utils import PrefetchShardIterable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+    from iden.shard.base import BaseShard
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class MixtureShardIterable(Generic[T]):
+    r"""Implement an iterable that interleaves the shards or records of
+    several sources with sampling weights.
+
+    A source is a sequence of shards, for example the shards of a
+    dataset split returned by ``get_shards``. Each source loads its
+    next shards in its own background threads, so the sources are
+    loaded in parallel.
+
+    At each step, a source is sampled proportionally to its weight.
+    If the fraction of items already drawn from this source would
+    exceed its target fraction by more than ``tolerance``, the source
+    with the largest deficit is used instead. So the mixture ratio
+    stays within the tolerance while the order stays random.
+
+    Args:
+        sources: The sources. The keys are the source names and the
+            values are the shards.
+        weights: The sampling weight of each source. The weights are
+            normalized so they do not need to sum to 1. By default,
+            all the sources have the same weight.
+        unit: The unit of interleaving. ``'record'`` yields the
+            records of the shards, ``'shard'`` yields the data of the
+            shards.
+        tolerance: The maximum difference between the observed and
+            target fraction of a source.
+        num_prefetch: The number of shards loaded ahead for each
+            source.
+        seed: The random seed used to sample the sources.
+        stop_on_first_exhausted: If ``True``, the iteration stops when
+            a source is exhausted, so the mixture ratio is respected
+            until the end. If ``False``, the iteration continues with
+            the remaining sources until all the sources are exhausted.
+
+    Raises:
+        ValueError: if the sources or the weights are incorrect.
+
+    Example:
+        ```pycon
+        >>> from iden.shard import InMemoryShard
+        >>> from iden.shard.mixing import MixtureShardIterable
+        >>> iterable = MixtureShardIterable(
+        ...     sources={
+        ...         "a": [InMemoryShard(["a1", "a2", "a3"]), InMemoryShard(["a4", "a5", "a6"])],
+        ...         "b": [InMemoryShard(["b1", "b2", "b3"])],
+        ...     },
+        ...     weights={"a": 2, "b": 1},
+        ... )
+        >>> records = list(iterable)
+        >>> sum(record.startswith("a") for record in records), len(records)
+        (6, 9)
+        >>> iterable.get_stats()["b"]["num_items"]
+        3
+
+        ```
+    """
+
+    def __init__(
+        self,
+        sources: Mapping[str, Sequence[BaseShard[T]]],
+        weights: Mapping[str, float] | None = None,
+        *,
+        unit: str = "record",
+        tolerance: float = 0.01,
+        num_prefetch: int = 1,
+        seed: int = 0,
+        stop_on_first_exhausted: bool = True,
+    ) -> None:
+        if not sources:
+            msg = "sources cannot be empty"
+            raise ValueError(msg)
+        if weights is None:
+            weights = dict.fromkeys(sources, 1.0)
+        if set(weights) != set(sources):
+            msg = (
+                f"The weights keys ({sorted(weights)}) do not match the sources keys "
+                f"({sorted(sources)})"
+            )
+            raise ValueError(msg)
+        if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+            msg = f"The weights must be positive or zero and not all zero: {dict(weights)}"
+            raise ValueError(msg)
+        if unit not in {"record", "shard"}:
+            msg = f"Incorrect unit: '{unit}'. The valid values are 'record' and 'shard'"
+            raise ValueError(msg)
+        if tolerance < 0:
+            msg = f"tolerance must be positive or zero but received {tolerance}"
+            raise ValueError(msg)
+        self._sources = {name: tuple(shards) for name, shards in sources.items()}
+        self._weights = {name: float(weights[name]) for name in self._sources}
+        self._unit = unit
+        self._tolerance = tolerance
+        self._num_prefetch = num_prefetch
+        self._seed = seed
+        self._stop_on_first_exhausted = stop_on_first_exhausted
+        self._stats = {name: _SourceStats() for name in self._sources}
+
+    def __iter__(self) -> Iterator[Any]:
+        self._stats = {name: _SourceStats() for name in self._sources}
+        rng = random.Random(self._seed)  # noqa: S311
+        iterators = {
+            name: self._iter_source(name, shards)
+            for name, shards in self._sources.items()
+            if self._weights[name] > 0
+        }
+        try:
+            while iterators:
+                name = self._select_source(rng, active=list(iterators))
+                try:
+                    item = next(iterators[name])
+                except StopIteration:
+                    logger.debug(f"source '{name}' is exhausted")
+                    del iterators[name]
+                    if self._stop_on_first_exhausted:
+                        return
+                    continue
+                self._stats[name].num_items += 1
+                yield item
+        finally:
+            for iterator in iterators.values():
+                iterator.close()
+
+    def __repr__(self) -> str:
+        args = repr_indent(
+            repr_mapping(
+                {
+                    "weights": self._weights,
+                    "unit": self._unit,
+                    "tolerance": self._tolerance,
+                    "num_prefetch": self._num_prefetch,
+                    "seed": self._seed,
+                    "stop_on_first_exhausted": self._stop_on_first_exhausted,
+                }
+            )
+        )
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        r"""Get the statistics of each source for the last iteration.
+
+        The wait time is the time spent waiting for the data of a
+        source. The source with the largest wait time is the
+        bottleneck of the mixture.
+
+        Returns:
+            The statistics of each source: the number of items and
+                shards yielded, the fraction of the items, the wait
+                time in seconds, and the throughput in items per
+                second of wait time.
+
+        Example:
+            ```pycon
+            >>> from iden.shard import InMemoryShard
+            >>> from iden.shard.mixing import MixtureShardIterable
+            >>> iterable = MixtureShardIterable(
+            ...     sources={"a": [InMemoryShard([1, 2])], "b": [InMemoryShard([3, 4])]},
+            ... )
+            >>> _ = list(iterable)
+            >>> stats = iterable.get_stats()
+            >>> stats["a"]["num_items"], stats["a"]["num_shards"]
+            (2, 1)
+
+            ```
+        """
+        total = sum(stats.num_items for stats in self._stats.values())
+        return {
+            name: {
+                "num_items": stats.num_items,
+                "num_shards": stats.num_shards,
+                "fraction": stats.num_items / total if total else 0.0,
+                "wait_time": stats.wait_time,
+                "throughput": stats.num_items / stats.wait_time if stats.wait_time else 0.0,
+            }
+            for name, stats in self._stats.items()
+        }
+
+    def _iter_source(self, name: str, shards: Sequence[BaseShard[T]]) -> Iterator[Any]:
+        r"""Iterate over the items of a source.
+
+        Args:
+            name: The source name.
+            shards: The shards of the source.
+
+        Returns:
+            An iterator over the items of the source.
+        """
+        stats = self._stats[name]
+        iterator = iter(PrefetchShardIterable(shards, num_prefetch=self._num_prefetch))
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    data = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    stats.wait_time += time.perf_counter() - start
+                stats.num_shards += 1
+                if self._unit == "shard":
+                    yield data
+                    continue
+                num_records = get_num_records(data)
+                if num_records is None:
+                    msg = (
+                        f"Incorrect data type: {type(data)}. The data do not have a record "
+                        "structure"
+                    )
+                    raise TypeError(msg)
+                for i in range(num_records):
+                    yield get_record(data, i)
+        finally:
+            iterator.close()
+
+    def _select_source(self, rng: random.Random, active: list[str]) -> str:
+        r"""Select the source of the next item.
+
+        Args:
+            rng: The random number generator.
+            active: The names of the sources that are not exhausted.
+
+        Returns:
+            The name of the selected source.
+        """
+        total_weight = sum(self._weights[name] for name in active)
+        targets = {name: self._weights[name] / total_weight for name in active}
+        name = rng.choices(active, weights=[targets[name] for name in active])[0]
+        total = sum(self._stats[key].num_items for key in active) + 1
+        if (self._stats[name].num_items + 1) / total - targets[name] <= self._tolerance:
+            return name
+        return max(active, key=lambda key: targets[key] * total - self._stats[key].num_items)
+
+
+class _SourceStats:
+    r"""Implement a container for the statistics of a source."""
+
+    def __init__(self) -> None:
+        self.num_items = 0
+        self.num_shards = 0
+        self.wait_time = 0.0
@@ -0,0 +1,217 @@
+r"""Contain utility functions to partition shards across distributed
+ranks and data loading workers."""
+
+from __future__ import annotations
+
+__all__ = ["get_shard_weight", "get_worker_shards", "partition_shards", "select_partition"]
+
+import heapq
+import sys
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from iden.shard.utils import get_data_nbytes
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from iden.shard.base import BaseShard
+
+T = TypeVar("T")
+
+
+def get_shard_weight(shard: BaseShard[Any]) -> int:
+    r"""Get the weight of a shard used to balance the partitions.
+
+    The weight is the size of the data file of the shard (see
+    ``get_data_nbytes``), or 1 if the size is not available.
+
+    Args:
+        shard: The shard.
+
+    Returns:
+        The weight of the shard.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import InMemoryShard, create_json_shard
+        >>> from iden.shard.partition import get_shard_weight
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shard = create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+        ...     get_shard_weight(shard)
+        ...
+        9
+        >>> get_shard_weight(InMemoryShard([1, 2, 3]))
+        1
+
+        ```
+    """
+    return get_data_nbytes(shard) or 1
+
+
+def partition_shards(
+    shards: Sequence[BaseShard[T]], num_partitions: int
+) -> list[tuple[BaseShard[T], ...]]:
+    r"""Partition shards so the partitions have roughly the same number
+    of bytes.
+
+    The partitions are computed with the greedy longest processing
+    time heuristic: the shards are assigned by decreasing weight to
+    the partition with the smallest total weight. The ties are broken
+    by the shard order and the partition index, so the output is
+    deterministic. The shards in a partition keep their input order.
+
+    Args:
+        shards: The shards to partition.
+        num_partitions: The number of partitions.
+
+    Returns:
+        The partitions. Some partitions are empty if there are fewer
+            shards than partitions.
+
+    Raises:
+        ValueError: if ``num_partitions`` is not positive.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard
+        >>> from iden.shard.partition import partition_shards
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_json_shard(list(range(n)), uri=Path(tmpdir).joinpath(f"uri{i}").as_uri())
+        ...         for i, n in enumerate([50, 10, 20, 30])
+        ...     ]
+        ...     partition_shards(shards, num_partitions=2)
+        ...
+        [(JsonShard(uri=file:///.../uri0),),
+         (JsonShard(uri=file:///.../uri1), JsonShard(uri=file:///.../uri2), JsonShard(uri=file:///.../uri3))]
+
+        ```
+    """
+    return [
+        tuple(shards[i] for i in indices)
+        for indices in _partition_indices(shards, num_partitions=num_partitions)
+    ]
+
+
+def select_partition(
+    shards: Sequence[BaseShard[T]], rank: int, world_size: int
+) -> tuple[BaseShard[T], ...]:
+    r"""Select the shards assigned to a rank.
+
+    The shards are partitioned with ``partition_shards``, so all the
+    ranks get roughly the same number of bytes.
+
+    Args:
+        shards: The shards to partition.
+        rank: The rank of the current process.
+        world_size: The number of processes.
+
+    Returns:
+        The shards assigned to the rank.
+
+    Raises:
+        ValueError: if ``world_size`` is not positive or ``rank`` is
+            not in ``[0, world_size)``.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard
+        >>> from iden.shard.partition import select_partition
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_json_shard(list(range(n)), uri=Path(tmpdir).joinpath(f"uri{i}").as_uri())
+        ...         for i, n in enumerate([50, 10, 20, 30])
+        ...     ]
+        ...     select_partition(shards, rank=0, world_size=2)
+        ...
+        (JsonShard(uri=file:///.../uri0),)
+
+        ```
+    """
+    if world_size <= 0:
+        msg = f"world_size must be positive but received {world_size}"
+        raise ValueError(msg)
+    if not 0 <= rank < world_size:
+        msg = f"rank must be in [0, {world_size}) but received {rank}"
+        raise ValueError(msg)
+    return tuple(shards[i] for i in _partition_indices(shards, num_partitions=world_size)[rank])
+
+
+def get_worker_shards(shards: Sequence[BaseShard[T]]) -> tuple[BaseShard[T], ...]:
+    r"""Select the shards assigned to the current data loading worker.
+
+    The worker is found with ``torch.utils.data.get_worker_info``. The
+    shards are partitioned with ``partition_shards``, so all the
+    workers get roughly the same number of bytes. All the shards are
+    returned if the function is not called in a worker process or if
+    ``torch`` is not imported, because a data loading worker always
+    imports ``torch``.
+
+    Args:
+        shards: The shards to partition.
+
+    Returns:
+        The shards assigned to the current worker.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard
+        >>> from iden.shard.partition import get_worker_shards
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+        ...         create_json_shard([4, 5, 6], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+        ...     ]
+        ...     get_worker_shards(shards)
+        ...
+        (JsonShard(uri=file:///.../uri1), JsonShard(uri=file:///.../uri2))
+
+        ```
+    """
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return tuple(shards)
+    info = torch.utils.data.get_worker_info()
+    if info is None:
+        return tuple(shards)
+    return select_partition(shards, rank=info.id, world_size=info.num_workers)
+
+
+def _partition_indices(shards: Sequence[BaseShard[Any]], num_partitions: int) -> list[list[int]]:
+    r"""Partition the indices of shards so the partitions have roughly
+    the same number of bytes.
+
+    Only the indices are returned, so a lazy sequence of shards (for
+    example ``CompactShardSequence``) materializes only the shards of
+    the selected partition.
+
+    Args:
+        shards: The shards to partition.
+        num_partitions: The number of partitions.
+
+    Returns:
+        The sorted indices of the shards in each partition.
+
+    Raises:
+        ValueError: if ``num_partitions`` is not positive.
+    """
+    if num_partitions <= 0:
+        msg = f"num_partitions must be positive but received {num_partitions}"
+        raise ValueError(msg)
+    weights = [get_shard_weight(shards[i]) for i in range(len(shards))]
+    order = sorted(range(len(shards)), key=lambda i: (-weights[i], i))
+    heap = [(0, partition) for partition in range(num_partitions)]
+    assignments = [[] for _ in range(num_partitions)]
+    for i in order:
+        load, partition = heapq.heappop(heap)
+        assignments[partition].append(i)
+        heapq.heappush(heap, (load + weights[i], partition))
+    return [sorted(indices) for indices in assignments]
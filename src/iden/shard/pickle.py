@@ -7,12 +7,13 @@ __all__ = ["PickleShard", "create_pickle_shard"]
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA
 from iden.io import JsonSaver, PickleLoader, PickleSaver
 from iden.shard.file import FileShard
+from iden.shard.metadata import generate_metadata
+from iden.storage import location_to_str, sanitize_location
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -33,6 +34,8 @@ class PickleShard(FileShard[T]):
     Args:
         uri: The shard's URI.
         path: The path to the pickle file.
+        metadata: The shard metadata e.g. the number of records or
+            the file size.
 
     Example:
         ```pycon
@@ -51,11 +54,15 @@ class PickleShard(FileShard[T]):
         ```
     """
 
-    def __init__(self, uri: str, path: Path | str) -> None:
-        super().__init__(uri, path, loader=PickleLoader())
+    __slots__ = ()
+
+    def __init__(self, uri: str, path: Path | str, metadata: dict[str, Any] | None = None) -> None:
+        super().__init__(uri, path, loader=PickleLoader(), metadata=metadata)
 
     @classmethod
-    def generate_uri_config(cls, path: Path) -> dict[str, Any]:
+    def generate_uri_config(
+        cls, path: Path | str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         r"""Generate the minimal config that is used to load the shard
         from its URI.
 
@@ -63,6 +70,8 @@ class PickleShard(FileShard[T]):
 
         Args:
             path: The path to the pickle file.
+            metadata: The shard metadata. It is not added to the
+                config if it is empty.
 
         Returns:
             The minimal config to load the shard from its URI.
@@ -81,13 +90,13 @@ class PickleShard(FileShard[T]):
 
             ```
         """
-        return {
-            KWARGS: {"path": sanitize_path(path).as_posix()},
-            LOADER: {OBJECT_TARGET: "iden.shard.loader.PickleShardLoader"},
-        }
+        kwargs = {"path": location_to_str(sanitize_location(path))}
+        if metadata:
+            kwargs[METADATA] = metadata
+        return {KWARGS: kwargs, LOADER: {OBJECT_TARGET: "iden.shard.loader.PickleShardLoader"}}
 
 
-def create_pickle_shard(data: T, uri: str, path: Path | None = None) -> PickleShard[T]:
+def create_pickle_shard(data: T, uri: str, path: Path | str | None = None) -> PickleShard[T]:
     r"""Create a ``PickleShard`` from data.
 
     Note:
@@ -118,9 +127,12 @@ def create_pickle_shard(data: T, uri: str, path: Path | None = None) -> PickleSh
         ```
     """
     if path is None:
-        path = sanitize_path(uri + ".pkl")
-    logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(PickleShard.generate_uri_config(path), sanitize_path(uri))
+        path = sanitize_location(uri + ".pkl")
     logger.info(f"Saving data in file {path}")
     PickleSaver().save(data, path)
-    return PickleShard(uri, path)
+    metadata = generate_metadata(data, path=path)
+    logger.info(f"Saving URI file {uri}")
+    JsonSaver().save(
+        PickleShard.generate_uri_config(path, metadata=metadata), sanitize_location(uri)
+    )
+    return PickleShard(uri, path, metadata=metadata)
@@ -0,0 +1,165 @@
+r"""Contain an iterable to rebatch the records of shards into batches
+with a fixed size."""
+
+from __future__ import annotations
+
+__all__ = ["RebatchShardIterable"]
+
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from iden.data.records import (
+    copy_records,
+    empty_records,
+    get_num_records,
+    promote_records,
+    slice_records,
+)
+from iden.shard.utils import PrefetchShardIterable, ShardIterable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from iden.shard.base import BaseShard
+
+T = TypeVar("T")
+
+
+class RebatchShardIterable(Generic[T]):
+    r"""Implement an iterable that yields batches of records with a
+    fixed size, spanning the shard boundaries.
+
+    The records of the shards are indexed along the first dimension of
+    the data (see ``iden.data.records``). A batch that is fully inside
+    a shard is a view of the shard data, so it is not copied. The
+    other batches are filled by copying slices of the shards into a
+    preallocated buffer, so no data are concatenated. The buffer is
+    allocated the first time a batch is copied. By default, the same
+    buffer is reused for all the batches, so a yielded batch is only
+    valid until the next batch is requested. Set
+    ``reuse_buffers=False`` to allocate a new buffer for each copied
+    batch.
+
+    The buffer is checked against the data of each shard before its
+    records are used. If the data type of an array cannot store the
+    records of a shard, the buffer is reallocated with the promoted
+    data type, so a batch has the data type of the concatenated
+    records. A ``TypeError`` or a ``ValueError`` is raised if the
+    records of a shard have another structure, shape or device than
+    the buffer. The tuples are not supported because a tuple buffer
+    cannot be filled in-place: use lists instead.
+
+    Args:
+        iterable: The shard iterable.
+        batch_size: The number of records in each batch.
+        drop_last: If ``True``, the last batch is dropped if it has
+            fewer than ``batch_size`` records.
+        reuse_buffers: If ``True``, the buffer is reused between the
+            batches.
+        num_prefetch: The number of shards loaded ahead in background
+            threads. ``0`` means the shards are loaded when needed.
+
+    Raises:
+        ValueError: if ``batch_size`` is not positive or
+            ``num_prefetch`` is negative.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> import numpy as np
+        >>> from pathlib import Path
+        >>> from iden.shard import create_numpy_safetensors_shard
+        >>> from iden.shard.rebatch import RebatchShardIterable
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_numpy_safetensors_shard(
+        ...             {"key": np.arange(5)}, uri=Path(tmpdir).joinpath("uri1").as_uri()
+        ...         ),
+        ...         create_numpy_safetensors_shard(
+        ...             {"key": np.arange(5, 8)}, uri=Path(tmpdir).joinpath("uri2").as_uri()
+        ...         ),
+        ...     ]
+        ...     [batch["key"].tolist() for batch in RebatchShardIterable(shards, batch_size=3)]
+        ...
+        [[0, 1, 2], [3, 4, 5], [6, 7]]
+
+        ```
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[BaseShard[T]],
+        batch_size: int,
+        drop_last: bool = False,
+        reuse_buffers: bool = True,
+        num_prefetch: int = 0,
+    ) -> None:
+        if batch_size <= 0:
+            msg = f"batch_size must be positive but received {batch_size}"
+            raise ValueError(msg)
+        if num_prefetch < 0:
+            msg = f"num_prefetch must be positive or zero but received {num_prefetch}"
+            raise ValueError(msg)
+        self._iterable = iterable
+        self._batch_size = batch_size
+        self._drop_last = drop_last
+        self._reuse_buffers = reuse_buffers
+        self._num_prefetch = num_prefetch
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(batch_size={self._batch_size:,}, "
+            f"drop_last={self._drop_last}, reuse_buffers={self._reuse_buffers}, "
+            f"num_prefetch={self._num_prefetch:,})"
+        )
+
+    def __iter__(self) -> Iterator[T]:
+        batch_size = self._batch_size
+        buffer = None
+        size = 0
+        for data in self._iter_data():
+            num_records = get_num_records(data)
+            if num_records is None:
+                msg = f"Incorrect data type: {type(data)}. The data do not have a record structure"
+                raise TypeError(msg)
+            # the buffer is checked before any batch of the shard is
+            # yielded, so an incompatible shard fails early
+            if buffer is None:
+                # a buffer without records checks the data without
+                # allocating the memory of a batch
+                empty_records(data, 0)
+            else:
+                buffer = promote_records(buffer, data, size)
+            start = 0
+            while start < num_records:
+                if size == 0 and num_records - start >= batch_size:
+                    # the batch is fully inside the shard
+                    yield slice_records(data, start, start + batch_size)
+                    start += batch_size
+                    continue
+                if buffer is None:
+                    buffer = empty_records(data, batch_size)
+                elif size == 0:
+                    # the buffer may have been promoted for the records
+                    # of the previous shards, which were all yielded
+                    buffer = promote_records(buffer, data, 0)
+                length = min(batch_size - size, num_records - start)
+                copy_records(data, start, buffer, size, length)
+                size += length
+                start += length
+                if size == batch_size:
+                    yield buffer
+                    size = 0
+                    if not self._reuse_buffers:
+                        buffer = None
+        if size > 0 and not self._drop_last:
+            yield slice_records(buffer, 0, size)
+
+    def _iter_data(self) -> Iterable[Any]:
+        r"""Get the iterable over the shard data.
+
+        Returns:
+            The iterable over the shard data.
+        """
+        if self._num_prefetch > 0:
+            return PrefetchShardIterable(self._iterable, num_prefetch=self._num_prefetch)
+        return ShardIterable(self._iterable)
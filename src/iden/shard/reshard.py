@@ -0,0 +1,235 @@
+r"""Contain code to reshard a sequence of shards i.e. merge small shards
+and split large shards."""
+
+from __future__ import annotations
+
+__all__ = ["reshard"]
+
+import logging
+import math
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from iden.data.records import (
+    concat_records,
+    get_nbytes,
+    get_num_records,
+    slice_records,
+    take_records,
+)
+from iden.shard.tuple import ShardTuple, create_shard_tuple
+from iden.shard.utils import PrefetchShardIterable
+from iden.utils.time import get_default_timer_registry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Future
+
+    from iden.shard.base import BaseShard
+    from iden.shard.generator.file import BaseFileShardGenerator
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The maximum number of records pickled to estimate the number of bytes
+# of a record if the data are not arrays.
+_NUM_SAMPLE_RECORDS = 64
+
+
+def reshard(
+    shards: Iterable[BaseShard[T]],
+    generator: BaseFileShardGenerator[T] | dict[Any, Any],
+    uri: str,
+    *,
+    num_records: int | None = None,
+    num_bytes: int | None = None,
+    num_workers: int = 1,
+) -> ShardTuple[T]:
+    r"""Reshard a sequence of shards so each new shard has a target
+    number of records or bytes.
+
+    The input shards are read in order and their records are streamed
+    into new shards, so small shards are merged and large shards are
+    split. At most ``num_workers`` input shards are loaded ahead and at
+    most ``num_workers`` output shards are waiting to be written, so
+    the memory usage is bounded. The order of the records is preserved.
+
+    The data in the shards must have a record structure: a list, a
+    tuple, an array or a dictionary of arrays. The new shards are
+    created by the shard generator with the same layout as the shards
+    created by a ``ShardTupleGenerator``: the shard IDs are
+    ``000000001``, ``000000002``, etc. The data generator of the shard
+    generator is not used.
+
+    Args:
+        shards: The shards to reshard.
+        generator: The file shard generator or its configuration used
+            to create the new shards.
+        uri: The URI of the new ``ShardTuple``.
+        num_records: The target number of records per new shard.
+        num_bytes: The target number of bytes per new shard. The
+            number of bytes of a record is computed from the array
+            sizes, or estimated from the pickle size of a sample of
+            records if the data are not arrays.
+        num_workers: The number of threads used to read the input
+            shards, and the number of threads used to write the new
+            shards.
+
+    Returns:
+        The ``ShardTuple`` with the new shards. The last new shard can
+            have fewer records than the target.
+
+    Raises:
+        ValueError: if both or none of ``num_records`` and
+            ``num_bytes`` are set, or if a target is not positive.
+        TypeError: if the data in a shard do not have a record
+            structure.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.data.generator import DataGenerator
+        >>> from iden.shard import create_json_shard, reshard
+        >>> from iden.shard.generator import JsonShardGenerator
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()),
+        ...         create_json_shard([4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()),
+        ...     ]
+        ...     generator = JsonShardGenerator(
+        ...         data=DataGenerator(None),
+        ...         path_uri=Path(tmpdir).joinpath("new/uri"),
+        ...         path_shard=Path(tmpdir).joinpath("new/data"),
+        ...     )
+        ...     new = reshard(
+        ...         shards, generator, uri=Path(tmpdir).joinpath("new/tuple").as_uri(), num_records=2
+        ...     )
+        ...     [shard.get_data() for shard in new]
+        ...
+        [[1, 2], [3, 4], [5, 6], [7]]
+
+        ```
+    """
+    if (num_records is None) == (num_bytes is None):
+        msg = "Exactly one of num_records and num_bytes must be set"
+        raise ValueError(msg)
+    if (num_records if num_records is not None else num_bytes) <= 0:
+        msg = f"The target must be positive (num_records={num_records}, num_bytes={num_bytes})"
+        raise ValueError(msg)
+    # local import to avoid cyclic dependencies
+    from iden.shard.generator import setup_shard_generator  # noqa: PLC0415
+
+    generator = setup_shard_generator(generator)
+    num_workers = max(1, num_workers)
+    with ThreadPoolExecutor(num_workers) as writers:
+        writer = _ShardWriter(generator, executor=writers, max_pending=num_workers)
+        for data in PrefetchShardIterable(shards, num_prefetch=num_workers):
+            size = get_num_records(data)
+            if size is None:
+                msg = f"Incorrect data type: {type(data)}. The data do not have a record structure"
+                raise TypeError(msg)
+            record_nbytes = _get_record_nbytes(data, size) if num_bytes is not None else 0
+            start = 0
+            while start < size:
+                if num_records is not None:
+                    needed = num_records - writer.num_records
+                else:
+                    needed = max(1, math.ceil((num_bytes - writer.num_bytes) / record_nbytes))
+                stop = min(start + needed, size)
+                writer.add(slice_records(data, start, stop), stop - start, record_nbytes)
+                if stop - start == needed:
+                    writer.flush()
+                start = stop
+        writer.flush()
+        new_shards = writer.get_shards()
+    logger.info(f"Resharded the data into {len(new_shards):,} shards")
+    return create_shard_tuple(new_shards, uri=uri)
+
+
+class _ShardWriter:
+    r"""Implement a buffer that writes the new shards in background
+    threads.
+
+    Args:
+        generator: The shard generator used to create the new shards.
+        executor: The executor used to write the shards.
+        max_pending: The maximum number of shards waiting to be
+            written.
+    """
+
+    def __init__(
+        self, generator: BaseFileShardGenerator[Any], executor: ThreadPoolExecutor, max_pending: int
+    ) -> None:
+        self._generator = generator
+        self._executor = executor
+        self._max_pending = max_pending
+
+        self._chunks = []
+        self._futures: list[Future] = []
+        self.num_records = 0
+        self.num_bytes = 0
+
+    def add(self, chunk: Any, num_records: int, record_nbytes: float) -> None:
+        r"""Add a chunk of records to the current shard.
+
+        Args:
+            chunk: The chunk of records.
+            num_records: The number of records in the chunk.
+            record_nbytes: The number of bytes of a record.
+        """
+        self._chunks.append(chunk)
+        self.num_records += num_records
+        self.num_bytes += num_records * record_nbytes
+
+    def flush(self) -> None:
+        r"""Write the current shard if it is not empty."""
+        if not self._chunks:
+            return
+        pending = [future for future in self._futures if not future.done()]
+        timers = get_default_timer_registry()
+        if len(pending) >= self._max_pending:
+            with timers.timer("reshard.wait_write"):
+                pending[0].result()
+        with timers.timer("reshard.concat"):
+            data = concat_records(self._chunks)
+        shard_id = f"{len(self._futures) + 1:09}"
+        self._futures.append(
+            self._executor.submit(self._generator.generate_from_data, data, shard_id)
+        )
+        self._chunks = []
+        self.num_records = 0
+        self.num_bytes = 0
+
+    def get_shards(self) -> list[BaseShard[Any]]:
+        r"""Wait for all the shards to be written and return them.
+
+        Returns:
+            The new shards, in the order they were created.
+        """
+        return [future.result() for future in self._futures]
+
+
+def _get_record_nbytes(data: Any, num_records: int) -> float:
+    r"""Get the average number of bytes of a record.
+
+    If the data are not arrays, the number of bytes is estimated from
+    the pickle size of at most ``_NUM_SAMPLE_RECORDS`` records evenly
+    spaced in the data, so the whole data are not pickled.
+
+    Args:
+        data: The data.
+        num_records: The number of records in the data.
+
+    Returns:
+        The average number of bytes of a record.
+    """
+    nbytes = get_nbytes(data)
+    if nbytes is None:
+        num_samples = min(num_records, _NUM_SAMPLE_RECORDS)
+        sample = take_records(data, [i * num_records // num_samples for i in range(num_samples)])
+        nbytes = len(pickle.dumps(sample, protocol=pickle.HIGHEST_PROTOCOL))
+        num_records = num_samples
+    return max(nbytes, 1) / max(num_records, 1)
@@ -13,13 +13,15 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from coola.utils.imports import is_numpy_available, is_torch_available
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA
 from iden.io import JsonSaver
 from iden.io.safetensors import NumpyLoader, NumpySaver, TorchLoader, TorchSaver
 from iden.shard.file import FileShard
+from iden.shard.metadata import generate_metadata
+from iden.storage import location_to_str, sanitize_location
+from iden.utils.trace import trace_span
 
 if TYPE_CHECKING or is_numpy_available():
     import numpy as np
@@ -32,6 +34,7 @@ else:  # pragma: no cover
     from coola.utils.fallback.torch import torch
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -47,6 +50,8 @@ class NumpySafetensorsShard(FileShard[dict[str, np.ndarray]]):
     Args:
         uri: The shard's URI.
         path: The path to the safetensors file.
+        metadata: The shard metadata e.g. the number of records or
+            the file size.
 
     Raises:
         RuntimeError: if ``safetensors`` or ``numpy`` is not installed.
@@ -69,11 +74,49 @@ class NumpySafetensorsShard(FileShard[dict[str, np.ndarray]]):
         ```
     """
 
-    def __init__(self, uri: str, path: Path | str) -> None:
-        super().__init__(uri, path, loader=NumpyLoader())
+    __slots__ = ()
+
+    def __init__(self, uri: str, path: Path | str, metadata: dict[str, Any] | None = None) -> None:
+        super().__init__(uri, path, loader=NumpyLoader(), metadata=metadata)
+
+    def get_data_keys(self, keys: Sequence[str]) -> dict[str, np.ndarray]:
+        r"""Get some arrays of the shard.
+
+        If the data are not cached, only the header and the byte ranges
+        of the requested arrays are read from the file.
+
+        Args:
+            keys: The keys of the arrays to get.
+
+        Returns:
+            The arrays.
+
+        Raises:
+            KeyError: if a key does not exist in the shard.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> import numpy as np
+            >>> from pathlib import Path
+            >>> from iden.shard import create_numpy_safetensors_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     uri = Path(tmpdir).joinpath("my_uri").as_uri()
+            ...     shard = create_numpy_safetensors_shard(
+            ...         {"key1": np.ones((2, 3)), "key2": np.arange(5)}, uri=uri
+            ...     )
+            ...     shard.get_data_keys(["key2"])
+            ...
+            {'key2': array([0, 1, 2, 3, 4])}
+
+            ```
+        """
+        return _get_data_keys(self, keys)
 
     @classmethod
-    def generate_uri_config(cls, path: Path) -> dict[str, Any]:
+    def generate_uri_config(
+        cls, path: Path | str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         r"""Generate the minimal config that is used to load the shard
         from its URI.
 
@@ -81,6 +124,8 @@ class NumpySafetensorsShard(FileShard[dict[str, np.ndarray]]):
 
         Args:
             path: The path to the pickle file.
+            metadata: The shard metadata. It is not added to the
+                config if it is empty.
 
         Returns:
             The minimal config to load the shard from its URI.
@@ -100,8 +145,11 @@ class NumpySafetensorsShard(FileShard[dict[str, np.ndarray]]):
 
             ```
         """
+        kwargs = {"path": location_to_str(sanitize_location(path))}
+        if metadata:
+            kwargs[METADATA] = metadata
         return {
-            KWARGS: {"path": sanitize_path(path).as_posix()},
+            KWARGS: kwargs,
             LOADER: {OBJECT_TARGET: "iden.shard.loader.NumpySafetensorsShardLoader"},
         }
 
@@ -116,6 +164,8 @@ class TorchSafetensorsShard(FileShard[dict[str, torch.Tensor]]):
     Args:
         uri: The shard's URI.
         path: The path to the safetensors file.
+        metadata: The shard metadata e.g. the number of records or
+            the file size.
 
     Raises:
         RuntimeError: if ``safetensors`` or ``torch`` is not installed.
@@ -138,11 +188,49 @@ class TorchSafetensorsShard(FileShard[dict[str, torch.Tensor]]):
         ```
     """
 
-    def __init__(self, uri: str, path: Path | str) -> None:
-        super().__init__(uri, path, loader=TorchLoader())
+    __slots__ = ()
+
+    def __init__(self, uri: str, path: Path | str, metadata: dict[str, Any] | None = None) -> None:
+        super().__init__(uri, path, loader=TorchLoader(), metadata=metadata)
+
+    def get_data_keys(self, keys: Sequence[str]) -> dict[str, torch.Tensor]:
+        r"""Get some tensors of the shard.
+
+        If the data are not cached, only the header and the byte ranges
+        of the requested tensors are read from the file.
+
+        Args:
+            keys: The keys of the tensors to get.
+
+        Returns:
+            The tensors.
+
+        Raises:
+            KeyError: if a key does not exist in the shard.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> import torch
+            >>> from pathlib import Path
+            >>> from iden.shard import create_torch_safetensors_shard
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     uri = Path(tmpdir).joinpath("my_uri").as_uri()
+            ...     shard = create_torch_safetensors_shard(
+            ...         {"key1": torch.ones(2, 3), "key2": torch.arange(5)}, uri=uri
+            ...     )
+            ...     shard.get_data_keys(["key2"])
+            ...
+            {'key2': tensor([0, 1, 2, 3, 4])}
+
+            ```
+        """
+        return _get_data_keys(self, keys)
 
     @classmethod
-    def generate_uri_config(cls, path: Path) -> dict[str, Any]:
+    def generate_uri_config(
+        cls, path: Path | str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         r"""Generate the minimal config that is used to load the shard
         from its URI.
 
@@ -150,6 +238,8 @@ class TorchSafetensorsShard(FileShard[dict[str, torch.Tensor]]):
 
         Args:
             path: The path to the pickle file.
+            metadata: The shard metadata. It is not added to the
+                config if it is empty.
 
         Returns:
             The minimal config to load the shard from its URI.
@@ -169,14 +259,17 @@ class TorchSafetensorsShard(FileShard[dict[str, torch.Tensor]]):
 
             ```
         """
+        kwargs = {"path": location_to_str(sanitize_location(path))}
+        if metadata:
+            kwargs[METADATA] = metadata
         return {
-            KWARGS: {"path": sanitize_path(path).as_posix()},
+            KWARGS: kwargs,
             LOADER: {OBJECT_TARGET: "iden.shard.loader.TorchSafetensorsShardLoader"},
         }
 
 
 def create_numpy_safetensors_shard(
-    data: dict[str, np.ndarray], uri: str, path: Path | None = None
+    data: dict[str, np.ndarray], uri: str, path: Path | str | None = None
 ) -> NumpySafetensorsShard:
     r"""Create a ``NumpySafetensorsShard`` from data.
 
@@ -215,16 +308,19 @@ def create_numpy_safetensors_shard(
         ```
     """
     if path is None:
-        path = sanitize_path(uri + ".safetensors")
-    logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(NumpySafetensorsShard.generate_uri_config(path), sanitize_path(uri))
+        path = sanitize_location(uri + ".safetensors")
     logger.info(f"Saving data in file {path}")
     NumpySaver().save(data, path)
-    return NumpySafetensorsShard(uri, path)
+    metadata = generate_metadata(data, path=path)
+    logger.info(f"Saving URI file {uri}")
+    JsonSaver().save(
+        NumpySafetensorsShard.generate_uri_config(path, metadata=metadata), sanitize_location(uri)
+    )
+    return NumpySafetensorsShard(uri, path, metadata=metadata)
 
 
 def create_torch_safetensors_shard(
-    data: dict[str, torch.Tensor], uri: str, path: Path | None = None
+    data: dict[str, torch.Tensor], uri: str, path: Path | str | None = None
 ) -> TorchSafetensorsShard:
     r"""Create a ``TorchSafetensorsShard`` from data.
 
@@ -263,9 +359,38 @@ def create_torch_safetensors_shard(
         ```
     """
     if path is None:
-        path = sanitize_path(uri + ".safetensors")
-    logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(TorchSafetensorsShard.generate_uri_config(path), sanitize_path(uri))
+        path = sanitize_location(uri + ".safetensors")
     logger.info(f"Saving data in file {path}")
     TorchSaver().save(data, path)
-    return TorchSafetensorsShard(uri, path)
+    metadata = generate_metadata(data, path=path)
+    logger.info(f"Saving URI file {uri}")
+    JsonSaver().save(
+        TorchSafetensorsShard.generate_uri_config(path, metadata=metadata), sanitize_location(uri)
+    )
+    return TorchSafetensorsShard(uri, path, metadata=metadata)
+
+
+def _get_data_keys(
+    shard: NumpySafetensorsShard | TorchSafetensorsShard, keys: Sequence[str]
+) -> Any:
+    r"""Get some tensors of a safetensors shard.
+
+    Args:
+        shard: The shard.
+        keys: The keys of the tensors to get.
+
+    Returns:
+        The tensors.
+
+    Raises:
+        KeyError: if a key does not exist in the shard.
+    """
+    if shard.is_cached():
+        data = shard.get_data()
+        missing = [key for key in keys if key not in data]
+        if missing:
+            msg = f"Keys {missing} do not exist in shard {shard.get_uri()}"
+            raise KeyError(msg)
+        return {key: data[key] for key in keys}
+    with trace_span("load_keys", category="io", uri=shard.get_uri(), num_keys=len(keys)):
+        return shard.loader.load_keys(shard.path, keys)
@@ -0,0 +1,226 @@
+r"""Contain code to iterate over the records of shards in a random
+order."""
+
+from __future__ import annotations
+
+__all__ = ["ShuffleShardIterable", "shuffle_shards"]
+
+import random
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from iden.data.records import (
+    concat_records,
+    get_num_records,
+    get_record,
+    slice_records,
+    take_records,
+)
+from iden.shard.utils import PrefetchShardIterable, ShardIterable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from iden.shard.base import BaseShard
+
+T = TypeVar("T")
+
+
+def shuffle_shards(
+    shards: Iterable[BaseShard[T]], seed: int = 0, epoch: int = 0
+) -> list[BaseShard[T]]:
+    r"""Shuffle shards in a deterministic order for a given seed and
+    epoch.
+
+    Args:
+        shards: The shards to shuffle.
+        seed: The random seed.
+        epoch: The epoch. Each epoch gives a different order.
+
+    Returns:
+        The shuffled shards. The same ``(seed, epoch)`` pair always
+            gives the same order.
+
+    Example:
+        ```pycon
+        >>> from iden.shard import InMemoryShard
+        >>> from iden.shard.shuffle import shuffle_shards
+        >>> shards = [InMemoryShard([i]) for i in range(5)]
+        >>> [shard.get_data() for shard in shuffle_shards(shards, seed=42, epoch=0)]
+        [[4], [3], [0], [1], [2]]
+        >>> [shard.get_data() for shard in shuffle_shards(shards, seed=42, epoch=1)]
+        [[2], [3], [1], [0], [4]]
+
+        ```
+    """
+    shards = list(shards)
+    _get_rng(seed, epoch).shuffle(shards)
+    return shards
+
+
+class ShuffleShardIterable(Generic[T]):
+    r"""Implement an iterable over the records of shards in a random
+    order.
+
+    The records are shuffled at two levels. First, the shard order is
+    permuted with ``shuffle_shards``. Then, the records are mixed
+    through a bounded shuffle buffer: the records of consecutive
+    shards are accumulated until the buffer holds ``buffer_size``
+    records, the buffer is permuted with a single vectorized gather
+    (``take_records``), and the first half is yielded. So at most
+    about ``buffer_size`` records and one shard are in memory at the
+    same time.
+
+    The data in the shards must have a record structure: a list, a
+    tuple, an array or a dictionary of arrays. The order only depends
+    on the seed and the epoch, so it can be reproduced.
+
+    Args:
+        shards: The shards to iterate over.
+        buffer_size: The number of records in the shuffle buffer.
+            ``0`` means the records are not shuffled across shards,
+            only within each shard.
+        seed: The random seed.
+        epoch: The initial epoch. It can be changed with
+            ``set_epoch``.
+        num_prefetch: The number of shards loaded ahead in background
+            threads. ``0`` means the shards are loaded when they are
+            needed.
+
+    Raises:
+        ValueError: if ``buffer_size`` or ``num_prefetch`` is
+            negative.
+
+    Example:
+        ```pycon
+        >>> from iden.shard import InMemoryShard
+        >>> from iden.shard.shuffle import ShuffleShardIterable
+        >>> shards = [InMemoryShard([1, 2, 3]), InMemoryShard([4, 5, 6, 7])]
+        >>> iterable = ShuffleShardIterable(shards, buffer_size=4, seed=42)
+        >>> sorted(iterable)
+        [1, 2, 3, 4, 5, 6, 7]
+
+        ```
+    """
+
+    def __init__(
+        self,
+        shards: Sequence[BaseShard[T]],
+        buffer_size: int = 1024,
+        seed: int = 0,
+        epoch: int = 0,
+        num_prefetch: int = 0,
+    ) -> None:
+        if buffer_size < 0:
+            msg = f"buffer_size must be positive or zero but received {buffer_size}"
+            raise ValueError(msg)
+        if num_prefetch < 0:
+            msg = f"num_prefetch must be positive or zero but received {num_prefetch}"
+            raise ValueError(msg)
+        self._shards = tuple(shards)
+        self._buffer_size = buffer_size
+        self._seed = seed
+        self._epoch = epoch
+        self._num_prefetch = num_prefetch
+
+    def __iter__(self) -> Iterator[Any]:
+        rng = _get_rng(self._seed, self._epoch)
+        shards = list(self._shards)
+        rng.shuffle(shards)
+        if self._num_prefetch > 0:
+            iterable = PrefetchShardIterable(shards, num_prefetch=self._num_prefetch)
+        else:
+            iterable = ShardIterable(shards)
+
+        chunks = []
+        num_records = 0
+        for data in iterable:
+            size = get_num_records(data)
+            if size is None:
+                msg = f"Incorrect data type: {type(data)}. The data do not have a record structure"
+                raise TypeError(msg)
+            chunks.append(data)
+            num_records += size
+            if num_records >= max(self._buffer_size, 1):
+                buffer = _shuffle_records(concat_records(chunks), num_records, rng)
+                keep = min(self._buffer_size // 2, num_records)
+                yield from _iter_records(buffer, 0, num_records - keep)
+                chunks = [slice_records(buffer, num_records - keep, num_records)] if keep else []
+                num_records = keep
+        if num_records > 0:
+            buffer = _shuffle_records(concat_records(chunks), num_records, rng)
+            yield from _iter_records(buffer, 0, num_records)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(num_shards={len(self._shards):,}, "
+            f"buffer_size={self._buffer_size:,}, seed={self._seed}, epoch={self._epoch}, "
+            f"num_prefetch={self._num_prefetch:,})"
+        )
+
+    @property
+    def epoch(self) -> int:
+        r"""The current epoch."""
+        return self._epoch
+
+    def set_epoch(self, epoch: int) -> None:
+        r"""Set the epoch used to generate the next random order.
+
+        Args:
+            epoch: The epoch.
+
+        Example:
+            ```pycon
+            >>> from iden.shard import InMemoryShard
+            >>> from iden.shard.shuffle import ShuffleShardIterable
+            >>> iterable = ShuffleShardIterable([InMemoryShard([1, 2, 3])], seed=42)
+            >>> iterable.set_epoch(2)
+            >>> iterable.epoch
+            2
+
+            ```
+        """
+        self._epoch = epoch
+
+
+def _get_rng(seed: int, epoch: int) -> random.Random:
+    r"""Get the random number generator for a seed and an epoch.
+
+    Args:
+        seed: The random seed.
+        epoch: The epoch.
+
+    Returns:
+        The random number generator.
+    """
+    return random.Random(f"{seed}-{epoch}")  # noqa: S311
+
+
+def _shuffle_records(data: Any, num_records: int, rng: random.Random) -> Any:
+    r"""Shuffle the records in the data.
+
+    Args:
+        data: The data to shuffle.
+        num_records: The number of records in the data.
+        rng: The random number generator.
+
+    Returns:
+        The shuffled data.
+    """
+    indices = list(range(num_records))
+    rng.shuffle(indices)
+    return take_records(data, indices)
+
+
+def _iter_records(data: Any, start: int, stop: int) -> Iterator[Any]:
+    r"""Iterate over some records in the data.
+
+    Args:
+        data: The data.
+        start: The index of the first record.
+        stop: The index after the last record.
+
+    Returns:
+        An iterator over the records.
+    """
+    for i in range(start, stop):
+        yield get_record(data, i)
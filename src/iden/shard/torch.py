@@ -7,12 +7,13 @@ __all__ = ["TorchShard", "create_torch_shard"]
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA
 from iden.io import JsonSaver, TorchLoader, TorchSaver
 from iden.shard.file import FileShard
+from iden.shard.metadata import generate_metadata
+from iden.storage import location_to_str, sanitize_location
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -32,6 +33,8 @@ class TorchShard(FileShard[T]):
     Args:
         uri: The shard's URI.
         path: The path to the PyTorch file.
+        metadata: The shard metadata e.g. the number of records or
+            the file size.
 
     Raises:
         RuntimeError: if ``torch`` is not installed.
@@ -54,11 +57,15 @@ class TorchShard(FileShard[T]):
         ```
     """
 
-    def __init__(self, uri: str, path: Path | str) -> None:
-        super().__init__(uri, path, loader=TorchLoader())
+    __slots__ = ()
+
+    def __init__(self, uri: str, path: Path | str, metadata: dict[str, Any] | None = None) -> None:
+        super().__init__(uri, path, loader=TorchLoader(), metadata=metadata)
 
     @classmethod
-    def generate_uri_config(cls, path: Path) -> dict[str, Any]:
+    def generate_uri_config(
+        cls, path: Path | str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         r"""Generate the minimal config that is used to load the shard
         from its URI.
 
@@ -66,6 +73,8 @@ class TorchShard(FileShard[T]):
 
         Args:
             path: The path to the pickle file.
+            metadata: The shard metadata. It is not added to the
+                config if it is empty.
 
         Returns:
             The minimal config to load the shard from its URI.
@@ -84,13 +93,13 @@ class TorchShard(FileShard[T]):
 
             ```
         """
-        return {
-            KWARGS: {"path": sanitize_path(path).as_posix()},
-            LOADER: {OBJECT_TARGET: "iden.shard.loader.TorchShardLoader"},
-        }
+        kwargs = {"path": location_to_str(sanitize_location(path))}
+        if metadata:
+            kwargs[METADATA] = metadata
+        return {KWARGS: kwargs, LOADER: {OBJECT_TARGET: "iden.shard.loader.TorchShardLoader"}}
 
 
-def create_torch_shard(data: T, uri: str, path: Path | None = None) -> TorchShard[T]:
+def create_torch_shard(data: T, uri: str, path: Path | str | None = None) -> TorchShard[T]:
     r"""Create a ``TorchShard`` from data.
 
     Note:
@@ -128,9 +137,12 @@ def create_torch_shard(data: T, uri: str, path: Path | None = None) -> TorchShar
         ```
     """
     if path is None:
-        path = sanitize_path(uri + ".pt")
-    logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(TorchShard.generate_uri_config(path), sanitize_path(uri))
+        path = sanitize_location(uri + ".pt")
     logger.info(f"Saving data in file {path}")
     TorchSaver().save(data, path)
-    return TorchShard(uri, path)
+    metadata = generate_metadata(data, path=path)
+    logger.info(f"Saving URI file {uri}")
+    JsonSaver().save(
+        TorchShard.generate_uri_config(path, metadata=metadata), sanitize_location(uri)
+    )
+    return TorchShard(uri, path, metadata=metadata)
@@ -2,12 +2,11 @@ r"""Contain a shard to manage a tuple of shards."""
 
 from __future__ import annotations
 
-__all__ = ["ShardTuple", "create_shard_tuple"]
+__all__ = ["ShardTuple", "create_shard_tuple", "extend_shard_tuple"]
 
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.equality import objects_are_equal
 from coola.utils.format import (
     repr_indent,
     repr_mapping,
@@ -16,13 +15,16 @@ from coola.utils.format import (
     str_mapping,
     str_sequence,
 )
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
 from iden.constants import LOADER, SHARDS
 from iden.io import JsonSaver, load_json
 from iden.shard.base import BaseShard
-from iden.shard.utils import get_list_uris
+from iden.shard.exceptions import ShardExistsError
+from iden.shard.fingerprint import compute_fingerprint
+from iden.shard.utils import get_list_uris, sort_by_uri
+from iden.storage import sanitize_location
+from iden.utils.equality import objects_are_equal
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -68,6 +70,8 @@ class ShardTuple(BaseShard[tuple[BaseShard[T], ...]]):
     def __init__(self, uri: str, shards: Iterable[BaseShard[T]]) -> None:
         self._uri = uri
         self._shards = tuple(shards)
+        self._fingerprint: str | None = None
+        self._has_fingerprint = False
 
     def __getitem__(self, index: int) -> BaseShard[T]:
         return self._shards[index]
@@ -76,12 +80,14 @@ class ShardTuple(BaseShard[tuple[BaseShard[T], ...]]):
         return len(self._shards)
 
     def __repr__(self) -> str:
-        shards = f"\n{repr_sequence(self._shards)}" if self._shards else ""
+        shards = self.get_data()
+        shards = f"\n{repr_sequence(shards)}" if shards else ""
         args = repr_indent(repr_mapping({"uri": self._uri, "shards": shards}))
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     def __str__(self) -> str:
-        shards = f"\n{str_sequence(self._shards)}" if self._shards else ""
+        shards = self.get_data()
+        shards = f"\n{str_sequence(shards)}" if shards else ""
         args = str_indent(str_mapping({"uri": self._uri, "shards": shards}))
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
@@ -92,6 +98,9 @@ class ShardTuple(BaseShard[tuple[BaseShard[T], ...]]):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if type(other) is not type(self):
             return False
+        fingerprint, other_fingerprint = self.get_fingerprint(), other.get_fingerprint()
+        if fingerprint is not None and other_fingerprint is not None:
+            return fingerprint == other_fingerprint
         return self.get_uri() == other.get_uri() and objects_are_equal(
             self.get_data(), other.get_data(), equal_nan=equal_nan
         )
@@ -133,6 +142,12 @@ class ShardTuple(BaseShard[tuple[BaseShard[T], ...]]):
     def get_data(self, cache: bool = False) -> tuple[BaseShard[T], ...]:  # noqa: ARG002
         return self._shards
 
+    def get_fingerprint(self) -> str | None:
+        if not self._has_fingerprint:
+            self._fingerprint = self._compute_fingerprint()
+            self._has_fingerprint = True
+        return self._fingerprint
+
     def get_uri(self) -> str:
         return self._uri
 
@@ -150,6 +165,22 @@ class ShardTuple(BaseShard[tuple[BaseShard[T], ...]]):
         uris = get_list_uris(self._shards)
         return uris == sorted(uris)
 
+    def _compute_fingerprint(self) -> str | None:
+        r"""Compute the fingerprint of the tuple from the fingerprints of
+        its shards.
+
+        Returns:
+            The fingerprint, or ``None`` if a shard does not have a
+                fingerprint.
+        """
+        fingerprints = []
+        for shard in self._shards:
+            fingerprint = shard.get_fingerprint()
+            if fingerprint is None:
+                return None
+            fingerprints.append(fingerprint)
+        return compute_fingerprint(type(self), [self._uri, *fingerprints])
+
     @classmethod
     def from_uri(cls, uri: str) -> ShardTuple[T]:
         r"""Instantiate a shard from its URI.
@@ -190,9 +221,8 @@ class ShardTuple(BaseShard[tuple[BaseShard[T], ...]]):
         # local import to avoid cyclic dependencies
         from iden.shard.loading import load_from_uri  # noqa: PLC0415
 
-        config = load_json(sanitize_path(uri))
-        shards = [load_from_uri(shard) for shard in config[SHARDS]]
-        return cls(uri=uri, shards=shards)
+        config = load_json(sanitize_location(uri))
+        return cls(uri=uri, shards=(load_from_uri(shard) for shard in config[SHARDS]))
 
     @classmethod
     def generate_uri_config(cls, shards: Iterable[BaseShard[T]]) -> dict[str, Any]:
@@ -274,5 +304,69 @@ def create_shard_tuple(shards: Iterable[BaseShard[T]], uri: str) -> ShardTuple[T
         ```
     """
     logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(ShardTuple.generate_uri_config(shards), sanitize_path(uri))
+    JsonSaver().save(ShardTuple.generate_uri_config(shards), sanitize_location(uri))
     return ShardTuple(uri, shards)
+
+
+def extend_shard_tuple(shard: ShardTuple[T], shards: Iterable[BaseShard[T]]) -> ShardTuple[T]:
+    r"""Extend a ``ShardTuple`` with new shards and rewrite its URI file.
+
+    The new shards are merged with the existing shards, and the
+    resulting shards are sorted by ascending order of URIs. The
+    extended tuple has the same type as the input tuple e.g. a
+    ``CompactShardTuple`` stays compact. Only the
+    URI file of the ``ShardTuple`` is rewritten, and it is replaced
+    atomically so a reader never sees a partially written file.
+
+    Args:
+        shard: The ``ShardTuple`` to extend.
+        shards: The shards to add to the ``ShardTuple``.
+
+    Returns:
+        The extended ``ShardTuple``. It has the same URI as the input
+            ``ShardTuple``.
+
+    Raises:
+        ShardExistsError: if one of the new shards has the same URI
+            as an existing shard.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard, create_shard_tuple, extend_shard_tuple
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shard = create_shard_tuple(
+        ...         [create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri())],
+        ...         uri=Path(tmpdir).joinpath("uri").as_uri(),
+        ...     )
+        ...     shard = extend_shard_tuple(
+        ...         shard,
+        ...         [create_json_shard([4, 5], uri=Path(tmpdir).joinpath("shard/uri2").as_uri())],
+        ...     )
+        ...     shard
+        ...
+        ShardTuple(
+          (uri): file:///.../uri
+          (shards):
+            (0): JsonShard(uri=file:///.../shard/uri1)
+            (1): JsonShard(uri=file:///.../shard/uri2)
+        )
+
+        ```
+    """
+    shards = tuple(shards)
+    uris = set(get_list_uris(shard.get_data()))
+    for new_shard in shards:
+        new_uri = new_shard.get_uri()
+        if new_uri in uris:
+            msg = f"shard `{new_uri}` already exists in `{shard.get_uri()}`"
+            raise ShardExistsError(msg)
+        uris.add(new_uri)
+    shards = sort_by_uri(shard.get_data() + shards)
+    cls = type(shard)
+    logger.info(f"Saving URI file {shard.get_uri()}")
+    JsonSaver().save(
+        cls.generate_uri_config(shards), sanitize_location(shard.get_uri()), exist_ok=True
+    )
+    return cls(shard.get_uri(), shards)
@@ -2,14 +2,28 @@ r"""Contain utility functions and classes for working with shards."""
 
 from __future__ import annotations
 
-__all__ = ["ShardIterable", "get_dict_uris", "get_list_uris", "sort_by_uri"]
-
+__all__ = [
+    "PrefetchShardIterable",
+    "ShardIterable",
+    "get_data_nbytes",
+    "get_dict_uris",
+    "get_list_uris",
+    "sort_by_uri",
+    "walk_shards",
+]
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from iden.constants import NBYTES
 from iden.shard import BaseShard
+from iden.storage import get_storage
+from iden.utils.trace import trace_span
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
 
     from iden.shard.base import BaseShard
 
@@ -56,6 +70,129 @@ class ShardIterable(Generic[T]):
         return f"{self.__class__.__qualname__}()"
 
 
+class PrefetchShardIterable(Generic[T]):
+    r"""Implement a shard iterable that loads the data of the next
+    shards in background threads.
+
+    While the data of a shard are used by the caller, the data of the
+    next ``num_prefetch`` shards are loaded, so the loads overlap with
+    the consumption. The memory usage is bounded by the data of
+    ``num_prefetch + 1`` shards. The data are yielded in the shard
+    order, and are not cached in the shards.
+
+    Args:
+        iterable: The shard iterable.
+        num_prefetch: The number of shards loaded ahead of the shard
+            whose data are used by the caller.
+
+    Raises:
+        ValueError: if ``num_prefetch`` is not positive.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard
+        >>> from iden.shard.utils import PrefetchShardIterable
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shards = [
+        ...         create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("shard/uri1").as_uri()),
+        ...         create_json_shard(
+        ...             [4, 5, 6, 7], uri=Path(tmpdir).joinpath("shard/uri2").as_uri()
+        ...         ),
+        ...     ]
+        ...     data = list(PrefetchShardIterable(shards, num_prefetch=2))
+        ...     data
+        ...
+        [[1, 2, 3], [4, 5, 6, 7]]
+
+        ```
+    """
+
+    def __init__(self, iterable: Iterable[BaseShard[T]], num_prefetch: int = 1) -> None:
+        if num_prefetch <= 0:
+            msg = f"num_prefetch must be positive but received {num_prefetch}"
+            raise ValueError(msg)
+        self._iterable = iterable
+        self._num_prefetch = num_prefetch
+
+    def __iter__(self) -> Iterator[T]:
+        with ThreadPoolExecutor(self._num_prefetch) as executor:
+            futures = deque()
+            try:
+                for shard in self._iterable:
+                    # the next load is submitted before the oldest data
+                    # are yielded, so it runs while the caller uses them
+                    futures.append(executor.submit(shard.get_data))
+                    if len(futures) > self._num_prefetch:
+                        yield _wait_prefetch(futures.popleft())
+                while futures:
+                    yield _wait_prefetch(futures.popleft())
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(num_prefetch={self._num_prefetch:,})"
+
+
+def _wait_prefetch(future: Future[T]) -> T:
+    r"""Wait for the data of a prefetched shard.
+
+    Args:
+        future: The future that loads the data.
+
+    Returns:
+        The data.
+    """
+    with trace_span("prefetch_wait", category="prefetch"):
+        return future.result()
+
+
+def get_data_nbytes(shard: BaseShard[Any]) -> int:
+    r"""Get the size of the data file of a shard without loading the
+    data.
+
+    The size recorded in the shard metadata is used if it is
+    available, so the storage backend is only queried for the shards
+    without this metadata.
+
+    Args:
+        shard: The shard.
+
+    Returns:
+        The size of the data file in bytes, or ``0`` if it is not
+            recorded in the metadata and the shard does not store its
+            data in a file or the file does not exist.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard
+        >>> from iden.shard.utils import get_data_nbytes
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shard = create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+        ...     get_data_nbytes(shard)
+        ...
+        9
+
+        ```
+    """
+    # local import to avoid cyclic dependencies
+    from iden.shard import FileShard  # noqa: PLC0415
+
+    nbytes = shard.get_metadata().get(NBYTES)
+    if nbytes is not None:
+        return nbytes
+    if not isinstance(shard, FileShard):
+        return 0
+    try:
+        return get_storage(shard.path).stat(shard.path).size
+    except FileNotFoundError:
+        return 0
+
+
 def get_dict_uris(shards: dict[str, BaseShard[Any]]) -> dict[str, str]:
     r"""Get the dictionary of shard URIs.
 
@@ -151,3 +288,53 @@ def sort_by_uri(
         ```
     """
     return sorted(shards, key=lambda item: item.get_uri(), reverse=reverse)
+
+
+def walk_shards(shard: BaseShard[Any], materialize: bool = True) -> Iterator[BaseShard[Any]]:
+    r"""Iterate over a shard and all the shards nested in it.
+
+    The nested shards are the shards in a ``ShardTuple`` or a
+    ``ShardDict``. The shards are visited in depth-first order, and
+    the nested shards are not loaded.
+
+    Args:
+        shard: The shard to walk.
+        materialize: If ``False``, the shards of a
+            ``CompactShardTuple`` are not visited, so they are not
+            materialized.
+
+    Returns:
+        An iterator over the shard and all its nested shards.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard, create_shard_tuple
+        >>> from iden.shard.utils import walk_shards
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     shard = create_shard_tuple(
+        ...         [
+        ...             create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri1").as_uri()),
+        ...             create_json_shard([4, 5, 6], uri=Path(tmpdir).joinpath("uri2").as_uri()),
+        ...         ],
+        ...         uri=Path(tmpdir).joinpath("uri").as_uri(),
+        ...     )
+        ...     list(walk_shards(shard))
+        ...
+        [ShardTuple(...), JsonShard(uri=file:///.../uri1), JsonShard(uri=file:///.../uri2)]
+
+        ```
+    """
+    # local import to avoid cyclic dependencies
+    from iden.shard import CompactShardTuple, ShardDict, ShardTuple  # noqa: PLC0415
+
+    yield shard
+    if isinstance(shard, CompactShardTuple) and not materialize:
+        return
+    if isinstance(shard, ShardTuple):
+        for child in shard.get_data():
+            yield from walk_shards(child, materialize=materialize)
+    elif isinstance(shard, ShardDict):
+        for child in shard.get_data().values():
+            yield from walk_shards(child, materialize=materialize)
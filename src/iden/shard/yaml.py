@@ -7,12 +7,13 @@ __all__ = ["YamlShard", "create_yaml_shard"]
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA
 from iden.io import JsonSaver, YamlLoader, YamlSaver
 from iden.shard.file import FileShard
+from iden.shard.metadata import generate_metadata
+from iden.storage import location_to_str, sanitize_location
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -32,6 +33,8 @@ class YamlShard(FileShard[T]):
     Args:
         uri: The shard's URI.
         path: The path to the YAML file.
+        metadata: The shard metadata e.g. the number of records or
+            the file size.
 
     Example:
         ```pycon
@@ -50,11 +53,15 @@ class YamlShard(FileShard[T]):
         ```
     """
 
-    def __init__(self, uri: str, path: Path | str) -> None:
-        super().__init__(uri, path, loader=YamlLoader())
+    __slots__ = ()
+
+    def __init__(self, uri: str, path: Path | str, metadata: dict[str, Any] | None = None) -> None:
+        super().__init__(uri, path, loader=YamlLoader(), metadata=metadata)
 
     @classmethod
-    def generate_uri_config(cls, path: Path) -> dict[str, Any]:
+    def generate_uri_config(
+        cls, path: Path | str, metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         r"""Generate the minimal config that is used to load the shard
         from its URI.
 
@@ -62,6 +69,8 @@ class YamlShard(FileShard[T]):
 
         Args:
             path: The path to the yaml file.
+            metadata: The shard metadata. It is not added to the
+                config if it is empty.
 
         Returns:
             The minimal config to load the shard from its URI.
@@ -81,13 +90,13 @@ class YamlShard(FileShard[T]):
 
             ```
         """
-        return {
-            KWARGS: {"path": sanitize_path(path).as_posix()},
-            LOADER: {OBJECT_TARGET: "iden.shard.loader.YamlShardLoader"},
-        }
+        kwargs = {"path": location_to_str(sanitize_location(path))}
+        if metadata:
+            kwargs[METADATA] = metadata
+        return {KWARGS: kwargs, LOADER: {OBJECT_TARGET: "iden.shard.loader.YamlShardLoader"}}
 
 
-def create_yaml_shard(data: T, uri: str, path: Path | None = None) -> YamlShard[T]:
+def create_yaml_shard(data: T, uri: str, path: Path | str | None = None) -> YamlShard[T]:
     r"""Create a ``YamlShard`` from data.
 
     Note:
@@ -118,9 +127,10 @@ def create_yaml_shard(data: T, uri: str, path: Path | None = None) -> YamlShard[
         ```
     """
     if path is None:
-        path = sanitize_path(uri + ".yaml")
-    logger.info(f"Saving URI file {uri}")
-    JsonSaver().save(YamlShard.generate_uri_config(path), sanitize_path(uri))
+        path = sanitize_location(uri + ".yaml")
     logger.info(f"Saving data in file {path}")
     YamlSaver().save(data, path)
-    return YamlShard(uri, path)
+    metadata = generate_metadata(data, path=path)
+    logger.info(f"Saving URI file {uri}")
+    JsonSaver().save(YamlShard.generate_uri_config(path, metadata=metadata), sanitize_location(uri))
+    return YamlShard(uri, path, metadata=metadata)
@@ -0,0 +1,40 @@
+r"""Contain the storage backends to read and write the files of the
+shards and datasets."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BaseStorage",
+    "LocalStorage",
+    "MemoryStorage",
+    "S3Storage",
+    "StorageStat",
+    "get_extension",
+    "get_scheme",
+    "get_storage",
+    "location_to_str",
+    "open_file",
+    "register_storage",
+    "sanitize_location",
+]
+
+from typing import TYPE_CHECKING
+
+from iden.storage.base import BaseStorage, StorageStat
+from iden.storage.registry import get_scheme, get_storage, register_storage
+from iden.storage.utils import get_extension, location_to_str, open_file, sanitize_location
+from iden.utils.lazy import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from iden.storage.local import LocalStorage
+    from iden.storage.memory import MemoryStorage
+    from iden.storage.s3 import S3Storage
+
+__getattr__, __dir__ = create_lazy_getattr(
+    __name__,
+    {
+        "iden.storage.local": ("LocalStorage",),
+        "iden.storage.memory": ("MemoryStorage",),
+        "iden.storage.s3": ("S3Storage",),
+    },
+)
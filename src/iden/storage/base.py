@@ -0,0 +1,308 @@
+r"""Contain the base class to implement a storage backend."""
+
+from __future__ import annotations
+
+__all__ = ["BaseStorage", "StorageStat"]
+
+import io
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+    from types import TracebackType
+
+
+@dataclass(frozen=True)
+class StorageStat:
+    r"""Define the status of a stored object.
+
+    Args:
+        size: The size of the object in bytes.
+        mtime_ns: The last modification time in nanoseconds since the
+            epoch.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import StorageStat
+        >>> StorageStat(size=9, mtime_ns=0)
+        StorageStat(size=9, mtime_ns=0)
+
+        ```
+    """
+
+    size: int
+    mtime_ns: int
+
+
+class BaseStorage(ABC):
+    r"""Define the base class to implement a storage backend.
+
+    A storage backend reads and writes the objects of a URI scheme
+    e.g. ``file://`` or ``memory://``. The location of an object is its
+    URI, or a path for the local files. The writes are atomic: an
+    object is either fully written or not changed, so a reader never
+    sees a partially written object.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import MemoryStorage
+        >>> storage = MemoryStorage()
+        >>> storage.write("memory://bucket/data.txt", b"abc")
+        >>> storage.read_range("memory://bucket/data.txt", offset=1, length=2)
+        b'bc'
+        >>> storage.stat("memory://bucket/data.txt").size
+        3
+
+        ```
+    """
+
+    def close(self) -> None:  # noqa: B027
+        r"""Release the pooled connections and handles.
+
+        The storage can still be used after, and opens new connections
+        or handles when needed.
+        """
+
+    def exists(self, location: Path | str) -> bool:
+        r"""Indicate if an object exists.
+
+        Args:
+            location: The location of the object.
+
+        Returns:
+            ``True`` if the object exists, otherwise ``False``.
+
+        Example:
+            ```pycon
+            >>> from iden.storage import MemoryStorage
+            >>> storage = MemoryStorage()
+            >>> storage.write("memory://bucket/data.txt", b"abc")
+            >>> storage.exists("memory://bucket/data.txt")
+            True
+            >>> storage.exists("memory://bucket/missing.txt")
+            False
+
+            ```
+        """
+        try:
+            self.stat(location)
+        except FileNotFoundError:
+            return False
+        return True
+
+    @abstractmethod
+    def list(self, location: Path | str) -> list[str]:
+        r"""List the names of the objects and directories in a
+        directory.
+
+        Args:
+            location: The location of the directory.
+
+        Returns:
+            The sorted names of the direct children of the directory.
+                The list is empty if the directory does not exist.
+
+        Example:
+            ```pycon
+            >>> from iden.storage import MemoryStorage
+            >>> storage = MemoryStorage()
+            >>> storage.write("memory://bucket/a.txt", b"abc")
+            >>> storage.write("memory://bucket/dir/b.txt", b"abc")
+            >>> storage.list("memory://bucket")
+            ['a.txt', 'dir']
+
+            ```
+        """
+
+    @abstractmethod
+    def open(self, location: Path | str, mode: str = "rb") -> Any:
+        r"""Open an object as a binary file object.
+
+        Args:
+            location: The location of the object.
+            mode: The mode, ``'rb'`` to read or ``'wb'`` to write. The
+                data written in a file object are committed when the
+                file object is closed without error.
+
+        Returns:
+            The file object.
+
+        Raises:
+            FileNotFoundError: if the object to read does not exist.
+            ValueError: if the mode is not supported.
+
+        Example:
+            ```pycon
+            >>> from iden.storage import MemoryStorage
+            >>> storage = MemoryStorage()
+            >>> with storage.open("memory://bucket/data.txt", mode="wb") as file:
+            ...     file.write(b"abc")
+            ...
+            3
+            >>> with storage.open("memory://bucket/data.txt") as file:
+            ...     file.read()
+            ...
+            b'abc'
+
+            ```
+        """
+
+    @abstractmethod
+    def read_range(self, location: Path | str, offset: int, length: int) -> bytes:
+        r"""Read a byte range of an object.
+
+        Args:
+            location: The location of the object.
+            offset: The offset of the first byte to read.
+            length: The number of bytes to read.
+
+        Returns:
+            The bytes. There are fewer than ``length`` bytes if the
+                range ends after the end of the object.
+
+        Raises:
+            FileNotFoundError: if the object does not exist.
+
+        Example:
+            ```pycon
+            >>> from iden.storage import MemoryStorage
+            >>> storage = MemoryStorage()
+            >>> storage.write("memory://bucket/data.txt", b"abcdef")
+            >>> storage.read_range("memory://bucket/data.txt", offset=2, length=3)
+            b'cde'
+
+            ```
+        """
+
+    @abstractmethod
+    def remove(self, location: Path | str) -> None:
+        r"""Remove an object.
+
+        Removing an object that does not exist has no effect.
+
+        Args:
+            location: The location of the object.
+
+        Example:
+            ```pycon
+            >>> from iden.storage import MemoryStorage
+            >>> storage = MemoryStorage()
+            >>> storage.write("memory://bucket/data.txt", b"abc")
+            >>> storage.remove("memory://bucket/data.txt")
+            >>> storage.exists("memory://bucket/data.txt")
+            False
+
+            ```
+        """
+
+    @abstractmethod
+    def stat(self, location: Path | str) -> StorageStat:
+        r"""Get the status of an object.
+
+        Args:
+            location: The location of the object.
+
+        Returns:
+            The status of the object.
+
+        Raises:
+            FileNotFoundError: if the object does not exist.
+
+        Example:
+            ```pycon
+            >>> from iden.storage import MemoryStorage
+            >>> storage = MemoryStorage()
+            >>> storage.write("memory://bucket/data.txt", b"abc")
+            >>> storage.stat("memory://bucket/data.txt").size
+            3
+
+            ```
+        """
+
+    @abstractmethod
+    def write(self, location: Path | str, data: bytes) -> None:
+        r"""Write an object atomically.
+
+        An existing object is replaced.
+
+        Args:
+            location: The location of the object.
+            data: The content of the object.
+
+        Example:
+            ```pycon
+            >>> from iden.storage import MemoryStorage
+            >>> storage = MemoryStorage()
+            >>> storage.write("memory://bucket/data.txt", b"abc")
+            >>> storage.read_range("memory://bucket/data.txt", offset=0, length=3)
+            b'abc'
+
+            ```
+        """
+
+
+class UploadBuffer(io.BytesIO):
+    r"""Implement an in-memory binary file object whose content is
+    committed when it is closed.
+
+    The content is not committed if the ``with`` block raises an
+    exception, so a failed write does not change the object.
+
+    Args:
+        commit: The function called with the content when the file
+            object is closed.
+
+    Example:
+        ```pycon
+        >>> from iden.storage.base import UploadBuffer
+        >>> with UploadBuffer(print) as file:
+        ...     file.write(b"abc")
+        ...
+        3
+        b'abc'
+
+        ```
+    """
+
+    def __init__(self, commit: Callable[[bytes], None]) -> None:
+        super().__init__()
+        self._commit: Callable[[bytes], None] | None = commit
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.discard()
+        self.close()
+
+    def close(self) -> None:
+        if not self.closed and self._commit is not None:
+            commit, self._commit = self._commit, None
+            commit(self.getvalue())
+        super().close()
+
+    def discard(self) -> None:
+        r"""Discard the content, so it is not committed when the file
+        object is closed."""
+        self._commit = None
+
+
+class UploadTextWrapper(io.TextIOWrapper):
+    r"""Implement a text wrapper of an ``UploadBuffer`` that does not
+    commit the content if the ``with`` block raises an exception."""
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None and isinstance(self.buffer, UploadBuffer):
+            self.buffer.discard()
+        self.close()
@@ -0,0 +1,155 @@
+r"""Contain the storage backend for the local files."""
+
+from __future__ import annotations
+
+__all__ = ["LocalStorage"]
+
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from coola.utils.path import sanitize_path
+
+from iden.io.utils import generate_unique_tmp_path
+from iden.storage.base import BaseStorage, StorageStat
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class LocalStorage(BaseStorage):
+    r"""Implement the storage backend for the local files.
+
+    The locations are paths or ``file://`` URIs. The file descriptors
+    used by ``read_range`` are pooled, so reading several ranges of the
+    same file does not open it each time. A pooled file descriptor is
+    reopened when its file was replaced or removed.
+
+    Args:
+        max_handles: The maximum number of pooled file descriptors.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.storage import LocalStorage
+        >>> storage = LocalStorage()
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("data.txt")
+        ...     storage.write(path, b"abcdef")
+        ...     storage.read_range(path.as_uri(), offset=2, length=3)
+        ...
+        b'cde'
+        >>> storage.close()
+
+        ```
+    """
+
+    def __init__(self, max_handles: int = 64) -> None:
+        self._max_handles = max_handles
+        self._lock = threading.Lock()
+        self._handles: OrderedDict[Path, int] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(max_handles={self._max_handles:,}, "
+            f"num_handles={len(self._handles):,})"
+        )
+
+    def __del__(self) -> None:
+        try:  # noqa: SIM105
+            self.close()
+        except Exception:  # noqa: BLE001, S110
+            # the modules can be unloaded when the interpreter exits
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            for fd in self._handles.values():
+                os.close(fd)
+            self._handles.clear()
+
+    def exists(self, location: Path | str) -> bool:
+        return sanitize_path(location).is_file()
+
+    def list(self, location: Path | str) -> list[str]:
+        path = sanitize_path(location)
+        if not path.is_dir():
+            return []
+        return sorted(child.name for child in path.iterdir())
+
+    def open(self, location: Path | str, mode: str = "rb") -> Any:
+        if mode not in {"rb", "wb"}:
+            msg = f"Incorrect mode: {mode}. The supported modes are 'rb' and 'wb'"
+            raise ValueError(msg)
+        path = sanitize_path(location)
+        if mode == "wb":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open(mode=mode)
+
+    def read_range(self, location: Path | str, offset: int, length: int) -> bytes:
+        path = sanitize_path(location)
+        fd = self._acquire(path)
+        try:
+            return os.pread(fd, length, offset)
+        finally:
+            self._release(path, fd)
+
+    def remove(self, location: Path | str) -> None:
+        sanitize_path(location).unlink(missing_ok=True)
+
+    def stat(self, location: Path | str) -> StorageStat:
+        stat = sanitize_path(location).stat()
+        return StorageStat(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+    def write(self, location: Path | str, data: bytes) -> None:
+        path = sanitize_path(location)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = generate_unique_tmp_path(path)
+        try:
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _acquire(self, path: Path) -> int:
+        r"""Get a file descriptor of a file, from the pool if possible.
+
+        The file descriptor is removed from the pool while it is used,
+        so it is never shared by two threads.
+
+        Args:
+            path: The path to the file.
+
+        Returns:
+            The file descriptor.
+        """
+        with self._lock:
+            fd = self._handles.pop(path, None)
+        if fd is not None:
+            if os.fstat(fd).st_nlink > 0:
+                return fd
+            # the file was replaced or removed since the file descriptor
+            # was opened
+            os.close(fd)
+        return os.open(path, os.O_RDONLY)
+
+    def _release(self, path: Path, fd: int) -> None:
+        r"""Put back a file descriptor in the pool.
+
+        The least recently used file descriptors are closed if the pool
+        is full.
+
+        Args:
+            path: The path to the file.
+            fd: The file descriptor.
+        """
+        with self._lock:
+            if path in self._handles:
+                # another thread pooled a file descriptor of the same file
+                os.close(fd)
+                return
+            self._handles[path] = fd
+            while len(self._handles) > self._max_handles:
+                os.close(self._handles.popitem(last=False)[1])
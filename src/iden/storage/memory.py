@@ -0,0 +1,116 @@
+r"""Contain an in-memory storage backend."""
+
+from __future__ import annotations
+
+__all__ = ["MemoryStorage"]
+
+import io
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from iden.storage.base import BaseStorage, StorageStat, UploadBuffer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_SCHEME = "memory://"
+
+
+class MemoryStorage(BaseStorage):
+    r"""Implement an in-memory storage backend.
+
+    The locations are ``memory://`` URIs e.g.
+    ``memory://bucket/data.json``. The objects are stored in the
+    memory of the current process, so they are lost when the process
+    ends. It is useful to test the code that uses a storage backend,
+    or to create temporary datasets without writing to disk.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import MemoryStorage
+        >>> storage = MemoryStorage()
+        >>> storage.write("memory://bucket/data.txt", b"abcdef")
+        >>> storage.read_range("memory://bucket/data.txt", offset=2, length=3)
+        b'cde'
+        >>> storage.list("memory://bucket")
+        ['data.txt']
+
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._objects: dict[str, tuple[bytes, int]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(num_objects={len(self._objects):,})"
+
+    def list(self, location: Path | str) -> list[str]:
+        prefix = _get_key(location).rstrip("/") + "/"
+        with self._lock:
+            keys = list(self._objects)
+        return sorted(
+            {key[len(prefix) :].partition("/")[0] for key in keys if key.startswith(prefix)}
+        )
+
+    def open(self, location: Path | str, mode: str = "rb") -> Any:
+        if mode == "rb":
+            return io.BytesIO(self._get(location)[0])
+        if mode == "wb":
+            return UploadBuffer(lambda data: self.write(location, data))
+        msg = f"Incorrect mode: {mode}. The supported modes are 'rb' and 'wb'"
+        raise ValueError(msg)
+
+    def read_range(self, location: Path | str, offset: int, length: int) -> bytes:
+        return self._get(location)[0][offset : offset + length]
+
+    def remove(self, location: Path | str) -> None:
+        with self._lock:
+            self._objects.pop(_get_key(location), None)
+
+    def stat(self, location: Path | str) -> StorageStat:
+        data, mtime_ns = self._get(location)
+        return StorageStat(size=len(data), mtime_ns=mtime_ns)
+
+    def write(self, location: Path | str, data: bytes) -> None:
+        with self._lock:
+            self._objects[_get_key(location)] = (bytes(data), time.time_ns())
+
+    def _get(self, location: Path | str) -> tuple[bytes, int]:
+        r"""Get an object.
+
+        Args:
+            location: The location of the object.
+
+        Returns:
+            The content and the modification time of the object.
+
+        Raises:
+            FileNotFoundError: if the object does not exist.
+        """
+        with self._lock:
+            obj = self._objects.get(_get_key(location))
+        if obj is None:
+            msg = f"object does not exist: {location}"
+            raise FileNotFoundError(msg)
+        return obj
+
+
+def _get_key(location: Path | str) -> str:
+    r"""Get the key of an object.
+
+    Args:
+        location: The location of the object.
+
+    Returns:
+        The key i.e. the location without the scheme.
+
+    Raises:
+        ValueError: if the location is not a ``memory://`` URI.
+    """
+    location = str(location)
+    if not location.startswith(_SCHEME):
+        msg = f"Incorrect location: {location}. The location must start with {_SCHEME!r}"
+        raise ValueError(msg)
+    return location[len(_SCHEME) :]
@@ -0,0 +1,142 @@
+r"""Contain the registry of the storage backends of the URI schemes."""
+
+from __future__ import annotations
+
+__all__ = ["get_scheme", "get_storage", "register_storage"]
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from iden.storage.base import BaseStorage
+
+_LOCK = threading.Lock()
+_STORAGES: dict[str, BaseStorage] = {}
+
+
+def _create_local_storage() -> BaseStorage:
+    from iden.storage.local import LocalStorage  # noqa: PLC0415
+
+    return LocalStorage()
+
+
+def _create_memory_storage() -> BaseStorage:
+    from iden.storage.memory import MemoryStorage  # noqa: PLC0415
+
+    return MemoryStorage()
+
+
+def _create_s3_storage() -> BaseStorage:
+    from iden.storage.s3 import S3Storage  # noqa: PLC0415
+
+    return S3Storage()
+
+
+# The default storage backends are created when they are used for the
+# first time.
+_DEFAULT_STORAGES: dict[str, Callable[[], BaseStorage]] = {
+    "file": _create_local_storage,
+    "memory": _create_memory_storage,
+    "s3": _create_s3_storage,
+}
+
+
+def get_scheme(location: Path | str) -> str:
+    r"""Get the URI scheme of a location.
+
+    Args:
+        location: The location i.e. a path or a URI.
+
+    Returns:
+        The URI scheme. It is ``'file'`` for the paths.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import get_scheme
+        >>> get_scheme("memory://bucket/data.json")
+        'memory'
+        >>> get_scheme("/data/data.json")
+        'file'
+
+        ```
+    """
+    if isinstance(location, Path):
+        return "file"
+    scheme = urlsplit(location).scheme
+    # A one-letter scheme is a Windows drive e.g. 'C:'
+    return scheme.lower() if len(scheme) > 1 else "file"
+
+
+def get_storage(location: Path | str) -> BaseStorage:
+    r"""Get the storage backend of a location.
+
+    Args:
+        location: The location i.e. a path or a URI.
+
+    Returns:
+        The storage backend registered for the URI scheme of the
+            location.
+
+    Raises:
+        ValueError: if no storage backend is registered for the URI
+            scheme.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import get_storage
+        >>> get_storage("memory://bucket/data.json")
+        MemoryStorage(num_objects=...)
+
+        ```
+    """
+    scheme = get_scheme(location)
+    storage = _STORAGES.get(scheme)
+    if storage is not None:
+        return storage
+    with _LOCK:
+        if scheme not in _STORAGES:
+            if scheme not in _DEFAULT_STORAGES:
+                msg = (
+                    f"No storage backend registered for the URI scheme {scheme!r} "
+                    f"(location: {location})"
+                )
+                raise ValueError(msg)
+            _STORAGES[scheme] = _DEFAULT_STORAGES[scheme]()
+        return _STORAGES[scheme]
+
+
+def register_storage(scheme: str, storage: BaseStorage, exist_ok: bool = False) -> None:
+    r"""Register the storage backend of a URI scheme.
+
+    Args:
+        scheme: The URI scheme e.g. ``'s3'``.
+        storage: The storage backend.
+        exist_ok: If ``False``, ``RuntimeError`` is raised if a storage
+            backend is already registered for the URI scheme.
+
+    Raises:
+        RuntimeError: if a storage backend is already registered for
+            the URI scheme and ``exist_ok`` is ``False``.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import MemoryStorage, get_storage, register_storage
+        >>> storage = MemoryStorage()
+        >>> register_storage("mem2", storage)
+        >>> get_storage("mem2://bucket/data.json") is storage
+        True
+
+        ```
+    """
+    with _LOCK:
+        if scheme in _STORAGES and not exist_ok:
+            msg = (
+                f"Storage backend {_STORAGES[scheme]} already registered for the URI scheme "
+                f"{scheme!r}. Use exist_ok=True to overwrite."
+            )
+            raise RuntimeError(msg)
+        _STORAGES[scheme] = storage
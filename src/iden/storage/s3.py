@@ -0,0 +1,297 @@
+r"""Contain a storage backend for the object stores compatible with the
+S3 API."""
+
+from __future__ import annotations
+
+__all__ = ["S3Storage"]
+
+import http.client
+import io
+import os
+import threading
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote, urlencode, urlsplit
+from xml.etree import ElementTree
+
+from iden.storage.base import BaseStorage, StorageStat, UploadBuffer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_DEFAULT_ENDPOINT_URL = "https://s3.amazonaws.com"
+
+
+class S3Storage(BaseStorage):
+    r"""Implement a storage backend for the object stores compatible
+    with the S3 API.
+
+    The locations are ``s3://bucket/key`` URIs. The requests use the
+    path-style addressing (``{endpoint_url}/{bucket}/{key}``) and are
+    not signed, so the backend works with the buckets that allow
+    anonymous access e.g. a local stand-in server or a public bucket.
+    The HTTP connections are pooled and reused between requests.
+
+    Args:
+        endpoint_url: The URL of the object store. If ``None``, the
+            ``AWS_ENDPOINT_URL`` environment variable is used if it is
+            set, otherwise the AWS endpoint.
+        max_connections: The maximum number of pooled connections.
+        timeout: The timeout of the requests in seconds.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import S3Storage
+        >>> from iden.testing import ObjectStoreServer
+        >>> with ObjectStoreServer() as server:
+        ...     storage = S3Storage(endpoint_url=server.endpoint_url)
+        ...     storage.write("s3://bucket/data.txt", b"abcdef")
+        ...     storage.read_range("s3://bucket/data.txt", offset=2, length=3)
+        ...     storage.close()
+        ...
+        b'cde'
+
+        ```
+    """
+
+    def __init__(
+        self, endpoint_url: str | None = None, max_connections: int = 8, timeout: float = 60.0
+    ) -> None:
+        self._endpoint_url = (
+            endpoint_url or os.environ.get("AWS_ENDPOINT_URL") or _DEFAULT_ENDPOINT_URL
+        ).rstrip("/")
+        self._pool = _ConnectionPool(
+            self._endpoint_url, max_connections=max_connections, timeout=timeout
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(endpoint_url={self._endpoint_url})"
+
+    def __del__(self) -> None:
+        try:  # noqa: SIM105
+            self.close()
+        except Exception:  # noqa: BLE001, S110
+            # the modules can be unloaded when the interpreter exits
+            pass
+
+    @property
+    def endpoint_url(self) -> str:
+        r"""The URL of the object store."""
+        return self._endpoint_url
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def list(self, location: Path | str) -> list[str]:
+        bucket, key = _split_location(location)
+        prefix = f"{key.rstrip('/')}/" if key else ""
+        names = set()
+        query = {"list-type": "2", "prefix": prefix, "delimiter": "/"}
+        while True:
+            status, _, data = self._request("GET", f"/{quote(bucket)}?{urlencode(query)}")
+            if status == http.HTTPStatus.NOT_FOUND:
+                return []
+            _check_status(status, location, data)
+            # The response is sent by the object store configured by the user.
+            root = ElementTree.fromstring(data)  # noqa: S314
+            names.update(item.text[len(prefix) :] for item in root.iterfind("{*}Contents/{*}Key"))
+            names.update(
+                item.text[len(prefix) :].rstrip("/")
+                for item in root.iterfind("{*}CommonPrefixes/{*}Prefix")
+            )
+            if root.findtext("{*}IsTruncated") != "true":
+                return sorted(names)
+            query["continuation-token"] = root.findtext("{*}NextContinuationToken")
+
+    def open(self, location: Path | str, mode: str = "rb") -> Any:
+        if mode == "rb":
+            status, _, data = self._request("GET", _get_request_path(location))
+            _check_status(status, location, data)
+            return io.BytesIO(data)
+        if mode == "wb":
+            return UploadBuffer(lambda data: self.write(location, data))
+        msg = f"Incorrect mode: {mode}. The supported modes are 'rb' and 'wb'"
+        raise ValueError(msg)
+
+    def read_range(self, location: Path | str, offset: int, length: int) -> bytes:
+        if length <= 0:
+            self.stat(location)
+            return b""
+        status, _, data = self._request(
+            "GET",
+            _get_request_path(location),
+            headers={"Range": f"bytes={offset}-{offset + length - 1}"},
+        )
+        if status == http.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+            # the range starts after the end of the object
+            return b""
+        _check_status(status, location, data)
+        if status == http.HTTPStatus.OK:
+            # the object store does not support the range requests
+            return data[offset : offset + length]
+        return data
+
+    def remove(self, location: Path | str) -> None:
+        status, _, data = self._request("DELETE", _get_request_path(location))
+        if status != http.HTTPStatus.NOT_FOUND:
+            _check_status(status, location, data)
+
+    def stat(self, location: Path | str) -> StorageStat:
+        status, headers, data = self._request("HEAD", _get_request_path(location))
+        _check_status(status, location, data)
+        last_modified = headers.get("Last-Modified")
+        mtime_ns = (
+            int(parsedate_to_datetime(last_modified).timestamp()) * 1_000_000_000
+            if last_modified
+            else 0
+        )
+        return StorageStat(size=int(headers.get("Content-Length", 0)), mtime_ns=mtime_ns)
+
+    def write(self, location: Path | str, data: bytes) -> None:
+        status, _, body = self._request("PUT", _get_request_path(location), body=bytes(data))
+        _check_status(status, location, body)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        r"""Send a request to the object store.
+
+        A request on a pooled connection that was closed by the server
+        is sent again on a new connection.
+
+        Args:
+            method: The HTTP method.
+            path: The path and query of the request.
+            headers: The headers of the request.
+            body: The body of the request.
+
+        Returns:
+            The status, the headers and the body of the response.
+        """
+        while True:
+            connection, reused = self._pool.acquire()
+            try:
+                connection.request(method, path, body=body, headers=headers or {})
+                response = connection.getresponse()
+                data = response.read()
+            except (ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._pool.release(connection)
+            return response.status, response.headers, data
+
+
+class _ConnectionPool:
+    r"""Implement a thread-safe pool of HTTP connections.
+
+    Args:
+        endpoint_url: The URL of the server.
+        max_connections: The maximum number of idle connections.
+        timeout: The timeout of the connections in seconds.
+    """
+
+    def __init__(self, endpoint_url: str, max_connections: int, timeout: float) -> None:
+        url = urlsplit(endpoint_url)
+        self._connection_cls = (
+            http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = url.hostname
+        self._port = url.port
+        self._max_connections = max_connections
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._idle: list[http.client.HTTPConnection] = []
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        r"""Get a connection, from the pool if possible.
+
+        Returns:
+            The connection, and ``True`` if it was used before.
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._connection_cls(self._host, self._port, timeout=self._timeout), False
+
+    def release(self, connection: http.client.HTTPConnection) -> None:
+        r"""Put back a connection in the pool.
+
+        Args:
+            connection: The connection.
+        """
+        with self._lock:
+            if len(self._idle) < self._max_connections:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        r"""Close the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+def _check_status(status: int, location: Path | str, body: bytes) -> None:
+    r"""Check the status of a response.
+
+    Args:
+        status: The status of the response.
+        location: The location of the requested object.
+        body: The body of the response.
+
+    Raises:
+        FileNotFoundError: if the object does not exist.
+        OSError: if the request failed.
+    """
+    if status == http.HTTPStatus.NOT_FOUND:
+        msg = f"object does not exist: {location}"
+        raise FileNotFoundError(msg)
+    if status >= http.HTTPStatus.MULTIPLE_CHOICES:
+        msg = f"request on {location} failed with status {status}: {body[:200]!r}"
+        raise OSError(msg)
+
+
+def _get_request_path(location: Path | str) -> str:
+    r"""Get the path of the requests on an object.
+
+    Args:
+        location: The location of the object.
+
+    Returns:
+        The path of the requests.
+    """
+    bucket, key = _split_location(location)
+    return f"/{quote(bucket)}/{quote(key)}"
+
+
+def _split_location(location: Path | str) -> tuple[str, str]:
+    r"""Split the location of an object.
+
+    Args:
+        location: The location of the object.
+
+    Returns:
+        The bucket and the key of the object.
+
+    Raises:
+        ValueError: if the location is not a ``s3://`` URI.
+    """
+    url = urlsplit(str(location))
+    if url.scheme != "s3" or not url.netloc:
+        msg = f"Incorrect location: {location}. The location must be a 's3://bucket/key' URI"
+        raise ValueError(msg)
+    return url.netloc, url.path.lstrip("/")
@@ -0,0 +1,142 @@
+r"""Contain utility functions to work with the locations of the storage
+backends."""
+
+from __future__ import annotations
+
+__all__ = ["get_extension", "location_to_str", "open_file", "sanitize_location"]
+
+import io
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from coola.utils.path import sanitize_path
+
+from iden.storage.base import UploadBuffer, UploadTextWrapper
+from iden.storage.registry import get_scheme, get_storage
+
+
+def sanitize_location(location: Path | str) -> Path | str:
+    r"""Sanitize a location.
+
+    The local locations i.e. the paths and the ``file://`` URIs are
+    converted to resolved ``Path`` objects, so the local files are
+    read and written without the storage backend overhead. The other
+    locations are returned as URIs.
+
+    Args:
+        location: The location to sanitize.
+
+    Returns:
+        The sanitized location.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import sanitize_location
+        >>> sanitize_location("file:///data/data.json")
+        PosixPath('/data/data.json')
+        >>> sanitize_location("memory://bucket/data.json")
+        'memory://bucket/data.json'
+
+        ```
+    """
+    if get_scheme(location) == "file":
+        return sanitize_path(location)
+    return location
+
+
+def get_extension(location: Path | str) -> str:
+    r"""Get the extension of a location.
+
+    Args:
+        location: The location.
+
+    Returns:
+        The extension without the leading dot, including all the
+            suffixes e.g. ``'tar.gz'``.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import get_extension
+        >>> get_extension("memory://bucket/data.json")
+        'json'
+        >>> get_extension("/data/data.tar.gz")
+        'tar.gz'
+
+        ```
+    """
+    path = location if isinstance(location, Path) else PurePosixPath(location)
+    return "".join(path.suffixes)[1:]
+
+
+def location_to_str(location: Path | str) -> str:
+    r"""Convert a location to a string.
+
+    Args:
+        location: The location.
+
+    Returns:
+        The path in the POSIX format for the local locations, otherwise
+            the URI.
+
+    Example:
+        ```pycon
+        >>> from pathlib import Path
+        >>> from iden.storage import location_to_str
+        >>> location_to_str(Path("/data/data.json"))
+        '/data/data.json'
+        >>> location_to_str("memory://bucket/data.json")
+        'memory://bucket/data.json'
+
+        ```
+    """
+    return location.as_posix() if isinstance(location, Path) else location
+
+
+def open_file(location: Path | str, mode: str = "rb", encoding: str | None = None) -> Any:
+    r"""Open a file object on a location.
+
+    The local files are opened with ``Path.open``, and the other
+    locations with their storage backend. The data written on a remote
+    location are committed when the file object is closed without
+    error.
+
+    Args:
+        location: The location of the file.
+        mode: The mode: ``'rb'``, ``'wb'``, ``'r'`` or ``'w'``.
+        encoding: The encoding of the text modes.
+
+    Returns:
+        The file object.
+
+    Raises:
+        ValueError: if the mode is not supported.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import open_file
+        >>> with open_file("memory://bucket/data.txt", mode="w") as file:
+        ...     file.write("abc")
+        ...
+        3
+        >>> with open_file("memory://bucket/data.txt", mode="r") as file:
+        ...     file.read()
+        ...
+        'abc'
+
+        ```
+    """
+    if mode not in {"rb", "wb", "r", "w"}:
+        msg = f"Incorrect mode: {mode}. The supported modes are 'rb', 'wb', 'r' and 'w'"
+        raise ValueError(msg)
+    if not isinstance(location, Path):
+        location = sanitize_location(location)
+    if isinstance(location, Path):
+        if "w" in mode:
+            location.parent.mkdir(parents=True, exist_ok=True)
+        return location.open(mode=mode, encoding=encoding)
+    file = get_storage(location).open(location, mode=mode if "b" in mode else f"{mode}b")
+    if "b" in mode:
+        return file
+    if isinstance(file, UploadBuffer):
+        return UploadTextWrapper(file, encoding=encoding)
+    return io.TextIOWrapper(file, encoding=encoding)
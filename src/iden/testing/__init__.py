@@ -3,6 +3,7 @@ r"""Contain some utility functions for testing."""
 from __future__ import annotations
 
 __all__ = [
+    "ObjectStoreServer",
     "cloudpickle_available",
     "cloudpickle_not_available",
     "joblib_available",
@@ -23,3 +24,4 @@ from iden.testing.fixtures import (
     yaml_available,
     yaml_not_available,
 )
+from iden.testing.object_store import ObjectStoreServer
@@ -0,0 +1,253 @@
+r"""Contain a local object store server to test the code that uses an
+object store."""
+
+from __future__ import annotations
+
+__all__ = ["ObjectStoreServer"]
+
+import http
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+class ObjectStoreServer:
+    r"""Implement a local object store server compatible with a subset
+    of the S3 API.
+
+    The server runs in a background thread and stores the objects in
+    memory. It supports the path-style requests to get (with a byte
+    range), put, delete and get the status of an object, and to list
+    the objects of a bucket with the ``ListObjectsV2`` API. The
+    buckets are created when an object is put.
+
+    Args:
+        max_keys: The maximum number of keys per listing page.
+
+    Example:
+        ```pycon
+        >>> from iden.storage import S3Storage
+        >>> from iden.testing import ObjectStoreServer
+        >>> with ObjectStoreServer() as server:
+        ...     storage = S3Storage(endpoint_url=server.endpoint_url)
+        ...     storage.write("s3://bucket/data.txt", b"abc")
+        ...     server.get_object("bucket", "data.txt")
+        ...     storage.close()
+        ...
+        b'abc'
+
+        ```
+    """
+
+    def __init__(self, max_keys: int = 1000) -> None:
+        self.max_keys = max_keys
+        self.num_connections = 0
+        self.num_requests = 0
+        self.lock = threading.Lock()
+        self.objects: dict[tuple[str, str], tuple[bytes, float]] = {}
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> ObjectStoreServer:  # noqa: PYI034
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    @property
+    def endpoint_url(self) -> str:
+        r"""The URL of the server."""
+        if self._server is None:
+            msg = "The server is not started"
+            raise RuntimeError(msg)
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def get_object(self, bucket: str, key: str) -> bytes | None:
+        r"""Get the content of an object.
+
+        Args:
+            bucket: The bucket of the object.
+            key: The key of the object.
+
+        Returns:
+            The content of the object, or ``None`` if it does not
+                exist.
+        """
+        with self.lock:
+            obj = self.objects.get((bucket, key))
+        return None if obj is None else obj[0]
+
+    def start(self) -> None:
+        r"""Start the server on a free port of the loopback
+        interface."""
+        handler = type("_Handler", (_ObjectStoreHandler,), {"store": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        r"""Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
+
+
+class _ObjectStoreHandler(BaseHTTPRequestHandler):
+    r"""Implement the request handler of ``ObjectStoreServer``."""
+
+    protocol_version = "HTTP/1.1"
+    store: ObjectStoreServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.store.lock:
+            self.store.num_connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        r"""Do not log the requests."""
+
+    def do_DELETE(self) -> None:
+        bucket, key, _ = self._parse()
+        with self.store.lock:
+            self.store.objects.pop((bucket, key), None)
+        self._send(http.HTTPStatus.NO_CONTENT)
+
+    def do_GET(self) -> None:
+        bucket, key, query = self._parse()
+        if not key:
+            self._list(bucket, query)
+            return
+        with self.store.lock:
+            obj = self.store.objects.get((bucket, key))
+        if obj is None:
+            self._send(http.HTTPStatus.NOT_FOUND)
+            return
+        data, mtime = obj
+        byte_range = self.headers.get("Range")
+        if byte_range is None:
+            self._send(http.HTTPStatus.OK, data, mtime=mtime)
+            return
+        start, _, end = byte_range.removeprefix("bytes=").partition("-")
+        start = int(start)
+        if start >= len(data):
+            self._send(http.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            return
+        end = min(int(end), len(data) - 1) if end else len(data) - 1
+        self._send(http.HTTPStatus.PARTIAL_CONTENT, data[start : end + 1], mtime=mtime)
+
+    def do_HEAD(self) -> None:
+        bucket, key, _ = self._parse()
+        with self.store.lock:
+            obj = self.store.objects.get((bucket, key))
+        if obj is None:
+            self._send(http.HTTPStatus.NOT_FOUND)
+            return
+        self.send_response(http.HTTPStatus.OK)
+        self.send_header("Content-Length", str(len(obj[0])))
+        self.send_header("Last-Modified", formatdate(obj[1], usegmt=True))
+        self.end_headers()
+
+    def do_PUT(self) -> None:
+        bucket, key, _ = self._parse()
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.store.lock:
+            self.store.objects[(bucket, key)] = (data, time.time())
+        self._send(http.HTTPStatus.OK)
+
+    def _list(self, bucket: str, query: dict[str, str]) -> None:
+        r"""Send the listing of the objects of a bucket.
+
+        Args:
+            bucket: The bucket.
+            query: The query of the request.
+        """
+        prefix = query.get("prefix", "")
+        delimiter = query.get("delimiter", "")
+        with self.store.lock:
+            keys = sorted(key for (name, key) in self.store.objects if name == bucket)
+        if not keys:
+            self._send(http.HTTPStatus.NOT_FOUND)
+            return
+        entries = []
+        for key in keys:
+            if not key.startswith(prefix):
+                continue
+            rest = key[len(prefix) :]
+            if delimiter and delimiter in rest:
+                entry = ("prefix", prefix + rest.partition(delimiter)[0] + delimiter)
+            else:
+                entry = ("key", key)
+            if not entries or entries[-1] != entry:
+                entries.append(entry)
+        start = int(query.get("continuation-token", 0))
+        page = entries[start : start + self.store.max_keys]
+        truncated = start + self.store.max_keys < len(entries)
+        items = "".join(
+            (
+                f"<Contents><Key>{escape(value)}</Key></Contents>"
+                if kind == "key"
+                else f"<CommonPrefixes><Prefix>{escape(value)}</Prefix></CommonPrefixes>"
+            )
+            for kind, value in page
+        )
+        token = (
+            f"<NextContinuationToken>{start + self.store.max_keys}</NextContinuationToken>"
+            if truncated
+            else ""
+        )
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+            f"<Name>{escape(bucket)}</Name><Prefix>{escape(prefix)}</Prefix>"
+            f"<IsTruncated>{str(truncated).lower()}</IsTruncated>{token}{items}"
+            "</ListBucketResult>"
+        )
+        self._send(http.HTTPStatus.OK, body.encode())
+
+    def _parse(self) -> tuple[str, str, dict[str, str]]:
+        r"""Parse the path of the request.
+
+        Returns:
+            The bucket, the key and the query of the request.
+        """
+        url = urlsplit(self.path)
+        bucket, _, key = url.path.lstrip("/").partition("/")
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        with self.store.lock:
+            self.store.num_requests += 1
+        return unquote(bucket), unquote(key), query
+
+    def _send(self, status: int, body: bytes = b"", mtime: float | None = None) -> None:
+        r"""Send a response.
+
+        Args:
+            status: The status of the response.
+            body: The body of the response.
+            mtime: The modification time of the object, if any.
+        """
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        if mtime is not None:
+            self.send_header("Last-Modified", formatdate(mtime, usegmt=True))
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,131 @@
+r"""Contain utility functions to register the iden types in the
+``coola`` equality registry without importing ``coola.equality``.
+
+``coola.equality`` imports ``torch`` and ``numpy`` if they are
+installed, which takes more than one second. The types are registered
+immediately if ``coola.equality`` is already imported, otherwise they
+are registered the first time iden compares objects with
+``objects_are_equal``. So importing ``iden`` does not import these
+packages, and ``coola`` uses the ``equal`` method of the iden objects.
+"""
+
+from __future__ import annotations
+
+__all__ = ["objects_are_equal", "register_equality_tester"]
+
+import sys
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import ModuleType
+
+_EQUALITY_MODULE = "coola.equality"
+
+_lock = threading.RLock()
+_pending: list[type] = []
+
+
+def objects_are_equal(actual: Any, expected: Any, equal_nan: bool = False) -> bool:
+    r"""Indicate if two objects are equal with ``coola``.
+
+    The pending iden types are registered in the default ``coola``
+    equality registry before the objects are compared.
+
+    Args:
+        actual: The actual object.
+        expected: The expected object.
+        equal_nan: If ``True``, then two ``NaN``s will be considered
+            equal.
+
+    Returns:
+        ``True`` if the two objects are equal, otherwise ``False``.
+
+    Example:
+        ```pycon
+        >>> from iden.shard import InMemoryShard
+        >>> from iden.utils.equality import objects_are_equal
+        >>> objects_are_equal({"key": InMemoryShard([1, 2])}, {"key": InMemoryShard([1, 2])})
+        True
+
+        ```
+    """
+    # local import because coola.equality imports torch and numpy
+    from coola.equality import objects_are_equal as coola_objects_are_equal  # noqa: PLC0415
+
+    _register_pending()
+    return coola_objects_are_equal(actual, expected, equal_nan=equal_nan)
+
+
+def register_equality_tester(cls: type) -> None:
+    r"""Register ``EqualNanEqualityTester`` for a type in the default
+    ``coola`` equality registry.
+
+    The tester is registered immediately if ``coola.equality`` is
+    already imported, otherwise it is registered the next time
+    ``objects_are_equal`` is called.
+
+    Args:
+        cls: The type to register. Its instances must implement the
+            method ``equal(other, equal_nan)``.
+
+    Example:
+        ```pycon
+        >>> from coola.equality import objects_are_equal
+        >>> from iden.utils.equality import register_equality_tester
+        >>> class Value:
+        ...     def __init__(self, value: int) -> None:
+        ...         self.value = value
+        ...     def equal(self, other: object, equal_nan: bool = False) -> bool:
+        ...         return isinstance(other, Value) and self.value == other.value
+        ...
+        >>> register_equality_tester(Value)
+        >>> objects_are_equal(Value(1), Value(1))
+        True
+
+        ```
+    """
+    with _lock:
+        _pending.append(cls)
+    module = sys.modules.get(_EQUALITY_MODULE)
+    if module is not None and not _is_initializing(module):
+        _register_pending()
+
+
+def _is_initializing(module: ModuleType) -> bool:
+    r"""Indicate if a module is being imported.
+
+    Args:
+        module: The module.
+
+    Returns:
+        ``True`` if the module is being imported, otherwise ``False``.
+    """
+    spec = getattr(module, "__spec__", None)
+    return bool(getattr(spec, "_initializing", False))
+
+
+def _register(classes: Sequence[type]) -> None:
+    r"""Register ``EqualNanEqualityTester`` for some types.
+
+    Args:
+        classes: The types to register.
+    """
+    # local import because coola.equality imports torch and numpy
+    from coola.equality.tester import (  # noqa: PLC0415
+        EqualNanEqualityTester,
+        get_default_registry,
+    )
+
+    registry = get_default_registry()
+    for cls in classes:
+        registry.register(cls, EqualNanEqualityTester(), exist_ok=True)
+
+
+def _register_pending() -> None:
+    r"""Register the pending types."""
+    with _lock:
+        if _pending:
+            _register(_pending)
+            _pending.clear()
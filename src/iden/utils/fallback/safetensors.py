@@ -27,11 +27,15 @@ def fake_function(*args: Any, **kwargs: Any) -> NoReturn:  # noqa: ARG001
 
 # Create fake submodules
 numpy: ModuleType = ModuleType("safetensors.numpy")
+numpy.load = fake_function
 numpy.load_file = fake_function
+numpy.save = fake_function
 numpy.save_file = fake_function
 
 torch: ModuleType = ModuleType("safetensors.torch")
+torch.load = fake_function
 torch.load_file = fake_function
+torch.save = fake_function
 torch.save_file = fake_function
 
 # Create a fake safetensors package with submodules as attributes
@@ -6,18 +6,23 @@ __all__ = [
     "check_cloudpickle",
     "check_joblib",
     "check_safetensors",
+    "check_torch",
     "check_yaml",
     "cloudpickle_available",
+    "decorator_package_available",
     "is_cloudpickle_available",
     "is_joblib_available",
     "is_safetensors_available",
+    "is_torch_available",
     "is_yaml_available",
     "joblib_available",
     "raise_error_cloudpickle_missing",
     "raise_error_joblib_missing",
     "raise_error_safetensors_missing",
+    "raise_error_torch_missing",
     "raise_error_yaml_missing",
     "safetensors_available",
+    "torch_available",
     "yaml_available",
 ]
 
@@ -39,6 +44,13 @@ from iden.utils.imports.safetensors import (
     raise_error_safetensors_missing,
     safetensors_available,
 )
+from iden.utils.imports.torch import (
+    check_torch,
+    is_torch_available,
+    raise_error_torch_missing,
+    torch_available,
+)
+from iden.utils.imports.universal import decorator_package_available
 from iden.utils.imports.yaml import (
     check_yaml,
     is_yaml_available,
@@ -12,7 +12,7 @@ __all__ = [
 from importlib.util import find_spec
 from typing import TYPE_CHECKING, Any, NoReturn
 
-from coola.utils.imports import decorator_package_available
+from iden.utils.imports.universal import decorator_package_available
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -0,0 +1,82 @@
+r"""Implement some utility functions to manage optional dependencies."""
+
+from __future__ import annotations
+
+__all__ = ["check_torch", "is_torch_available", "raise_error_torch_missing", "torch_available"]
+
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, NoReturn
+
+from iden.utils.imports.universal import decorator_package_available
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def check_torch() -> None:
+    r"""Check if the ``torch`` package is installed.
+
+    Raises:
+        RuntimeError: if the ``torch`` package is not installed.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.imports import check_torch
+        >>> check_torch()
+
+        ```
+    """
+    if not is_torch_available():
+        raise_error_torch_missing()
+
+
+def is_torch_available() -> bool:
+    r"""Indicate if the ``torch`` package is installed or not.
+
+    Returns:
+        ``True`` if ``torch`` is available otherwise ``False``.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.imports import is_torch_available
+        >>> is_torch_available()
+
+        ```
+    """
+    return find_spec("torch") is not None
+
+
+def torch_available(fn: Callable[..., Any]) -> Callable[..., Any]:
+    r"""Implement a decorator to execute a function only if ``torch``
+    package is installed.
+
+    Args:
+        fn: The function to execute.
+
+    Returns:
+        A wrapper around ``fn`` if ``torch`` package is installed,
+            otherwise ``None``.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.imports import torch_available
+        >>> @torch_available
+        ... def my_function(n: int = 0) -> int:
+        ...     return 42 + n
+        ...
+        >>> my_function()
+
+        ```
+    """
+    return decorator_package_available(fn, is_torch_available)
+
+
+def raise_error_torch_missing() -> NoReturn:
+    r"""Raise a RuntimeError to indicate the ``torch`` package is
+    missing."""
+    msg = (
+        "'torch' package is required but not installed. "
+        "The 'torch' package can be installed with the command:\n\n"
+        "pip install torch\n"
+    )
+    raise RuntimeError(msg)
@@ -0,0 +1,52 @@
+r"""Implement some utility functions to manage optional dependencies."""
+
+from __future__ import annotations
+
+__all__ = ["decorator_package_available"]
+
+from functools import wraps
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+
+def decorator_package_available(fn: F, condition: Callable[[], bool]) -> F:
+    r"""Implement a decorator to execute a function only if a package is
+    installed.
+
+    This function does not import ``coola.utils.imports``, which
+    imports ``torch`` and ``numpy`` if they are installed.
+
+    Args:
+        fn: The function to execute.
+        condition: The condition to check if a package is installed or
+            not.
+
+    Returns:
+        A wrapper around ``fn`` if condition is true, otherwise
+            ``None``.
+
+    Example:
+        ```pycon
+        >>> from functools import partial
+        >>> from iden.utils.imports import decorator_package_available, is_yaml_available
+        >>> decorator = partial(decorator_package_available, condition=is_yaml_available)
+        >>> @decorator
+        ... def my_function(n: int = 0) -> int:
+        ...     return 42 + n
+        ...
+        >>> my_function(2)
+
+        ```
+    """
+
+    @wraps(fn)
+    def inner(*args: Any, **kwargs: Any) -> Any:
+        if not condition():
+            return None
+        return fn(*args, **kwargs)
+
+    return inner
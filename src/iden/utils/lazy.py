@@ -0,0 +1,58 @@
+r"""Contain utility functions to lazily import the attributes of a
+package (PEP 562)."""
+
+from __future__ import annotations
+
+__all__ = ["create_lazy_getattr"]
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+
+def create_lazy_getattr(
+    package: str, lazy_imports: Mapping[str, Sequence[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    r"""Create the module ``__getattr__`` and ``__dir__`` functions
+    that lazily import the attributes of a package.
+
+    An attribute is imported from its module the first time it is
+    accessed, and is then stored in the package namespace, so the
+    next accesses do not call ``__getattr__``.
+
+    Args:
+        package: The package name, usually ``__name__``.
+        lazy_imports: The attributes to import lazily. The keys are
+            the module names and the values are the attribute names
+            in each module.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions of the package.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.lazy import create_lazy_getattr
+        >>> getattr_, dir_ = create_lazy_getattr("iden.io", {"iden.io.json": ["JsonLoader"]})
+        >>> getattr_("JsonLoader")
+        <class 'iden.io.json.JsonLoader'>
+
+        ```
+    """
+    modules = {name: module for module, names in lazy_imports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        module = modules.get(name)
+        if module is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted(set(vars(sys.modules[package])) | set(modules))
+
+    return __getattr__, __dir__
@@ -0,0 +1,80 @@
+r"""Contain a compact data structure to store many strings."""
+
+from __future__ import annotations
+
+__all__ = ["PackedStringArray"]
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class PackedStringArray:
+    r"""Implement an append-only array of strings stored in a single
+    buffer.
+
+    The strings are encoded in UTF-8 and concatenated in a
+    ``bytearray``, and their offsets are stored in an array of
+    integers. Storing a string costs its number of bytes plus 8 bytes,
+    instead of a Python ``str`` object and a pointer for a ``list``.
+    The strings are decoded when they are accessed.
+
+    Args:
+        strings: The initial strings.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.packed import PackedStringArray
+        >>> strings = PackedStringArray(["abc", "de"])
+        >>> strings.append("fghi")
+        >>> len(strings)
+        3
+        >>> strings[1]
+        'de'
+        >>> list(strings)
+        ['abc', 'de', 'fghi']
+
+        ```
+    """
+
+    def __init__(self, strings: Iterable[str] = ()) -> None:
+        self._data = bytearray()
+        self._offsets = array("Q", [0])
+        for string in strings:
+            self.append(string)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = f"index {index} is out of range"
+            raise IndexError(msg)
+        return self._data[self._offsets[index] : self._offsets[index + 1]].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        data, offsets = self._data, self._offsets
+        for i in range(len(self)):
+            yield data[offsets[i] : offsets[i + 1]].decode()
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(size={len(self):,}, nbytes={self.nbytes:,})"
+
+    @property
+    def nbytes(self) -> int:
+        r"""The number of bytes used to store the strings and their
+        offsets."""
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+    def append(self, string: str) -> None:
+        r"""Append a string at the end of the array.
+
+        Args:
+            string: The string to append.
+        """
+        self._data += string.encode()
+        self._offsets.append(len(self._data))
@@ -2,27 +2,34 @@ r"""Contain utility functions to measure time."""
 
 from __future__ import annotations
 
-__all__ = ["sync_perf_counter", "timeblock"]
+__all__ = [
+    "TimerRegistry",
+    "TimerStats",
+    "get_default_timer_registry",
+    "sync_perf_counter",
+    "timeblock",
+]
 
+import functools
+import inspect
+import json
 import logging
+import math
+import random
+import sys
+import threading
 import time
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
-from unittest.mock import Mock
-
-from coola.utils.imports import is_torch_available
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from iden.utils.format import human_time
 
-if is_torch_available():
-    import torch
-else:  # pragma: no cover
-    torch = Mock()
-
-
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
+    from types import TracebackType
 
+F = TypeVar("F", bound="Callable[..., Any]")
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -46,7 +53,9 @@ def sync_perf_counter() -> float:
 
         ```
     """
-    if is_torch_available() and torch.cuda.is_available():
+    # CUDA kernels can only be running if torch is already imported
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
         torch.cuda.synchronize()
     return time.perf_counter()
 
@@ -79,3 +88,426 @@ def timeblock(message: str = "Total time: {time}") -> Generator[None, None, None
         yield
     finally:
         logger.info(message.format(time=human_time(sync_perf_counter() - start_time)))
+
+
+class TimerStats:
+    r"""Implement the statistics of a named timer.
+
+    The count, total, minimum and maximum are exact. The percentiles
+    are computed on a uniform random sample of at most ``max_samples``
+    durations, so the memory usage is bounded.
+
+    Args:
+        max_samples: The maximum number of durations kept to compute
+            the percentiles.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.time import TimerStats
+        >>> stats = TimerStats()
+        >>> for duration in [1.0, 2.0, 3.0, 4.0]:
+        ...     stats.add(duration)
+        ...
+        >>> stats
+        TimerStats(count=4, total=10, min=1, max=4)
+        >>> stats.mean, stats.percentile(50)
+        (2.5, 2.5)
+
+        ```
+    """
+
+    def __init__(self, max_samples: int = 10_000) -> None:
+        self._max_samples = max_samples
+        self._samples: list[float] = []
+        self._rng = random.Random(0)  # noqa: S311
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(count={self.count:,}, total={self.total:.6g}, "
+            f"min={self.min:.6g}, max={self.max:.6g})"
+        )
+
+    @property
+    def mean(self) -> float:
+        r"""The mean duration in seconds, or ``nan`` if there is no
+        duration."""
+        return self.total / self.count if self.count else math.nan
+
+    def add(self, duration: float) -> None:
+        r"""Add a duration.
+
+        Args:
+            duration: The duration in seconds.
+        """
+        self.count += 1
+        self.total += duration
+        self.min = min(self.min, duration)
+        self.max = max(self.max, duration)
+        if len(self._samples) < self._max_samples:
+            self._samples.append(duration)
+        else:
+            # reservoir sampling keeps a uniform sample of all the durations
+            index = self._rng.randrange(self.count)
+            if index < self._max_samples:
+                self._samples[index] = duration
+
+    def percentile(self, q: float) -> float:
+        r"""Compute a percentile of the durations.
+
+        Args:
+            q: The percentile, in ``[0, 100]``.
+
+        Returns:
+            The percentile computed with linear interpolation, or
+                ``nan`` if there is no duration.
+        """
+        if not self._samples:
+            return math.nan
+        samples = sorted(self._samples)
+        position = (len(samples) - 1) * q / 100
+        low = math.floor(position)
+        high = min(low + 1, len(samples) - 1)
+        return samples[low] + (samples[high] - samples[low]) * (position - low)
+
+    def to_dict(self) -> dict[str, float]:
+        r"""Convert the statistics to a dictionary.
+
+        Returns:
+            The count, total, mean, minimum, maximum and the 50th,
+                90th and 99th percentiles in seconds.
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min if self.count else math.nan,
+            "max": self.max if self.count else math.nan,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class TimerRegistry:
+    r"""Implement a registry of named timers that aggregates the
+    durations of timed blocks.
+
+    A timer can be used as a context manager, an async context
+    manager or a decorator. The timed blocks can be nested: the name
+    of a nested timer is prefixed by the names of the enclosing
+    timers, e.g. ``'epoch/load'``. The nesting is tracked with a
+    context variable, so it works with threads and asyncio tasks.
+    When the registry is disabled, the timers do not measure anything
+    and have a very low overhead.
+
+    Args:
+        enabled: If ``True``, the timers measure the durations.
+        max_samples: The maximum number of durations kept by each
+            timer to compute the percentiles.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.time import TimerRegistry
+        >>> timers = TimerRegistry()
+        >>> for _ in range(3):
+        ...     with timers.timer("epoch"):
+        ...         with timers.timer("load"):
+        ...             x = [1, 2, 3]
+        ...
+        >>> @timers.timed("process")
+        ... def process(x):
+        ...     return x
+        ...
+        >>> process(1)
+        1
+        >>> sorted(timers.get_stats())
+        ['epoch', 'epoch/load', 'process']
+        >>> timers.get_stats()["epoch/load"]["count"]
+        3
+
+        ```
+    """
+
+    def __init__(self, enabled: bool = True, max_samples: int = 10_000) -> None:
+        self._enabled = enabled
+        self._max_samples = max_samples
+        self._stats: dict[str, TimerStats] = {}
+        self._lock = threading.Lock()
+        self._path: ContextVar[tuple[str, ...]] = ContextVar(f"timer_path_{id(self)}", default=())
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(enabled={self._enabled}, "
+            f"num_timers={len(self._stats):,})"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        r"""``True`` if the timers measure the durations."""
+        return self._enabled
+
+    def enable(self) -> None:
+        r"""Enable the timers."""
+        self._enabled = True
+
+    def disable(self) -> None:
+        r"""Disable the timers.
+
+        The statistics that were already recorded are kept.
+        """
+        self._enabled = False
+
+    def timer(self, name: str) -> _Timer | _NullTimer:
+        r"""Get a timer that measures a block of code.
+
+        Args:
+            name: The timer name.
+
+        Returns:
+            The timer. It can be used as a context manager or an async
+                context manager.
+
+        Example:
+            ```pycon
+            >>> import asyncio
+            >>> from iden.utils.time import TimerRegistry
+            >>> timers = TimerRegistry()
+            >>> async def main():
+            ...     async with timers.timer("fetch"):
+            ...         await asyncio.sleep(0)
+            ...
+            >>> asyncio.run(main())
+            >>> timers.get_stats()["fetch"]["count"]
+            1
+
+            ```
+        """
+        if not self._enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name: str | None = None) -> Callable[[F], F]:
+        r"""Get a decorator that measures each call of a function.
+
+        Coroutine functions are supported. The registry is checked at
+        each call, so the decorated function is measured only when the
+        registry is enabled.
+
+        Args:
+            name: The timer name. By default, the qualified name of
+                the function is used.
+
+        Returns:
+            The decorator.
+
+        Example:
+            ```pycon
+            >>> from iden.utils.time import TimerRegistry
+            >>> timers = TimerRegistry()
+            >>> @timers.timed()
+            ... def process(x):
+            ...     return x
+            ...
+            >>> process(1)
+            1
+            >>> list(timers.get_stats())
+            ['process']
+
+            ```
+        """
+
+        def decorator(func: F) -> F:
+            timer_name = name or func.__qualname__
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    async with self.timer(timer_name):
+                        return await func(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.timer(timer_name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record(self, name: str, duration: float) -> None:
+        r"""Record a duration measured outside of a timer.
+
+        Args:
+            name: The full timer name.
+            duration: The duration in seconds.
+
+        Example:
+            ```pycon
+            >>> from iden.utils.time import TimerRegistry
+            >>> timers = TimerRegistry()
+            >>> timers.record("load", 0.5)
+            >>> timers.get_stats()["load"]["total"]
+            0.5
+
+            ```
+        """
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = TimerStats(self._max_samples)
+            stats.add(duration)
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        r"""Get the statistics of all the timers.
+
+        Returns:
+            The statistics of each timer, in the order of creation.
+                The durations are in seconds.
+        """
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        r"""Remove all the recorded durations."""
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self) -> str:
+        r"""Get a summary table of the timers.
+
+        Returns:
+            The table, with one line per timer. The durations are in
+                milliseconds.
+
+        Example:
+            ```pycon
+            >>> from iden.utils.time import TimerRegistry
+            >>> timers = TimerRegistry()
+            >>> timers.record("load", 0.5)
+            >>> print(timers.summary())
+            name    count    total (ms)     mean (ms)      min (ms)      max (ms)      p50 (ms)      p90 (ms)      p99 (ms)
+            load        1       500.000       500.000       500.000       500.000       500.000       500.000       500.000
+
+            ```
+        """
+        stats = self.get_stats()
+        columns = ("total", "mean", "min", "max", "p50", "p90", "p99")
+        width = max((len(name) for name in stats), default=4)
+        header = f"{'name':<{width}}  {'count':>7}" + "".join(
+            f"  {column + ' (ms)':>12}" for column in columns
+        )
+        lines = [header]
+        for name, values in stats.items():
+            lines.append(
+                f"{name:<{width}}  {values['count']:>7,}"
+                + "".join(f"  {values[column] * 1e3:>12.3f}" for column in columns)
+            )
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        r"""Convert the statistics of all the timers to JSON.
+
+        Returns:
+            The statistics in the JSON format.
+
+        Example:
+            ```pycon
+            >>> from iden.utils.time import TimerRegistry
+            >>> timers = TimerRegistry()
+            >>> timers.record("load", 0.5)
+            >>> timers.to_json()
+            '{"load": {"count": 1, "total": 0.5, "mean": 0.5, "min": 0.5, "max": 0.5, "p50": 0.5, "p90": 0.5, "p99": 0.5}}'
+
+            ```
+        """
+        return json.dumps(self.get_stats())
+
+
+class _Timer:
+    r"""Implement a timer that measures a block of code.
+
+    Args:
+        registry: The registry where the duration is recorded.
+        name: The timer name.
+    """
+
+    def __init__(self, registry: TimerRegistry, name: str) -> None:
+        self._registry = registry
+        self._name = name
+        self._token = None
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        path = self._registry._path
+        self._token = path.set((*path.get(), self._name))
+        self._start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        duration = time.perf_counter() - self._start
+        path = self._registry._path
+        name = "/".join(path.get())
+        path.reset(self._token)
+        self._registry.record(name, duration)
+
+    async def __aenter__(self) -> None:
+        self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+
+class _NullTimer:
+    r"""Implement a timer that does not measure anything."""
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    async def __aenter__(self) -> None:
+        pass
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+_default_registry = TimerRegistry(enabled=False)
+
+
+def get_default_timer_registry() -> TimerRegistry:
+    r"""Get the default timer registry.
+
+    The default registry is disabled, so the timers of the library
+    have a very low overhead until it is enabled.
+
+    Returns:
+        The default timer registry.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.time import get_default_timer_registry
+        >>> timers = get_default_timer_registry()
+        >>> timers
+        TimerRegistry(enabled=False, num_timers=...)
+
+        ```
+    """
+    return _default_registry
@@ -0,0 +1,378 @@
+r"""Contain an opt-in tracer that records the spans of the loading
+pipeline in the Chrome trace-event format.
+
+The trace files can be opened with ``chrome://tracing`` or
+https://ui.perfetto.dev to see a timeline of the URI resolution, file
+I/O, prefetch waits and cache operations in each thread.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "Tracer",
+    "get_tracer",
+    "start_tracing",
+    "stop_tracing",
+    "trace_instant",
+    "trace_span",
+    "tracing",
+]
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any
+
+from coola.utils.path import sanitize_path
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_NULL_CONTEXT = nullcontext()
+_tracer: Tracer | None = None
+
+
+class Tracer:
+    r"""Implement a tracer that records spans in the Chrome trace-event
+    format.
+
+    The spans are recorded as complete events (``'ph': 'X'``) with the
+    process and thread IDs, so the spans of each thread are displayed
+    on their own track. The tracer is thread-safe.
+
+    Args:
+        max_events: The maximum number of recorded events. The events
+            above this limit are dropped, so the memory usage is
+            bounded.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.trace import Tracer
+        >>> tracer = Tracer()
+        >>> with tracer.span("load", category="io", fmt="json"):
+        ...     x = [1, 2, 3]
+        ...
+        >>> tracer
+        Tracer(num_events=1, num_dropped=0)
+        >>> event = tracer.get_events()[0]
+        >>> event["name"], event["cat"], event["ph"], event["args"]
+        ('load', 'io', 'X', {'fmt': 'json'})
+
+        ```
+    """
+
+    def __init__(self, max_events: int = 1_000_000) -> None:
+        self._max_events = max_events
+        self._events: list[dict[str, Any]] = []
+        self._thread_names: dict[int, str] = {}
+        self._num_dropped = 0
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(num_events={len(self._events):,}, "
+            f"num_dropped={self._num_dropped:,})"
+        )
+
+    @contextmanager
+    def span(self, name: str, category: str = "iden", **args: Any) -> Generator[None, None, None]:
+        r"""Implement a context manager that records a span.
+
+        Args:
+            name: The span name.
+            category: The span category e.g. ``'io'`` or ``'uri'``.
+            **args: Some arguments attached to the span. They must be
+                compatible with the JSON format.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self._add_event(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self._origin) / 1e3,
+                    "dur": (end - start) / 1e3,
+                    "args": args,
+                }
+            )
+
+    def instant(self, name: str, category: str = "iden", **args: Any) -> None:
+        r"""Record an instant event.
+
+        Args:
+            name: The event name.
+            category: The event category.
+            **args: Some arguments attached to the event. They must be
+                compatible with the JSON format.
+
+        Example:
+            ```pycon
+            >>> from iden.utils.trace import Tracer
+            >>> tracer = Tracer()
+            >>> tracer.instant("cache_clear", category="cache")
+            >>> tracer.get_events()[0]["ph"]
+            'i'
+
+            ```
+        """
+        self._add_event(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "i",
+                "s": "t",
+                "ts": (time.perf_counter_ns() - self._origin) / 1e3,
+                "args": args,
+            }
+        )
+
+    def clear(self) -> None:
+        r"""Remove all the recorded events."""
+        with self._lock:
+            self._events.clear()
+            self._thread_names.clear()
+            self._num_dropped = 0
+
+    def get_events(self) -> list[dict[str, Any]]:
+        r"""Get the recorded events.
+
+        Returns:
+            The recorded events, in recording order.
+        """
+        with self._lock:
+            return list(self._events)
+
+    def to_dict(self) -> dict[str, Any]:
+        r"""Convert the trace to the Chrome trace-event format.
+
+        Returns:
+            The trace. The thread names are added as metadata events.
+
+        Example:
+            ```pycon
+            >>> from iden.utils.trace import Tracer
+            >>> tracer = Tracer()
+            >>> with tracer.span("load"):
+            ...     x = [1, 2, 3]
+            ...
+            >>> trace = tracer.to_dict()
+            >>> sorted(trace)
+            ['displayTimeUnit', 'otherData', 'traceEvents']
+            >>> [event["ph"] for event in trace["traceEvents"]]
+            ['M', 'X']
+
+            ```
+        """
+        pid = os.getpid()
+        with self._lock:
+            metadata = [
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self._thread_names.items()
+            ]
+            events = metadata + self._events
+            num_dropped = self._num_dropped
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"num_dropped": num_dropped},
+        }
+
+    def save(self, path: Path | str) -> None:
+        r"""Save the trace in a JSON file.
+
+        Args:
+            path: The path to the JSON file.
+
+        Example:
+            ```pycon
+            >>> import tempfile
+            >>> from pathlib import Path
+            >>> from iden.utils.trace import Tracer
+            >>> tracer = Tracer()
+            >>> with tempfile.TemporaryDirectory() as tmpdir:
+            ...     path = Path(tmpdir).joinpath("trace.json")
+            ...     tracer.save(path)
+            ...     path.is_file()
+            ...
+            True
+
+            ```
+        """
+        path = sanitize_path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open(mode="w") as file:
+            json.dump(self.to_dict(), file)
+        logger.info(f"trace saved in {path}")
+
+    def _add_event(self, event: dict[str, Any]) -> None:
+        r"""Add an event to the trace.
+
+        Args:
+            event: The event without the process and thread IDs.
+        """
+        thread = threading.current_thread()
+        event["pid"] = os.getpid()
+        event["tid"] = thread.ident
+        with self._lock:
+            if len(self._events) >= self._max_events:
+                self._num_dropped += 1
+                return
+            self._events.append(event)
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+
+def get_tracer() -> Tracer | None:
+    r"""Get the active tracer.
+
+    Returns:
+        The active tracer, or ``None`` if tracing is disabled.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.trace import get_tracer
+        >>> get_tracer()
+
+        ```
+    """
+    return _tracer
+
+
+def start_tracing(tracer: Tracer | None = None) -> Tracer:
+    r"""Start tracing.
+
+    Args:
+        tracer: The tracer that records the spans. A new tracer is
+            created if ``None``.
+
+    Returns:
+        The active tracer.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.trace import start_tracing, stop_tracing
+        >>> tracer = start_tracing()
+        >>> tracer
+        Tracer(num_events=0, num_dropped=0)
+        >>> stop_tracing() is tracer
+        True
+
+        ```
+    """
+    global _tracer  # noqa: PLW0603
+    _tracer = tracer or Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Tracer | None:
+    r"""Stop tracing.
+
+    Returns:
+        The tracer that was active, or ``None`` if tracing was
+            disabled.
+    """
+    global _tracer  # noqa: PLW0603
+    tracer = _tracer
+    _tracer = None
+    return tracer
+
+
+@contextmanager
+def tracing(
+    path: Path | str | None = None, tracer: Tracer | None = None
+) -> Generator[Tracer, None, None]:
+    r"""Implement a context manager that enables tracing in a block of
+    code.
+
+    Args:
+        path: The path to the JSON file where the trace is saved when
+            exiting the context. The trace is not saved if ``None``.
+        tracer: The tracer that records the spans. A new tracer is
+            created if ``None``.
+
+    Returns:
+        The active tracer.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from iden.shard import create_json_shard
+        >>> from iden.utils.trace import tracing
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     with tracing(Path(tmpdir).joinpath("trace.json")) as tracer:
+        ...         shard = create_json_shard([1, 2, 3], uri=Path(tmpdir).joinpath("uri").as_uri())
+        ...         data = shard.get_data()
+        ...
+        >>> sorted({event["name"] for event in tracer.get_events()})
+        ['load', 'save']
+
+        ```
+    """
+    tracer = start_tracing(tracer)
+    try:
+        yield tracer
+    finally:
+        stop_tracing()
+        if path is not None:
+            tracer.save(path)
+
+
+def trace_span(name: str, category: str = "iden", **args: Any) -> AbstractContextManager[None]:
+    r"""Get a context manager that records a span with the active
+    tracer.
+
+    The context manager does nothing if tracing is disabled, so it can
+    be used in the hot paths.
+
+    Args:
+        name: The span name.
+        category: The span category e.g. ``'io'`` or ``'uri'``.
+        **args: Some arguments attached to the span. They must be
+            compatible with the JSON format.
+
+    Returns:
+        The context manager.
+
+    Example:
+        ```pycon
+        >>> from iden.utils.trace import trace_span, tracing
+        >>> with tracing() as tracer:
+        ...     with trace_span("decode", category="io"):
+        ...         x = [1, 2, 3]
+        ...
+        >>> [event["name"] for event in tracer.get_events()]
+        ['decode']
+
+        ```
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_CONTEXT
+    return tracer.span(name, category, **args)
+
+
+def trace_instant(name: str, category: str = "iden", **args: Any) -> None:
+    r"""Record an instant event with the active tracer.
+
+    Nothing is recorded if tracing is disabled.
+
+    Args:
+        name: The event name.
+        category: The event category.
+        **args: Some arguments attached to the event. They must be
+            compatible with the JSON format.
+    """
+    tracer = _tracer
+    if tracer is not None:
+        tracer.instant(name, category, **args)
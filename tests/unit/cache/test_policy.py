@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from coola.equality import objects_are_equal
+
+from iden.cache import (
+    FileChangeCachePolicy,
+    PinnedCachePolicy,
+    TTLCachePolicy,
+    WeakRefCachePolicy,
+)
+from iden.io import save_json
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path_ = tmp_path.joinpath("data.json")
+    save_json([1, 2, 3], path_)
+    return path_
+
+
+#######################################
+#     Tests for PinnedCachePolicy     #
+#######################################
+
+
+def test_pinned_cache_policy_repr() -> None:
+    assert repr(PinnedCachePolicy()) == "PinnedCachePolicy()"
+
+
+def test_pinned_cache_policy_load(path: Path) -> None:
+    load = Mock(return_value=[1, 2, 3])
+    data, entry = PinnedCachePolicy().load(path, load)
+    assert data == [1, 2, 3]
+    assert entry is data
+    load.assert_called_once_with()
+
+
+def test_pinned_cache_policy_lookup(path: Path) -> None:
+    policy = PinnedCachePolicy()
+    _, entry = policy.load(path, lambda: [1, 2, 3])
+    assert policy.lookup(entry, path) == (True, [1, 2, 3])
+
+
+########################################
+#     Tests for WeakRefCachePolicy     #
+########################################
+
+
+def test_weakref_cache_policy_repr() -> None:
+    assert repr(WeakRefCachePolicy()) == "WeakRefCachePolicy()"
+
+
+def test_weakref_cache_policy_lookup_referenced(path: Path) -> None:
+    policy = WeakRefCachePolicy()
+    data, entry = policy.load(path, lambda: np.arange(3))
+    is_valid, cached = policy.lookup(entry, path)
+    assert is_valid
+    assert cached is data
+
+
+def test_weakref_cache_policy_lookup_released(path: Path) -> None:
+    policy = WeakRefCachePolicy()
+    data, entry = policy.load(path, lambda: np.arange(3))
+    del data
+    assert policy.lookup(entry, path) == (False, None)
+
+
+@pytest.mark.parametrize("data", [[1, 2, 3], {"key": 1}, "abc"])
+def test_weakref_cache_policy_load_not_weakrefable(path: Path, data: object) -> None:
+    policy = WeakRefCachePolicy()
+    with pytest.raises(TypeError, match=r"do not support weak references"):
+        policy.load(path, lambda: data)
+
+
+####################################
+#     Tests for TTLCachePolicy     #
+####################################
+
+
+def test_ttl_cache_policy_repr() -> None:
+    assert repr(TTLCachePolicy(ttl=10.0)) == "TTLCachePolicy(ttl=10.0)"
+
+
+@pytest.mark.parametrize("ttl", [0, -1.0])
+def test_ttl_cache_policy_incorrect_ttl(ttl: float) -> None:
+    with pytest.raises(ValueError, match="ttl must be positive"):
+        TTLCachePolicy(ttl=ttl)
+
+
+def test_ttl_cache_policy_lookup_valid(path: Path) -> None:
+    policy = TTLCachePolicy(ttl=10.0)
+    with patch("iden.cache.policy.time.monotonic", return_value=100.0):
+        _, entry = policy.load(path, lambda: [1, 2, 3])
+    with patch("iden.cache.policy.time.monotonic", return_value=109.0):
+        assert policy.lookup(entry, path) == (True, [1, 2, 3])
+
+
+def test_ttl_cache_policy_lookup_expired(path: Path) -> None:
+    policy = TTLCachePolicy(ttl=10.0)
+    with patch("iden.cache.policy.time.monotonic", return_value=100.0):
+        _, entry = policy.load(path, lambda: [1, 2, 3])
+    with patch("iden.cache.policy.time.monotonic", return_value=110.0):
+        assert policy.lookup(entry, path) == (False, None)
+
+
+###########################################
+#     Tests for FileChangeCachePolicy     #
+###########################################
+
+
+def test_file_change_cache_policy_repr() -> None:
+    assert repr(FileChangeCachePolicy()) == "FileChangeCachePolicy()"
+
+
+def test_file_change_cache_policy_lookup_unchanged(path: Path) -> None:
+    policy = FileChangeCachePolicy()
+    _, entry = policy.load(path, lambda: [1, 2, 3])
+    assert policy.lookup(entry, path) == (True, [1, 2, 3])
+
+
+def test_file_change_cache_policy_lookup_size_changed(path: Path) -> None:
+    policy = FileChangeCachePolicy()
+    _, entry = policy.load(path, lambda: [1, 2, 3])
+    save_json([1, 2, 3, 4], path, exist_ok=True)
+    assert policy.lookup(entry, path) == (False, None)
+
+
+def test_file_change_cache_policy_lookup_mtime_changed(path: Path) -> None:
+    policy = FileChangeCachePolicy()
+    _, entry = policy.load(path, lambda: [1, 2, 3])
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert policy.lookup(entry, path) == (False, None)
+
+
+def test_file_change_cache_policy_lookup_deleted(path: Path) -> None:
+    policy = FileChangeCachePolicy()
+    _, entry = policy.load(path, lambda: [1, 2, 3])
+    path.unlink()
+    assert policy.lookup(entry, path) == (False, None)
+
+
+def test_file_change_cache_policy_load_changed_during_load(path: Path) -> None:
+    policy = FileChangeCachePolicy()
+
+    def load() -> list[int]:
+        save_json([1, 2, 3, 4], path, exist_ok=True)
+        return [1, 2, 3]
+
+    _, entry = policy.load(path, load)
+    assert policy.lookup(entry, path) == (False, None)
+
+
+def test_file_change_cache_policy_memory_storage() -> None:
+    path = "memory://test-cache-policy/data.json"
+    save_json({"key": "abc"}, path)
+    policy = FileChangeCachePolicy()
+    _, entry = policy.load(path, lambda: {"key": "abc"})
+    assert objects_are_equal(policy.lookup(entry, path), (True, {"key": "abc"}))
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import pickle
+import time
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from coola.equality import objects_are_equal
+from coola.utils.imports import is_torch_available
+
+from iden.cache import SharedMemoryCache
+
+if is_torch_available():
+    import torch
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+fork_available = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="Require fork"
+)
+torch_available = pytest.mark.skipif(not is_torch_available(), reason="Require torch")
+
+
+@pytest.fixture
+def cache() -> Generator[SharedMemoryCache, None, None]:
+    cache = SharedMemoryCache()
+    yield cache
+    cache.clear()
+
+
+def load_slowly(path: Path) -> np.ndarray:
+    with path.open(mode="a") as file:
+        file.write("load\n")
+    time.sleep(0.2)
+    return np.arange(10)
+
+
+def worker(cache: SharedMemoryCache, path: Path, output: Path) -> None:
+    data = cache.get_or_load("key", lambda: load_slowly(path))
+    output.write_text(str(int(data.sum())))
+
+
+def exit_while_loading() -> None:
+    os._exit(1)
+
+
+def dying_worker(cache: SharedMemoryCache) -> None:
+    cache.get_or_load("key", exit_while_loading)
+
+
+#######################################
+#     Tests for SharedMemoryCache     #
+#######################################
+
+
+def test_shared_memory_cache_repr() -> None:
+    assert repr(SharedMemoryCache(name="abc")) == "SharedMemoryCache(name='abc', num_local=0)"
+
+
+def test_shared_memory_cache_name() -> None:
+    assert SharedMemoryCache(name="abc").name == "abc"
+
+
+def test_shared_memory_cache_name_default() -> None:
+    assert SharedMemoryCache().name != SharedMemoryCache().name
+
+
+def test_shared_memory_cache_contains_true(cache: SharedMemoryCache) -> None:
+    cache.get_or_load("key", lambda: [1, 2, 3])
+    assert "key" in cache
+
+
+def test_shared_memory_cache_contains_false(cache: SharedMemoryCache) -> None:
+    assert "key" not in cache
+
+
+def test_shared_memory_cache_get_or_load(cache: SharedMemoryCache) -> None:
+    assert objects_are_equal(
+        cache.get_or_load("key", lambda: {"array": np.arange(5), "name": "abc"}),
+        {"array": np.arange(5), "name": "abc"},
+    )
+
+
+def test_shared_memory_cache_get_or_load_cached(cache: SharedMemoryCache) -> None:
+    load = Mock(return_value=[1, 2, 3])
+    data = cache.get_or_load("key", load)
+    assert cache.get_or_load("key", load) is data
+    load.assert_called_once_with()
+
+
+def test_shared_memory_cache_get_or_load_zero_copy(cache: SharedMemoryCache) -> None:
+    data1 = cache.get_or_load("key", lambda: np.zeros(5))
+    data2 = SharedMemoryCache(name=cache.name).get_or_load("key", Mock())
+    data1[0] = 42.0
+    assert data2[0] == 42.0
+
+
+def test_shared_memory_cache_get_or_load_non_contiguous(cache: SharedMemoryCache) -> None:
+    array = np.arange(12).reshape(3, 4)
+    assert objects_are_equal(cache.get_or_load("key", lambda: array.T), array.T)
+
+
+@torch_available
+def test_shared_memory_cache_get_or_load_torch(cache: SharedMemoryCache) -> None:
+    data = {"key1": torch.arange(6).view(2, 3), "key2": torch.ones(3, dtype=torch.bfloat16)}
+    assert objects_are_equal(cache.get_or_load("key", lambda: data), data)
+
+
+@torch_available
+def test_shared_memory_cache_get_or_load_torch_zero_copy(cache: SharedMemoryCache) -> None:
+    data1 = cache.get_or_load("key", lambda: torch.zeros(5))
+    data2 = SharedMemoryCache(name=cache.name).get_or_load("key", Mock())
+    data1[0] = 42.0
+    assert data2[0].item() == 42.0
+
+
+def test_shared_memory_cache_get_or_load_error(cache: SharedMemoryCache) -> None:
+    with pytest.raises(RuntimeError, match=r"load failed"):
+        cache.get_or_load("key", Mock(side_effect=RuntimeError("load failed")))
+    assert "key" not in cache
+    assert cache.get_or_load("key", lambda: [1, 2, 3]) == [1, 2, 3]
+
+
+def test_shared_memory_cache_get_or_load_not_picklable(
+    cache: SharedMemoryCache, caplog: pytest.LogCaptureFixture
+) -> None:
+    def func() -> int:
+        return 42
+
+    with caplog.at_level(logging.WARNING):
+        assert cache.get_or_load("key", lambda: func) is func
+    assert "cannot be stored in shared memory" in caplog.text
+    assert "key" not in cache
+
+
+def test_shared_memory_cache_get_or_load_timeout(caplog: pytest.LogCaptureFixture) -> None:
+    cache1 = SharedMemoryCache()
+    cache2 = SharedMemoryCache(name=cache1.name, timeout=0.01)
+    # simulate a load in progress in another process
+    state = cache1._create_state("key")
+    try:
+        with caplog.at_level(logging.WARNING):
+            assert cache2.get_or_load("key", lambda: [1, 2, 3]) == [1, 2, 3]
+        assert "timeout when waiting for the data of 'key'" in caplog.text
+    finally:
+        state.close()
+        cache1.remove("key")
+
+
+def test_shared_memory_cache_get_or_load_leftover_data_segment(cache: SharedMemoryCache) -> None:
+    # simulate a process that ended after writing the data segment
+    segment = shared_memory.SharedMemory(
+        name=cache._get_segment_name("key", "d"), create=True, size=8
+    )
+    segment.close()
+    assert objects_are_equal(cache.get_or_load("key", lambda: np.arange(5)), np.arange(5))
+    assert "key" in cache
+
+
+@fork_available
+def test_shared_memory_cache_get_or_load_owner_ended(
+    cache: SharedMemoryCache, caplog: pytest.LogCaptureFixture
+) -> None:
+    process = multiprocessing.get_context("fork").Process(target=dying_worker, args=(cache,))
+    process.start()
+    process.join()
+    assert process.exitcode == 1
+    # the entry of the ended process is still in the loading state
+    assert "key" not in cache
+    start = time.monotonic()
+    with caplog.at_level(logging.WARNING):
+        assert cache.get_or_load("key", lambda: [1, 2, 3]) == [1, 2, 3]
+    assert time.monotonic() - start < 5.0
+    assert f"the process {process.pid} that loads the data of 'key' ended" in caplog.text
+    assert "key" in cache
+
+
+def test_shared_memory_cache_pickle(cache: SharedMemoryCache) -> None:
+    cache.get_or_load("key", lambda: [1, 2, 3])
+    other = pickle.loads(pickle.dumps(cache))  # noqa: S301
+    assert other.name == cache.name
+    assert "key" in other
+    assert other.get_or_load("key", Mock()) == [1, 2, 3]
+
+
+def test_shared_memory_cache_remove(cache: SharedMemoryCache) -> None:
+    cache.get_or_load("key", lambda: [1, 2, 3])
+    cache.remove("key")
+    assert "key" not in cache
+    assert cache.get_or_load("key", lambda: [4, 5]) == [4, 5]
+
+
+def test_shared_memory_cache_remove_missing(cache: SharedMemoryCache) -> None:
+    cache.remove("key")
+    assert "key" not in cache
+
+
+def test_shared_memory_cache_remove_other_process(cache: SharedMemoryCache) -> None:
+    cache.get_or_load("key", lambda: [1, 2, 3])
+    SharedMemoryCache(name=cache.name).remove("key")
+    assert "key" not in SharedMemoryCache(name=cache.name)
+
+
+def test_shared_memory_cache_clear(cache: SharedMemoryCache) -> None:
+    data = cache.get_or_load("key1", lambda: np.arange(5))
+    cache.get_or_load("key2", lambda: [1, 2, 3])
+    cache.clear()
+    assert "key1" not in cache
+    assert "key2" not in cache
+    # the data are still valid after the segments are released
+    assert objects_are_equal(data, np.arange(5))
+
+
+@fork_available
+def test_shared_memory_cache_single_flight(cache: SharedMemoryCache, tmp_path: Path) -> None:
+    path = tmp_path.joinpath("loads.txt")
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=worker, args=(cache, path, tmp_path.joinpath(f"output{i}")))
+        for i in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+    assert path.read_text() == "load\n"
+    assert [tmp_path.joinpath(f"output{i}").read_text() for i in range(4)] == ["45"] * 4
+    assert cache.get_or_load("key", Mock()).sum() == 45
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from coola.equality import objects_are_equal
+
+from iden.cache import TranscodingCache
+from iden.io import save_json, save_pickle
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path.joinpath("data/source.json")
+    save_json([1, 2, 3], path)
+    return path
+
+
+def create_source(path: Path, size: int) -> Path:
+    save_pickle(np.zeros(size, dtype=np.uint8), path)
+    return path
+
+
+######################################
+#     Tests for TranscodingCache     #
+######################################
+
+
+def test_transcoding_cache_repr(tmp_path: Path) -> None:
+    assert repr(TranscodingCache(tmp_path, max_bytes=100)).startswith("TranscodingCache(")
+
+
+def test_transcoding_cache_path(tmp_path: Path) -> None:
+    assert TranscodingCache(tmp_path).path == tmp_path
+
+
+def test_transcoding_cache_persistent(tmp_path: Path) -> None:
+    assert TranscodingCache(tmp_path).persistent
+
+
+def test_transcoding_cache_contains_true(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    cache.get_or_load(source.as_posix(), lambda: [1, 2, 3])
+    assert source.as_posix() in cache
+
+
+def test_transcoding_cache_contains_false(tmp_path: Path, source: Path) -> None:
+    assert source.as_posix() not in TranscodingCache(tmp_path.joinpath("cache"))
+
+
+def test_transcoding_cache_contains_missing_source(tmp_path: Path) -> None:
+    assert tmp_path.joinpath("missing").as_posix() not in TranscodingCache(tmp_path)
+
+
+def test_transcoding_cache_get_or_load(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    load = Mock(return_value={"array": np.arange(5), "name": "abc"})
+    assert objects_are_equal(
+        cache.get_or_load(source.as_posix(), load), {"array": np.arange(5), "name": "abc"}
+    )
+    assert objects_are_equal(
+        cache.get_or_load(source.as_posix(), load), {"array": np.arange(5), "name": "abc"}
+    )
+    load.assert_called_once_with()
+
+
+def test_transcoding_cache_get_or_load_other_instance(tmp_path: Path, source: Path) -> None:
+    TranscodingCache(tmp_path.joinpath("cache")).get_or_load(source.as_posix(), lambda: [1, 2])
+    load = Mock()
+    assert TranscodingCache(tmp_path.joinpath("cache")).get_or_load(source.as_posix(), load) == [
+        1,
+        2,
+    ]
+    load.assert_not_called()
+
+
+def test_transcoding_cache_get_or_load_writable(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    cache.get_or_load(source.as_posix(), lambda: np.zeros(4))
+    array = cache.get_or_load(source.as_posix(), Mock())
+    array[0] = 42.0
+    # the cache file is not changed
+    assert cache.get_or_load(source.as_posix(), Mock())[0] == 0.0
+
+
+def test_transcoding_cache_get_or_load_source_changed(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    cache.get_or_load(source.as_posix(), lambda: [1, 2, 3])
+    save_json([4, 5], source, exist_ok=True)
+    assert cache.get_or_load(source.as_posix(), lambda: [4, 5]) == [4, 5]
+    # the outdated entry is removed
+    assert len(list(tmp_path.joinpath("cache").iterdir())) == 1
+
+
+def test_transcoding_cache_get_or_load_source_mtime_changed(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    cache.get_or_load(source.as_posix(), lambda: [1, 2, 3])
+    os.utime(source, ns=(0, 0))
+    assert source.as_posix() not in cache
+
+
+def test_transcoding_cache_get_or_load_missing_source(tmp_path: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    assert cache.get_or_load(tmp_path.joinpath("missing").as_posix(), lambda: [1, 2]) == [1, 2]
+    assert not tmp_path.joinpath("cache").exists()
+
+
+def test_transcoding_cache_get_or_load_error(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    with pytest.raises(RuntimeError, match=r"load failed"):
+        cache.get_or_load(source.as_posix(), Mock(side_effect=RuntimeError("load failed")))
+    assert source.as_posix() not in cache
+
+
+def test_transcoding_cache_get_or_load_not_picklable(
+    tmp_path: Path, source: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    def func() -> int:
+        return 42
+
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    with caplog.at_level(logging.WARNING):
+        assert cache.get_or_load(source.as_posix(), lambda: func) is func
+    assert "cannot be stored in the transcoding cache" in caplog.text
+    assert source.as_posix() not in cache
+    assert not tmp_path.joinpath("cache").exists()
+
+
+def test_transcoding_cache_max_bytes(tmp_path: Path) -> None:
+    sources = [create_source(tmp_path.joinpath(f"source{i}.pkl"), 1000) for i in range(3)]
+    cache = TranscodingCache(tmp_path.joinpath("cache"), max_bytes=2500)
+    for source in sources:
+        cache.get_or_load(source.as_posix(), lambda: np.zeros(1000, dtype=np.uint8))
+    assert sources[0].as_posix() not in cache
+    assert sources[1].as_posix() in cache
+    assert sources[2].as_posix() in cache
+    assert cache.nbytes <= 2500
+
+
+def test_transcoding_cache_max_bytes_lru(tmp_path: Path) -> None:
+    sources = [create_source(tmp_path.joinpath(f"source{i}.pkl"), 1000) for i in range(3)]
+    cache = TranscodingCache(tmp_path.joinpath("cache"), max_bytes=2500)
+    cache.get_or_load(sources[0].as_posix(), lambda: np.zeros(1000, dtype=np.uint8))
+    cache.get_or_load(sources[1].as_posix(), lambda: np.zeros(1000, dtype=np.uint8))
+    # the first entry becomes the most recently used entry
+    cache.get_or_load(sources[0].as_posix(), Mock())
+    cache.get_or_load(sources[2].as_posix(), lambda: np.zeros(1000, dtype=np.uint8))
+    assert sources[0].as_posix() in cache
+    assert sources[1].as_posix() not in cache
+    assert sources[2].as_posix() in cache
+
+
+def test_transcoding_cache_max_bytes_keep_last(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"), max_bytes=10)
+    cache.get_or_load(source.as_posix(), lambda: np.zeros(1000, dtype=np.uint8))
+    assert source.as_posix() in cache
+
+
+def test_transcoding_cache_nbytes(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    assert cache.nbytes == 0
+    cache.get_or_load(source.as_posix(), lambda: np.zeros(1000, dtype=np.uint8))
+    assert cache.nbytes >= 1000
+
+
+def test_transcoding_cache_pickle(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"), max_bytes=100)
+    cache.get_or_load(source.as_posix(), lambda: [1, 2, 3])
+    other = pickle.loads(pickle.dumps(cache))  # noqa: S301
+    assert other.path == cache.path
+    assert source.as_posix() in other
+
+
+def test_transcoding_cache_remove(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    data = cache.get_or_load(source.as_posix(), lambda: np.arange(5))
+    cache.remove(source.as_posix())
+    assert source.as_posix() not in cache
+    assert cache.nbytes == 0
+    assert objects_are_equal(data, np.arange(5))
+
+
+def test_transcoding_cache_remove_missing(tmp_path: Path, source: Path) -> None:
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    cache.remove(source.as_posix())
+    assert source.as_posix() not in cache
+
+
+def test_transcoding_cache_clear(tmp_path: Path) -> None:
+    sources = [create_source(tmp_path.joinpath(f"source{i}.pkl"), 10) for i in range(2)]
+    cache = TranscodingCache(tmp_path.joinpath("cache"))
+    for source in sources:
+        cache.get_or_load(source.as_posix(), lambda: [1, 2, 3])
+    cache.clear()
+    assert cache.nbytes == 0
+    assert list(tmp_path.joinpath("cache").iterdir()) == []
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola.equality import objects_are_equal
+from coola.utils.imports import is_torch_available
+
+from iden.cache.utils import pack_data, unpack_data
+
+if is_torch_available():
+    import torch
+
+torch_available = pytest.mark.skipif(not is_torch_available(), reason="Require torch")
+
+
+def pack_unpack(data: object) -> object:
+    chunks, size = pack_data(data)
+    buffer = bytearray(size)
+    for offset, chunk in chunks:
+        buffer[offset : offset + chunk.nbytes] = chunk
+    return unpack_data(memoryview(buffer))
+
+
+###############################
+#     Tests for pack_data     #
+###############################
+
+
+def test_pack_data_alignment() -> None:
+    chunks, size = pack_data({"key1": np.arange(3, dtype=np.int8), "key2": np.ones(5)})
+    assert [offset % 64 for offset, _ in chunks[2:]] == [0, 0]
+    assert size == chunks[-1][0] + chunks[-1][1].nbytes
+
+
+def test_pack_data_no_buffer() -> None:
+    chunks, size = pack_data([1, 2, 3])
+    assert len(chunks) == 2
+    assert size == sum(chunk.nbytes for _, chunk in chunks)
+
+
+#################################
+#     Tests for unpack_data     #
+#################################
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [1, 2, 3],
+        {"key": "abc", "value": None},
+        np.arange(10),
+        np.arange(12).reshape(3, 4).T,
+        {"key1": np.ones((2, 3)), "key2": [np.zeros(4, dtype=np.float16)]},
+    ],
+)
+def test_unpack_data(data: object) -> None:
+    assert objects_are_equal(pack_unpack(data), data)
+
+
+def test_unpack_data_zero_copy() -> None:
+    chunks, size = pack_data(np.zeros(4))
+    buffer = bytearray(size)
+    for offset, chunk in chunks:
+        buffer[offset : offset + chunk.nbytes] = chunk
+    array = unpack_data(memoryview(buffer))
+    array[0] = 42.0
+    assert unpack_data(memoryview(buffer))[0] == 42.0
+
+
+@torch_available
+@pytest.mark.parametrize(
+    "data",
+    (
+        [
+            torch.arange(6).view(2, 3),
+            torch.arange(6).view(2, 3).t(),
+            torch.ones(3, dtype=torch.bfloat16),
+            torch.ones(3, requires_grad=True),
+        ]
+        if is_torch_available()
+        else []
+    ),
+)
+def test_unpack_data_torch(data: torch.Tensor) -> None:
+    assert objects_are_equal(pack_unpack({"tensor": data}), {"tensor": data.detach()})
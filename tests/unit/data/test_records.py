@@ -0,0 +1,466 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from coola.equality import objects_are_equal
+from coola.testing.fixtures import numpy_available, torch_available
+from coola.utils.imports import is_numpy_available, is_torch_available
+
+from iden.data.records import (
+    concat_records,
+    copy_records,
+    empty_records,
+    get_nbytes,
+    get_num_records,
+    get_record,
+    promote_records,
+    slice_records,
+    take_records,
+)
+
+if is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    np = Mock()
+
+if is_torch_available():
+    import torch
+else:  # pragma: no cover
+    torch = Mock()
+
+
+#####################################
+#     Tests for get_num_records     #
+#####################################
+
+
+@pytest.mark.parametrize("data", [[1, 2, 3], (1, 2, 3), ["a", "b", "c"]])
+def test_get_num_records_sequence(data: list | tuple) -> None:
+    assert get_num_records(data) == 3
+
+
+@numpy_available
+def test_get_num_records_numpy() -> None:
+    assert get_num_records(np.ones((4, 3))) == 4
+
+
+@numpy_available
+def test_get_num_records_numpy_scalar() -> None:
+    assert get_num_records(np.array(1.0)) is None
+
+
+@torch_available
+def test_get_num_records_torch() -> None:
+    assert get_num_records(torch.ones(4, 3)) == 4
+
+
+@numpy_available
+def test_get_num_records_dict() -> None:
+    assert get_num_records({"key1": np.ones((4, 3)), "key2": [1, 2, 3, 4]}) == 4
+
+
+@numpy_available
+def test_get_num_records_dict_different_sizes() -> None:
+    assert get_num_records({"key1": np.ones((4, 3)), "key2": [1, 2, 3]}) is None
+
+
+def test_get_num_records_dict_empty() -> None:
+    assert get_num_records({}) is None
+
+
+@pytest.mark.parametrize("data", [1, 1.2, "abc", None])
+def test_get_num_records_invalid(data: object) -> None:
+    assert get_num_records(data) is None
+
+
+################################
+#     Tests for get_nbytes     #
+################################
+
+
+@numpy_available
+def test_get_nbytes_numpy() -> None:
+    assert get_nbytes(np.ones((4, 3), dtype=np.float32)) == 48
+
+
+@torch_available
+def test_get_nbytes_torch() -> None:
+    assert get_nbytes(torch.ones(4, 3, dtype=torch.float64)) == 96
+
+
+@numpy_available
+def test_get_nbytes_dict() -> None:
+    assert get_nbytes({"key1": np.ones((4, 3)), "key2": np.arange(4, dtype=np.int32)}) == 112
+
+
+@numpy_available
+def test_get_nbytes_dict_not_array() -> None:
+    assert get_nbytes({"key1": np.ones((4, 3)), "key2": [1, 2, 3, 4]}) is None
+
+
+@pytest.mark.parametrize("data", [[1, 2, 3], {}, "abc"])
+def test_get_nbytes_invalid(data: object) -> None:
+    assert get_nbytes(data) is None
+
+
+################################
+#     Tests for get_record     #
+################################
+
+
+def test_get_record_list() -> None:
+    assert get_record([1, 2, 3, 4], 1) == 2
+
+
+def test_get_record_tuple_negative() -> None:
+    assert get_record((1, 2, 3, 4), -1) == 4
+
+
+@numpy_available
+def test_get_record_numpy() -> None:
+    assert objects_are_equal(get_record(np.arange(6).reshape(3, 2), 1), np.array([2, 3]))
+
+
+@torch_available
+def test_get_record_torch() -> None:
+    assert objects_are_equal(get_record(torch.arange(6).view(3, 2), 1), torch.tensor([2, 3]))
+
+
+@numpy_available
+def test_get_record_dict() -> None:
+    assert objects_are_equal(
+        get_record({"key1": np.ones((4, 2)), "key2": ["a", "b", "c", "d"]}, 2),
+        {"key1": np.ones(2), "key2": "c"},
+    )
+
+
+def test_get_record_invalid() -> None:
+    with pytest.raises(TypeError, match=r"do not have a record structure"):
+        get_record(42, 0)
+
+
+###################################
+#     Tests for slice_records     #
+###################################
+
+
+def test_slice_records_list() -> None:
+    assert slice_records([1, 2, 3, 4], 1, 3) == [2, 3]
+
+
+def test_slice_records_tuple() -> None:
+    assert slice_records((1, 2, 3, 4), 2, 10) == (3, 4)
+
+
+@numpy_available
+def test_slice_records_numpy() -> None:
+    assert objects_are_equal(slice_records(np.arange(5), 1, 3), np.array([1, 2]))
+
+
+@torch_available
+def test_slice_records_torch() -> None:
+    assert objects_are_equal(slice_records(torch.arange(5), 1, 3), torch.tensor([1, 2]))
+
+
+@numpy_available
+def test_slice_records_dict() -> None:
+    assert objects_are_equal(
+        slice_records({"key1": np.arange(4), "key2": ["a", "b", "c", "d"]}, 1, 3),
+        {"key1": np.array([1, 2]), "key2": ["b", "c"]},
+    )
+
+
+def test_slice_records_invalid() -> None:
+    with pytest.raises(TypeError, match=r"do not have a record structure"):
+        slice_records(42, 0, 1)
+
+
+##################################
+#     Tests for take_records     #
+##################################
+
+
+def test_take_records_list() -> None:
+    assert take_records([1, 2, 3, 4], [3, 0, 2]) == [4, 1, 3]
+
+
+def test_take_records_tuple() -> None:
+    assert take_records((1, 2, 3, 4), [1, 1]) == (2, 2)
+
+
+def test_take_records_range() -> None:
+    assert take_records([1, 2, 3, 4], range(1, 3)) == [2, 3]
+
+
+@numpy_available
+def test_take_records_numpy() -> None:
+    assert objects_are_equal(
+        take_records(np.arange(10).reshape(5, 2), [4, 0]), np.array([[8, 9], [0, 1]])
+    )
+
+
+@numpy_available
+def test_take_records_numpy_empty() -> None:
+    assert objects_are_equal(take_records(np.arange(5), []), np.array([], dtype=np.int64))
+
+
+@torch_available
+def test_take_records_torch() -> None:
+    assert objects_are_equal(
+        take_records(torch.arange(10).view(5, 2), [4, 0]), torch.tensor([[8, 9], [0, 1]])
+    )
+
+
+@numpy_available
+def test_take_records_dict() -> None:
+    assert objects_are_equal(
+        take_records({"key1": np.arange(4), "key2": ["a", "b", "c", "d"]}, [3, 0]),
+        {"key1": np.array([3, 0]), "key2": ["d", "a"]},
+    )
+
+
+def test_take_records_invalid() -> None:
+    with pytest.raises(TypeError, match=r"do not have a record structure"):
+        take_records(42, [0])
+
+
+####################################
+#     Tests for concat_records     #
+####################################
+
+
+def test_concat_records_list() -> None:
+    assert concat_records([[1, 2], [3], [4, 5]]) == [1, 2, 3, 4, 5]
+
+
+def test_concat_records_tuple() -> None:
+    assert concat_records([(1, 2), (3,)]) == (1, 2, 3)
+
+
+def test_concat_records_single() -> None:
+    data = [1, 2]
+    assert concat_records([data]) is data
+
+
+@numpy_available
+def test_concat_records_numpy() -> None:
+    assert objects_are_equal(
+        concat_records([np.arange(2), np.arange(3)]), np.array([0, 1, 0, 1, 2])
+    )
+
+
+@torch_available
+def test_concat_records_torch() -> None:
+    assert objects_are_equal(
+        concat_records([torch.arange(2), torch.arange(3)]), torch.tensor([0, 1, 0, 1, 2])
+    )
+
+
+@numpy_available
+def test_concat_records_dict() -> None:
+    assert objects_are_equal(
+        concat_records(
+            [{"key1": np.arange(2), "key2": ["a"]}, {"key1": np.arange(1), "key2": ["b"]}]
+        ),
+        {"key1": np.array([0, 1, 0]), "key2": ["a", "b"]},
+    )
+
+
+def test_concat_records_empty() -> None:
+    with pytest.raises(ValueError, match=r"Cannot concatenate an empty sequence"):
+        concat_records([])
+
+
+def test_concat_records_invalid() -> None:
+    with pytest.raises(TypeError, match=r"do not have a record structure"):
+        concat_records([1, 2])
+
+
+###################################
+#     Tests for empty_records     #
+###################################
+
+
+@numpy_available
+def test_empty_records_numpy() -> None:
+    buffer = empty_records(np.ones((4, 3), dtype=np.float32), 8)
+    assert buffer.shape == (8, 3)
+    assert buffer.dtype == np.float32
+
+
+@torch_available
+def test_empty_records_torch() -> None:
+    buffer = empty_records(torch.ones(4, 3, dtype=torch.int32), 8)
+    assert buffer.shape == (8, 3)
+    assert buffer.dtype == torch.int32
+    assert buffer.device == torch.device("cpu")
+
+
+def test_empty_records_list() -> None:
+    assert empty_records([1, 2, 3], 2) == [None, None]
+
+
+@numpy_available
+def test_empty_records_dict() -> None:
+    buffer = empty_records({"key1": np.ones((4, 3)), "key2": [1, 2, 3, 4]}, 2)
+    assert buffer["key1"].shape == (2, 3)
+    assert buffer["key2"] == [None, None]
+
+
+def test_empty_records_invalid() -> None:
+    with pytest.raises(TypeError, match=r"Incorrect data type"):
+        empty_records(42, 2)
+
+
+def test_empty_records_tuple() -> None:
+    with pytest.raises(TypeError, match=r"a tuple cannot be filled in-place"):
+        empty_records((1, 2, 3), 2)
+
+
+##################################
+#     Tests for copy_records     #
+##################################
+
+
+@numpy_available
+def test_copy_records_numpy() -> None:
+    buffer = np.zeros(5, dtype=int)
+    copy_records(np.arange(10), 2, buffer, 1, 3)
+    assert objects_are_equal(buffer, np.array([0, 2, 3, 4, 0]))
+
+
+@torch_available
+def test_copy_records_torch() -> None:
+    buffer = torch.zeros(4, 2)
+    copy_records(torch.ones(3, 2), 0, buffer, 2, 2)
+    assert objects_are_equal(buffer, torch.tensor([[0.0, 0.0], [0.0, 0.0], [1.0, 1.0], [1.0, 1.0]]))
+
+
+def test_copy_records_list() -> None:
+    buffer = [None] * 4
+    copy_records([1, 2, 3], 1, buffer, 0, 2)
+    assert buffer == [2, 3, None, None]
+
+
+@numpy_available
+def test_copy_records_dict() -> None:
+    buffer = {"key1": np.zeros(3, dtype=int), "key2": [None] * 3}
+    copy_records({"key1": np.arange(5), "key2": ["a", "b", "c", "d", "e"]}, 3, buffer, 0, 2)
+    assert objects_are_equal(buffer, {"key1": np.array([3, 4, 0]), "key2": ["d", "e", None]})
+
+
+def test_copy_records_dict_different_keys() -> None:
+    with pytest.raises(ValueError, match=r"do not have the same keys"):
+        copy_records({"key1": [1, 2]}, 0, {"key2": [None, None]}, 0, 2)
+
+
+def test_copy_records_dict_not_mapping() -> None:
+    with pytest.raises(TypeError, match=r"The buffer is a dictionary"):
+        copy_records([1, 2], 0, {"key": [None, None]}, 0, 2)
+
+
+#####################################
+#     Tests for promote_records     #
+#####################################
+
+
+@numpy_available
+def test_promote_records_numpy_same_dtype() -> None:
+    buffer = np.zeros(3, dtype=np.int64)
+    assert promote_records(buffer, np.arange(5, dtype=np.int32), 2) is buffer
+
+
+@numpy_available
+def test_promote_records_numpy_promote_dtype() -> None:
+    buffer = np.array([3, 4, 0])
+    new = promote_records(buffer, np.array([0.5]), 2)
+    assert new.dtype == np.float64
+    assert new.shape == (3,)
+    assert objects_are_equal(new[:2], np.array([3.0, 4.0]))
+
+
+@numpy_available
+def test_promote_records_numpy_empty_buffer() -> None:
+    new = promote_records(np.zeros(3), np.arange(5), 0)
+    assert new.dtype == np.arange(5).dtype
+    assert new.shape == (3,)
+
+
+@numpy_available
+def test_promote_records_numpy_different_record_shape() -> None:
+    with pytest.raises(ValueError, match=r"do not have the same record shape"):
+        promote_records(np.zeros((3, 2)), np.ones((4, 3)), 1)
+
+
+@numpy_available
+def test_promote_records_numpy_not_array() -> None:
+    with pytest.raises(TypeError, match=r"Incorrect data type"):
+        promote_records(np.zeros(3), [1, 2], 1)
+
+
+@torch_available
+def test_promote_records_torch_same_dtype() -> None:
+    buffer = torch.zeros(3)
+    assert promote_records(buffer, torch.ones(2), 1) is buffer
+
+
+@torch_available
+def test_promote_records_torch_promote_dtype() -> None:
+    buffer = torch.tensor([3, 4, 0])
+    new = promote_records(buffer, torch.tensor([0.5]), 2)
+    assert new.dtype == torch.float32
+    assert objects_are_equal(new[:2], torch.tensor([3.0, 4.0]))
+
+
+@torch_available
+def test_promote_records_torch_different_device() -> None:
+    data = Mock(spec=torch.Tensor, shape=(2,), device=torch.device("meta"), dtype=torch.float32)
+    with pytest.raises(ValueError, match=r"are not on the same device"):
+        promote_records(torch.zeros(3), data, 1)
+
+
+@numpy_available
+@torch_available
+def test_promote_records_numpy_torch() -> None:
+    with pytest.raises(TypeError, match=r"Incorrect data type"):
+        promote_records(np.zeros(3), torch.zeros(2), 1)
+
+
+def test_promote_records_list() -> None:
+    buffer = [1, None]
+    assert promote_records(buffer, [2, 3], 1) is buffer
+
+
+def test_promote_records_list_tuple() -> None:
+    with pytest.raises(TypeError, match=r"The buffer is a list"):
+        promote_records([1, None], (2, 3), 1)
+
+
+@numpy_available
+def test_promote_records_dict() -> None:
+    buffer = {"key1": np.array([1, 0]), "key2": [None, None]}
+    new = promote_records(buffer, {"key1": np.array([0.5]), "key2": ["a"]}, 1)
+    assert new["key1"].dtype == np.float64
+    assert new["key2"] is buffer["key2"]
+
+
+@numpy_available
+def test_promote_records_dict_unchanged() -> None:
+    buffer = {"key1": np.array([1, 0]), "key2": [None, None]}
+    assert promote_records(buffer, {"key1": np.array([2]), "key2": ["a"]}, 1) is buffer
+
+
+def test_promote_records_dict_different_keys() -> None:
+    with pytest.raises(ValueError, match=r"do not have the same keys"):
+        promote_records({"key1": [None]}, {"key2": [1]}, 0)
+
+
+def test_promote_records_dict_not_mapping() -> None:
+    with pytest.raises(TypeError, match=r"The buffer is a dictionary"):
+        promote_records({"key": [None]}, [1], 0)
+
+
+def test_promote_records_invalid() -> None:
+    with pytest.raises(TypeError, match=r"Incorrect buffer type"):
+        promote_records(42, [1], 0)
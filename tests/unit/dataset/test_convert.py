@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+from coola.equality import objects_are_equal
+
+from iden.dataset import VanillaDataset, create_vanilla_dataset
+from iden.dataset.convert import convert_dataset, main
+from iden.shard import (
+    JsonShard,
+    PickleShard,
+    create_json_shard,
+    create_pickle_shard,
+    create_shard_dict,
+    create_shard_tuple,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def create_dataset(path: Path) -> str:
+    shards = create_shard_dict(
+        shards={
+            "train": create_shard_tuple(
+                [
+                    create_pickle_shard(
+                        list(range(i)), uri=path.joinpath(f"shards/train/uri{i:02d}").as_uri()
+                    )
+                    for i in range(1, 12)
+                ],
+                uri=path.joinpath("uri_train").as_uri(),
+            ),
+            "val": create_shard_tuple(
+                [create_pickle_shard([42], uri=path.joinpath("shards/val/uri").as_uri())],
+                uri=path.joinpath("uri_val").as_uri(),
+            ),
+        },
+        uri=path.joinpath("uri_shards").as_uri(),
+    )
+    assets = create_shard_dict(
+        shards={"stats": create_json_shard({"mean": 1.0}, uri=path.joinpath("stats").as_uri())},
+        uri=path.joinpath("uri_assets").as_uri(),
+    )
+    uri = path.joinpath("uri").as_uri()
+    create_vanilla_dataset(uri=uri, shards=shards, assets=assets)
+    return uri
+
+
+#####################################
+#     Tests for convert_dataset     #
+#####################################
+
+
+def test_convert_dataset(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    dataset = convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    assert isinstance(dataset, VanillaDataset)
+    assert dataset.get_uri() == tmp_path.joinpath("new/dataset").as_uri()
+    assert dataset.get_num_shards("train") == 11
+    assert dataset.get_num_shards("val") == 1
+    assert all(isinstance(shard, JsonShard) for shard in dataset.get_shards("train"))
+    assert dataset.get_shards("val")[0].get_data() == [42]
+
+
+def test_convert_dataset_order(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    dataset = convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    assert [shard.get_data() for shard in dataset.get_shards("train")] == [
+        list(range(i)) for i in range(1, 12)
+    ]
+    uris = [shard.get_uri() for shard in dataset.get_shards("train")]
+    assert uris == sorted(uris)
+
+
+def test_convert_dataset_assets(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    dataset = convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    assert dataset.has_asset("stats")
+    assert dataset.get_asset("stats").get_data() == {"mean": 1.0}
+
+
+def test_convert_dataset_load_from_uri(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    dataset = convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    assert VanillaDataset.from_uri(dataset.get_uri()).equal(dataset)
+
+
+def test_convert_dataset_num_workers(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    dataset = convert_dataset(uri, tmp_path.joinpath("new"), fmt="json", num_workers=2)
+    assert [shard.get_data() for shard in dataset.get_shards("train")] == [
+        list(range(i)) for i in range(1, 12)
+    ]
+
+
+def test_convert_dataset_resume(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    # the first shard was converted, and the second shard was interrupted
+    # after its data were saved
+    create_json_shard([0], uri=tmp_path.joinpath("new/splits/train/000000001").as_uri())
+    tmp_path.joinpath("new/splits/train/000000002.json").write_text("[")
+    dataset = convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    assert dataset.get_shards("train")[0].get_data() == [0]
+    assert dataset.get_shards("train")[1].get_data() == [0, 1]
+
+
+def test_convert_dataset_resume_finished(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    dataset = convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    assert convert_dataset(uri, tmp_path.joinpath("new"), fmt="json").equal(dataset)
+
+
+def test_convert_dataset_resume_split_uri_exists(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    # the conversion was interrupted after the URI file of a split was saved
+    tmp_path.joinpath("new/dataset").unlink()
+    tmp_path.joinpath("new/shards").unlink()
+    dataset = convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    assert VanillaDataset.from_uri(dataset.get_uri()).equal(dataset)
+    assert dataset.get_shards("val")[0].get_data() == [42]
+
+
+def test_convert_dataset_resume_false(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    with pytest.raises(FileExistsError, match=r"already exists"):
+        convert_dataset(uri, tmp_path.joinpath("new"), fmt="json", resume=False)
+
+
+def test_convert_dataset_throughput(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    with caplog.at_level(logging.INFO):
+        convert_dataset(uri, tmp_path.joinpath("new"), fmt="json")
+    assert "converted 12 shards in" in caplog.text
+    assert "shards/s" in caplog.text
+
+
+def test_convert_dataset_incorrect_format(tmp_path: Path) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    with pytest.raises(ValueError, match=r"Incorrect format: abc"):
+        convert_dataset(uri, tmp_path.joinpath("new"), fmt="abc")
+
+
+##########################
+#     Tests for main     #
+##########################
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    uri = create_dataset(tmp_path.joinpath("source"))
+    assert main([uri, tmp_path.joinpath("new").as_posix(), "--format", "pickle"]) == 0
+    new_uri = tmp_path.joinpath("new/dataset").as_uri()
+    assert capsys.readouterr().out.strip() == new_uri
+    dataset = VanillaDataset.from_uri(new_uri)
+    assert isinstance(dataset.get_shards("val")[0], PickleShard)
+    assert objects_are_equal(dataset.get_shards("val")[0].get_data(), [42])
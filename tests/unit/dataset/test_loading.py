@@ -5,6 +5,7 @@ from coola.utils.path import sanitize_path
 
 from iden.dataset import VanillaDataset, load_from_uri
 from iden.io import JsonSaver
+from iden.observer import MetricsRegistry, register_load_observer, unregister_load_observer
 from iden.shard import (
     BaseShard,
     ShardDict,
@@ -96,6 +97,18 @@ def test_load_from_uri_file(uri: str, dataset: VanillaDataset) -> None:
     assert load_from_uri(uri).equal(dataset)
 
 
+def test_load_from_uri_load_observer(uri: str) -> None:
+    metrics = MetricsRegistry()
+    register_load_observer(metrics)
+    try:
+        load_from_uri(uri)
+    finally:
+        unregister_load_observer(metrics)
+    counters = metrics.get_counters()
+    assert counters["uri/dataset"]["num_loads"] == 1
+    assert counters["uri/shard"]["num_loads"] > 0
+
+
 def test_load_from_uri_missing() -> None:
     with pytest.raises(FileNotFoundError, match=r"uri file does not exist:"):
         load_from_uri("file:///data/my_uri")
@@ -1,26 +1,38 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import pytest
 from coola.equality import objects_are_equal
 from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import ASSETS, LOADER, SHARDS
+from iden.cache import FileChangeCachePolicy, SharedMemoryCache, TTLCachePolicy
+from iden.constants import ASSETS, LOADER, NBYTES, NUM_RECORDS, SHARDS
 from iden.dataset import VanillaDataset
 from iden.dataset.exceptions import AssetNotFoundError, SplitNotFoundError
-from iden.dataset.vanilla import check_shards, create_vanilla_dataset
-from iden.io import JsonSaver
+from iden.dataset.vanilla import check_shards, create_vanilla_dataset, extend_split
+from iden.io import JsonSaver, load_json, save_json
+from iden.observer import (
+    MetricsRegistry,
+    register_load_observer,
+    unregister_load_observer,
+)
 from iden.shard import (
     BaseShard,
+    CompactShardSequence,
+    CompactShardTuple,
     InMemoryShard,
+    JsonShard,
     ShardDict,
     ShardTuple,
+    create_compact_shard_tuple,
     create_json_shard,
     create_shard_dict,
     create_shard_tuple,
 )
+from iden.shard.exceptions import ShardExistsError
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -135,6 +147,42 @@ def test_vanilla_dataset_equal_true(
     )
 
 
+def test_vanilla_dataset_equal_fingerprint(
+    uri: str, shards: ShardDict[ShardTuple[BaseShard]], assets: ShardDict
+) -> None:
+    with patch("coola.equality.objects_are_equal") as equal:
+        assert VanillaDataset(uri=uri, shards=shards, assets=assets).equal(
+            VanillaDataset(uri=uri, shards=shards, assets=assets)
+        )
+    equal.assert_not_called()
+
+
+def test_vanilla_dataset_get_fingerprint(
+    uri: str, shards: ShardDict[ShardTuple[BaseShard]], assets: ShardDict
+) -> None:
+    fingerprint = VanillaDataset(uri=uri, shards=shards, assets=assets).get_fingerprint()
+    assert len(fingerprint) == 64
+    assert fingerprint == VanillaDataset(uri=uri, shards=shards, assets=assets).get_fingerprint()
+    assert (
+        fingerprint
+        != VanillaDataset(uri=uri + "123", shards=shards, assets=assets).get_fingerprint()
+    )
+
+
+def test_vanilla_dataset_get_fingerprint_in_memory(tmp_path: Path) -> None:
+    assert create_dataset(tmp_path, [1, 2, 3]).get_fingerprint() is None
+
+
+def test_vanilla_dataset_get_fingerprint_append_shards(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    fingerprint = dataset.get_fingerprint()
+    dataset.append_shards(
+        "train", [create_json_shard([3], uri=tmp_path.joinpath("train/uri2").as_uri())]
+    )
+    assert dataset.get_fingerprint() != fingerprint
+    assert dataset.get_fingerprint() == VanillaDataset.from_uri(dataset.get_uri()).get_fingerprint()
+
+
 def test_vanilla_dataset_equal_false_different_uri(
     uri: str, shards: ShardDict[ShardTuple[BaseShard]], assets: ShardDict
 ) -> None:
@@ -195,6 +243,195 @@ def test_vanilla_dataset_equal_false_equal_nan(tmp_path: Path) -> None:
     )
 
 
+def test_vanilla_dataset_append_shards(tmp_path: Path) -> None:
+    dataset = create_vanilla_dataset(
+        shards=create_shard_dict(
+            {
+                "train": create_shard_tuple(
+                    shards=[
+                        create_json_shard([1, 2], uri=tmp_path.joinpath("train/uri2").as_uri())
+                    ],
+                    uri=tmp_path.joinpath("uri_train").as_uri(),
+                ),
+                "val": create_shard_tuple(shards=[], uri=tmp_path.joinpath("uri_val").as_uri()),
+            },
+            uri=tmp_path.joinpath("uri_shards").as_uri(),
+        ),
+        assets=create_shard_dict(shards={}, uri=tmp_path.joinpath("uri_assets").as_uri()),
+        uri=tmp_path.joinpath("uri").as_uri(),
+    )
+    shard1 = create_json_shard([3], uri=tmp_path.joinpath("train/uri1").as_uri())
+    shard3 = create_json_shard([4, 5], uri=tmp_path.joinpath("train/uri3").as_uri())
+    dataset.append_shards("train", [shard3, shard1])
+
+    assert dataset.get_num_shards("train") == 3
+    assert dataset.get_num_shards("val") == 0
+    assert [shard.get_uri() for shard in dataset.get_shards("train")] == [
+        tmp_path.joinpath("train/uri1").as_uri(),
+        tmp_path.joinpath("train/uri2").as_uri(),
+        tmp_path.joinpath("train/uri3").as_uri(),
+    ]
+    assert VanillaDataset.from_uri(dataset.get_uri()).equal(dataset)
+
+
+def test_vanilla_dataset_append_shards_missing(dataset: VanillaDataset) -> None:
+    with pytest.raises(SplitNotFoundError, match=r"split 'missing' does not exist"):
+        dataset.append_shards("missing", [])
+
+
+def create_small_dataset(path: Path) -> VanillaDataset:
+    return create_vanilla_dataset(
+        shards=create_shard_dict(
+            {
+                "train": create_shard_tuple(
+                    shards=[create_json_shard([1, 2], uri=path.joinpath("train/uri1").as_uri())],
+                    uri=path.joinpath("uri_train").as_uri(),
+                ),
+            },
+            uri=path.joinpath("uri_shards").as_uri(),
+        ),
+        assets=create_shard_dict(
+            shards={"stats": create_json_shard({"mean": 42}, uri=path.joinpath("stats").as_uri())},
+            uri=path.joinpath("uri_assets").as_uri(),
+        ),
+        uri=path.joinpath("uri").as_uri(),
+    )
+
+
+def test_vanilla_dataset_add_load_observer(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    metrics = MetricsRegistry()
+    dataset.add_load_observer(metrics)
+    dataset.get_shards("train")[0].get_data()
+    dataset.get_asset("stats").get_data()
+    assert metrics.get_counters()["shard/json"]["num_loads"] == 2
+
+
+def test_vanilla_dataset_add_load_observer_global(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    metrics = MetricsRegistry()
+    dataset.add_load_observer(metrics)
+    register_load_observer(metrics)
+    try:
+        dataset.get_shards("train")[0].get_data()
+    finally:
+        unregister_load_observer(metrics)
+    assert metrics.get_counters()["shard/json"]["num_loads"] == 1
+
+
+def test_vanilla_dataset_add_load_observer_append_shards(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    metrics = MetricsRegistry()
+    dataset.add_load_observer(metrics)
+    dataset.append_shards(
+        "train", [create_json_shard([3], uri=tmp_path.joinpath("train/uri2").as_uri())]
+    )
+    for shard in dataset.get_shards("train"):
+        shard.get_data()
+    assert metrics.get_counters()["shard/json"]["num_loads"] == 2
+
+
+def test_vanilla_dataset_add_load_observer_compact(tmp_path: Path) -> None:
+    dataset = create_vanilla_dataset(
+        shards=create_shard_dict(
+            {
+                "train": create_compact_shard_tuple(
+                    shards=[
+                        create_json_shard([1, 2], uri=tmp_path.joinpath("train/uri1").as_uri())
+                    ],
+                    uri=tmp_path.joinpath("uri_train").as_uri(),
+                ),
+            },
+            uri=tmp_path.joinpath("uri_shards").as_uri(),
+        ),
+        assets=create_shard_dict(shards={}, uri=tmp_path.joinpath("uri_assets").as_uri()),
+        uri=tmp_path.joinpath("uri").as_uri(),
+    )
+    metrics = MetricsRegistry()
+    dataset.add_load_observer(metrics)
+    dataset.get_shards("train")[0].get_data()
+    assert metrics.get_counters()["shard/json"]["num_loads"] == 1
+
+
+def test_vanilla_dataset_remove_load_observer(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    metrics = MetricsRegistry()
+    dataset.add_load_observer(metrics)
+    dataset.remove_load_observer(metrics)
+    dataset.get_shards("train")[0].get_data()
+    assert metrics.get_counters() == {}
+
+
+def test_vanilla_dataset_set_data_cache(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    cache = SharedMemoryCache()
+    dataset.set_data_cache(cache)
+    try:
+        assert dataset.get_shards("train")[0].get_data(cache=True) == [1, 2]
+        assert dataset.get_asset("stats").get_data(cache=True) == {"mean": 42}
+        assert tmp_path.joinpath("train/uri1.json").as_posix() in cache
+        assert tmp_path.joinpath("stats.json").as_posix() in cache
+    finally:
+        cache.clear()
+
+
+def test_vanilla_dataset_set_data_cache_append_shards(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    cache = SharedMemoryCache()
+    dataset.set_data_cache(cache)
+    dataset.append_shards(
+        "train", [create_json_shard([3], uri=tmp_path.joinpath("train/uri2").as_uri())]
+    )
+    try:
+        assert dataset.get_shards("train")[1].get_data(cache=True) == [3]
+        assert tmp_path.joinpath("train/uri2.json").as_posix() in cache
+    finally:
+        cache.clear()
+
+
+def test_vanilla_dataset_set_data_cache_none(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    cache = SharedMemoryCache()
+    dataset.set_data_cache(cache)
+    dataset.set_data_cache(None)
+    assert dataset.get_shards("train")[0].get_data(cache=True) == [1, 2]
+    assert tmp_path.joinpath("train/uri1.json").as_posix() not in cache
+
+
+def test_vanilla_dataset_set_cache_policy(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    dataset.set_cache_policy(FileChangeCachePolicy())
+    shard = dataset.get_shards("train")[0]
+    assert shard.get_data(cache=True) == [1, 2]
+    assert dataset.get_asset("stats").get_data(cache=True) == {"mean": 42}
+    save_json([1, 2, 3], shard.path, exist_ok=True)
+    assert shard.get_data(cache=True) == [1, 2, 3]
+    assert dataset.get_asset("stats").is_cached()
+
+
+def test_vanilla_dataset_set_cache_policy_append_shards(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    dataset.set_cache_policy(TTLCachePolicy(ttl=10.0))
+    dataset.get_shards("train")[0].get_data(cache=True)
+    dataset.append_shards(
+        "train", [create_json_shard([3], uri=tmp_path.joinpath("train/uri2").as_uri())]
+    )
+    shards = dataset.get_shards("train")
+    assert shards[0].is_cached()
+    with patch("iden.cache.policy.time.monotonic", return_value=0.0):
+        assert shards[1].get_data(cache=True) == [3]
+    assert not shards[1].is_cached()
+
+
+def test_vanilla_dataset_set_cache_policy_none(tmp_path: Path) -> None:
+    dataset = create_small_dataset(tmp_path)
+    dataset.set_cache_policy(TTLCachePolicy(ttl=10.0))
+    dataset.set_cache_policy(None)
+    with patch("iden.cache.policy.time.monotonic", return_value=0.0):
+        dataset.get_shards("train")[0].get_data(cache=True)
+    assert dataset.get_shards("train")[0].is_cached()
+
+
 def test_vanilla_dataset_get_asset(dataset: VanillaDataset) -> None:
     assert objects_are_equal(dataset.get_asset("stats").get_data(), {"mean": 42})
 
@@ -227,6 +464,41 @@ def test_vanilla_dataset_get_shards_missing(dataset: VanillaDataset) -> None:
         dataset.get_shards("missing")
 
 
+def test_vanilla_dataset_get_shards_rank(
+    dataset: VanillaDataset, shards: ShardDict[ShardTuple[BaseShard]]
+) -> None:
+    train = shards["train"].get_data()
+    assert objects_are_equal(
+        dataset.get_shards("train", rank=0, world_size=2), (train[0], train[2])
+    )
+    assert objects_are_equal(dataset.get_shards("train", rank=1, world_size=2), (train[1],))
+
+
+def test_vanilla_dataset_get_shards_rank_world_size_1(
+    dataset: VanillaDataset, shards: ShardDict[ShardTuple[BaseShard]]
+) -> None:
+    assert objects_are_equal(
+        dataset.get_shards("train", rank=0, world_size=1), shards["train"].get_data()
+    )
+
+
+def test_vanilla_dataset_get_shards_rank_more_ranks_than_shards(dataset: VanillaDataset) -> None:
+    assert dataset.get_shards("test", rank=1, world_size=2) == ()
+
+
+@pytest.mark.parametrize(("rank", "world_size"), [(0, None), (None, 2)])
+def test_vanilla_dataset_get_shards_rank_incomplete(
+    dataset: VanillaDataset, rank: int | None, world_size: int | None
+) -> None:
+    with pytest.raises(ValueError, match=r"rank and world_size must be both set"):
+        dataset.get_shards("train", rank=rank, world_size=world_size)
+
+
+def test_vanilla_dataset_get_shards_rank_incorrect(dataset: VanillaDataset) -> None:
+    with pytest.raises(ValueError, match=r"rank must be in \[0, 2\)"):
+        dataset.get_shards("train", rank=2, world_size=2)
+
+
 def test_vanilla_dataset_get_num_shards(dataset: VanillaDataset) -> None:
     assert dataset.get_num_shards("train") == 3
     assert dataset.get_num_shards("val") == 0
@@ -238,6 +510,127 @@ def test_vanilla_dataset_get_num_shards_missing(dataset: VanillaDataset) -> None
         dataset.get_num_shards("missing")
 
 
+def test_vanilla_dataset_get_num_samples(dataset: VanillaDataset) -> None:
+    assert dataset.get_num_samples("train") == 8
+
+
+def test_vanilla_dataset_get_num_samples_empty(dataset: VanillaDataset) -> None:
+    assert dataset.get_num_samples("val") == 0
+
+
+def test_vanilla_dataset_get_num_samples_missing(dataset: VanillaDataset) -> None:
+    with pytest.raises(SplitNotFoundError, match=r"split 'missing' does not exist"):
+        dataset.get_num_samples("missing")
+
+
+def test_vanilla_dataset_get_sample(dataset: VanillaDataset) -> None:
+    assert [dataset.get_sample("train", i) for i in range(8)] == [1, 2, 3, 4, 5, 6, 7, 8]
+
+
+def test_vanilla_dataset_get_sample_negative(dataset: VanillaDataset) -> None:
+    assert dataset.get_sample("test", -2) == 14
+
+
+def test_vanilla_dataset_get_sample_out_of_range(dataset: VanillaDataset) -> None:
+    with pytest.raises(IndexError, match=r"record index out of range"):
+        dataset.get_sample("train", 8)
+
+
+def test_vanilla_dataset_get_sample_missing(dataset: VanillaDataset) -> None:
+    with pytest.raises(SplitNotFoundError, match=r"split 'missing' does not exist"):
+        dataset.get_sample("missing", 0)
+
+
+def test_vanilla_dataset_get_slice(dataset: VanillaDataset) -> None:
+    assert dataset.get_slice("train", 2, 7) == [3, 4, 5, 6, 7]
+
+
+def test_vanilla_dataset_get_slice_missing(dataset: VanillaDataset) -> None:
+    with pytest.raises(SplitNotFoundError, match=r"split 'missing' does not exist"):
+        dataset.get_slice("missing", 0, 1)
+
+
+def test_vanilla_dataset_get_sample_after_append_shards(tmp_path: Path) -> None:
+    dataset = create_split_dataset(tmp_path)
+    assert dataset.get_num_samples("train") == 2
+    dataset.append_shards(
+        "train", [create_json_shard([3, 4, 5], uri=tmp_path.joinpath("train/uri3").as_uri())]
+    )
+    assert dataset.get_num_samples("train") == 5
+    assert dataset.get_sample("train", 4) == 5
+
+
+def test_vanilla_dataset_get_split_stats(dataset: VanillaDataset) -> None:
+    assert dataset.get_split_stats("train") == {"num_shards": 3, NUM_RECORDS: 8, NBYTES: 24}
+
+
+def test_vanilla_dataset_get_split_stats_empty(dataset: VanillaDataset) -> None:
+    assert dataset.get_split_stats("val") == {"num_shards": 0, NUM_RECORDS: 0, NBYTES: 0}
+
+
+def test_vanilla_dataset_get_split_stats_missing_metadata(tmp_path: Path) -> None:
+    dataset = create_split_dataset(tmp_path)
+    shard = create_json_shard([3, 4, 5], uri=tmp_path.joinpath("train/uri3").as_uri())
+    dataset.append_shards("train", [JsonShard(uri=shard.get_uri(), path=shard.path)])
+    assert dataset.get_split_stats("train") == {"num_shards": 2, NUM_RECORDS: None, NBYTES: None}
+
+
+def test_vanilla_dataset_get_split_stats_split_missing(dataset: VanillaDataset) -> None:
+    with pytest.raises(SplitNotFoundError, match=r"split 'missing' does not exist"):
+        dataset.get_split_stats("missing")
+
+
+def create_compact_dataset(path: Path) -> VanillaDataset:
+    return create_vanilla_dataset(
+        shards=create_shard_dict(
+            {
+                "train": create_compact_shard_tuple(
+                    shards=[
+                        create_json_shard([1, 2], uri=path.joinpath("train/uri1").as_uri()),
+                        create_json_shard([3, 4, 5], uri=path.joinpath("train/uri2").as_uri()),
+                    ],
+                    uri=path.joinpath("uri_train").as_uri(),
+                ),
+            },
+            uri=path.joinpath("uri_shards").as_uri(),
+        ),
+        assets=create_shard_dict(shards={}, uri=path.joinpath("uri_assets").as_uri()),
+        uri=path.joinpath("uri").as_uri(),
+    )
+
+
+def test_vanilla_dataset_get_shards_compact(tmp_path: Path) -> None:
+    dataset = create_compact_dataset(tmp_path)
+    shards = dataset.get_shards("train")
+    assert isinstance(shards, CompactShardSequence)
+    assert len(shards) == 2
+    assert shards[1].get_data() == [3, 4, 5]
+
+
+def test_vanilla_dataset_get_shards_compact_rank(tmp_path: Path) -> None:
+    dataset = create_compact_dataset(tmp_path)
+    assert [shard.get_data() for shard in dataset.get_shards("train", rank=0, world_size=2)] == [
+        [3, 4, 5]
+    ]
+    assert [shard.get_data() for shard in dataset.get_shards("train", rank=1, world_size=2)] == [
+        [1, 2]
+    ]
+
+
+def test_vanilla_dataset_get_num_samples_compact(tmp_path: Path) -> None:
+    dataset = create_compact_dataset(tmp_path)
+    with patch.object(CompactShardTuple, "_materialize") as materialize:
+        assert dataset.get_num_samples("train") == 5
+    materialize.assert_not_called()
+
+
+def test_vanilla_dataset_get_split_stats_compact(tmp_path: Path) -> None:
+    dataset = create_compact_dataset(tmp_path)
+    with patch.object(CompactShardTuple, "_materialize") as materialize:
+        assert dataset.get_split_stats("train") == {"num_shards": 2, NUM_RECORDS: 5, NBYTES: 15}
+    materialize.assert_not_called()
+
+
 def test_vanilla_dataset_get_splits(dataset: VanillaDataset) -> None:
     assert dataset.get_splits() == {"train", "val", "test"}
 
@@ -359,3 +752,57 @@ def test_check_shards_incorrect_type(tmp_path: Path) -> None:
 
     with pytest.raises(TypeError, match=r"Incorrect shard type:"):
         check_shards(shards)
+
+
+##################################
+#     Tests for extend_split     #
+##################################
+
+
+def create_split_dataset(path: Path) -> VanillaDataset:
+    return create_vanilla_dataset(
+        shards=create_shard_dict(
+            {
+                "train": create_shard_tuple(
+                    shards=[create_json_shard([1, 2], uri=path.joinpath("train/uri2").as_uri())],
+                    uri=path.joinpath("uri_train").as_uri(),
+                ),
+            },
+            uri=path.joinpath("uri_shards").as_uri(),
+        ),
+        assets=create_shard_dict(shards={}, uri=path.joinpath("uri_assets").as_uri()),
+        uri=path.joinpath("uri").as_uri(),
+    )
+
+
+def test_extend_split(tmp_path: Path) -> None:
+    dataset = create_split_dataset(tmp_path)
+    extend_split(
+        dataset.get_uri(),
+        split="train",
+        shards=[
+            create_json_shard([3], uri=tmp_path.joinpath("train/uri3").as_uri()),
+            create_json_shard([4, 5], uri=tmp_path.joinpath("train/uri1").as_uri()),
+        ],
+    )
+    assert load_json(tmp_path.joinpath("uri_train"))[SHARDS] == [
+        tmp_path.joinpath("train/uri1").as_uri(),
+        tmp_path.joinpath("train/uri2").as_uri(),
+        tmp_path.joinpath("train/uri3").as_uri(),
+    ]
+    assert VanillaDataset.from_uri(dataset.get_uri()).get_num_shards("train") == 3
+
+
+def test_extend_split_missing(tmp_path: Path) -> None:
+    dataset = create_split_dataset(tmp_path)
+    with pytest.raises(SplitNotFoundError, match=r"split 'missing' does not exist"):
+        extend_split(dataset.get_uri(), split="missing", shards=[])
+
+
+def test_extend_split_duplicate(tmp_path: Path) -> None:
+    dataset = create_split_dataset(tmp_path)
+    with pytest.raises(ShardExistsError, match=r"already exists"):
+        extend_split(dataset.get_uri(), split="train", shards=dataset.get_shards("train"))
+    assert load_json(tmp_path.joinpath("uri_train"))[SHARDS] == [
+        tmp_path.joinpath("train/uri2").as_uri()
+    ]
@@ -84,6 +84,20 @@ def test_numpy_loader_load(path_numpy: Path) -> None:
     assert objects_are_equal(data, {"key1": np.ones((2, 3)), "key2": np.arange(5)})
 
 
+@safetensors_available
+@numpy_available
+def test_numpy_loader_load_keys(path_numpy: Path) -> None:
+    data = NumpyLoader().load_keys(path_numpy, ["key2"])
+    assert objects_are_equal(data, {"key2": np.arange(5)})
+
+
+@safetensors_available
+@numpy_available
+def test_numpy_loader_load_keys_missing(path_numpy: Path) -> None:
+    with pytest.raises(KeyError, match=r"Keys \['missing'\] do not exist"):
+        NumpyLoader().load_keys(path_numpy, ["missing"])
+
+
 def test_numpy_loader_no_safetensors() -> None:
     with (
         patch("iden.utils.imports.safetensors.is_safetensors_available", lambda: False),
@@ -152,6 +166,20 @@ def test_torch_loader_save(path_torch: Path) -> None:
     assert objects_are_equal(data, {"key1": torch.ones(2, 3), "key2": torch.arange(5)})
 
 
+@safetensors_available
+@torch_available
+def test_torch_loader_load_keys(path_torch: Path) -> None:
+    data = TorchLoader().load_keys(path_torch, ["key1"])
+    assert objects_are_equal(data, {"key1": torch.ones(2, 3)})
+
+
+@safetensors_available
+@torch_available
+def test_torch_loader_load_keys_missing(path_torch: Path) -> None:
+    with pytest.raises(KeyError, match=r"Keys \['missing'\] do not exist"):
+        TorchLoader().load_keys(path_torch, ["missing"])
+
+
 def test_torch_loader_no_safetensors() -> None:
     with (
         patch("iden.utils.imports.safetensors.is_safetensors_available", lambda: False),
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import pytest
+from coola.equality import objects_are_equal
+from coola.testing.fixtures import numpy_available, torch_available
+from coola.utils.imports import is_numpy_available, is_torch_available
+
+from iden.io.safetensors import NumpySaver, SafetensorsReader, TorchSaver
+from iden.storage import MemoryStorage, get_storage
+from iden.storage import registry as storage_registry
+from iden.testing import safetensors_available
+from iden.utils.imports import is_safetensors_available
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+if is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    np = Mock()
+
+if is_torch_available():
+    import torch
+else:  # pragma: no cover
+    torch = Mock()
+
+if is_safetensors_available() and is_numpy_available():
+    from safetensors import numpy as sn
+else:  # pragma: no cover
+    sn = Mock()
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.nbytes = 0
+
+    def read_range(self, location: Path | str, offset: int, length: int) -> bytes:
+        data = super().read_range(location, offset, length)
+        self.nbytes += len(data)
+        return data
+
+
+@pytest.fixture(scope="module")
+def path_numpy(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("tmp").joinpath("data.safetensors")
+    NumpySaver().save(
+        {"key1": np.ones((2, 3)), "key2": np.arange(5), "key3": np.zeros((0, 4))}, path
+    )
+    return path
+
+
+@pytest.fixture(scope="module")
+def path_torch(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("tmp").joinpath("data.safetensors")
+    TorchSaver().save(
+        {
+            "key1": torch.ones(2, 3),
+            "key2": torch.arange(5),
+            "key3": torch.ones(2, dtype=torch.bfloat16),
+        },
+        path,
+    )
+    return path
+
+
+def write_header(path: Path, header: bytes) -> None:
+    path.write_bytes(len(header).to_bytes(8, byteorder="little") + header)
+
+
+#######################################
+#     Tests for SafetensorsReader     #
+#######################################
+
+
+def test_safetensors_reader_repr(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    assert repr(SafetensorsReader(path)) == (
+        f"SafetensorsReader(path={path.as_posix()}, max_gap=0)"
+    )
+
+
+def test_safetensors_reader_path(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    assert SafetensorsReader(path.as_uri()).path == path
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_get_header(path_numpy: Path) -> None:
+    assert SafetensorsReader(path_numpy).get_header() == {
+        "key1": {"dtype": "F64", "shape": [2, 3], "data_offsets": [40, 88]},
+        "key2": {"dtype": "I64", "shape": [5], "data_offsets": [0, 40]},
+        "key3": {"dtype": "F64", "shape": [0, 4], "data_offsets": [88, 88]},
+    }
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_get_metadata(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    path.write_bytes(sn.save({"key": np.arange(3)}, metadata={"a": "b"}))
+    reader = SafetensorsReader(path)
+    assert reader.get_metadata() == {"a": "b"}
+    assert reader.keys() == ["key"]
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_get_metadata_empty(path_numpy: Path) -> None:
+    assert SafetensorsReader(path_numpy).get_metadata() == {}
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_keys(path_numpy: Path) -> None:
+    assert SafetensorsReader(path_numpy).keys() == ["key1", "key2", "key3"]
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_read_numpy(path_numpy: Path) -> None:
+    assert objects_are_equal(
+        SafetensorsReader(path_numpy).read_numpy(),
+        {"key1": np.ones((2, 3)), "key2": np.arange(5), "key3": np.zeros((0, 4))},
+    )
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_read_numpy_keys(path_numpy: Path) -> None:
+    assert objects_are_equal(
+        SafetensorsReader(path_numpy).read_numpy(["key2", "key1"]),
+        {"key2": np.arange(5), "key1": np.ones((2, 3))},
+    )
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_read_numpy_writable(path_numpy: Path) -> None:
+    array = SafetensorsReader(path_numpy).read_numpy(["key2"])["key2"]
+    array[0] = 42
+    assert array.tolist() == [42, 1, 2, 3, 4]
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_read_numpy_missing_key(path_numpy: Path) -> None:
+    with pytest.raises(KeyError, match=r"Keys \['missing'\] do not exist"):
+        SafetensorsReader(path_numpy).read_numpy(["key1", "missing"])
+
+
+@safetensors_available
+@torch_available
+def test_safetensors_reader_read_numpy_unsupported_dtype(path_torch: Path) -> None:
+    with pytest.raises(ValueError, match=r"dtype \(BF16\) that is not supported by numpy"):
+        SafetensorsReader(path_torch).read_numpy(["key3"])
+
+
+@safetensors_available
+@torch_available
+def test_safetensors_reader_read_torch(path_torch: Path) -> None:
+    assert objects_are_equal(
+        SafetensorsReader(path_torch).read_torch(),
+        {
+            "key1": torch.ones(2, 3),
+            "key2": torch.arange(5),
+            "key3": torch.ones(2, dtype=torch.bfloat16),
+        },
+    )
+
+
+@safetensors_available
+@torch_available
+def test_safetensors_reader_read_torch_keys(path_torch: Path) -> None:
+    assert objects_are_equal(
+        SafetensorsReader(path_torch).read_torch(["key2"]), {"key2": torch.arange(5)}
+    )
+
+
+@safetensors_available
+@torch_available
+def test_safetensors_reader_read_torch_empty(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    TorchSaver().save({"key": torch.zeros(0, 3)}, path)
+    assert objects_are_equal(SafetensorsReader(path).read_torch(), {"key": torch.zeros(0, 3)})
+
+
+@safetensors_available
+@torch_available
+def test_safetensors_reader_read_torch_missing_key(path_torch: Path) -> None:
+    with pytest.raises(KeyError, match=r"Keys \['missing'\] do not exist"):
+        SafetensorsReader(path_torch).read_torch(["missing"])
+
+
+@torch_available
+def test_safetensors_reader_read_torch_unsupported_dtype(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    write_header(
+        path, json.dumps({"key": {"dtype": "C64", "shape": [0], "data_offsets": [0, 0]}}).encode()
+    )
+    with pytest.raises(ValueError, match=r"dtype \(C64\) that is not supported by torch"):
+        SafetensorsReader(path).read_torch()
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_memory(path_numpy: Path) -> None:
+    location = "memory://test-safetensors-reader/data.safetensors"
+    get_storage(location).write(location, path_numpy.read_bytes())
+    assert objects_are_equal(
+        SafetensorsReader(location).read_numpy(["key2"]), {"key2": np.arange(5)}
+    )
+
+
+@safetensors_available
+@numpy_available
+def test_safetensors_reader_read_only_requested_bytes() -> None:
+    storage = CountingStorage()
+    location = "memory://bucket/data.safetensors"
+    with patch.dict(storage_registry._STORAGES, {"memory": storage}):
+        _check_read_only_requested_bytes(storage, location)
+
+
+def _check_read_only_requested_bytes(storage: CountingStorage, location: str) -> None:
+    NumpySaver().save({f"key{i}": np.ones(1000, dtype=np.float32) for i in range(10)}, location)
+    reader = SafetensorsReader(location)
+    header_nbytes = 8 + int.from_bytes(storage.read_range(location, 0, 8), byteorder="little")
+    storage.nbytes = 0
+    assert objects_are_equal(reader.read_numpy(["key3"]), {"key3": np.ones(1000, dtype=np.float32)})
+    assert storage.nbytes == header_nbytes + 4000
+    storage.nbytes = 0
+    reader.read_numpy(["key5"])
+    assert storage.nbytes == 4000
+
+
+def test_safetensors_reader_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        SafetensorsReader(tmp_path.joinpath("data.safetensors")).keys()
+
+
+def test_safetensors_reader_missing_header(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    path.write_bytes(b"abc")
+    with pytest.raises(ValueError, match="missing header"):
+        SafetensorsReader(path).keys()
+
+
+def test_safetensors_reader_truncated_header(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    path.write_bytes((100).to_bytes(8, byteorder="little") + b"{}")
+    with pytest.raises(ValueError, match="truncated header"):
+        SafetensorsReader(path).keys()
+
+
+def test_safetensors_reader_invalid_json(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    write_header(path, b"{abc")
+    with pytest.raises(ValueError, match="Invalid safetensors file"):
+        SafetensorsReader(path).keys()
+
+
+def test_safetensors_reader_incorrect_header(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    write_header(path, b"[1, 2]")
+    with pytest.raises(ValueError, match="incorrect header"):
+        SafetensorsReader(path).keys()
+
+
+@numpy_available
+def test_safetensors_reader_truncated_tensor(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.safetensors")
+    write_header(
+        path, json.dumps({"key": {"dtype": "F32", "shape": [4], "data_offsets": [0, 16]}}).encode()
+    )
+    with pytest.raises(ValueError, match="tensor 'key' is truncated"):
+        SafetensorsReader(path).read_numpy()
+
+
+def test_safetensors_reader_no_numpy(tmp_path: Path) -> None:
+    with (
+        patch("coola.utils.imports.numpy.is_numpy_available", lambda: False),
+        pytest.raises(RuntimeError, match=r"'numpy' package is required but not installed."),
+    ):
+        SafetensorsReader(tmp_path.joinpath("data.safetensors")).read_numpy()
+
+
+def test_safetensors_reader_no_torch(tmp_path: Path) -> None:
+    with (
+        patch("coola.utils.imports.torch.is_torch_available", lambda: False),
+        pytest.raises(RuntimeError, match=r"'torch' package is required but not installed."),
+    ):
+        SafetensorsReader(tmp_path.joinpath("data.safetensors")).read_torch()
@@ -4,11 +4,12 @@ from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
 import pytest
+from coola.equality import objects_are_equal
 from coola.testing.fixtures import numpy_available, torch_available
 from coola.utils.imports import is_numpy_available, is_torch_available
 
 from iden.io import save_text
-from iden.io.safetensors import NumpySaver, TorchSaver
+from iden.io.safetensors import NumpyLoader, NumpySaver, TorchLoader, TorchSaver
 from iden.testing import safetensors_available
 
 if TYPE_CHECKING:
@@ -102,6 +103,16 @@ def test_numpy_saver_save_file_exist_ok_dir(tmp_path: Path) -> None:
         saver.save({"key1": np.ones((2, 3)), "key2": np.arange(5)}, path)
 
 
+@safetensors_available
+@numpy_available
+def test_numpy_saver_save_memory() -> None:
+    location = "memory://test-numpy-safetensors-saver/data.safetensors"
+    NumpySaver().save({"key1": np.ones((2, 3)), "key2": np.arange(5)}, location)
+    assert objects_are_equal(
+        NumpyLoader().load(location), {"key1": np.ones((2, 3)), "key2": np.arange(5)}
+    )
+
+
 def test_numpy_saver_no_safetensors() -> None:
     with (
         patch("iden.utils.imports.safetensors.is_safetensors_available", lambda: False),
@@ -196,6 +207,16 @@ def test_torch_saver_save_file_exist_ok_dir(tmp_path: Path) -> None:
         saver.save({"key1": torch.ones(2, 3), "key2": torch.arange(5)}, path)
 
 
+@safetensors_available
+@torch_available
+def test_torch_saver_save_memory() -> None:
+    location = "memory://test-torch-safetensors-saver/data.safetensors"
+    TorchSaver().save({"key1": torch.ones(2, 3), "key2": torch.arange(5)}, location)
+    assert objects_are_equal(
+        TorchLoader().load(location), {"key1": torch.ones(2, 3), "key2": torch.arange(5)}
+    )
+
+
 def test_torch_saver_no_safetensors() -> None:
     with (
         patch("iden.utils.imports.safetensors.is_safetensors_available", lambda: False),
@@ -109,6 +109,26 @@ def test_json_saver_save_file_exist_ok_dir(tmp_path: Path) -> None:
         saver.save({"key1": [1, 2, 3], "key2": "abc"}, path)
 
 
+def test_json_saver_save_memory() -> None:
+    location = "memory://test-json-saver/data.json"
+    JsonSaver().save({"key1": [1, 2, 3], "key2": "abc"}, location)
+    assert load_json(location) == {"key1": [1, 2, 3], "key2": "abc"}
+
+
+def test_json_saver_save_memory_file_exist() -> None:
+    location = "memory://test-json-saver/exist.json"
+    save_json({"key1": [1, 2, 3], "key2": "abc"}, location)
+    with pytest.raises(FileExistsError, match=r"path .* already exists."):
+        JsonSaver().save({"key1": [1, 2, 3], "key2": "abc"}, location)
+
+
+def test_json_saver_save_memory_file_exist_ok() -> None:
+    location = "memory://test-json-saver/exist_ok.json"
+    save_json({"key1": [1, 2, 3], "key2": "abc"}, location)
+    JsonSaver().save({"key1": [3, 2, 1], "key2": "meow"}, location, exist_ok=True)
+    assert load_json(location) == {"key1": [3, 2, 1], "key2": "meow"}
+
+
 ###############################
 #     Tests for load_json     #
 ###############################
@@ -9,11 +9,13 @@ from coola.testing.fixtures import torch_available
 from iden.io import (
     LoaderRegistry,
     TextLoader,
+    YamlLoader,
     get_default_loader_registry,
     load,
     register_loaders,
     save_json,
     save_text,
+    save_yaml,
 )
 from iden.testing import joblib_available, yaml_available
 
@@ -135,6 +137,15 @@ def test_get_default_loader_registry_yaml() -> None:
     assert registry.has_loader("yml")
 
 
+@yaml_available
+def test_get_default_loader_registry_yaml_loader(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.yaml")
+    save_yaml({"key": [1, 2, 3]}, path)
+    registry = get_default_loader_registry()
+    assert isinstance(registry.find_loader("yaml"), YamlLoader)
+    assert load(path) == {"key": [1, 2, 3]}
+
+
 def test_get_default_loader_registry_no_yaml() -> None:
     with patch("iden.io.loading.is_yaml_available", lambda: False):
         registry = get_default_loader_registry()
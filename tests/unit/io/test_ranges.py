@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from iden.io import coalesce_ranges, read_ranges
+from iden.storage import MemoryStorage
+from iden.storage import registry as storage_registry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = []
+
+    def read_range(self, location: Path | str, offset: int, length: int) -> bytes:
+        self.calls.append((offset, length))
+        return super().read_range(location, offset, length)
+
+
+@pytest.fixture
+def storage() -> Iterator[CountingStorage]:
+    storage = CountingStorage()
+    with patch.dict(storage_registry._STORAGES, {"memory": storage}):
+        yield storage
+
+
+#####################################
+#     Tests for coalesce_ranges     #
+#####################################
+
+
+def test_coalesce_ranges_empty() -> None:
+    assert coalesce_ranges([]) == []
+
+
+def test_coalesce_ranges_adjacent() -> None:
+    assert coalesce_ranges([(0, 10), (10, 5), (15, 5)]) == [(0, 20)]
+
+
+def test_coalesce_ranges_unsorted() -> None:
+    assert coalesce_ranges([(20, 5), (0, 10), (10, 5)]) == [(0, 15), (20, 5)]
+
+
+def test_coalesce_ranges_overlap() -> None:
+    assert coalesce_ranges([(0, 10), (5, 3), (8, 10)]) == [(0, 18)]
+
+
+def test_coalesce_ranges_max_gap() -> None:
+    assert coalesce_ranges([(0, 10), (14, 5), (30, 5)], max_gap=4) == [(0, 19), (30, 5)]
+
+
+def test_coalesce_ranges_ignore_empty() -> None:
+    assert coalesce_ranges([(0, 0), (5, 2), (10, -1)]) == [(5, 2)]
+
+
+#################################
+#     Tests for read_ranges     #
+#################################
+
+
+def test_read_ranges(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    path.write_bytes(b"abcdefghij")
+    assert [bytes(buf) for buf in read_ranges(path, [(6, 2), (0, 3), (3, 2)])] == [
+        b"gh",
+        b"abc",
+        b"de",
+    ]
+
+
+def test_read_ranges_uri(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    path.write_bytes(b"abcdefghij")
+    assert [bytes(buf) for buf in read_ranges(path.as_uri(), [(2, 3)])] == [b"cde"]
+
+
+def test_read_ranges_empty(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    path.write_bytes(b"abcdefghij")
+    assert read_ranges(path, []) == []
+
+
+def test_read_ranges_empty_range(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    path.write_bytes(b"abcdefghij")
+    assert [bytes(buf) for buf in read_ranges(path, [(4, 0), (0, 2)])] == [b"", b"ab"]
+
+
+def test_read_ranges_after_end(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    path.write_bytes(b"abcdefghij")
+    assert [bytes(buf) for buf in read_ranges(path, [(8, 5), (20, 2)])] == [b"ij", b""]
+
+
+def test_read_ranges_writable(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.bin")
+    path.write_bytes(b"abcdefghij")
+    assert not read_ranges(path, [(0, 2)])[0].readonly
+
+
+def test_read_ranges_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        read_ranges(tmp_path.joinpath("data.bin"), [(0, 2)])
+
+
+def test_read_ranges_coalesce_requests(storage: CountingStorage) -> None:
+    storage.write("memory://bucket/data.bin", b"abcdefghij")
+    storage.calls.clear()
+    buffers = read_ranges("memory://bucket/data.bin", [(0, 2), (2, 2), (8, 2)])
+    assert [bytes(buf) for buf in buffers] == [b"ab", b"cd", b"ij"]
+    assert storage.calls == [(0, 4), (8, 2)]
+
+
+def test_read_ranges_max_gap(storage: CountingStorage) -> None:
+    storage.write("memory://bucket/data.bin", b"abcdefghij")
+    storage.calls.clear()
+    buffers = read_ranges("memory://bucket/data.bin", [(0, 2), (2, 2), (8, 2)], max_gap=4)
+    assert [bytes(buf) for buf in buffers] == [b"ab", b"cd", b"ij"]
+    assert storage.calls == [(0, 10)]
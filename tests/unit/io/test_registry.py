@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 from coola.equality import objects_are_equal
+from objectory import OBJECT_TARGET
 
 from iden.io import (
     JsonLoader,
@@ -12,6 +13,7 @@ from iden.io import (
     save_json,
     save_text,
 )
+from iden.observer import MetricsRegistry, register_load_observer, unregister_load_observer
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -70,6 +72,26 @@ def test_loader_registry_load_txt(tmp_path: Path) -> None:
     assert LoaderRegistry({"json": JsonLoader(), "txt": TextLoader()}).load(path) == "hello"
 
 
+def test_loader_registry_load_observer(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.json")
+    save_json([1, 2, 3], path)
+    metrics = MetricsRegistry()
+    register_load_observer(metrics)
+    try:
+        LoaderRegistry({"json": JsonLoader()}).load(path)
+    finally:
+        unregister_load_observer(metrics)
+    assert metrics.get_counters() == {
+        "file/json": {
+            "num_loads": 1,
+            "num_errors": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "nbytes": path.stat().st_size,
+        }
+    }
+
+
 def test_loader_registry_register() -> None:
     loader = LoaderRegistry()
     text_loader = TextLoader()
@@ -125,6 +147,22 @@ def test_loader_registry_find_loader_txt() -> None:
     assert isinstance(LoaderRegistry({"txt": TextLoader()}).find_loader("txt"), TextLoader)
 
 
+def test_loader_registry_find_loader_config() -> None:
+    registry = LoaderRegistry({"txt": {OBJECT_TARGET: "iden.io.TextLoader"}})
+    loader = registry.find_loader("txt")
+    assert isinstance(loader, TextLoader)
+    assert registry.find_loader("txt") is loader
+
+
+def test_loader_registry_load_config(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    save_text("hello", path)
+    registry = LoaderRegistry()
+    registry.register("txt", {OBJECT_TARGET: "iden.io.TextLoader"})
+    assert registry.has_loader("txt")
+    assert registry.load(path) == "hello"
+
+
 def test_loader_registry_find_loader_incorrect_extension() -> None:
     with pytest.raises(ValueError, match=r"Incorrect extension:"):
         LoaderRegistry().find_loader("txt")
@@ -204,6 +204,15 @@ def test_torch_saver_save_file_exist_ok_dir(tmp_path: Path) -> None:
         saver.save({"key1": [1, 2, 3], "key2": "abc", "key3": torch.arange(5)}, path)
 
 
+@torch_available
+def test_torch_saver_save_memory() -> None:
+    location = "memory://test-torch-saver/data.pt"
+    TorchSaver().save({"key1": [1, 2, 3], "key2": "abc", "key3": torch.arange(5)}, location)
+    assert objects_are_equal(
+        load_torch(location), {"key1": [1, 2, 3], "key2": "abc", "key3": torch.arange(5)}
+    )
+
+
 def test_torch_saver_no_torch() -> None:
     with (
         patch("coola.utils.imports.torch.is_torch_available", lambda: False),
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from iden.observer import BaseLoadObserver, LoadEvent
+
+###############################
+#     Tests for LoadEvent     #
+###############################
+
+
+def test_load_event_defaults() -> None:
+    event = LoadEvent(kind="shard")
+    assert event.kind == "shard"
+    assert event.uri is None
+    assert event.path is None
+    assert event.fmt is None
+    assert event.nbytes is None
+    assert event.cached is None
+    assert event.duration is None
+    assert event.error is None
+
+
+def test_load_event_eq() -> None:
+    assert LoadEvent(kind="file", fmt="json", nbytes=9) == LoadEvent(
+        kind="file", fmt="json", nbytes=9
+    )
+
+
+######################################
+#     Tests for BaseLoadObserver     #
+######################################
+
+
+def test_base_load_observer_on_load_start() -> None:
+    assert BaseLoadObserver().on_load_start(LoadEvent(kind="shard")) is None
+
+
+def test_base_load_observer_on_load_end() -> None:
+    assert BaseLoadObserver().on_load_end(LoadEvent(kind="shard")) is None
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import math
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from iden.observer import LatencyHistogram, LoadEvent, MetricsRegistry
+from iden.shard import create_json_shard
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+######################################
+#     Tests for LatencyHistogram     #
+######################################
+
+
+def test_latency_histogram_repr() -> None:
+    assert repr(LatencyHistogram(buckets=[0.1, 1.0])) == (
+        "LatencyHistogram(count=0, total=0, buckets=(0.1, 1.0))"
+    )
+
+
+@pytest.mark.parametrize("buckets", [[], [1.0, 0.1]])
+def test_latency_histogram_incorrect_buckets(buckets: list[float]) -> None:
+    with pytest.raises(ValueError, match="buckets must be a non-empty sequence"):
+        LatencyHistogram(buckets=buckets)
+
+
+def test_latency_histogram_observe() -> None:
+    histogram = LatencyHistogram(buckets=[0.1, 1.0])
+    for value in [0.05, 0.1, 0.3, 2.0]:
+        histogram.observe(value)
+    assert histogram.count == 4
+    assert histogram.total == pytest.approx(2.45)
+    assert histogram.get_counts() == {0.1: 2, 1.0: 1, math.inf: 1}
+
+
+def test_latency_histogram_quantile() -> None:
+    histogram = LatencyHistogram(buckets=[0.1, 1.0])
+    for value in [0.05, 0.2, 0.3, 2.0]:
+        histogram.observe(value)
+    assert histogram.quantile(0.0) == 0.1
+    assert histogram.quantile(0.25) == 0.1
+    assert histogram.quantile(0.5) == 1.0
+    assert histogram.quantile(1.0) == math.inf
+
+
+def test_latency_histogram_quantile_empty() -> None:
+    assert math.isnan(LatencyHistogram().quantile(0.5))
+
+
+#####################################
+#     Tests for MetricsRegistry     #
+#####################################
+
+
+def test_metrics_registry_repr() -> None:
+    assert repr(MetricsRegistry()) == "MetricsRegistry(num_keys=0)"
+
+
+def test_metrics_registry_on_load_end() -> None:
+    metrics = MetricsRegistry()
+    metrics.on_load_end(LoadEvent(kind="shard", fmt="json", nbytes=10, cached=False, duration=0.1))
+    metrics.on_load_end(LoadEvent(kind="shard", fmt="json", nbytes=10, cached=True, duration=0.0))
+    metrics.on_load_end(LoadEvent(kind="file", fmt="pt", nbytes=5, duration=0.2))
+    metrics.on_load_end(
+        LoadEvent(kind="file", fmt="pt", nbytes=5, duration=0.2, error=RuntimeError())
+    )
+    assert metrics.get_counters() == {
+        "shard/json": {
+            "num_loads": 2,
+            "num_errors": 0,
+            "cache_hits": 1,
+            "cache_misses": 1,
+            "nbytes": 10,
+        },
+        "file/pt": {
+            "num_loads": 2,
+            "num_errors": 1,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "nbytes": 10,
+        },
+    }
+
+
+def test_metrics_registry_on_load_start() -> None:
+    metrics = MetricsRegistry()
+    metrics.on_load_start(LoadEvent(kind="shard", fmt="json"))
+    assert metrics.get_counters() == {}
+
+
+def test_metrics_registry_get_histograms() -> None:
+    metrics = MetricsRegistry(buckets=[0.1, 1.0])
+    metrics.on_load_end(LoadEvent(kind="shard", fmt="json", duration=0.05))
+    metrics.on_load_end(LoadEvent(kind="shard", fmt="json", duration=0.5))
+    histograms = metrics.get_histograms()
+    assert list(histograms) == ["shard/json"]
+    assert histograms["shard/json"].get_counts() == {0.1: 1, 1.0: 1, math.inf: 0}
+
+
+def test_metrics_registry_get_slowest() -> None:
+    metrics = MetricsRegistry(num_slowest=2)
+    for i, duration in enumerate([0.3, 0.1, 0.5, 0.2]):
+        metrics.on_load_end(LoadEvent(kind="shard", uri=f"uri{i}", duration=duration))
+    metrics.on_load_end(LoadEvent(kind="shard", uri="cached", cached=True, duration=1.0))
+    assert [event.uri for event in metrics.get_slowest()] == ["uri2", "uri0"]
+
+
+def test_metrics_registry_get_slowest_disabled() -> None:
+    metrics = MetricsRegistry(num_slowest=0)
+    metrics.on_load_end(LoadEvent(kind="shard", duration=0.1))
+    assert metrics.get_slowest() == []
+
+
+def test_metrics_registry_get_summary() -> None:
+    metrics = MetricsRegistry(buckets=[0.1, 1.0])
+    metrics.on_load_end(LoadEvent(kind="file", fmt="json", nbytes=9, duration=0.05))
+    metrics.on_load_end(LoadEvent(kind="file", fmt="json", nbytes=9, duration=0.15))
+    summary = metrics.get_summary()["file/json"]
+    assert summary["num_loads"] == 2
+    assert summary["nbytes"] == 18
+    assert summary["total_time"] == pytest.approx(0.2)
+    assert summary["mean_time"] == pytest.approx(0.1)
+    assert summary["p50"] == 0.1
+    assert summary["p99"] == 1.0
+
+
+def test_metrics_registry_pickle() -> None:
+    metrics = MetricsRegistry()
+    metrics.on_load_end(LoadEvent(kind="file", fmt="json", duration=0.05, nbytes=10))
+    other = pickle.loads(pickle.dumps(metrics))  # noqa: S301
+    assert other.get_counters() == metrics.get_counters()
+    other.on_load_end(LoadEvent(kind="file", fmt="json", duration=0.05))
+    assert other.get_counters()["file/json"]["num_loads"] == 2
+    assert metrics.get_counters()["file/json"]["num_loads"] == 1
+
+
+def test_metrics_registry_pickle_shard(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    metrics = MetricsRegistry()
+    shard.add_load_observer(metrics)
+    shard.get_data()
+    other = pickle.loads(pickle.dumps(shard))  # noqa: S301
+    assert other.get_data() == [1, 2, 3]
+
+
+def test_metrics_registry_reset() -> None:
+    metrics = MetricsRegistry()
+    metrics.on_load_end(LoadEvent(kind="file", fmt="json", duration=0.05))
+    metrics.reset()
+    assert metrics.get_counters() == {}
+    assert metrics.get_histograms() == {}
+    assert metrics.get_slowest() == []
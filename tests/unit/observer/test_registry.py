@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+from iden.observer import (
+    BaseLoadObserver,
+    LoadEvent,
+    get_load_observers,
+    has_load_observers,
+    observe_load,
+    register_load_observer,
+    unregister_load_observer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def observer() -> Generator[BaseLoadObserver, None, None]:
+    observer = Mock(spec=BaseLoadObserver)
+    yield observer
+    unregister_load_observer(observer)
+
+
+############################################
+#     Tests for register_load_observer     #
+############################################
+
+
+def test_register_load_observer(observer: BaseLoadObserver) -> None:
+    register_load_observer(observer)
+    assert get_load_observers() == (observer,)
+    assert has_load_observers()
+
+
+def test_register_load_observer_duplicate(observer: BaseLoadObserver) -> None:
+    register_load_observer(observer)
+    register_load_observer(observer)
+    assert get_load_observers() == (observer,)
+
+
+def test_unregister_load_observer(observer: BaseLoadObserver) -> None:
+    register_load_observer(observer)
+    unregister_load_observer(observer)
+    assert get_load_observers() == ()
+    assert not has_load_observers()
+
+
+def test_unregister_load_observer_missing(observer: BaseLoadObserver) -> None:
+    unregister_load_observer(observer)
+    assert get_load_observers() == ()
+
+
+##################################
+#     Tests for observe_load     #
+##################################
+
+
+def test_observe_load_no_observer() -> None:
+    with observe_load(LoadEvent(kind="file")):
+        pass
+
+
+def test_observe_load_global_observer(observer: Mock) -> None:
+    register_load_observer(observer)
+    event = LoadEvent(kind="file", fmt="json")
+    with observe_load(event):
+        pass
+    observer.on_load_start.assert_called_once_with(event)
+    end_event = observer.on_load_end.call_args.args[0]
+    assert end_event.kind == "file"
+    assert end_event.fmt == "json"
+    assert end_event.duration >= 0.0
+    assert end_event.error is None
+
+
+def test_observe_load_extra_observers() -> None:
+    observer = Mock(spec=BaseLoadObserver)
+    with observe_load(LoadEvent(kind="file"), observers=[observer]):
+        pass
+    assert observer.on_load_start.call_count == 1
+    assert observer.on_load_end.call_count == 1
+
+
+def test_observe_load_duplicate_observers(observer: Mock) -> None:
+    register_load_observer(observer)
+    with observe_load(LoadEvent(kind="file"), observers=[observer, observer]):
+        pass
+    assert observer.on_load_start.call_count == 1
+    assert observer.on_load_end.call_count == 1
+
+
+def test_observe_load_error() -> None:
+    observer = Mock(spec=BaseLoadObserver)
+    error = RuntimeError("load failed")
+    with (
+        pytest.raises(RuntimeError, match="load failed"),
+        observe_load(LoadEvent(kind="file"), observers=[observer]),
+    ):
+        raise error
+    assert observer.on_load_end.call_args.args[0].error is error
+
+
+def test_observe_load_observer_error(caplog: pytest.LogCaptureFixture) -> None:
+    failing = Mock(spec=BaseLoadObserver, on_load_start=Mock(side_effect=RuntimeError("bug")))
+    observer = Mock(spec=BaseLoadObserver)
+    with (
+        caplog.at_level(logging.ERROR),
+        observe_load(LoadEvent(kind="file"), observers=[failing, observer]),
+    ):
+        pass
+    assert observer.on_load_start.call_count == 1
+    assert observer.on_load_end.call_count == 1
+    assert "on_load_start" in caplog.text
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from coola.equality import objects_are_equal
 
+from iden.constants import NBYTES, NUM_RECORDS
 from iden.data.generator import DataGenerator
 from iden.shard import JsonShard
 from iden.shard.generator import JsonShardGenerator
@@ -159,3 +160,30 @@ def test_json_shard_generator_generate(tmp_path: Path) -> None:
         )
     )
     assert objects_are_equal(shard.get_data(), [1, 2, 3])
+
+
+def test_json_shard_generator_generate_from_data(tmp_path: Path) -> None:
+    generator = JsonShardGenerator(
+        data=DataGenerator([1, 2, 3]),
+        path_uri=tmp_path.joinpath("uri"),
+        path_shard=tmp_path.joinpath("shard"),
+    )
+    shard = generator.generate_from_data([4, 5], "000001")
+    assert shard.equal(
+        JsonShard(
+            uri=tmp_path.joinpath("uri/000001").as_uri(),
+            path=tmp_path.joinpath("shard/000001.json"),
+        )
+    )
+    assert objects_are_equal(shard.get_data(), [4, 5])
+
+
+def test_json_shard_generator_generate_metadata(tmp_path: Path) -> None:
+    generator = JsonShardGenerator(
+        data=DataGenerator([1, 2, 3]),
+        path_uri=tmp_path.joinpath("uri"),
+        path_shard=tmp_path.joinpath("shard"),
+    )
+    generator.generate("000001")
+    shard = JsonShard.from_uri(tmp_path.joinpath("uri/000001").as_uri())
+    assert shard.get_metadata() == {NUM_RECORDS: 3, NBYTES: 9}
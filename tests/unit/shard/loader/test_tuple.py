@@ -7,12 +7,14 @@ from coola.equality import objects_are_equal
 
 from iden.shard import (
     BaseShard,
+    CompactShardTuple,
     JsonShard,
     ShardTuple,
+    create_compact_shard_tuple,
     create_json_shard,
     create_shard_tuple,
 )
-from iden.shard.loader import ShardTupleLoader
+from iden.shard.loader import CompactShardTupleLoader, ShardTupleLoader
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -83,3 +85,37 @@ def test_shard_tuple_loader_load(uri: str, shards: Sequence[BaseShard], path_sha
             JsonShard.from_uri(uri=path_shard.joinpath("uri3").as_uri()),
         ),
     )
+
+
+#############################################
+#     Tests for CompactShardTupleLoader     #
+#############################################
+
+
+def test_compact_shard_tuple_loader_repr() -> None:
+    assert repr(CompactShardTupleLoader()).startswith("CompactShardTupleLoader(")
+
+
+def test_compact_shard_tuple_loader_equal_true() -> None:
+    assert CompactShardTupleLoader().equal(CompactShardTupleLoader())
+
+
+def test_compact_shard_tuple_loader_equal_false_different_type() -> None:
+    assert not CompactShardTupleLoader().equal(ShardTupleLoader())
+
+
+def test_compact_shard_tuple_loader_load(
+    tmp_path: Path, shards: Sequence[BaseShard], path_shard: Path
+) -> None:
+    uri = tmp_path.joinpath("uri").as_uri()
+    create_compact_shard_tuple(shards=shards, uri=uri)
+    shard = CompactShardTupleLoader().load(uri)
+    assert shard.equal(CompactShardTuple(uri=uri, shards=shards))
+    assert objects_are_equal(
+        shard.get_data(),
+        (
+            JsonShard.from_uri(uri=path_shard.joinpath("uri1").as_uri()),
+            JsonShard.from_uri(uri=path_shard.joinpath("uri2").as_uri()),
+            JsonShard.from_uri(uri=path_shard.joinpath("uri3").as_uri()),
+        ),
+    )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from iden.shard import BaseShard, create_json_shard
+from iden.shard.benchmark import LoadingStats, benchmark_loading
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def shards(tmp_path: Path) -> list[BaseShard]:
+    return [
+        create_json_shard(list(range(i)), uri=tmp_path.joinpath(f"uri{i}").as_uri())
+        for i in range(5)
+    ]
+
+
+##################################
+#     Tests for LoadingStats     #
+##################################
+
+
+def test_loading_stats_bytes_per_second() -> None:
+    assert LoadingStats(num_shards=10, nbytes=2000, duration=2.0).bytes_per_second == 1000.0
+
+
+def test_loading_stats_bytes_per_second_zero_duration() -> None:
+    assert LoadingStats(num_shards=10, nbytes=2000, duration=0.0).bytes_per_second == 0.0
+
+
+def test_loading_stats_shards_per_second() -> None:
+    assert LoadingStats(num_shards=10, nbytes=2000, duration=2.0).shards_per_second == 5.0
+
+
+def test_loading_stats_shards_per_second_zero_duration() -> None:
+    assert LoadingStats(num_shards=10, nbytes=2000, duration=0.0).shards_per_second == 0.0
+
+
+#######################################
+#     Tests for benchmark_loading     #
+#######################################
+
+
+@pytest.mark.parametrize("num_prefetch", [0, 1, 3])
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_benchmark_loading(shards: list[BaseShard], num_prefetch: int, num_workers: int) -> None:
+    stats = benchmark_loading(shards, num_prefetch=num_prefetch, num_workers=num_workers)
+    assert stats.num_shards == 5
+    assert stats.nbytes == sum(shard.path.stat().st_size for shard in shards)
+    assert stats.duration >= 0.0
+
+
+def test_benchmark_loading_no_cache(shards: list[BaseShard]) -> None:
+    benchmark_loading(shards, num_prefetch=2)
+    assert not any(shard.is_cached() for shard in shards)
+
+
+def test_benchmark_loading_empty() -> None:
+    assert benchmark_loading([]).num_shards == 0
+
+
+def test_benchmark_loading_incorrect_num_prefetch(shards: list[BaseShard]) -> None:
+    with pytest.raises(ValueError, match=r"num_prefetch must be non-negative"):
+        benchmark_loading(shards, num_prefetch=-1)
+
+
+def test_benchmark_loading_incorrect_num_workers(shards: list[BaseShard]) -> None:
+    with pytest.raises(ValueError, match=r"num_workers must be positive"):
+        benchmark_loading(shards, num_workers=0)
@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+import gc
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from coola.equality import objects_are_equal
+from objectory import OBJECT_TARGET
+
+from iden.cache import SharedMemoryCache, TTLCachePolicy
+from iden.constants import LOADER, NBYTES, NUM_RECORDS, SHARDS
+from iden.io import load_json
+from iden.observer import MetricsRegistry
+from iden.shard import (
+    CompactShardSequence,
+    CompactShardTuple,
+    InMemoryShard,
+    JsonShard,
+    ShardTuple,
+    create_compact_shard_tuple,
+    create_json_shard,
+    create_pickle_shard,
+    create_shard_tuple,
+    extend_shard_tuple,
+    load_from_uri,
+)
+from iden.shard.fingerprint import compute_fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from iden.shard import BaseShard
+
+
+@pytest.fixture(scope="module")
+def path_shard(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("shards")
+
+
+@pytest.fixture(scope="module")
+def shards(path_shard: Path) -> tuple[BaseShard, ...]:
+    return (
+        create_json_shard([1, 2, 3], uri=path_shard.joinpath("uri1").as_uri()),
+        create_json_shard([4, 5, 6, 7], uri=path_shard.joinpath("uri2").as_uri()),
+        create_json_shard([8], uri=path_shard.joinpath("uri3").as_uri()),
+    )
+
+
+@pytest.fixture(scope="module")
+def uri(tmp_path_factory: pytest.TempPathFactory, shards: Sequence[BaseShard]) -> str:
+    uri_ = tmp_path_factory.mktemp("tmp").joinpath("uri").as_uri()
+    create_compact_shard_tuple(shards=shards, uri=uri_)
+    return uri_
+
+
+#######################################
+#     Tests for CompactShardTuple     #
+#######################################
+
+
+def test_compact_shard_tuple_len(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert len(CompactShardTuple(uri=uri, shards=shards)) == 3
+
+
+def test_compact_shard_tuple_len_empty(uri: str) -> None:
+    assert len(CompactShardTuple(uri=uri, shards=[])) == 0
+
+
+def test_compact_shard_tuple_repr(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert repr(CompactShardTuple(uri=uri, shards=shards)).startswith("CompactShardTuple(")
+
+
+def test_compact_shard_tuple_str(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert str(CompactShardTuple(uri=uri, shards=shards)).startswith("CompactShardTuple(")
+
+
+def test_compact_shard_tuple_is_shard_tuple(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert isinstance(CompactShardTuple(uri=uri, shards=shards), ShardTuple)
+
+
+def test_compact_shard_tuple_incorrect_shard(uri: str) -> None:
+    with pytest.raises(TypeError, match=r"CompactShardTuple only supports FileShard"):
+        CompactShardTuple(uri=uri, shards=[InMemoryShard([1, 2, 3])])
+
+
+def test_compact_shard_tuple_generator(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert len(CompactShardTuple(uri=uri, shards=(shard for shard in shards))) == 3
+
+
+def test_compact_shard_tuple_getitem(uri: str, shards: Sequence[BaseShard]) -> None:
+    shard = CompactShardTuple(uri=uri, shards=shards)
+    assert objects_are_equal(shard[0], shards[0])
+    assert objects_are_equal(shard[1], shards[1])
+    assert objects_are_equal(shard[2], shards[2])
+
+
+def test_compact_shard_tuple_getitem_negative(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert objects_are_equal(CompactShardTuple(uri=uri, shards=shards)[-1], shards[2])
+
+
+@pytest.mark.parametrize("index", [3, -4])
+def test_compact_shard_tuple_getitem_out_of_range(
+    uri: str, shards: Sequence[BaseShard], index: int
+) -> None:
+    shard = CompactShardTuple(uri=uri, shards=shards)
+    with pytest.raises(IndexError, match=r"is out of range"):
+        shard[index]
+
+
+def test_compact_shard_tuple_getitem_type(uri: str, shards: Sequence[BaseShard]) -> None:
+    shard = CompactShardTuple(uri=uri, shards=shards)[0]
+    assert isinstance(shard, JsonShard)
+    assert shard.path == shards[0].path
+    assert shard.get_metadata() == shards[0].get_metadata()
+    assert shard.get_data() == [1, 2, 3]
+
+
+def test_compact_shard_tuple_getitem_same_object(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    shard = tuple_shard[0]
+    assert tuple_shard[0] is shard
+
+
+def test_compact_shard_tuple_getitem_threads(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: tuple_shard[1], range(32)))
+    assert all(shard is results[0] for shard in results)
+
+
+def test_compact_shard_tuple_getitem_released(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    tuple_shard[0].get_data(cache=True)
+    gc.collect()
+    assert not tuple_shard.is_cached()
+
+
+def test_compact_shard_tuple_shared_loader(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    assert tuple_shard[0].loader is tuple_shard[2].loader
+    assert len(tuple_shard._formats) == 1
+
+
+def test_compact_shard_tuple_multiple_formats(tmp_path: Path) -> None:
+    shards = [
+        create_json_shard([1, 2], uri=tmp_path.joinpath("uri1").as_uri()),
+        create_pickle_shard([3, 4], uri=tmp_path.joinpath("uri2").as_uri()),
+        create_json_shard([5], uri=tmp_path.joinpath("uri3").as_uri()),
+    ]
+    tuple_shard = CompactShardTuple(uri=tmp_path.joinpath("uri").as_uri(), shards=shards)
+    assert objects_are_equal(tuple_shard.get_data(), tuple(shards))
+    assert [shard.get_data() for shard in tuple_shard.get_data()] == [[1, 2], [3, 4], [5]]
+    assert len(tuple_shard._formats) == 2
+
+
+def test_compact_shard_tuple_memory() -> None:
+    shard = create_json_shard([1, 2, 3], uri="memory://test-compact-shard-tuple/uri1")
+    tuple_shard = CompactShardTuple(uri="memory://test-compact-shard-tuple/uri", shards=[shard])
+    assert tuple_shard[0].path == shard.path
+    assert tuple_shard[0].get_data() == [1, 2, 3]
+
+
+def test_compact_shard_tuple_metadata(tmp_path: Path) -> None:
+    shard = JsonShard(uri=tmp_path.joinpath("uri1").as_uri(), path=tmp_path.joinpath("data.json"))
+    tuple_shard = CompactShardTuple(uri=tmp_path.joinpath("uri").as_uri(), shards=[shard])
+    assert tuple_shard[0].get_metadata() == {}
+
+
+def test_compact_shard_tuple_nbytes(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    assert tuple_shard.nbytes > 0
+    assert tuple_shard.nbytes < 4 * sum(
+        len(shard.get_uri()) + len(shard.path.as_posix()) for shard in shards
+    )
+
+
+def test_compact_shard_tuple_clear(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    shard = tuple_shard[0]
+    shard.get_data(cache=True)
+    assert tuple_shard.is_cached()
+    tuple_shard.clear()
+    assert not tuple_shard.is_cached()
+    assert not shard.is_cached()
+
+
+def test_compact_shard_tuple_equal_true(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert CompactShardTuple(uri=uri, shards=shards).equal(
+        CompactShardTuple(uri=uri, shards=shards)
+    )
+
+
+def test_compact_shard_tuple_equal_false_different_shards(
+    uri: str, shards: Sequence[BaseShard]
+) -> None:
+    assert not CompactShardTuple(uri=uri, shards=shards).equal(
+        CompactShardTuple(uri=uri, shards=shards[:2])
+    )
+
+
+def test_compact_shard_tuple_equal_false_different_type(
+    uri: str, shards: Sequence[BaseShard]
+) -> None:
+    assert not CompactShardTuple(uri=uri, shards=shards).equal(ShardTuple(uri=uri, shards=shards))
+
+
+def test_compact_shard_tuple_get_fingerprint(uri: str, shards: Sequence[BaseShard]) -> None:
+    fingerprint = CompactShardTuple(uri=uri, shards=shards).get_fingerprint()
+    assert len(fingerprint) == 64
+    assert fingerprint != ShardTuple(uri=uri, shards=shards).get_fingerprint()
+
+
+def test_compact_shard_tuple_get_fingerprint_not_materialized(
+    uri: str, shards: Sequence[BaseShard]
+) -> None:
+    shard = CompactShardTuple(uri=uri, shards=shards)
+    with patch.object(CompactShardTuple, "_materialize") as materialize:
+        shard.get_fingerprint()
+    materialize.assert_not_called()
+
+
+def test_compact_shard_tuple_get_fingerprint_children(
+    uri: str, shards: Sequence[BaseShard]
+) -> None:
+    assert CompactShardTuple(uri=uri, shards=shards).get_fingerprint() == compute_fingerprint(
+        CompactShardTuple, [uri, *[shard.get_fingerprint() for shard in shards]]
+    )
+
+
+def test_compact_shard_tuple_get_data(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert objects_are_equal(CompactShardTuple(uri=uri, shards=shards).get_data(), tuple(shards))
+
+
+def test_compact_shard_tuple_get_sequence(uri: str, shards: Sequence[BaseShard]) -> None:
+    sequence = CompactShardTuple(uri=uri, shards=shards).get_sequence()
+    assert isinstance(sequence, CompactShardSequence)
+    assert len(sequence) == 3
+
+
+def test_compact_shard_tuple_get_shard_metadata(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    assert tuple_shard.get_shard_metadata(1) == shards[1].get_metadata()
+    assert tuple_shard.get_shard_metadata(-1) == shards[2].get_metadata()
+    assert not tuple_shard._materialized
+
+
+def test_compact_shard_tuple_get_shard_metadata_empty(tmp_path: Path) -> None:
+    shard = JsonShard(uri=tmp_path.joinpath("uri1").as_uri(), path=tmp_path.joinpath("data.json"))
+    tuple_shard = CompactShardTuple(uri=tmp_path.joinpath("uri").as_uri(), shards=[shard])
+    assert tuple_shard.get_shard_metadata(0) == {}
+
+
+def test_compact_shard_tuple_get_shard_metadata_out_of_range(
+    uri: str, shards: Sequence[BaseShard]
+) -> None:
+    with pytest.raises(IndexError):
+        CompactShardTuple(uri=uri, shards=shards).get_shard_metadata(3)
+
+
+def test_compact_shard_tuple_get_uri(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert CompactShardTuple(uri=uri, shards=shards).get_uri() == uri
+
+
+def test_compact_shard_tuple_get_uris(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert CompactShardTuple(uri=uri, shards=shards).get_uris() == [
+        shard.get_uri() for shard in shards
+    ]
+
+
+def test_compact_shard_tuple_is_sorted_by_uri_true(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert CompactShardTuple(uri=uri, shards=shards).is_sorted_by_uri()
+
+
+def test_compact_shard_tuple_is_sorted_by_uri_false(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert not CompactShardTuple(uri=uri, shards=shards[::-1]).is_sorted_by_uri()
+
+
+def test_compact_shard_tuple_is_sorted_by_uri_empty(uri: str) -> None:
+    assert CompactShardTuple(uri=uri, shards=[]).is_sorted_by_uri()
+
+
+def test_compact_shard_tuple_add_load_observer(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    shard = tuple_shard[0]
+    metrics = MetricsRegistry()
+    tuple_shard.add_load_observer(metrics)
+    tuple_shard.add_load_observer(metrics)
+    shard.get_data()
+    tuple_shard[1].get_data()
+    assert metrics.get_counters()["shard/json"]["num_loads"] == 2
+
+
+def test_compact_shard_tuple_remove_load_observer(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    shard = tuple_shard[0]
+    metrics = MetricsRegistry()
+    tuple_shard.add_load_observer(metrics)
+    tuple_shard.remove_load_observer(metrics)
+    shard.get_data()
+    tuple_shard[1].get_data()
+    assert metrics.get_counters() == {}
+
+
+def test_compact_shard_tuple_set_data_cache(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    shard = tuple_shard[0]
+    cache = SharedMemoryCache()
+    tuple_shard.set_data_cache(cache)
+    try:
+        shard.get_data(cache=True)
+        tuple_shard[1].get_data(cache=True)
+        assert shards[0].path.as_posix() in cache
+        assert shards[1].path.as_posix() in cache
+    finally:
+        cache.clear()
+
+
+def test_compact_shard_tuple_set_cache_policy(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    shard = tuple_shard[0]
+    policy = TTLCachePolicy(ttl=10.0)
+    tuple_shard.set_cache_policy(policy)
+    assert shard._cache_policy is policy
+    assert tuple_shard[1]._cache_policy is policy
+
+
+def test_compact_shard_tuple_pickle(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    tuple_shard[0].get_data(cache=True)
+    shard = pickle.loads(pickle.dumps(tuple_shard))  # noqa: S301
+    assert shard.equal(tuple_shard)
+    assert not shard.is_cached()
+
+
+def test_compact_shard_tuple_from_uri(uri: str, shards: Sequence[BaseShard]) -> None:
+    shard = CompactShardTuple.from_uri(uri)
+    assert isinstance(shard, CompactShardTuple)
+    assert shard.equal(CompactShardTuple(uri=uri, shards=shards))
+
+
+def test_compact_shard_tuple_from_uri_shard_tuple(
+    tmp_path: Path, shards: Sequence[BaseShard]
+) -> None:
+    uri = tmp_path.joinpath("uri").as_uri()
+    create_shard_tuple(shards, uri=uri)
+    assert objects_are_equal(CompactShardTuple.from_uri(uri).get_data(), tuple(shards))
+
+
+def test_compact_shard_tuple_generate_uri_config(shards: Sequence[BaseShard]) -> None:
+    assert CompactShardTuple.generate_uri_config(shards) == {
+        SHARDS: [shard.get_uri() for shard in shards],
+        LOADER: {OBJECT_TARGET: "iden.shard.loader.CompactShardTupleLoader"},
+    }
+
+
+def test_compact_shard_tuple_generate_uri_config_compact(
+    uri: str, shards: Sequence[BaseShard]
+) -> None:
+    assert CompactShardTuple.generate_uri_config(CompactShardTuple(uri=uri, shards=shards)) == {
+        SHARDS: [shard.get_uri() for shard in shards],
+        LOADER: {OBJECT_TARGET: "iden.shard.loader.CompactShardTupleLoader"},
+    }
+
+
+##########################################
+#     Tests for CompactShardSequence     #
+##########################################
+
+
+def test_compact_shard_sequence_len(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert len(CompactShardSequence(CompactShardTuple(uri=uri, shards=shards))) == 3
+
+
+def test_compact_shard_sequence_repr(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert (
+        repr(CompactShardSequence(CompactShardTuple(uri=uri, shards=shards)))
+        == "CompactShardSequence(num_shards=3)"
+    )
+
+
+def test_compact_shard_sequence_getitem(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    sequence = CompactShardSequence(tuple_shard)
+    assert sequence[1] is tuple_shard[1]
+    assert sequence[-1].equal(shards[2])
+
+
+def test_compact_shard_sequence_getitem_slice(uri: str, shards: Sequence[BaseShard]) -> None:
+    sequence = CompactShardSequence(CompactShardTuple(uri=uri, shards=shards))
+    assert objects_are_equal(sequence[1:], tuple(shards[1:]))
+    assert sequence[3:] == ()
+
+
+def test_compact_shard_sequence_getitem_out_of_range(uri: str, shards: Sequence[BaseShard]) -> None:
+    sequence = CompactShardSequence(CompactShardTuple(uri=uri, shards=shards))
+    with pytest.raises(IndexError):
+        sequence[3]
+
+
+def test_compact_shard_sequence_iter(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert objects_are_equal(
+        tuple(CompactShardSequence(CompactShardTuple(uri=uri, shards=shards))), tuple(shards)
+    )
+
+
+def test_compact_shard_sequence_does_not_materialize(uri: str, shards: Sequence[BaseShard]) -> None:
+    tuple_shard = CompactShardTuple(uri=uri, shards=shards)
+    sequence = CompactShardSequence(tuple_shard)
+    assert len(sequence) == 3
+    assert sequence.get_metadata(0) == shards[0].get_metadata()
+    assert not tuple_shard._materialized
+
+
+def test_compact_shard_sequence_get_metadata(uri: str, shards: Sequence[BaseShard]) -> None:
+    sequence = CompactShardSequence(CompactShardTuple(uri=uri, shards=shards))
+    assert sequence.get_metadata(-1) == {NUM_RECORDS: 1, NBYTES: 3}
+
+
+################################################
+#     Tests for create_compact_shard_tuple     #
+################################################
+
+
+def test_create_compact_shard_tuple(tmp_path: Path, shards: Sequence[BaseShard]) -> None:
+    uri = tmp_path.joinpath("uri").as_uri()
+    shard = create_compact_shard_tuple(shards, uri=uri)
+    assert shard.equal(CompactShardTuple(uri=uri, shards=shards))
+    assert load_json(tmp_path.joinpath("uri")) == {
+        SHARDS: [shard.get_uri() for shard in shards],
+        LOADER: {OBJECT_TARGET: "iden.shard.loader.CompactShardTupleLoader"},
+    }
+
+
+def test_create_compact_shard_tuple_load_from_uri(
+    tmp_path: Path, shards: Sequence[BaseShard]
+) -> None:
+    uri = tmp_path.joinpath("uri").as_uri()
+    create_compact_shard_tuple(shards, uri=uri)
+    shard = load_from_uri(uri)
+    assert isinstance(shard, CompactShardTuple)
+    assert shard.equal(CompactShardTuple(uri=uri, shards=shards))
+
+
+def test_create_compact_shard_tuple_metadata(tmp_path: Path) -> None:
+    shard = create_compact_shard_tuple(
+        [create_json_shard([1, 2, 3], uri=tmp_path.joinpath("shard").as_uri())],
+        uri=tmp_path.joinpath("uri").as_uri(),
+    )
+    assert shard[0].get_metadata()[NUM_RECORDS] == 3
+
+
+def test_extend_shard_tuple_compact(tmp_path: Path, shards: Sequence[BaseShard]) -> None:
+    uri = tmp_path.joinpath("uri").as_uri()
+    shard = extend_shard_tuple(create_compact_shard_tuple(shards[:1], uri=uri), shards[1:])
+    assert isinstance(shard, CompactShardTuple)
+    assert shard.equal(CompactShardTuple(uri=uri, shards=shards))
+    assert isinstance(load_from_uri(uri), CompactShardTuple)
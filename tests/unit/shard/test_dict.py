@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 from coola.equality import objects_are_equal
@@ -8,7 +9,13 @@ from objectory import OBJECT_TARGET
 
 from iden.constants import LOADER, SHARDS
 from iden.io import load_json
-from iden.shard import JsonShard, ShardDict, create_json_shard, create_shard_dict
+from iden.shard import (
+    InMemoryShard,
+    JsonShard,
+    ShardDict,
+    create_json_shard,
+    create_shard_dict,
+)
 from iden.shard.exceptions import ShardNotFoundError
 
 if TYPE_CHECKING:
@@ -118,6 +125,51 @@ def test_shard_tuple_equal_false_different_type_child(
     assert not ShardDict(uri=uri, shards=shards).equal(Child(uri=uri, shards=shards))
 
 
+def test_shard_dict_equal_fingerprint(uri: str, shards: dict[str, BaseShard]) -> None:
+    with patch("coola.equality.objects_are_equal") as equal:
+        assert ShardDict(uri=uri, shards=shards).equal(ShardDict(uri=uri, shards=shards))
+    equal.assert_not_called()
+
+
+def test_shard_dict_equal_in_memory(tmp_path: Path) -> None:
+    uri = tmp_path.joinpath("uri").as_uri()
+    assert ShardDict(uri=uri, shards={"a": InMemoryShard([1, 2])}).equal(
+        ShardDict(uri=uri, shards={"a": InMemoryShard([1, 2])})
+    )
+    assert not ShardDict(uri=uri, shards={"a": InMemoryShard([1, 2])}).equal(
+        ShardDict(uri=uri, shards={"a": InMemoryShard([1, 3])})
+    )
+
+
+def test_shard_dict_get_fingerprint(uri: str, shards: dict[str, BaseShard]) -> None:
+    fingerprint = ShardDict(uri=uri, shards=shards).get_fingerprint()
+    assert len(fingerprint) == 64
+    assert fingerprint == ShardDict(uri=uri, shards=shards).get_fingerprint()
+
+
+def test_shard_dict_get_fingerprint_different_uri(uri: str, shards: dict[str, BaseShard]) -> None:
+    assert (
+        ShardDict(uri=uri, shards=shards).get_fingerprint()
+        != ShardDict(uri=uri + "123", shards=shards).get_fingerprint()
+    )
+
+
+def test_shard_dict_get_fingerprint_different_keys(uri: str, shards: dict[str, BaseShard]) -> None:
+    assert (
+        ShardDict(uri=uri, shards={"a": shards["001"]}).get_fingerprint()
+        != ShardDict(uri=uri, shards={"b": shards["001"]}).get_fingerprint()
+    )
+
+
+def test_shard_dict_get_fingerprint_in_memory(tmp_path: Path) -> None:
+    assert (
+        ShardDict(
+            uri=tmp_path.joinpath("uri").as_uri(), shards={"a": InMemoryShard([1, 2])}
+        ).get_fingerprint()
+        is None
+    )
+
+
 def test_shard_dict_get_data(uri: str, shards: dict[str, BaseShard], path_shard: Path) -> None:
     assert objects_are_equal(
         ShardDict(uri=uri, shards=shards).get_data(),
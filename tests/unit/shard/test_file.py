@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 from coola.equality import objects_are_equal
 from coola.utils.path import sanitize_path
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
-from iden.io import save_json
+from iden.cache import (
+    FileChangeCachePolicy,
+    SharedMemoryCache,
+    TranscodingCache,
+    TTLCachePolicy,
+    WeakRefCachePolicy,
+)
+from iden.constants import KWARGS, LOADER, METADATA, NBYTES, NUM_RECORDS
+from iden.io import JsonLoader, save_json
+from iden.observer import (
+    MetricsRegistry,
+    register_load_observer,
+    unregister_load_observer,
+)
 from iden.shard import FileShard, create_json_shard
 
 if TYPE_CHECKING:
@@ -47,6 +65,11 @@ def test_file_shard_path(uri: str, path: Path) -> None:
     assert FileShard(uri=uri, path=path).path == path
 
 
+def test_file_shard_loader(uri: str, path: Path) -> None:
+    loader = JsonLoader()
+    assert FileShard(uri=uri, path=path, loader=loader).loader is loader
+
+
 def test_file_shard_clear_not_initialized(uri: str, path: Path) -> None:
     shard = FileShard(uri=uri, path=path)
     shard.clear()
@@ -139,6 +162,383 @@ def test_file_shard_get_data_multiple_calls_cache(uri: str, path: Path) -> None:
     assert objects_are_equal(shard.get_data(), {"key1": [1, 2, 3, 4], "key2": "abc"})
 
 
+def test_file_shard_get_data_cache_single_flight(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path, loader=JsonLoader())
+    release = threading.Event()
+    loads = []
+
+    def load(path: Path) -> dict:
+        loads.append(path)
+        release.wait(timeout=5)
+        return {"key": 1}
+
+    with (
+        patch.object(JsonLoader, "load", side_effect=load),
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        futures = [executor.submit(shard.get_data, cache=True) for _ in range(8)]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+    assert len(loads) == 1
+    assert all(result is results[0] for result in results)
+    assert shard.is_cached()
+
+
+def test_file_shard_get_data_cache_single_flight_error(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path, loader=JsonLoader())
+    release = threading.Event()
+    loads = []
+
+    def load(path: Path) -> dict:
+        loads.append(path)
+        release.wait(timeout=5)
+        if len(loads) == 1:
+            msg = "load error"
+            raise RuntimeError(msg)
+        return {"key": 1}
+
+    with (
+        patch.object(JsonLoader, "load", side_effect=load),
+        ThreadPoolExecutor(max_workers=4) as executor,
+    ):
+        futures = [executor.submit(shard.get_data, cache=True) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        errors = [future.exception() for future in futures]
+    assert len(loads) == 2
+    assert sum(error is not None for error in errors) == 1
+    assert shard.get_data() == {"key": 1}
+
+
+def test_file_shard_get_data_cache_clear_during_load(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path, loader=JsonLoader())
+    started, release = threading.Event(), threading.Event()
+
+    def load(path: Path) -> dict:  # noqa: ARG001
+        started.set()
+        release.wait(timeout=5)
+        return {"key": 1}
+
+    with (
+        patch.object(JsonLoader, "load", side_effect=load),
+        ThreadPoolExecutor(max_workers=1) as executor,
+    ):
+        future = executor.submit(shard.get_data, cache=True)
+        assert started.wait(timeout=5)
+        shard.clear()
+        release.set()
+        assert future.result() == {"key": 1}
+    assert not shard.is_cached()
+    assert shard.get_data(cache=True) == {"key1": [1, 2, 3], "key2": "abc"}
+    assert shard.is_cached()
+
+
+def test_file_shard_get_data_no_cache_not_single_flight(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path, loader=JsonLoader())
+    with patch.object(JsonLoader, "load", return_value={"key": 1}) as load:
+        shard.get_data()
+        shard.get_data()
+    assert load.call_count == 2
+    assert not shard.is_cached()
+
+
+def test_file_shard_pickle(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path)
+    shard.get_data(cache=True)
+    other = pickle.loads(pickle.dumps(shard))  # noqa: S301
+    assert other.equal(shard)
+    assert other.is_cached()
+    assert other.get_data() == {"key1": [1, 2, 3], "key2": "abc"}
+    other.clear()
+    assert shard.is_cached()
+
+
+class ScaledFileShard(FileShard):
+    def __init__(self, uri: str, path: Path | str, scale: int = 1) -> None:
+        super().__init__(uri=uri, path=path)
+        self.scale = scale
+
+
+class SlottedFileShard(FileShard):
+    __slots__ = ("__offset", "scale")
+
+    def __init__(self, uri: str, path: Path | str, scale: int = 1) -> None:
+        super().__init__(uri=uri, path=path)
+        self.scale = scale
+        self.__offset = scale + 1
+
+    def get_offset(self) -> int:
+        return self.__offset
+
+
+def test_file_shard_pickle_subclass_attributes(uri: str, path: Path) -> None:
+    shard = ScaledFileShard(uri=uri, path=path, scale=5)
+    other = pickle.loads(pickle.dumps(shard))  # noqa: S301
+    assert other.scale == 5
+    assert other.equal(shard)
+    assert other.get_data() == {"key1": [1, 2, 3], "key2": "abc"}
+
+
+def test_file_shard_pickle_subclass_slots(uri: str, path: Path) -> None:
+    shard = SlottedFileShard(uri=uri, path=path, scale=5)
+    other = pickle.loads(pickle.dumps(shard))  # noqa: S301
+    assert other.scale == 5
+    assert other.get_offset() == 6
+    assert other.equal(shard)
+
+
+def test_file_shard_get_metadata(uri: str, path: Path) -> None:
+    assert FileShard(uri=uri, path=path, metadata={NUM_RECORDS: 3}).get_metadata() == {
+        NUM_RECORDS: 3
+    }
+
+
+def test_file_shard_get_metadata_empty(uri: str, path: Path) -> None:
+    assert FileShard(uri=uri, path=path).get_metadata() == {}
+
+
+def test_file_shard_get_metadata_copy(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path, metadata={NUM_RECORDS: 3})
+    shard.get_metadata()[NUM_RECORDS] = 5
+    assert shard.get_metadata() == {NUM_RECORDS: 3}
+
+
+def test_file_shard_add_load_observer(uri: str, path: Path) -> None:
+    metrics = MetricsRegistry()
+    shard = FileShard(uri=uri, path=path, metadata={NBYTES: 42})
+    shard.add_load_observer(metrics)
+    shard.add_load_observer(metrics)
+    shard.get_data(cache=True)
+    shard.get_data(cache=True)
+    assert metrics.get_counters() == {
+        "shard/json": {
+            "num_loads": 2,
+            "num_errors": 0,
+            "cache_hits": 1,
+            "cache_misses": 1,
+            "nbytes": 42,
+        }
+    }
+    assert metrics.get_slowest()[0].uri == uri
+
+
+def test_file_shard_add_load_observer_nbytes_file_size(uri: str, path: Path) -> None:
+    metrics = MetricsRegistry()
+    shard = FileShard(uri=uri, path=path)
+    shard.add_load_observer(metrics)
+    shard.get_data()
+    assert metrics.get_counters()["shard/json"]["nbytes"] == path.stat().st_size
+
+
+def test_file_shard_add_load_observer_error(uri: str, tmp_path: Path) -> None:
+    metrics = MetricsRegistry()
+    shard = FileShard(uri=uri, path=tmp_path.joinpath("missing.json"))
+    shard.add_load_observer(metrics)
+    with pytest.raises(FileNotFoundError):
+        shard.get_data()
+    assert metrics.get_counters()["shard/json"]["num_errors"] == 1
+
+
+def test_file_shard_remove_load_observer(uri: str, path: Path) -> None:
+    metrics = MetricsRegistry()
+    shard = FileShard(uri=uri, path=path)
+    shard.add_load_observer(metrics)
+    shard.remove_load_observer(metrics)
+    shard.get_data()
+    assert metrics.get_counters() == {}
+
+
+def test_file_shard_set_data_cache(uri: str, path: Path) -> None:
+    cache = SharedMemoryCache()
+    shard = FileShard(uri=uri, path=path)
+    shard.set_data_cache(cache)
+    try:
+        assert objects_are_equal(shard.get_data(cache=True), {"key1": [1, 2, 3], "key2": "abc"})
+        assert shard.is_cached()
+        assert path.as_posix() in cache
+    finally:
+        cache.clear()
+
+
+def test_file_shard_set_data_cache_shared(uri: str, path: Path) -> None:
+    cache = SharedMemoryCache()
+    shard1 = FileShard(uri=uri, path=path)
+    shard1.set_data_cache(cache)
+    shard2 = FileShard(uri=uri, path=path)
+    shard2.set_data_cache(cache)
+    try:
+        assert shard1.get_data(cache=True) is shard2.get_data(cache=True)
+    finally:
+        cache.clear()
+
+
+def test_file_shard_set_data_cache_no_cache(uri: str, path: Path) -> None:
+    cache = SharedMemoryCache()
+    shard = FileShard(uri=uri, path=path)
+    shard.set_data_cache(cache)
+    assert objects_are_equal(shard.get_data(), {"key1": [1, 2, 3], "key2": "abc"})
+    assert not shard.is_cached()
+    assert path.as_posix() not in cache
+
+
+def test_file_shard_set_data_cache_persistent(uri: str, path: Path, tmp_path: Path) -> None:
+    cache = TranscodingCache(tmp_path)
+    shard = FileShard(uri=uri, path=path)
+    shard.set_data_cache(cache)
+    assert objects_are_equal(shard.get_data(), {"key1": [1, 2, 3], "key2": "abc"})
+    assert not shard.is_cached()
+    assert path.as_posix() in cache
+
+
+def test_file_shard_clear_data_cache(uri: str, path: Path) -> None:
+    cache = SharedMemoryCache()
+    shard = FileShard(uri=uri, path=path)
+    shard.set_data_cache(cache)
+    try:
+        shard.get_data(cache=True)
+        shard.clear()
+        assert not shard.is_cached()
+        assert path.as_posix() in cache
+    finally:
+        cache.clear()
+
+
+def test_file_shard_set_cache_policy_weakref(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path, loader=JsonLoader())
+    shard.set_cache_policy(WeakRefCachePolicy())
+    with patch.object(JsonLoader, "load", side_effect=lambda _: np.arange(3)) as load:
+        data = shard.get_data(cache=True)
+        assert shard.get_data(cache=True) is data
+        assert shard.is_cached()
+        assert load.call_count == 1
+        del data
+        assert not shard.is_cached()
+        shard.get_data(cache=True)
+        assert load.call_count == 2
+
+
+def test_file_shard_set_cache_policy_ttl(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path, loader=JsonLoader())
+    shard.set_cache_policy(TTLCachePolicy(ttl=10.0))
+    with patch.object(JsonLoader, "load", return_value={"key": 1}) as load:
+        with patch("iden.cache.policy.time.monotonic", return_value=100.0):
+            shard.get_data(cache=True)
+            shard.get_data(cache=True)
+        assert load.call_count == 1
+        with patch("iden.cache.policy.time.monotonic", return_value=110.0):
+            assert not shard.is_cached()
+            shard.get_data(cache=True)
+        assert load.call_count == 2
+
+
+def test_file_shard_set_cache_policy_file_change(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    shard.set_cache_policy(FileChangeCachePolicy())
+    assert shard.get_data(cache=True) == [1, 2, 3]
+    assert shard.is_cached()
+    save_json([1, 2, 3, 4], shard.path, exist_ok=True)
+    assert not shard.is_cached()
+    assert shard.get_data(cache=True) == [1, 2, 3, 4]
+    assert shard.is_cached()
+
+
+def test_file_shard_set_cache_policy_clear(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path)
+    shard.get_data(cache=True)
+    shard.set_cache_policy(TTLCachePolicy(ttl=10.0))
+    assert not shard.is_cached()
+
+
+def test_file_shard_set_cache_policy_same(uri: str, path: Path) -> None:
+    policy = TTLCachePolicy(ttl=10.0)
+    shard = FileShard(uri=uri, path=path)
+    shard.set_cache_policy(policy)
+    shard.get_data(cache=True)
+    shard.set_cache_policy(policy)
+    assert shard.is_cached()
+
+
+def test_file_shard_set_cache_policy_weakref_not_weakrefable(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path, loader=JsonLoader())
+    shard.set_cache_policy(WeakRefCachePolicy())
+    with pytest.raises(TypeError, match=r"do not support weak references"):
+        shard.get_data(cache=True)
+    assert not shard.is_cached()
+    assert shard.get_data() == {"key1": [1, 2, 3], "key2": "abc"}
+
+
+def test_file_shard_set_cache_policy_none(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path, loader=JsonLoader())
+    shard.set_cache_policy(WeakRefCachePolicy())
+    shard.set_cache_policy(None)
+    shard.get_data(cache=True)
+    assert shard.is_cached()
+
+
+def test_file_shard_set_cache_policy_pickle(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path)
+    shard.set_cache_policy(TTLCachePolicy(ttl=10.0))
+    shard.get_data(cache=True)
+    other = pickle.loads(pickle.dumps(shard))  # noqa: S301
+    assert not other.is_cached()
+    assert other.get_data(cache=True) == {"key1": [1, 2, 3], "key2": "abc"}
+    assert other.is_cached()
+
+
+def test_file_shard_get_data_global_load_observer(uri: str, path: Path) -> None:
+    metrics = MetricsRegistry()
+    register_load_observer(metrics)
+    try:
+        FileShard(uri=uri, path=path).get_data()
+    finally:
+        unregister_load_observer(metrics)
+    counters = metrics.get_counters()
+    assert counters["shard/json"]["num_loads"] == 1
+    assert counters["file/json"]["num_loads"] == 1
+
+
+def test_file_shard_get_fingerprint(uri: str, path: Path) -> None:
+    fingerprint = FileShard(uri=uri, path=path).get_fingerprint()
+    assert isinstance(fingerprint, str)
+    assert len(fingerprint) == 64
+
+
+def test_file_shard_get_fingerprint_same(uri: str, path: Path) -> None:
+    assert (
+        FileShard(uri=uri, path=path).get_fingerprint()
+        == FileShard(uri=uri, path=path.as_posix()).get_fingerprint()
+    )
+
+
+def test_file_shard_get_fingerprint_cached(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path)
+    assert shard.get_fingerprint() is shard.get_fingerprint()
+
+
+def test_file_shard_get_fingerprint_different_uri(uri: str, path: Path) -> None:
+    assert (
+        FileShard(uri=uri, path=path).get_fingerprint()
+        != FileShard(uri=uri + "123", path=path).get_fingerprint()
+    )
+
+
+def test_file_shard_get_fingerprint_different_path(uri: str, path: Path, tmp_path: Path) -> None:
+    assert (
+        FileShard(uri=uri, path=path).get_fingerprint()
+        != FileShard(uri=uri, path=tmp_path).get_fingerprint()
+    )
+
+
+def test_file_shard_get_fingerprint_different_type(uri: str, path: Path) -> None:
+    class Child(FileShard): ...
+
+    assert (
+        FileShard(uri=uri, path=path).get_fingerprint()
+        != Child(uri=uri, path=path).get_fingerprint()
+    )
+
+
 def test_file_shard_get_uri(uri: str, path: Path) -> None:
     assert FileShard(uri=uri, path=path).get_uri() == uri
 
@@ -154,6 +554,30 @@ def test_file_shard_is_cached_true(uri: str, path: Path) -> None:
     assert shard.is_cached()
 
 
+def test_file_shard_slots(uri: str, path: Path) -> None:
+    shard = FileShard(uri=uri, path=path)
+    assert not hasattr(shard, "__dict__")
+    with pytest.raises(AttributeError):
+        shard.attr = 1
+
+
+def test_file_shard_from_parts(uri: str, path: Path) -> None:
+    loader = JsonLoader()
+    shard = FileShard.from_parts(uri=uri, path=path, loader=loader, metadata={NUM_RECORDS: 2})
+    assert shard.equal(FileShard(uri=uri, path=path))
+    assert shard.get_metadata() == {NUM_RECORDS: 2}
+    assert shard.get_data() == {"key1": [1, 2, 3], "key2": "abc"}
+    assert not shard.is_cached()
+
+
+def test_file_shard_from_parts_shared_loader(uri: str, path: Path) -> None:
+    loader = JsonLoader()
+    shard1 = FileShard.from_parts(uri=uri, path=path, loader=loader)
+    shard2 = FileShard.from_parts(uri=uri, path=path, loader=loader)
+    assert shard1._loader is shard2._loader
+    assert shard1.get_metadata() == {}
+
+
 def test_file_shard_from_uri(uri: str, path: Path) -> None:
     shard = FileShard.from_uri(uri)
     assert shard.equal(FileShard(uri=uri, path=path))
@@ -165,3 +589,10 @@ def test_json_shard_generate_uri_config(path: Path) -> None:
         KWARGS: {"path": path.as_posix()},
         LOADER: {OBJECT_TARGET: "iden.shard.loader.FileShardLoader"},
     }
+
+
+def test_file_shard_generate_uri_config_metadata(path: Path) -> None:
+    assert FileShard.generate_uri_config(path, metadata={NUM_RECORDS: 3}) == {
+        KWARGS: {"path": path.as_posix(), METADATA: {NUM_RECORDS: 3}},
+        LOADER: {OBJECT_TARGET: "iden.shard.loader.FileShardLoader"},
+    }
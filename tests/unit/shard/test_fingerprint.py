@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from iden.io import save_json
+from iden.shard import (
+    InMemoryShard,
+    create_compact_shard_tuple,
+    create_json_shard,
+    create_shard_dict,
+    create_shard_tuple,
+)
+from iden.shard.fingerprint import compute_fingerprint, get_content_fingerprint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+#########################################
+#     Tests for compute_fingerprint     #
+#########################################
+
+
+def test_compute_fingerprint() -> None:
+    fingerprint = compute_fingerprint(dict, ["abc", "de"])
+    assert isinstance(fingerprint, str)
+    assert len(fingerprint) == 64
+
+
+def test_compute_fingerprint_same() -> None:
+    assert compute_fingerprint(dict, ["abc", "de"]) == compute_fingerprint(dict, ["abc", "de"])
+
+
+def test_compute_fingerprint_different_parts() -> None:
+    assert compute_fingerprint(dict, ["abc", "de"]) != compute_fingerprint(dict, ["ab", "cde"])
+
+
+def test_compute_fingerprint_different_type() -> None:
+    assert compute_fingerprint(dict, ["abc"]) != compute_fingerprint(list, ["abc"])
+
+
+def test_compute_fingerprint_empty() -> None:
+    assert compute_fingerprint(dict, []) != compute_fingerprint(dict, [""])
+
+
+#############################################
+#     Tests for get_content_fingerprint     #
+#############################################
+
+
+@pytest.mark.parametrize("method", ["stat", "digest"])
+def test_get_content_fingerprint_file(tmp_path: Path, method: str) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    fingerprint = get_content_fingerprint(shard, method=method)
+    assert len(fingerprint) == 64
+    assert fingerprint != shard.get_fingerprint()
+    assert fingerprint == get_content_fingerprint(shard, method=method)
+
+
+@pytest.mark.parametrize("method", ["stat", "digest"])
+def test_get_content_fingerprint_file_changed(tmp_path: Path, method: str) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    fingerprint = get_content_fingerprint(shard, method=method)
+    save_json([1, 2], shard.path, exist_ok=True)
+    assert fingerprint != get_content_fingerprint(shard, method=method)
+
+
+def test_get_content_fingerprint_file_different_methods(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    assert get_content_fingerprint(shard, method="stat") != get_content_fingerprint(
+        shard, method="digest"
+    )
+
+
+def test_get_content_fingerprint_file_memory() -> None:
+    shard = create_json_shard([1, 2, 3], uri="memory://test-get-content-fingerprint/uri")
+    assert len(get_content_fingerprint(shard, method="digest")) == 64
+
+
+@pytest.mark.parametrize("method", ["stat", "digest"])
+def test_get_content_fingerprint_tuple(tmp_path: Path, method: str) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard2 = create_json_shard([4, 5], uri=tmp_path.joinpath("uri2").as_uri())
+    shard = create_shard_tuple([shard1, shard2], uri=tmp_path.joinpath("uri").as_uri())
+    fingerprint = get_content_fingerprint(shard, method=method)
+    assert len(fingerprint) == 64
+    save_json([4, 5, 6], shard2.path, exist_ok=True)
+    assert fingerprint != get_content_fingerprint(shard, method=method)
+
+
+def test_get_content_fingerprint_compact_tuple(tmp_path: Path) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard = create_compact_shard_tuple([shard1], uri=tmp_path.joinpath("uri").as_uri())
+    fingerprint = get_content_fingerprint(shard, method="digest")
+    save_json([4, 5, 6], shard1.path, exist_ok=True)
+    assert fingerprint != get_content_fingerprint(shard, method="digest")
+
+
+@pytest.mark.parametrize("method", ["stat", "digest"])
+def test_get_content_fingerprint_dict(tmp_path: Path, method: str) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard = create_shard_dict({"a": shard1}, uri=tmp_path.joinpath("uri").as_uri())
+    fingerprint = get_content_fingerprint(shard, method=method)
+    assert len(fingerprint) == 64
+    save_json([4, 5, 6, 7], shard1.path, exist_ok=True)
+    assert fingerprint != get_content_fingerprint(shard, method=method)
+
+
+def test_get_content_fingerprint_in_memory() -> None:
+    assert get_content_fingerprint(InMemoryShard([1, 2, 3])) is None
+
+
+def test_get_content_fingerprint_tuple_in_memory(tmp_path: Path) -> None:
+    shard = create_shard_tuple([InMemoryShard([1, 2, 3])], uri=tmp_path.joinpath("uri").as_uri())
+    assert get_content_fingerprint(shard) is None
+
+
+def test_get_content_fingerprint_incorrect_method(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    with pytest.raises(ValueError, match=r"Incorrect method: incorrect"):
+        get_content_fingerprint(shard, method="incorrect")
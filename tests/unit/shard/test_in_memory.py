@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from iden.constants import NUM_RECORDS
 from iden.shard import InMemoryShard
 
 ###################################
@@ -56,6 +57,18 @@ def test_in_memory_shard_get_data() -> None:
     assert InMemoryShard([1, 2, 3]).get_data() == [1, 2, 3]
 
 
+def test_in_memory_shard_get_metadata() -> None:
+    assert InMemoryShard([1, 2, 3]).get_metadata() == {NUM_RECORDS: 3}
+
+
+def test_in_memory_shard_get_metadata_empty() -> None:
+    assert InMemoryShard(42).get_metadata() == {}
+
+
+def test_in_memory_shard_get_fingerprint() -> None:
+    assert InMemoryShard([1, 2, 3]).get_fingerprint() is None
+
+
 def test_in_memory_shard_get_uri() -> None:
     assert InMemoryShard([1, 2, 3]).get_uri() is None
 
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from coola.equality import objects_are_equal
+from coola.testing.fixtures import numpy_available
+from coola.utils.imports import is_numpy_available
+
+from iden.shard import (
+    CompactShardTuple,
+    InMemoryShard,
+    RecordIndex,
+    create_json_shard,
+)
+from iden.shard.json import JsonShard
+
+if is_numpy_available():
+    import numpy as np
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> RecordIndex:
+    return RecordIndex(
+        [
+            create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri()),
+            create_json_shard([], uri=tmp_path.joinpath("uri2").as_uri()),
+            create_json_shard([4, 5, 6, 7], uri=tmp_path.joinpath("uri3").as_uri()),
+            create_json_shard([8, 9], uri=tmp_path.joinpath("uri4").as_uri()),
+        ]
+    )
+
+
+#################################
+#     Tests for RecordIndex     #
+#################################
+
+
+def test_record_index_repr(index: RecordIndex) -> None:
+    assert repr(index) == "RecordIndex(num_shards=4, num_records=9)"
+
+
+def test_record_index_len(index: RecordIndex) -> None:
+    assert len(index) == 9
+
+
+def test_record_index_len_empty() -> None:
+    assert len(RecordIndex([])) == 0
+
+
+def test_record_index_does_not_load_shards(tmp_path: Path) -> None:
+    shards = [
+        create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri()),
+        create_json_shard([4, 5], uri=tmp_path.joinpath("uri2").as_uri()),
+    ]
+    with patch.object(JsonShard, "get_data") as get_data:
+        assert len(RecordIndex(shards)) == 5
+    get_data.assert_not_called()
+
+
+def test_record_index_compact_does_not_materialize(tmp_path: Path) -> None:
+    tuple_shard = CompactShardTuple(
+        uri=tmp_path.joinpath("uri").as_uri(),
+        shards=[
+            create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri()),
+            create_json_shard([4, 5], uri=tmp_path.joinpath("uri2").as_uri()),
+        ],
+    )
+    index = RecordIndex(tuple_shard.get_sequence())
+    assert len(index) == 5
+    assert not tuple_shard._materialized
+    assert index.get_record(3) == 4
+
+
+def test_record_index_compact_without_metadata(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    tuple_shard = CompactShardTuple(
+        uri=tmp_path.joinpath("uri").as_uri(),
+        shards=[JsonShard(uri=shard.get_uri(), path=shard.path)],
+    )
+    assert len(RecordIndex(tuple_shard.get_sequence())) == 3
+
+
+def test_record_index_without_metadata() -> None:
+    assert len(RecordIndex([InMemoryShard([1, 2, 3]), InMemoryShard([4, 5])])) == 5
+
+
+@pytest.mark.parametrize(
+    ("position", "expected"),
+    [(0, (0, 0)), (2, (0, 2)), (3, (2, 0)), (6, (2, 3)), (7, (3, 0)), (8, (3, 1)), (-1, (3, 1))],
+)
+def test_record_index_find(index: RecordIndex, position: int, expected: tuple[int, int]) -> None:
+    assert index.find(position) == expected
+
+
+@pytest.mark.parametrize("position", [9, 100, -10])
+def test_record_index_find_out_of_range(index: RecordIndex, position: int) -> None:
+    with pytest.raises(IndexError, match=r"record index out of range"):
+        index.find(position)
+
+
+def test_record_index_get_record(index: RecordIndex) -> None:
+    assert [index.get_record(i) for i in range(len(index))] == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+
+def test_record_index_get_record_loads_one_shard(tmp_path: Path) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard2 = create_json_shard([4, 5], uri=tmp_path.joinpath("uri2").as_uri())
+    index = RecordIndex([shard1, shard2])
+    with patch.object(
+        JsonShard, "get_data", autospec=True, side_effect=JsonShard.get_data
+    ) as get_data:
+        assert index.get_record(4) == 5
+    get_data.assert_called_once_with(shard2)
+
+
+def test_record_index_get_record_sequential_loads_each_shard_once(tmp_path: Path) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard2 = create_json_shard([4, 5], uri=tmp_path.joinpath("uri2").as_uri())
+    index = RecordIndex([shard1, shard2])
+    with patch.object(
+        JsonShard, "get_data", autospec=True, side_effect=JsonShard.get_data
+    ) as get_data:
+        assert [index.get_record(i) for i in range(5)] == [1, 2, 3, 4, 5]
+    assert get_data.call_count == 2
+
+
+@numpy_available
+def test_record_index_get_record_dict() -> None:
+    index = RecordIndex(
+        [
+            InMemoryShard({"key1": np.arange(3), "key2": ["a", "b", "c"]}),
+            InMemoryShard({"key1": np.arange(3, 5), "key2": ["d", "e"]}),
+        ]
+    )
+    assert objects_are_equal(index.get_record(3), {"key1": np.int64(3), "key2": "d"})
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "expected"),
+    [
+        (0, 9, [1, 2, 3, 4, 5, 6, 7, 8, 9]),
+        (1, 3, [2, 3]),
+        (2, 8, [3, 4, 5, 6, 7, 8]),
+        (3, 7, [4, 5, 6, 7]),
+        (-3, 100, [7, 8, 9]),
+        (5, 5, []),
+        (9, 9, []),
+        (6, 2, []),
+    ],
+)
+def test_record_index_get_slice(index: RecordIndex, start: int, stop: int, expected: list) -> None:
+    assert index.get_slice(start, stop) == expected
+
+
+@numpy_available
+def test_record_index_get_slice_numpy() -> None:
+    index = RecordIndex([InMemoryShard(np.arange(3)), InMemoryShard(np.arange(3, 8))])
+    assert objects_are_equal(index.get_slice(1, 5), np.array([1, 2, 3, 4]))
+
+
+def test_record_index_get_slice_reuses_last_shard(tmp_path: Path) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard2 = create_json_shard([4, 5], uri=tmp_path.joinpath("uri2").as_uri())
+    index = RecordIndex([shard1, shard2])
+    with patch.object(
+        JsonShard, "get_data", autospec=True, side_effect=JsonShard.get_data
+    ) as get_data:
+        assert index.get_slice(3, 4) == [4]
+        assert index.get_record(4) == 5
+    get_data.assert_called_once_with(shard2)
+
+
+def test_record_index_get_slice_empty_range_does_not_load(tmp_path: Path) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard2 = create_json_shard([4, 5], uri=tmp_path.joinpath("uri2").as_uri())
+    index = RecordIndex([shard1, shard2])
+    assert index.get_record(4) == 5
+    with patch.object(JsonShard, "get_data") as get_data:
+        assert index.get_slice(1, 1) == []
+        assert index.get_slice(4, 2) == []
+    get_data.assert_not_called()
+
+
+@numpy_available
+def test_record_index_get_slice_empty_range_numpy() -> None:
+    index = RecordIndex([InMemoryShard(np.arange(3)), InMemoryShard(np.arange(3, 8))])
+    assert objects_are_equal(index.get_slice(5, 5), np.array([], dtype=np.int64))
+
+
+def test_record_index_get_slice_empty() -> None:
+    with pytest.raises(IndexError, match=r"cannot slice an empty record index"):
+        RecordIndex([]).get_slice(0, 1)
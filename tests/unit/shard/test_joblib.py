@@ -6,7 +6,7 @@ import pytest
 from coola.equality import objects_are_equal
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA, NBYTES
 from iden.io import load_json
 from iden.shard import JoblibShard, create_joblib_shard
 from iden.testing import joblib_available
@@ -198,7 +198,7 @@ def test_create_joblib_shard(tmp_path: Path) -> None:
     assert objects_are_equal(
         load_json(uri_file),
         {
-            KWARGS: {"path": path.as_posix()},
+            KWARGS: {"path": path.as_posix(), METADATA: {NBYTES: path.stat().st_size}},
             LOADER: {OBJECT_TARGET: "iden.shard.loader.JoblibShardLoader"},
         },
         show_difference=True,
@@ -215,7 +215,7 @@ def test_create_joblib_shard_with_data(tmp_path: Path) -> None:
     shard = create_joblib_shard(data={"key1": [1, 2, 3], "key2": "abc"}, uri=uri, path=path)
 
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {"path": path.as_posix(), METADATA: {NBYTES: path.stat().st_size}},
         LOADER: {OBJECT_TARGET: "iden.shard.loader.JoblibShardLoader"},
     }
     assert shard.equal(JoblibShard(uri=uri, path=path))
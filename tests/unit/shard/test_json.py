@@ -6,7 +6,7 @@ import pytest
 from coola.equality import objects_are_equal
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA, NBYTES, NUM_RECORDS
 from iden.io import load_json
 from iden.shard import JsonShard, create_json_shard
 
@@ -159,6 +159,13 @@ def test_json_shard_generate_uri_config(path: Path) -> None:
     }
 
 
+def test_json_shard_generate_uri_config_metadata(path: Path) -> None:
+    assert JsonShard.generate_uri_config(path, metadata={NUM_RECORDS: 3}) == {
+        KWARGS: {"path": path.as_posix(), METADATA: {NUM_RECORDS: 3}},
+        LOADER: {OBJECT_TARGET: "iden.shard.loader.JsonShardLoader"},
+    }
+
+
 #######################################
 #     Tests for create_json_shard     #
 #######################################
@@ -172,7 +179,7 @@ def test_create_json_shard(tmp_path: Path) -> None:
 
     assert uri_file.is_file()
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {"path": path.as_posix(), METADATA: {NBYTES: path.stat().st_size}},
         LOADER: {OBJECT_TARGET: "iden.shard.loader.JsonShardLoader"},
     }
     assert shard.equal(JsonShard(uri=uri, path=path))
@@ -186,8 +193,22 @@ def test_create_json_shard_with_data(tmp_path: Path) -> None:
     shard = create_json_shard(data={"key1": [1, 2, 3], "key2": "abc"}, uri=uri, path=path)
 
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {"path": path.as_posix(), METADATA: {NBYTES: path.stat().st_size}},
         LOADER: {OBJECT_TARGET: "iden.shard.loader.JsonShardLoader"},
     }
     assert shard.equal(JsonShard(uri=uri, path=path))
     assert objects_are_equal(shard.get_data(), {"key1": [1, 2, 3], "key2": "abc"})
+
+
+def test_create_json_shard_metadata(tmp_path: Path) -> None:
+    uri_file = tmp_path.joinpath("my_uri")
+    uri = uri_file.as_uri()
+    path = tmp_path.joinpath("my_uri.json")
+    shard = create_json_shard(data=[1, 2, 3], uri=uri)
+
+    assert load_json(uri_file) == {
+        KWARGS: {"path": path.as_posix(), METADATA: {NUM_RECORDS: 3, NBYTES: 9}},
+        LOADER: {OBJECT_TARGET: "iden.shard.loader.JsonShardLoader"},
+    }
+    assert shard.get_metadata() == {NUM_RECORDS: 3, NBYTES: 9}
+    assert JsonShard.from_uri(uri).get_metadata() == {NUM_RECORDS: 3, NBYTES: 9}
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from coola.equality import objects_are_equal
@@ -10,6 +10,7 @@ from coola.utils.imports import is_numpy_available, is_torch_available
 from coola.utils.path import sanitize_path
 
 from iden.io import JsonSaver
+from iden.observer import MetricsRegistry, register_load_observer, unregister_load_observer
 from iden.shard import (
     CloudpickleShard,
     FileShard,
@@ -30,7 +31,14 @@ from iden.shard import (
     create_yaml_shard,
     load_from_uri,
 )
-from iden.testing import cloudpickle_available, safetensors_available, yaml_available
+from iden.storage import S3Storage
+from iden.storage import registry as storage_registry
+from iden.testing import (
+    ObjectStoreServer,
+    cloudpickle_available,
+    safetensors_available,
+    yaml_available,
+)
 
 if is_numpy_available():
     import numpy as np
@@ -158,6 +166,52 @@ def test_load_from_uri_yaml(tmp_path: Path) -> None:
     assert objects_are_equal(shard.get_data(), {"key1": [1, 2, 3], "key2": "abc"})
 
 
+def test_load_from_uri_load_observer(tmp_path: Path) -> None:
+    uri = tmp_path.joinpath("my_uri").as_uri()
+    create_json_shard(data=[1, 2, 3], uri=uri)
+    metrics = MetricsRegistry()
+    register_load_observer(metrics)
+    try:
+        load_from_uri(uri)
+    finally:
+        unregister_load_observer(metrics)
+    assert metrics.get_counters()["uri/shard"]["num_loads"] == 1
+    assert metrics.get_slowest()[0].uri == uri
+
+
+def test_load_from_uri_memory() -> None:
+    uri = "memory://test-load-from-uri/my_uri"
+    create_json_shard(data={"key1": [1, 2, 3], "key2": "abc"}, uri=uri)
+    shard = load_from_uri(uri)
+    assert shard.equal(JsonShard(uri=uri, path=f"{uri}.json"))
+    assert objects_are_equal(shard.get_data(), {"key1": [1, 2, 3], "key2": "abc"})
+
+
+def test_load_from_uri_memory_tuple() -> None:
+    shards = (
+        create_json_shard([1, 2, 3], uri="memory://test-load-from-uri-tuple/uri1"),
+        create_json_shard([4, 5, 6, 7], uri="memory://test-load-from-uri-tuple/uri2"),
+    )
+    uri = "memory://test-load-from-uri-tuple/uri"
+    create_shard_tuple(shards, uri=uri)
+    shard = load_from_uri(uri)
+    assert shard.equal(ShardTuple(uri=uri, shards=shards))
+    assert objects_are_equal(shard[1].get_data(), [4, 5, 6, 7])
+
+
+def test_load_from_uri_s3() -> None:
+    with ObjectStoreServer() as server:
+        storage = S3Storage(endpoint_url=server.endpoint_url)
+        with patch.dict(storage_registry._STORAGES, {"s3": storage}):
+            uri = "s3://bucket/my_uri"
+            create_json_shard(data={"key1": [1, 2, 3], "key2": "abc"}, uri=uri)
+            shard = load_from_uri(uri)
+            assert shard.path == "s3://bucket/my_uri.json"
+            assert objects_are_equal(shard.get_data(), {"key1": [1, 2, 3], "key2": "abc"})
+        storage.close()
+    assert server.num_connections == 1
+
+
 def test_load_from_uri_missing() -> None:
     with pytest.raises(FileNotFoundError, match=r"uri file does not exist:"):
         load_from_uri("file:///data/my_uri")
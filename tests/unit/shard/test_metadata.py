@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from coola.testing.fixtures import numpy_available, torch_available
+from coola.utils.imports import is_numpy_available, is_torch_available
+
+from iden.constants import DTYPE, FEATURES, NBYTES, NUM_RECORDS, SHAPE
+from iden.io import save_json
+from iden.shard import InMemoryShard, JsonShard, create_json_shard
+from iden.shard.metadata import generate_metadata, get_shard_num_records
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+if is_numpy_available():
+    import numpy as np
+
+if is_torch_available():
+    import torch
+
+
+#######################################
+#     Tests for generate_metadata     #
+#######################################
+
+
+def test_generate_metadata_list() -> None:
+    assert generate_metadata([1, 2, 3]) == {NUM_RECORDS: 3}
+
+
+def test_generate_metadata_dict() -> None:
+    assert generate_metadata({"key1": [1, 2, 3], "key2": [4, 5, 6]}) == {NUM_RECORDS: 3}
+
+
+@pytest.mark.parametrize("data", [42, "abc", {"key1": [1, 2, 3], "key2": "abc"}])
+def test_generate_metadata_no_records(data: object) -> None:
+    assert generate_metadata(data) == {}
+
+
+def test_generate_metadata_path(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.json")
+    save_json([1, 2, 3], path)
+    assert generate_metadata([1, 2, 3], path=path) == {NUM_RECORDS: 3, NBYTES: 9}
+
+
+@numpy_available
+def test_generate_metadata_numpy() -> None:
+    assert generate_metadata(np.ones((4, 3), dtype=np.float32)) == {
+        NUM_RECORDS: 4,
+        NBYTES: 48,
+        SHAPE: [4, 3],
+        DTYPE: "float32",
+    }
+
+
+@torch_available
+def test_generate_metadata_torch() -> None:
+    assert generate_metadata(torch.ones(4, 3, dtype=torch.float64)) == {
+        NUM_RECORDS: 4,
+        NBYTES: 96,
+        SHAPE: [4, 3],
+        DTYPE: "float64",
+    }
+
+
+@numpy_available
+def test_generate_metadata_dict_numpy() -> None:
+    assert generate_metadata(
+        {"key1": np.ones((4, 3), dtype=np.float32), "key2": np.arange(4), "key3": [1, 2, 3, 4]}
+    ) == {
+        NUM_RECORDS: 4,
+        FEATURES: {
+            "key1": {SHAPE: [4, 3], DTYPE: "float32"},
+            "key2": {SHAPE: [4], DTYPE: "int64"},
+        },
+    }
+
+
+@numpy_available
+def test_generate_metadata_dict_numpy_path(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.json")
+    save_json([1, 2, 3], path)
+    assert generate_metadata({"key": np.arange(5, dtype=np.int64)}, path=path) == {
+        NUM_RECORDS: 5,
+        NBYTES: 9,
+        FEATURES: {"key": {SHAPE: [5], DTYPE: "int64"}},
+    }
+
+
+###########################################
+#     Tests for get_shard_num_records     #
+###########################################
+
+
+def test_get_shard_num_records_metadata(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    with patch.object(JsonShard, "get_data") as get_data:
+        assert get_shard_num_records(shard) == 3
+    get_data.assert_not_called()
+
+
+def test_get_shard_num_records_no_metadata(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    assert get_shard_num_records(JsonShard(uri=shard.get_uri(), path=shard.path)) == 3
+
+
+def test_get_shard_num_records_in_memory() -> None:
+    assert get_shard_num_records(InMemoryShard([1, 2, 3, 4])) == 4
+
+
+def test_get_shard_num_records_invalid() -> None:
+    with pytest.raises(TypeError, match=r"do not have a record structure"):
+        get_shard_num_records(InMemoryShard(42))
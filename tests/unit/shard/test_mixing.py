@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import pytest
+
+from iden.shard import BaseShard, InMemoryShard
+from iden.shard.mixing import MixtureShardIterable
+
+
+def create_source(name: str, num_shards: int, num_records: int) -> list[BaseShard]:
+    return [
+        InMemoryShard([f"{name}{i * num_records + j}" for j in range(num_records)])
+        for i in range(num_shards)
+    ]
+
+
+def count(records: list[str], name: str) -> int:
+    return sum(record.startswith(name) for record in records)
+
+
+##########################################
+#     Tests for MixtureShardIterable     #
+##########################################
+
+
+def test_mixture_shard_iterable_repr() -> None:
+    assert repr(MixtureShardIterable({"a": [], "b": []})).startswith("MixtureShardIterable(")
+
+
+def test_mixture_shard_iterable_iter_equal_weights() -> None:
+    records = list(
+        MixtureShardIterable({"a": create_source("a", 5, 10), "b": create_source("b", 5, 10)})
+    )
+    assert len(records) >= 99
+    assert abs(count(records, "a") - count(records, "b")) <= 2
+
+
+def test_mixture_shard_iterable_iter_ratio() -> None:
+    iterable = MixtureShardIterable(
+        {"a": create_source("a", 10, 100), "b": create_source("b", 10, 100)},
+        weights={"a": 3, "b": 1},
+        tolerance=0.01,
+    )
+    records = list(iterable)
+    assert abs(count(records, "a") / len(records) - 0.75) <= 0.01
+    for stop in range(100, len(records), 100):
+        assert abs(count(records[:stop], "a") / stop - 0.75) <= 0.02
+
+
+def test_mixture_shard_iterable_iter_records_order_in_source() -> None:
+    records = list(
+        MixtureShardIterable({"a": create_source("a", 3, 4), "b": create_source("b", 3, 4)})
+    )
+    records_a = [record for record in records if record.startswith("a")]
+    assert records_a == [f"a{i}" for i in range(len(records_a))]
+
+
+def test_mixture_shard_iterable_iter_stop_on_first_exhausted() -> None:
+    records = list(
+        MixtureShardIterable({"a": create_source("a", 1, 10), "b": create_source("b", 5, 10)})
+    )
+    assert count(records, "a") == 10
+    assert count(records, "b") <= 12
+
+
+def test_mixture_shard_iterable_iter_all_sources() -> None:
+    records = list(
+        MixtureShardIterable(
+            {"a": create_source("a", 1, 10), "b": create_source("b", 5, 10)},
+            stop_on_first_exhausted=False,
+        )
+    )
+    assert count(records, "a") == 10
+    assert count(records, "b") == 50
+
+
+def test_mixture_shard_iterable_iter_unit_shard() -> None:
+    records = list(
+        MixtureShardIterable(
+            {"a": create_source("a", 2, 3), "b": create_source("b", 2, 3)},
+            unit="shard",
+            stop_on_first_exhausted=False,
+        )
+    )
+    assert sorted(records) == [
+        ["a0", "a1", "a2"],
+        ["a3", "a4", "a5"],
+        ["b0", "b1", "b2"],
+        ["b3", "b4", "b5"],
+    ]
+
+
+def test_mixture_shard_iterable_iter_zero_weight() -> None:
+    records = list(
+        MixtureShardIterable(
+            {"a": create_source("a", 2, 3), "b": create_source("b", 2, 3)},
+            weights={"a": 1, "b": 0},
+        )
+    )
+    assert records == ["a0", "a1", "a2", "a3", "a4", "a5"]
+
+
+def test_mixture_shard_iterable_iter_deterministic() -> None:
+    sources = {"a": create_source("a", 3, 10), "b": create_source("b", 3, 10)}
+    assert list(MixtureShardIterable(sources, seed=1, tolerance=0.2)) == list(
+        MixtureShardIterable(sources, seed=1, tolerance=0.2)
+    )
+
+
+def test_mixture_shard_iterable_iter_empty_sources() -> None:
+    assert list(MixtureShardIterable({"a": [], "b": []})) == []
+
+
+def test_mixture_shard_iterable_iter_invalid_data() -> None:
+    with pytest.raises(TypeError, match=r"do not have a record structure"):
+        list(MixtureShardIterable({"a": [InMemoryShard(42)]}))
+
+
+def test_mixture_shard_iterable_get_stats() -> None:
+    iterable = MixtureShardIterable(
+        {"a": create_source("a", 2, 5), "b": create_source("b", 2, 5)},
+        stop_on_first_exhausted=False,
+    )
+    list(iterable)
+    stats = iterable.get_stats()
+    assert stats["a"]["num_items"] == 10
+    assert stats["a"]["num_shards"] == 2
+    assert stats["a"]["fraction"] == 0.5
+    assert stats["a"]["wait_time"] >= 0.0
+    assert stats["b"]["num_items"] == 10
+
+
+def test_mixture_shard_iterable_get_stats_before_iter() -> None:
+    assert MixtureShardIterable({"a": create_source("a", 2, 5)}).get_stats() == {
+        "a": {"num_items": 0, "num_shards": 0, "fraction": 0.0, "wait_time": 0.0, "throughput": 0.0}
+    }
+
+
+def test_mixture_shard_iterable_sources_empty() -> None:
+    with pytest.raises(ValueError, match=r"sources cannot be empty"):
+        MixtureShardIterable({})
+
+
+def test_mixture_shard_iterable_weights_keys() -> None:
+    with pytest.raises(ValueError, match=r"do not match the sources keys"):
+        MixtureShardIterable({"a": [], "b": []}, weights={"a": 1})
+
+
+@pytest.mark.parametrize("weights", [{"a": -1, "b": 1}, {"a": 0, "b": 0}])
+def test_mixture_shard_iterable_incorrect_weights(weights: dict[str, float]) -> None:
+    with pytest.raises(ValueError, match=r"The weights must be positive or zero"):
+        MixtureShardIterable({"a": [], "b": []}, weights=weights)
+
+
+def test_mixture_shard_iterable_incorrect_unit() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect unit: 'batch'"):
+        MixtureShardIterable({"a": []}, unit="batch")
+
+
+def test_mixture_shard_iterable_incorrect_tolerance() -> None:
+    with pytest.raises(ValueError, match=r"tolerance must be positive or zero"):
+        MixtureShardIterable({"a": []}, tolerance=-0.1)
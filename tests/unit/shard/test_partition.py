@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import pytest
+from coola.testing.fixtures import torch_available
+
+from iden.constants import NBYTES
+from iden.shard import BaseShard, FileShard, InMemoryShard, JsonShard, create_json_shard
+from iden.shard.partition import (
+    get_shard_weight,
+    get_worker_shards,
+    partition_shards,
+    select_partition,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def create_shards(path: Path, weights: list[int]) -> list[BaseShard]:
+    return [
+        FileShard(uri=f"uri{i}", path=path.joinpath(f"data{i}"), metadata={NBYTES: weight})
+        for i, weight in enumerate(weights)
+    ]
+
+
+def get_uris(partitions: list[tuple[BaseShard, ...]]) -> list[list[str]]:
+    return [[shard.get_uri() for shard in partition] for partition in partitions]
+
+
+######################################
+#     Tests for get_shard_weight     #
+######################################
+
+
+def test_get_shard_weight_metadata(tmp_path: Path) -> None:
+    assert get_shard_weight(FileShard(uri="uri", path=tmp_path, metadata={NBYTES: 42})) == 42
+
+
+def test_get_shard_weight_file_size(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    assert get_shard_weight(JsonShard(uri=shard.get_uri(), path=shard.path)) == 9
+
+
+def test_get_shard_weight_missing_file(tmp_path: Path) -> None:
+    assert get_shard_weight(JsonShard(uri="uri", path=tmp_path.joinpath("missing.json"))) == 1
+
+
+def test_get_shard_weight_in_memory() -> None:
+    assert get_shard_weight(InMemoryShard([1, 2, 3])) == 1
+
+
+######################################
+#     Tests for partition_shards     #
+######################################
+
+
+def test_partition_shards_balanced(tmp_path: Path) -> None:
+    assert get_uris(partition_shards(create_shards(tmp_path, [50, 10, 20, 30, 40]), 2)) == [
+        ["uri0", "uri1", "uri2"],
+        ["uri3", "uri4"],
+    ]
+
+
+def test_partition_shards_one_partition(tmp_path: Path) -> None:
+    assert get_uris(partition_shards(create_shards(tmp_path, [3, 1, 2]), 1)) == [
+        ["uri0", "uri1", "uri2"]
+    ]
+
+
+def test_partition_shards_more_partitions_than_shards(tmp_path: Path) -> None:
+    assert get_uris(partition_shards(create_shards(tmp_path, [1, 2]), 4)) == [
+        ["uri1"],
+        ["uri0"],
+        [],
+        [],
+    ]
+
+
+def test_partition_shards_same_weight(tmp_path: Path) -> None:
+    assert get_uris(partition_shards(create_shards(tmp_path, [1, 1, 1, 1, 1]), 2)) == [
+        ["uri0", "uri2", "uri4"],
+        ["uri1", "uri3"],
+    ]
+
+
+def test_partition_shards_empty() -> None:
+    assert partition_shards([], 2) == [(), ()]
+
+
+def test_partition_shards_disjoint_and_complete(tmp_path: Path) -> None:
+    shards = create_shards(tmp_path, [7, 3, 9, 1, 4, 4, 8, 2, 6, 5])
+    partitions = partition_shards(shards, 3)
+    uris = [uri for partition in get_uris(partitions) for uri in partition]
+    assert sorted(uris) == sorted(shard.get_uri() for shard in shards)
+    loads = [sum(shard.get_metadata()[NBYTES] for shard in partition) for partition in partitions]
+    assert max(loads) - min(loads) <= 9
+
+
+def test_partition_shards_deterministic(tmp_path: Path) -> None:
+    shards = create_shards(tmp_path, [7, 3, 9, 1, 4, 4, 8, 2, 6, 5])
+    assert get_uris(partition_shards(shards, 3)) == get_uris(partition_shards(shards, 3))
+
+
+@pytest.mark.parametrize("num_partitions", [0, -1])
+def test_partition_shards_incorrect_num_partitions(tmp_path: Path, num_partitions: int) -> None:
+    with pytest.raises(ValueError, match=r"num_partitions must be positive"):
+        partition_shards(create_shards(tmp_path, [1, 2]), num_partitions)
+
+
+######################################
+#     Tests for select_partition     #
+######################################
+
+
+def test_select_partition(tmp_path: Path) -> None:
+    shards = create_shards(tmp_path, [50, 10, 20, 30, 40])
+    assert get_uris([select_partition(shards, rank=0, world_size=2)]) == [["uri0", "uri1", "uri2"]]
+    assert get_uris([select_partition(shards, rank=1, world_size=2)]) == [["uri3", "uri4"]]
+
+
+@pytest.mark.parametrize("rank", [-1, 2, 3])
+def test_select_partition_incorrect_rank(tmp_path: Path, rank: int) -> None:
+    with pytest.raises(ValueError, match=r"rank must be in \[0, 2\)"):
+        select_partition(create_shards(tmp_path, [1, 2]), rank=rank, world_size=2)
+
+
+def test_select_partition_incorrect_world_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match=r"world_size must be positive"):
+        select_partition(create_shards(tmp_path, [1, 2]), rank=0, world_size=0)
+
+
+#######################################
+#     Tests for get_worker_shards     #
+#######################################
+
+
+def test_get_worker_shards_main_process(tmp_path: Path) -> None:
+    shards = create_shards(tmp_path, [1, 2, 3])
+    assert get_worker_shards(shards) == tuple(shards)
+
+
+@torch_available
+def test_get_worker_shards_worker(tmp_path: Path) -> None:
+    shards = create_shards(tmp_path, [50, 10, 20, 30, 40])
+    with patch("torch.utils.data.get_worker_info", Mock(return_value=Mock(id=1, num_workers=2))):
+        assert get_uris([get_worker_shards(shards)]) == [["uri3", "uri4"]]
+
+
+def test_get_worker_shards_no_torch(tmp_path: Path) -> None:
+    shards = create_shards(tmp_path, [1, 2, 3])
+    with patch.dict(sys.modules, {"torch": None}):
+        assert get_worker_shards(shards) == tuple(shards)
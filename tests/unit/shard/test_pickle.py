@@ -6,7 +6,7 @@ import pytest
 from coola.equality import objects_are_equal
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA, NBYTES
 from iden.io import load_json
 from iden.shard import PickleShard, create_pickle_shard
 
@@ -172,7 +172,7 @@ def test_create_pickle_shard(tmp_path: Path) -> None:
 
     assert uri_file.is_file()
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {"path": path.as_posix(), METADATA: {NBYTES: path.stat().st_size}},
         LOADER: {OBJECT_TARGET: "iden.shard.loader.PickleShardLoader"},
     }
     assert shard.equal(PickleShard(uri=uri, path=path))
@@ -186,7 +186,7 @@ def test_create_pickle_shard_with_data(tmp_path: Path) -> None:
     shard = create_pickle_shard(data={"key1": [1, 2, 3], "key2": "abc"}, uri=uri, path=path)
 
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {"path": path.as_posix(), METADATA: {NBYTES: path.stat().st_size}},
         LOADER: {OBJECT_TARGET: "iden.shard.loader.PickleShardLoader"},
     }
     assert shard.equal(PickleShard(uri=uri, path=path))
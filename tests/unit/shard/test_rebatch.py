@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+from coola.equality import objects_are_equal
+from coola.testing.fixtures import numpy_available, torch_available
+from coola.utils.imports import is_numpy_available, is_torch_available
+
+from iden.data.records import empty_records
+from iden.shard import InMemoryShard
+from iden.shard.rebatch import RebatchShardIterable
+
+if is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    np = Mock()
+
+if is_torch_available():
+    import torch
+else:  # pragma: no cover
+    torch = Mock()
+
+
+##########################################
+#     Tests for RebatchShardIterable     #
+##########################################
+
+
+def test_rebatch_shard_iterable_repr() -> None:
+    assert repr(RebatchShardIterable([], batch_size=4)) == (
+        "RebatchShardIterable(batch_size=4, drop_last=False, reuse_buffers=True, num_prefetch=0)"
+    )
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_rebatch_shard_iterable_incorrect_batch_size(batch_size: int) -> None:
+    with pytest.raises(ValueError, match=r"batch_size must be positive"):
+        RebatchShardIterable([], batch_size=batch_size)
+
+
+def test_rebatch_shard_iterable_incorrect_num_prefetch() -> None:
+    with pytest.raises(ValueError, match=r"num_prefetch must be positive or zero"):
+        RebatchShardIterable([], batch_size=2, num_prefetch=-1)
+
+
+def test_rebatch_shard_iterable_empty() -> None:
+    assert list(RebatchShardIterable([], batch_size=2)) == []
+
+
+@numpy_available
+def test_rebatch_shard_iterable_numpy() -> None:
+    shards = [InMemoryShard(np.arange(5)), InMemoryShard(np.arange(5, 8))]
+    batches = [batch.tolist() for batch in RebatchShardIterable(shards, batch_size=3)]
+    assert batches == [[0, 1, 2], [3, 4, 5], [6, 7]]
+
+
+@numpy_available
+def test_rebatch_shard_iterable_numpy_drop_last() -> None:
+    shards = [InMemoryShard(np.arange(5)), InMemoryShard(np.arange(5, 8))]
+    batches = [
+        batch.tolist() for batch in RebatchShardIterable(shards, batch_size=3, drop_last=True)
+    ]
+    assert batches == [[0, 1, 2], [3, 4, 5]]
+
+
+@numpy_available
+def test_rebatch_shard_iterable_numpy_batch_larger_than_shards() -> None:
+    shards = [InMemoryShard(np.arange(i * 2, i * 2 + 2)) for i in range(5)]
+    batches = [batch.tolist() for batch in RebatchShardIterable(shards, batch_size=4)]
+    assert batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+@numpy_available
+def test_rebatch_shard_iterable_numpy_empty_shard() -> None:
+    shards = [
+        InMemoryShard(np.arange(3)),
+        InMemoryShard(np.arange(0)),
+        InMemoryShard(np.arange(3, 6)),
+    ]
+    batches = [batch.tolist() for batch in RebatchShardIterable(shards, batch_size=2)]
+    assert batches == [[0, 1], [2, 3], [4, 5]]
+
+
+@numpy_available
+def test_rebatch_shard_iterable_numpy_view_inside_shard() -> None:
+    data = np.arange(6)
+    batches = list(RebatchShardIterable([InMemoryShard(data)], batch_size=3))
+    assert all(np.shares_memory(batch, data) for batch in batches)
+
+
+@numpy_available
+def test_rebatch_shard_iterable_reuse_buffers() -> None:
+    shards = [InMemoryShard(np.arange(i * 3, i * 3 + 3)) for i in range(4)]
+    batches = list(RebatchShardIterable(shards, batch_size=2))
+    # the batches 1 and 4 span two shards so they are copied in the buffer
+    assert batches[1] is batches[4]
+    assert batches[1].base is None
+
+
+@numpy_available
+def test_rebatch_shard_iterable_reuse_buffers_false() -> None:
+    shards = [InMemoryShard(np.arange(i * 3, i * 3 + 3)) for i in range(4)]
+    batches = list(RebatchShardIterable(shards, batch_size=2, reuse_buffers=False))
+    assert batches[1] is not batches[4]
+    assert [batch.tolist() for batch in batches] == [
+        [0, 1],
+        [2, 3],
+        [4, 5],
+        [6, 7],
+        [8, 9],
+        [10, 11],
+    ]
+
+
+@numpy_available
+def test_rebatch_shard_iterable_reuse_buffers_false_lazy_allocation() -> None:
+    shards = [InMemoryShard(np.arange(i * 4, i * 4 + 4)) for i in range(3)]
+    with patch("iden.shard.rebatch.empty_records", wraps=empty_records) as empty:
+        batches = list(RebatchShardIterable(shards, batch_size=2, reuse_buffers=False))
+    assert len(batches) == 6
+    assert all(call.args[1] == 0 for call in empty.call_args_list)
+
+
+@numpy_available
+def test_rebatch_shard_iterable_reuse_buffers_false_allocation_per_copied_batch() -> None:
+    shards = [InMemoryShard(np.arange(i * 3, i * 3 + 3)) for i in range(4)]
+    with patch("iden.shard.rebatch.empty_records", wraps=empty_records) as empty:
+        list(RebatchShardIterable(shards, batch_size=2, reuse_buffers=False))
+    # only the batches 1 and 4 span two shards
+    assert [call.args[1] for call in empty.call_args_list].count(2) == 2
+
+
+@numpy_available
+def test_rebatch_shard_iterable_numpy_dict() -> None:
+    shards = [
+        InMemoryShard({"key1": np.ones((3, 2)), "key2": np.arange(3)}),
+        InMemoryShard({"key1": np.zeros((2, 2)), "key2": np.arange(3, 5)}),
+    ]
+    batches = [
+        {key: value.copy() for key, value in batch.items()}
+        for batch in RebatchShardIterable(shards, batch_size=4)
+    ]
+    assert objects_are_equal(
+        batches,
+        [
+            {
+                "key1": np.array([[1.0, 1.0], [1.0, 1.0], [1.0, 1.0], [0.0, 0.0]]),
+                "key2": np.array([0, 1, 2, 3]),
+            },
+            {"key1": np.array([[0.0, 0.0]]), "key2": np.array([4])},
+        ],
+    )
+
+
+@torch_available
+def test_rebatch_shard_iterable_torch_dict() -> None:
+    shards = [
+        InMemoryShard({"key1": torch.ones(3, 2), "key2": torch.arange(3)}),
+        InMemoryShard({"key1": torch.zeros(3, 2), "key2": torch.arange(3, 6)}),
+    ]
+    batches = [
+        {key: value.clone() for key, value in batch.items()}
+        for batch in RebatchShardIterable(shards, batch_size=2, num_prefetch=2)
+    ]
+    assert objects_are_equal(
+        batches,
+        [
+            {"key1": torch.ones(2, 2), "key2": torch.tensor([0, 1])},
+            {"key1": torch.tensor([[1.0, 1.0], [0.0, 0.0]]), "key2": torch.tensor([2, 3])},
+            {"key1": torch.zeros(2, 2), "key2": torch.tensor([4, 5])},
+        ],
+    )
+
+
+def test_rebatch_shard_iterable_list() -> None:
+    shards = [InMemoryShard([1, 2, 3]), InMemoryShard([4, 5, 6, 7])]
+    batches = [list(batch) for batch in RebatchShardIterable(shards, batch_size=2)]
+    assert batches == [[1, 2], [3, 4], [5, 6], [7]]
+
+
+def test_rebatch_shard_iterable_no_record_structure() -> None:
+    with pytest.raises(TypeError, match=r"The data do not have a record structure"):
+        list(RebatchShardIterable([InMemoryShard(42)], batch_size=2))
+
+
+@numpy_available
+def test_rebatch_shard_iterable_different_keys() -> None:
+    shards = [InMemoryShard({"key1": np.arange(3)}), InMemoryShard({"key2": np.arange(3)})]
+    with pytest.raises(ValueError, match=r"do not have the same keys"):
+        list(RebatchShardIterable(shards, batch_size=2))
+
+
+@numpy_available
+def test_rebatch_shard_iterable_numpy_promote_dtype() -> None:
+    shards = [InMemoryShard(np.array([1, 2, 3, 4])), InMemoryShard(np.array([0.5, 1.5]))]
+    batches = list(RebatchShardIterable(shards, batch_size=3))
+    assert objects_are_equal(batches, [np.array([1, 2, 3]), np.array([4.0, 0.5, 1.5])])
+
+
+@numpy_available
+def test_rebatch_shard_iterable_numpy_buffer_dtype_of_shard() -> None:
+    shards = [InMemoryShard(np.array([1.0, 2.0, 3.0, 4.0])), InMemoryShard(np.arange(5, 11))]
+    batches = list(RebatchShardIterable(shards, batch_size=3))
+    assert objects_are_equal(
+        batches,
+        [
+            np.array([1.0, 2.0, 3.0]),
+            np.array([4.0, 5.0, 6.0]),
+            np.array([7, 8, 9]),
+            np.array([10]),
+        ],
+    )
+
+
+@torch_available
+def test_rebatch_shard_iterable_torch_promote_dtype() -> None:
+    shards = [InMemoryShard(torch.tensor([1, 2, 3, 4])), InMemoryShard(torch.tensor([0.5, 1.5]))]
+    batches = list(RebatchShardIterable(shards, batch_size=3))
+    assert objects_are_equal(batches, [torch.tensor([1, 2, 3]), torch.tensor([4.0, 0.5, 1.5])])
+
+
+@numpy_available
+def test_rebatch_shard_iterable_numpy_different_record_shape() -> None:
+    shards = [InMemoryShard(np.ones((3, 2))), InMemoryShard(np.ones((3, 3)))]
+    with pytest.raises(ValueError, match=r"do not have the same record shape"):
+        list(RebatchShardIterable(shards, batch_size=2))
+
+
+def test_rebatch_shard_iterable_tuple() -> None:
+    iterator = iter(RebatchShardIterable([InMemoryShard((1, 2, 3, 4))], batch_size=2))
+    with pytest.raises(TypeError, match=r"a tuple cannot be filled in-place"):
+        next(iterator)
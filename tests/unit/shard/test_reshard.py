@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import pytest
+from coola.equality import objects_are_equal
+from coola.testing.fixtures import numpy_available
+from coola.utils.imports import is_numpy_available
+from objectory import OBJECT_TARGET
+
+from iden.data.generator import DataGenerator
+from iden.shard import (
+    InMemoryShard,
+    ShardTuple,
+    create_json_shard,
+    reshard,
+)
+from iden.shard.generator import JsonShardGenerator, PickleShardGenerator
+
+if is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    np = Mock()
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def create_generator(path: Path) -> JsonShardGenerator:
+    return JsonShardGenerator(
+        data=DataGenerator(None),
+        path_uri=path.joinpath("new/uri"),
+        path_shard=path.joinpath("new/data"),
+    )
+
+
+#############################
+#     Tests for reshard     #
+#############################
+
+
+@pytest.mark.parametrize("num_workers", [1, 2, 4])
+def test_reshard_num_records_merge(tmp_path: Path, num_workers: int) -> None:
+    shards = [
+        create_json_shard([i], uri=tmp_path.joinpath(f"shards/uri{i}").as_uri()) for i in range(7)
+    ]
+    new = reshard(
+        shards,
+        create_generator(tmp_path),
+        uri=tmp_path.joinpath("new/tuple").as_uri(),
+        num_records=3,
+        num_workers=num_workers,
+    )
+    assert isinstance(new, ShardTuple)
+    assert [shard.get_data() for shard in new] == [[0, 1, 2], [3, 4, 5], [6]]
+    assert new.is_sorted_by_uri()
+    assert new.get_uri() == tmp_path.joinpath("new/tuple").as_uri()
+    assert ShardTuple.from_uri(new.get_uri()).equal(new)
+
+
+def test_reshard_num_records_split(tmp_path: Path) -> None:
+    shards = [create_json_shard(list(range(5)), uri=tmp_path.joinpath("shards/uri").as_uri())]
+    new = reshard(
+        shards,
+        create_generator(tmp_path),
+        uri=tmp_path.joinpath("new/tuple").as_uri(),
+        num_records=2,
+    )
+    assert [shard.get_data() for shard in new] == [[0, 1], [2, 3], [4]]
+    assert [shard.get_uri() for shard in new] == [
+        tmp_path.joinpath("new/uri/000000001").as_uri(),
+        tmp_path.joinpath("new/uri/000000002").as_uri(),
+        tmp_path.joinpath("new/uri/000000003").as_uri(),
+    ]
+
+
+def test_reshard_empty(tmp_path: Path) -> None:
+    new = reshard(
+        [], create_generator(tmp_path), uri=tmp_path.joinpath("new/tuple").as_uri(), num_records=2
+    )
+    assert len(new) == 0
+
+
+def test_reshard_empty_shard(tmp_path: Path) -> None:
+    new = reshard(
+        [InMemoryShard([]), InMemoryShard([1, 2, 3])],
+        create_generator(tmp_path),
+        uri=tmp_path.joinpath("new/tuple").as_uri(),
+        num_records=2,
+    )
+    assert [shard.get_data() for shard in new] == [[1, 2], [3]]
+
+
+def test_reshard_generator_config(tmp_path: Path) -> None:
+    new = reshard(
+        [InMemoryShard([1, 2, 3])],
+        {
+            OBJECT_TARGET: "iden.shard.generator.PickleShardGenerator",
+            "data": DataGenerator(None),
+            "path_uri": tmp_path.joinpath("new/uri"),
+            "path_shard": tmp_path.joinpath("new/data"),
+        },
+        uri=tmp_path.joinpath("new/tuple").as_uri(),
+        num_records=2,
+    )
+    assert [shard.get_data() for shard in new] == [[1, 2], [3]]
+
+
+@numpy_available
+def test_reshard_num_bytes_numpy(tmp_path: Path) -> None:
+    generator = PickleShardGenerator(
+        data=DataGenerator(None),
+        path_uri=tmp_path.joinpath("new/uri"),
+        path_shard=tmp_path.joinpath("new/data"),
+    )
+    shards = [
+        InMemoryShard({"key1": np.arange(10, dtype=np.int64), "key2": np.ones((10, 3))}),
+        InMemoryShard({"key1": np.arange(10, 15, dtype=np.int64), "key2": np.zeros((5, 3))}),
+    ]
+    # 32 bytes per record
+    new = reshard(shards, generator, uri=tmp_path.joinpath("new/tuple").as_uri(), num_bytes=200)
+    assert [len(shard.get_data()["key1"]) for shard in new] == [7, 7, 1]
+    assert objects_are_equal(
+        np.concatenate([shard.get_data()["key1"] for shard in new]), np.arange(15)
+    )
+    assert objects_are_equal(
+        new[1].get_data()["key2"], np.concatenate([np.ones((3, 3)), np.zeros((4, 3))])
+    )
+
+
+def test_reshard_num_bytes_pickle_estimate(tmp_path: Path) -> None:
+    new = reshard(
+        [InMemoryShard(list(range(100)))],
+        create_generator(tmp_path),
+        uri=tmp_path.joinpath("new/tuple").as_uri(),
+        num_bytes=1_000_000,
+    )
+    assert [shard.get_data() for shard in new] == [list(range(100))]
+
+
+def test_reshard_num_bytes_pickle_estimate_sample(tmp_path: Path) -> None:
+    data = [str(i) * 10 for i in range(1000)]
+    with patch("iden.shard.reshard.pickle.dumps", wraps=pickle.dumps) as dumps:
+        new = reshard(
+            [InMemoryShard(data)],
+            create_generator(tmp_path),
+            uri=tmp_path.joinpath("new/tuple").as_uri(),
+            num_bytes=len(pickle.dumps(data)) // 4,
+        )
+    assert len(dumps.call_args.args[0]) == 64
+    assert 3 <= len(new) <= 5
+    assert [record for shard in new for record in shard.get_data()] == data
+
+
+@pytest.mark.parametrize(("num_records", "num_bytes"), [(None, None), (1, 1)])
+def test_reshard_incorrect_target(
+    tmp_path: Path, num_records: int | None, num_bytes: int | None
+) -> None:
+    with pytest.raises(ValueError, match=r"Exactly one of num_records and num_bytes must be set"):
+        reshard(
+            [],
+            create_generator(tmp_path),
+            uri=tmp_path.joinpath("new/tuple").as_uri(),
+            num_records=num_records,
+            num_bytes=num_bytes,
+        )
+
+
+def test_reshard_incorrect_target_value(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match=r"The target must be positive"):
+        reshard(
+            [],
+            create_generator(tmp_path),
+            uri=tmp_path.joinpath("new/tuple").as_uri(),
+            num_records=0,
+        )
+
+
+def test_reshard_incorrect_data(tmp_path: Path) -> None:
+    with pytest.raises(TypeError, match=r"do not have a record structure"):
+        reshard(
+            [InMemoryShard(42)],
+            create_generator(tmp_path),
+            uri=tmp_path.joinpath("new/tuple").as_uri(),
+            num_records=2,
+        )
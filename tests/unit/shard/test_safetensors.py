@@ -9,7 +9,7 @@ from coola.testing.fixtures import numpy_available, torch_available
 from coola.utils.imports import is_numpy_available, is_torch_available
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import DTYPE, FEATURES, KWARGS, LOADER, METADATA, NBYTES, SHAPE
 from iden.io import load_json
 from iden.shard import (
     NumpySafetensorsShard,
@@ -221,6 +221,41 @@ def test_numpy_safetensors_shard_get_data_multiple_calls(uri_np: str, path_np: P
     assert objects_are_equal(shard.get_data(), {"key1": np.full((2, 3), 2.0), "key2": np.arange(5)})
 
 
+@safetensors_available
+@numpy_available
+def test_numpy_safetensors_shard_get_data_keys(uri_np: str, path_np: Path) -> None:
+    shard = NumpySafetensorsShard(uri=uri_np, path=path_np)
+    assert objects_are_equal(shard.get_data_keys(["key2"]), {"key2": np.arange(5)})
+    assert not shard.is_cached()
+
+
+@safetensors_available
+@numpy_available
+def test_numpy_safetensors_shard_get_data_keys_cached(uri_np: str, path_np: Path) -> None:
+    shard = NumpySafetensorsShard(uri=uri_np, path=path_np)
+    data = shard.get_data(cache=True)
+    keys = shard.get_data_keys(["key1"])
+    assert objects_are_equal(keys, {"key1": np.ones((2, 3))})
+    assert keys["key1"] is data["key1"]
+
+
+@safetensors_available
+@numpy_available
+def test_numpy_safetensors_shard_get_data_keys_missing(uri_np: str, path_np: Path) -> None:
+    shard = NumpySafetensorsShard(uri=uri_np, path=path_np)
+    with pytest.raises(KeyError, match=r"Keys \['missing'\] do not exist"):
+        shard.get_data_keys(["missing"])
+
+
+@safetensors_available
+@numpy_available
+def test_numpy_safetensors_shard_get_data_keys_cached_missing(uri_np: str, path_np: Path) -> None:
+    shard = NumpySafetensorsShard(uri=uri_np, path=path_np)
+    shard.get_data(cache=True)
+    with pytest.raises(KeyError, match=r"Keys \['missing'\] do not exist"):
+        shard.get_data_keys(["missing"])
+
+
 @safetensors_available
 @numpy_available
 def test_numpy_safetensors_shard_get_uri(uri_np: str, path_np: Path) -> None:
@@ -430,6 +465,34 @@ def test_torch_safetensors_shard_get_data_multiple_calls(uri: str, path: Path) -
     )
 
 
+@safetensors_available
+@torch_available
+def test_torch_safetensors_shard_get_data_keys(uri: str, path: Path) -> None:
+    shard = TorchSafetensorsShard(uri=uri, path=path)
+    assert objects_are_equal(shard.get_data_keys(["key2"]), {"key2": torch.arange(5)})
+    assert not shard.is_cached()
+
+
+@safetensors_available
+@torch_available
+def test_torch_safetensors_shard_get_data_keys_cached(uri: str, path: Path) -> None:
+    shard = TorchSafetensorsShard(uri=uri, path=path)
+    data = shard.get_data(cache=True)
+    keys = shard.get_data_keys(["key1"])
+    assert objects_are_equal(keys, {"key1": torch.ones(2, 3)})
+    assert keys["key1"] is data["key1"]
+
+
+@safetensors_available
+@torch_available
+def test_torch_safetensors_shard_get_data_keys_memory() -> None:
+    shard = create_torch_safetensors_shard(
+        {"key1": torch.ones(2, 3), "key2": torch.arange(5)},
+        uri="memory://test-torch-safetensors-shard/uri",
+    )
+    assert objects_are_equal(shard.get_data_keys(["key2"]), {"key2": torch.arange(5)})
+
+
 @safetensors_available
 @torch_available
 def test_torch_safetensors_shard_get_uri(uri: str, path: Path) -> None:
@@ -500,7 +563,16 @@ def test_create_numpy_safetensors_shard(tmp_path: Path) -> None:
 
     assert uri_file.is_file()
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {
+            "path": path.as_posix(),
+            METADATA: {
+                NBYTES: path.stat().st_size,
+                FEATURES: {
+                    "key1": {SHAPE: [2, 3], DTYPE: "float64"},
+                    "key2": {SHAPE: [5], DTYPE: "int64"},
+                },
+            },
+        },
         LOADER: {OBJECT_TARGET: "iden.shard.loader.NumpySafetensorsShardLoader"},
     }
     assert shard.equal(NumpySafetensorsShard(uri=uri, path=path))
@@ -518,7 +590,16 @@ def test_create_numpy_safetensors_shard_with_data(tmp_path: Path) -> None:
     )
 
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {
+            "path": path.as_posix(),
+            METADATA: {
+                NBYTES: path.stat().st_size,
+                FEATURES: {
+                    "key1": {SHAPE: [2, 3], DTYPE: "float64"},
+                    "key2": {SHAPE: [5], DTYPE: "int64"},
+                },
+            },
+        },
         LOADER: {OBJECT_TARGET: "iden.shard.loader.NumpySafetensorsShardLoader"},
     }
     assert shard.equal(NumpySafetensorsShard(uri=uri, path=path))
@@ -542,7 +623,16 @@ def test_create_torch_safetensors_shard(tmp_path: Path) -> None:
 
     assert uri_file.is_file()
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {
+            "path": path.as_posix(),
+            METADATA: {
+                NBYTES: path.stat().st_size,
+                FEATURES: {
+                    "key1": {SHAPE: [2, 3], DTYPE: "float32"},
+                    "key2": {SHAPE: [5], DTYPE: "int64"},
+                },
+            },
+        },
         LOADER: {OBJECT_TARGET: "iden.shard.loader.TorchSafetensorsShardLoader"},
     }
     assert shard.equal(TorchSafetensorsShard(uri=uri, path=path))
@@ -560,7 +650,16 @@ def test_create_torch_safetensors_shard_with_data(tmp_path: Path) -> None:
     )
 
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {
+            "path": path.as_posix(),
+            METADATA: {
+                NBYTES: path.stat().st_size,
+                FEATURES: {
+                    "key1": {SHAPE: [2, 3], DTYPE: "float32"},
+                    "key2": {SHAPE: [5], DTYPE: "int64"},
+                },
+            },
+        },
         LOADER: {OBJECT_TARGET: "iden.shard.loader.TorchSafetensorsShardLoader"},
     }
     assert shard.equal(TorchSafetensorsShard(uri=uri, path=path))
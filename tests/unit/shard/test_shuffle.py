@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from coola.equality import objects_are_equal
+from coola.testing.fixtures import numpy_available, torch_available
+from coola.utils.imports import is_numpy_available, is_torch_available
+
+from iden.shard import BaseShard, InMemoryShard
+from iden.shard.shuffle import ShuffleShardIterable, shuffle_shards
+
+if is_numpy_available():
+    import numpy as np
+else:  # pragma: no cover
+    np = Mock()
+
+if is_torch_available():
+    import torch
+else:  # pragma: no cover
+    torch = Mock()
+
+
+def create_shards(num_shards: int = 10, num_records: int = 10) -> list[BaseShard]:
+    return [
+        InMemoryShard(list(range(i * num_records, (i + 1) * num_records)))
+        for i in range(num_shards)
+    ]
+
+
+####################################
+#     Tests for shuffle_shards     #
+####################################
+
+
+def test_shuffle_shards_permutation() -> None:
+    shards = create_shards()
+    shuffled = shuffle_shards(shards, seed=1, epoch=0)
+    assert len(shuffled) == len(shards)
+    assert {id(shard) for shard in shuffled} == {id(shard) for shard in shards}
+    assert shuffled != shards
+
+
+def test_shuffle_shards_deterministic() -> None:
+    shards = create_shards()
+    assert shuffle_shards(shards, seed=1, epoch=3) == shuffle_shards(shards, seed=1, epoch=3)
+
+
+def test_shuffle_shards_different_epoch() -> None:
+    shards = create_shards()
+    assert shuffle_shards(shards, seed=1, epoch=0) != shuffle_shards(shards, seed=1, epoch=1)
+
+
+def test_shuffle_shards_different_seed() -> None:
+    shards = create_shards()
+    assert shuffle_shards(shards, seed=1, epoch=0) != shuffle_shards(shards, seed=2, epoch=0)
+
+
+def test_shuffle_shards_does_not_modify_input() -> None:
+    shards = create_shards()
+    copy = list(shards)
+    shuffle_shards(shards, seed=1)
+    assert shards == copy
+
+
+def test_shuffle_shards_empty() -> None:
+    assert shuffle_shards([]) == []
+
+
+##########################################
+#     Tests for ShuffleShardIterable     #
+##########################################
+
+
+def test_shuffle_shard_iterable_repr() -> None:
+    assert repr(ShuffleShardIterable(create_shards(), buffer_size=8, seed=1, epoch=2)) == (
+        "ShuffleShardIterable(num_shards=10, buffer_size=8, seed=1, epoch=2, num_prefetch=0)"
+    )
+
+
+@pytest.mark.parametrize("buffer_size", [0, 1, 7, 32, 1000])
+@pytest.mark.parametrize("num_prefetch", [0, 2])
+def test_shuffle_shard_iterable_iter_all_records(buffer_size: int, num_prefetch: int) -> None:
+    records = list(
+        ShuffleShardIterable(
+            create_shards(), buffer_size=buffer_size, seed=1, num_prefetch=num_prefetch
+        )
+    )
+    assert sorted(records) == list(range(100))
+    assert records != list(range(100))
+
+
+def test_shuffle_shard_iterable_iter_deterministic() -> None:
+    shards = create_shards()
+    assert list(ShuffleShardIterable(shards, buffer_size=16, seed=1, epoch=2)) == list(
+        ShuffleShardIterable(shards, buffer_size=16, seed=1, epoch=2)
+    )
+
+
+def test_shuffle_shard_iterable_iter_prefetch_same_order() -> None:
+    shards = create_shards()
+    assert list(ShuffleShardIterable(shards, buffer_size=16, seed=1)) == list(
+        ShuffleShardIterable(shards, buffer_size=16, seed=1, num_prefetch=3)
+    )
+
+
+def test_shuffle_shard_iterable_set_epoch() -> None:
+    iterable = ShuffleShardIterable(create_shards(), buffer_size=16, seed=1)
+    records0 = list(iterable)
+    iterable.set_epoch(1)
+    assert iterable.epoch == 1
+    records1 = list(iterable)
+    assert records0 != records1
+    assert sorted(records0) == sorted(records1)
+
+
+def test_shuffle_shard_iterable_buffer_size_0_stays_in_shard() -> None:
+    records = list(ShuffleShardIterable(create_shards(), buffer_size=0, seed=1))
+    for i in range(10):
+        chunk = records[i * 10 : (i + 1) * 10]
+        assert len({record // 10 for record in chunk}) == 1
+
+
+def test_shuffle_shard_iterable_mixes_shards() -> None:
+    records = list(ShuffleShardIterable(create_shards(), buffer_size=40, seed=1))
+    assert len({record // 10 for record in records[:10]}) > 1
+
+
+def test_shuffle_shard_iterable_empty() -> None:
+    assert list(ShuffleShardIterable([], buffer_size=4)) == []
+
+
+def test_shuffle_shard_iterable_empty_shards() -> None:
+    shards = [InMemoryShard([]), InMemoryShard([1, 2]), InMemoryShard([])]
+    assert sorted(ShuffleShardIterable(shards, buffer_size=4)) == [1, 2]
+
+
+@numpy_available
+def test_shuffle_shard_iterable_dict_numpy() -> None:
+    shards = [
+        InMemoryShard({"x": np.arange(i * 5, (i + 1) * 5), "y": np.arange(i * 5, (i + 1) * 5) * 2})
+        for i in range(4)
+    ]
+    records = list(ShuffleShardIterable(shards, buffer_size=8, seed=1))
+    assert sorted(int(record["x"]) for record in records) == list(range(20))
+    assert all(record["y"] == 2 * record["x"] for record in records)
+
+
+@torch_available
+def test_shuffle_shard_iterable_torch() -> None:
+    shards = [InMemoryShard(torch.arange(i * 5, (i + 1) * 5)) for i in range(4)]
+    records = list(ShuffleShardIterable(shards, buffer_size=8, seed=1))
+    assert objects_are_equal(torch.stack(records).sort().values, torch.arange(20))
+
+
+def test_shuffle_shard_iterable_invalid_data() -> None:
+    with pytest.raises(TypeError, match=r"do not have a record structure"):
+        list(ShuffleShardIterable([InMemoryShard(42)]))
+
+
+def test_shuffle_shard_iterable_incorrect_buffer_size() -> None:
+    with pytest.raises(ValueError, match=r"buffer_size must be positive or zero"):
+        ShuffleShardIterable([], buffer_size=-1)
+
+
+def test_shuffle_shard_iterable_incorrect_num_prefetch() -> None:
+    with pytest.raises(ValueError, match=r"num_prefetch must be positive or zero"):
+        ShuffleShardIterable([], num_prefetch=-1)
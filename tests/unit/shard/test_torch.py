@@ -9,7 +9,7 @@ from coola.testing.fixtures import torch_available
 from coola.utils.imports import is_torch_available
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import DTYPE, FEATURES, KWARGS, LOADER, METADATA, NBYTES, SHAPE
 from iden.io import load_json
 from iden.shard import TorchShard, create_torch_shard
 
@@ -224,7 +224,16 @@ def test_create_torch_shard(tmp_path: Path) -> None:
 
     assert uri_file.is_file()
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {
+            "path": path.as_posix(),
+            METADATA: {
+                NBYTES: path.stat().st_size,
+                FEATURES: {
+                    "key1": {SHAPE: [2, 3], DTYPE: "float32"},
+                    "key2": {SHAPE: [5], DTYPE: "int64"},
+                },
+            },
+        },
         LOADER: {OBJECT_TARGET: "iden.shard.loader.TorchShardLoader"},
     }
     assert shard.equal(TorchShard(uri=uri, path=path))
@@ -241,7 +250,16 @@ def test_create_torch_shard_with_data(tmp_path: Path) -> None:
     )
 
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {
+            "path": path.as_posix(),
+            METADATA: {
+                NBYTES: path.stat().st_size,
+                FEATURES: {
+                    "key1": {SHAPE: [2, 3], DTYPE: "float32"},
+                    "key2": {SHAPE: [5], DTYPE: "int64"},
+                },
+            },
+        },
         LOADER: {OBJECT_TARGET: "iden.shard.loader.TorchShardLoader"},
     }
     assert shard.equal(TorchShard(uri=uri, path=path))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 from coola.equality import objects_are_equal
@@ -14,7 +15,9 @@ from iden.shard import (
     ShardTuple,
     create_json_shard,
     create_shard_tuple,
+    extend_shard_tuple,
 )
+from iden.shard.exceptions import ShardExistsError
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -120,6 +123,51 @@ def test_shard_tuple_equal_false_equal_nan(tmp_path: Path) -> None:
     )
 
 
+def test_shard_tuple_equal_fingerprint(uri: str, shards: Sequence[BaseShard]) -> None:
+    with patch("coola.equality.objects_are_equal") as equal:
+        assert ShardTuple(uri=uri, shards=shards).equal(ShardTuple(uri=uri, shards=shards))
+    equal.assert_not_called()
+
+
+def test_shard_tuple_get_fingerprint(uri: str, shards: Sequence[BaseShard]) -> None:
+    fingerprint = ShardTuple(uri=uri, shards=shards).get_fingerprint()
+    assert len(fingerprint) == 64
+    assert fingerprint == ShardTuple(uri=uri, shards=shards).get_fingerprint()
+
+
+def test_shard_tuple_get_fingerprint_different_uri(uri: str, shards: Sequence[BaseShard]) -> None:
+    assert (
+        ShardTuple(uri=uri, shards=shards).get_fingerprint()
+        != ShardTuple(uri=uri + "123", shards=shards).get_fingerprint()
+    )
+
+
+def test_shard_tuple_get_fingerprint_different_shards(
+    uri: str, shards: Sequence[BaseShard]
+) -> None:
+    assert (
+        ShardTuple(uri=uri, shards=shards).get_fingerprint()
+        != ShardTuple(uri=uri, shards=shards[::-1]).get_fingerprint()
+    )
+
+
+def test_shard_tuple_get_fingerprint_cached(uri: str, shards: Sequence[BaseShard]) -> None:
+    shard = ShardTuple(uri=uri, shards=shards)
+    fingerprint = shard.get_fingerprint()
+    with patch.object(JsonShard, "get_fingerprint") as get_fingerprint:
+        assert shard.get_fingerprint() == fingerprint
+    get_fingerprint.assert_not_called()
+
+
+def test_shard_tuple_get_fingerprint_in_memory(tmp_path: Path, shards: Sequence[BaseShard]) -> None:
+    assert (
+        ShardTuple(
+            uri=tmp_path.joinpath("uri").as_uri(), shards=[*shards, InMemoryShard([1, 2])]
+        ).get_fingerprint()
+        is None
+    )
+
+
 def test_shard_tuple_get(uri: str, shards: Sequence[BaseShard], path_shard: Path) -> None:
     sl = ShardTuple(uri=uri, shards=shards)
     assert sl.get(0).equal(JsonShard.from_uri(uri=path_shard.joinpath("uri1").as_uri()))
@@ -265,3 +313,49 @@ def test_create_shard_tuple(tmp_path: Path, shards: Sequence[BaseShard], path_sh
             JsonShard.from_uri(uri=path_shard.joinpath("uri3").as_uri()),
         ),
     )
+
+
+########################################
+#     Tests for extend_shard_tuple     #
+########################################
+
+
+def test_extend_shard_tuple(tmp_path: Path, shards: Sequence[BaseShard]) -> None:
+    uri_file = tmp_path.joinpath("my_uri")
+    shard = create_shard_tuple(shards=shards[1:], uri=uri_file.as_uri())
+    new_shard = create_json_shard([9], uri=tmp_path.joinpath("uri4").as_uri())
+    shard = extend_shard_tuple(shard, [new_shard, shards[0]])
+
+    assert shard.get_uri() == uri_file.as_uri()
+    assert shard.is_sorted_by_uri()
+    assert objects_are_equal(shard.get_data(), (*shards, new_shard))
+    assert load_json(uri_file)[SHARDS] == [
+        shards[0].get_uri(),
+        shards[1].get_uri(),
+        shards[2].get_uri(),
+        new_shard.get_uri(),
+    ]
+    assert ShardTuple.from_uri(uri_file.as_uri()).equal(shard)
+
+
+def test_extend_shard_tuple_empty(tmp_path: Path, shards: Sequence[BaseShard]) -> None:
+    uri_file = tmp_path.joinpath("my_uri")
+    shard = extend_shard_tuple(create_shard_tuple(shards=shards, uri=uri_file.as_uri()), [])
+    assert shard.equal(ShardTuple(uri=uri_file.as_uri(), shards=shards))
+    assert load_json(uri_file)[SHARDS] == [shard.get_uri() for shard in shards]
+
+
+def test_extend_shard_tuple_duplicate(tmp_path: Path, shards: Sequence[BaseShard]) -> None:
+    uri_file = tmp_path.joinpath("my_uri")
+    shard = create_shard_tuple(shards=shards, uri=uri_file.as_uri())
+    with pytest.raises(ShardExistsError, match=r"already exists"):
+        extend_shard_tuple(shard, [shards[1]])
+    assert load_json(uri_file)[SHARDS] == [shard.get_uri() for shard in shards]
+
+
+def test_extend_shard_tuple_duplicate_new_shards(
+    tmp_path: Path, shards: Sequence[BaseShard]
+) -> None:
+    shard = create_shard_tuple(shards=[], uri=tmp_path.joinpath("my_uri").as_uri())
+    with pytest.raises(ShardExistsError, match=r"already exists"):
+        extend_shard_tuple(shard, [shards[0], shards[0]])
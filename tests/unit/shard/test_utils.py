@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
 
 import pytest
 from coola.equality import objects_are_equal
 
+from iden.constants import NBYTES
 from iden.shard import (
     BaseShard,
     JsonShard,
+    create_compact_shard_tuple,
     create_json_shard,
+    create_shard_dict,
+    create_shard_tuple,
     get_dict_uris,
     get_list_uris,
     sort_by_uri,
 )
-from iden.shard.utils import ShardIterable
+from iden.shard.utils import (
+    PrefetchShardIterable,
+    ShardIterable,
+    get_data_nbytes,
+    walk_shards,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -53,6 +65,101 @@ def test_shard_iterable_iter_empty() -> None:
     assert objects_are_equal(list(ShardIterable([])), [])
 
 
+###########################################
+#     Tests for PrefetchShardIterable     #
+###########################################
+
+
+def test_prefetch_shard_iterable_repr() -> None:
+    assert (
+        repr(PrefetchShardIterable([], num_prefetch=2)) == "PrefetchShardIterable(num_prefetch=2)"
+    )
+
+
+@pytest.mark.parametrize("num_prefetch", [1, 2, 5])
+def test_prefetch_shard_iterable_iter(shards: Iterable[BaseShard], num_prefetch: int) -> None:
+    assert objects_are_equal(
+        list(PrefetchShardIterable(shards, num_prefetch=num_prefetch)),
+        [[1, 2, 3], [4, 5, 6, 7], [8]],
+    )
+
+
+def test_prefetch_shard_iterable_iter_empty() -> None:
+    assert list(PrefetchShardIterable([])) == []
+
+
+def test_prefetch_shard_iterable_iter_not_cached(shards: Iterable[BaseShard]) -> None:
+    list(PrefetchShardIterable(shards))
+    assert not any(shard.is_cached() for shard in shards)
+
+
+def test_prefetch_shard_iterable_iter_early_stop(shards: Iterable[BaseShard]) -> None:
+    iterator = iter(PrefetchShardIterable(shards, num_prefetch=2))
+    assert next(iterator) == [1, 2, 3]
+    iterator.close()
+
+
+@pytest.mark.parametrize("num_prefetch", [1, 2])
+def test_prefetch_shard_iterable_iter_bounded(
+    shards: Iterable[BaseShard], num_prefetch: int
+) -> None:
+    with patch.object(
+        ThreadPoolExecutor, "submit", autospec=True, side_effect=ThreadPoolExecutor.submit
+    ) as submit:
+        iterator = iter(PrefetchShardIterable(shards, num_prefetch=num_prefetch))
+        assert next(iterator) == [1, 2, 3]
+        assert submit.call_count == num_prefetch + 1
+        iterator.close()
+
+
+def test_prefetch_shard_iterable_iter_overlap() -> None:
+    started = threading.Event()
+
+    def load() -> list[int]:
+        started.set()
+        return [4, 5]
+
+    shards = [Mock(get_data=Mock(return_value=[1, 2, 3])), Mock(get_data=Mock(side_effect=load))]
+    iterator = iter(PrefetchShardIterable(shards, num_prefetch=1))
+    assert next(iterator) == [1, 2, 3]
+    # the second shard is loaded while the caller uses the first shard
+    assert started.wait(timeout=5.0)
+    assert next(iterator) == [4, 5]
+
+
+@pytest.mark.parametrize("num_prefetch", [0, -1])
+def test_prefetch_shard_iterable_incorrect_num_prefetch(num_prefetch: int) -> None:
+    with pytest.raises(ValueError, match=r"num_prefetch must be positive"):
+        PrefetchShardIterable([], num_prefetch=num_prefetch)
+
+
+#####################################
+#     Tests for get_data_nbytes     #
+#####################################
+
+
+def test_get_data_nbytes(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    assert get_data_nbytes(shard) == shard.path.stat().st_size
+
+
+def test_get_data_nbytes_missing_file(tmp_path: Path) -> None:
+    shard = JsonShard(uri="uri", path=tmp_path.joinpath("missing.json"))
+    assert get_data_nbytes(shard) == 0
+
+
+def test_get_data_nbytes_metadata(tmp_path: Path) -> None:
+    shard = JsonShard(uri="uri", path=tmp_path.joinpath("data.json"), metadata={NBYTES: 42})
+    with patch("iden.shard.utils.get_storage") as get_storage:
+        assert get_data_nbytes(shard) == 42
+    get_storage.assert_not_called()
+
+
+def test_get_data_nbytes_not_file_shard(tmp_path: Path) -> None:
+    shard = create_shard_tuple([], uri=tmp_path.joinpath("uri").as_uri())
+    assert get_data_nbytes(shard) == 0
+
+
 ###################################
 #     Tests for get_dict_uris     #
 ###################################
@@ -140,3 +247,45 @@ def test_sort_by_uri_reverse(tmp_path: Path) -> None:
 
 def test_sort_by_uri_empty() -> None:
     assert sort_by_uri([]) == []
+
+
+#################################
+#     Tests for walk_shards     #
+#################################
+
+
+def test_walk_shards(tmp_path: Path) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard2 = create_json_shard([4, 5, 6], uri=tmp_path.joinpath("uri2").as_uri())
+    shard3 = create_json_shard([7, 8], uri=tmp_path.joinpath("uri3").as_uri())
+    tuple_shard = create_shard_tuple([shard1, shard2], uri=tmp_path.joinpath("tuple").as_uri())
+    dict_shard = create_shard_dict(
+        {"a": tuple_shard, "b": shard3}, uri=tmp_path.joinpath("dict").as_uri()
+    )
+    assert list(walk_shards(dict_shard)) == [dict_shard, tuple_shard, shard1, shard2, shard3]
+
+
+def test_walk_shards_compact(tmp_path: Path) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard2 = create_json_shard([4, 5, 6], uri=tmp_path.joinpath("uri2").as_uri())
+    tuple_shard = create_compact_shard_tuple(
+        [shard1, shard2], uri=tmp_path.joinpath("tuple").as_uri()
+    )
+    shards = list(walk_shards(tuple_shard))
+    assert shards[0] is tuple_shard
+    assert objects_are_equal(shards[1:], [shard1, shard2])
+
+
+def test_walk_shards_compact_materialize_false(tmp_path: Path) -> None:
+    shard1 = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri1").as_uri())
+    shard2 = create_json_shard([4, 5, 6], uri=tmp_path.joinpath("uri2").as_uri())
+    tuple_shard = create_compact_shard_tuple([shard1], uri=tmp_path.joinpath("tuple").as_uri())
+    dict_shard = create_shard_dict(
+        {"a": tuple_shard, "b": shard2}, uri=tmp_path.joinpath("dict").as_uri()
+    )
+    assert list(walk_shards(dict_shard, materialize=False)) == [dict_shard, tuple_shard, shard2]
+
+
+def test_walk_shards_single(tmp_path: Path) -> None:
+    shard = create_json_shard([1, 2, 3], uri=tmp_path.joinpath("uri").as_uri())
+    assert list(walk_shards(shard)) == [shard]
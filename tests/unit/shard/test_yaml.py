@@ -6,7 +6,7 @@ import pytest
 from coola.equality import objects_are_equal
 from objectory import OBJECT_TARGET
 
-from iden.constants import KWARGS, LOADER
+from iden.constants import KWARGS, LOADER, METADATA, NBYTES
 from iden.io import load_json
 from iden.shard import YamlShard, create_yaml_shard
 from iden.testing import yaml_available
@@ -197,7 +197,7 @@ def test_create_yaml_shard(tmp_path: Path) -> None:
 
     assert uri_file.is_file()
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {"path": path.as_posix(), METADATA: {NBYTES: path.stat().st_size}},
         LOADER: {OBJECT_TARGET: "iden.shard.loader.YamlShardLoader"},
     }
     assert shard.equal(YamlShard(uri=uri, path=path))
@@ -212,7 +212,7 @@ def test_create_yaml_shard_with_data(tmp_path: Path) -> None:
     shard = create_yaml_shard(data={"key1": [1, 2, 3], "key2": "abc"}, uri=uri, path=path)
 
     assert load_json(uri_file) == {
-        KWARGS: {"path": path.as_posix()},
+        KWARGS: {"path": path.as_posix(), METADATA: {NBYTES: path.stat().st_size}},
         LOADER: {OBJECT_TARGET: "iden.shard.loader.YamlShardLoader"},
     }
     assert shard.equal(YamlShard(uri=uri, path=path))
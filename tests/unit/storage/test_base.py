@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import pytest
+
+from iden.storage import MemoryStorage, StorageStat
+from iden.storage.base import UploadBuffer, UploadTextWrapper
+
+#################################
+#     Tests for StorageStat     #
+#################################
+
+
+def test_storage_stat() -> None:
+    stat = StorageStat(size=9, mtime_ns=42)
+    assert stat.size == 9
+    assert stat.mtime_ns == 42
+
+
+def test_storage_stat_frozen() -> None:
+    stat = StorageStat(size=9, mtime_ns=42)
+    with pytest.raises(AttributeError):
+        stat.size = 1
+
+
+#################################
+#     Tests for BaseStorage     #
+#################################
+
+
+def test_base_storage_exists_true() -> None:
+    storage = MemoryStorage()
+    storage.write("memory://bucket/data.txt", b"abc")
+    assert storage.exists("memory://bucket/data.txt")
+
+
+def test_base_storage_exists_false() -> None:
+    assert not MemoryStorage().exists("memory://bucket/data.txt")
+
+
+def test_base_storage_close() -> None:
+    storage = MemoryStorage()
+    storage.write("memory://bucket/data.txt", b"abc")
+    storage.close()
+    assert storage.read_range("memory://bucket/data.txt", offset=0, length=3) == b"abc"
+
+
+##################################
+#     Tests for UploadBuffer     #
+##################################
+
+
+def test_upload_buffer_commit_on_close() -> None:
+    committed = []
+    buffer = UploadBuffer(committed.append)
+    buffer.write(b"abc")
+    assert committed == []
+    buffer.close()
+    assert committed == [b"abc"]
+
+
+def test_upload_buffer_commit_once() -> None:
+    committed = []
+    buffer = UploadBuffer(committed.append)
+    buffer.write(b"abc")
+    buffer.close()
+    buffer.close()
+    assert committed == [b"abc"]
+
+
+def test_upload_buffer_context_manager() -> None:
+    committed = []
+    with UploadBuffer(committed.append) as buffer:
+        buffer.write(b"abc")
+    assert committed == [b"abc"]
+    assert buffer.closed
+
+
+def test_upload_buffer_context_manager_exception() -> None:
+    committed = []
+    buffer = UploadBuffer(committed.append)
+
+    def write_and_fail() -> None:
+        with buffer:
+            buffer.write(b"abc")
+            msg = "failure"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="failure"):
+        write_and_fail()
+    assert committed == []
+    assert buffer.closed
+
+
+def test_upload_buffer_discard() -> None:
+    committed = []
+    buffer = UploadBuffer(committed.append)
+    buffer.write(b"abc")
+    buffer.discard()
+    buffer.close()
+    assert committed == []
+
+
+#######################################
+#     Tests for UploadTextWrapper     #
+#######################################
+
+
+def test_upload_text_wrapper_context_manager() -> None:
+    committed = []
+    with UploadTextWrapper(UploadBuffer(committed.append), encoding="utf-8") as file:
+        file.write("abc")
+    assert committed == [b"abc"]
+
+
+def test_upload_text_wrapper_context_manager_exception() -> None:
+    committed = []
+
+    def write_and_fail() -> None:
+        with UploadTextWrapper(UploadBuffer(committed.append), encoding="utf-8") as file:
+            file.write("abc")
+            msg = "failure"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="failure"):
+        write_and_fail()
+    assert committed == []
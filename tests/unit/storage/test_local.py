@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from iden.storage import LocalStorage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+##################################
+#     Tests for LocalStorage     #
+##################################
+
+
+def test_local_storage_repr() -> None:
+    assert repr(LocalStorage()) == "LocalStorage(max_handles=64, num_handles=0)"
+
+
+def test_local_storage_write_read_range(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    path = tmp_path.joinpath("data.txt")
+    storage.write(path, b"abcdef")
+    assert path.read_bytes() == b"abcdef"
+    assert storage.read_range(path, offset=2, length=3) == b"cde"
+
+
+def test_local_storage_write_uri(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    path = tmp_path.joinpath("dir", "data.txt")
+    storage.write(path.as_uri(), b"abc")
+    assert path.read_bytes() == b"abc"
+
+
+def test_local_storage_write_no_tmp_file(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    storage.write(tmp_path.joinpath("data.txt"), b"abc")
+    assert storage.list(tmp_path) == ["data.txt"]
+
+
+def test_local_storage_read_range_after_end(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    path = tmp_path.joinpath("data.txt")
+    path.write_bytes(b"abc")
+    assert storage.read_range(path, offset=2, length=10) == b"c"
+    assert storage.read_range(path, offset=5, length=10) == b""
+
+
+def test_local_storage_read_range_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        LocalStorage().read_range(tmp_path.joinpath("data.txt"), offset=0, length=1)
+
+
+def test_local_storage_read_range_pooled_handle(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    path = tmp_path.joinpath("data.txt")
+    path.write_bytes(b"abcdef")
+    assert storage.read_range(path, offset=0, length=2) == b"ab"
+    assert storage.read_range(path, offset=2, length=2) == b"cd"
+    assert repr(storage) == "LocalStorage(max_handles=64, num_handles=1)"
+
+
+def test_local_storage_read_range_replaced_file(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    path = tmp_path.joinpath("data.txt")
+    storage.write(path, b"abc")
+    assert storage.read_range(path, offset=0, length=3) == b"abc"
+    storage.write(path, b"def")
+    assert storage.read_range(path, offset=0, length=3) == b"def"
+
+
+def test_local_storage_read_range_max_handles(tmp_path: Path) -> None:
+    storage = LocalStorage(max_handles=2)
+    for i in range(5):
+        path = tmp_path.joinpath(f"data{i}.txt")
+        path.write_bytes(b"abc")
+        assert storage.read_range(path, offset=0, length=3) == b"abc"
+    assert repr(storage) == "LocalStorage(max_handles=2, num_handles=2)"
+
+
+def test_local_storage_close(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    path = tmp_path.joinpath("data.txt")
+    path.write_bytes(b"abc")
+    storage.read_range(path, offset=0, length=3)
+    storage.close()
+    assert repr(storage) == "LocalStorage(max_handles=64, num_handles=0)"
+    assert storage.read_range(path, offset=0, length=3) == b"abc"
+
+
+def test_local_storage_open_read(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    path.write_bytes(b"abc")
+    with LocalStorage().open(path) as file:
+        assert file.read() == b"abc"
+
+
+def test_local_storage_open_write(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("dir", "data.txt")
+    with LocalStorage().open(path, mode="wb") as file:
+        file.write(b"abc")
+    assert path.read_bytes() == b"abc"
+
+
+def test_local_storage_open_incorrect_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect mode: r"):
+        LocalStorage().open(tmp_path.joinpath("data.txt"), mode="r")
+
+
+def test_local_storage_list(tmp_path: Path) -> None:
+    tmp_path.joinpath("b.txt").write_bytes(b"abc")
+    tmp_path.joinpath("a.txt").write_bytes(b"abc")
+    tmp_path.joinpath("dir").mkdir()
+    assert LocalStorage().list(tmp_path) == ["a.txt", "b.txt", "dir"]
+
+
+def test_local_storage_list_missing(tmp_path: Path) -> None:
+    assert LocalStorage().list(tmp_path.joinpath("missing")) == []
+
+
+def test_local_storage_exists(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    storage = LocalStorage()
+    assert not storage.exists(path)
+    path.write_bytes(b"abc")
+    assert storage.exists(path)
+    assert not storage.exists(tmp_path)
+
+
+def test_local_storage_remove(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    path.write_bytes(b"abc")
+    LocalStorage().remove(path)
+    assert not path.exists()
+
+
+def test_local_storage_remove_missing(tmp_path: Path) -> None:
+    LocalStorage().remove(tmp_path.joinpath("data.txt"))
+
+
+def test_local_storage_stat(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    path.write_bytes(b"abcdef")
+    stat = LocalStorage().stat(path)
+    assert stat.size == 6
+    assert stat.mtime_ns == path.stat().st_mtime_ns
+
+
+def test_local_storage_stat_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        LocalStorage().stat(tmp_path.joinpath("data.txt"))
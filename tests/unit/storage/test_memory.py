@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import pytest
+
+from iden.storage import MemoryStorage
+
+###################################
+#     Tests for MemoryStorage     #
+###################################
+
+
+def test_memory_storage_repr() -> None:
+    assert repr(MemoryStorage()) == "MemoryStorage(num_objects=0)"
+
+
+def test_memory_storage_write_read_range() -> None:
+    storage = MemoryStorage()
+    storage.write("memory://bucket/data.txt", b"abcdef")
+    assert storage.read_range("memory://bucket/data.txt", offset=2, length=3) == b"cde"
+
+
+def test_memory_storage_write_overwrite() -> None:
+    storage = MemoryStorage()
+    storage.write("memory://bucket/data.txt", b"abc")
+    storage.write("memory://bucket/data.txt", b"defgh")
+    assert storage.read_range("memory://bucket/data.txt", offset=0, length=10) == b"defgh"
+
+
+def test_memory_storage_read_range_after_end() -> None:
+    storage = MemoryStorage()
+    storage.write("memory://bucket/data.txt", b"abc")
+    assert storage.read_range("memory://bucket/data.txt", offset=2, length=10) == b"c"
+    assert storage.read_range("memory://bucket/data.txt", offset=5, length=10) == b""
+
+
+def test_memory_storage_read_range_missing() -> None:
+    with pytest.raises(FileNotFoundError, match="object does not exist"):
+        MemoryStorage().read_range("memory://bucket/data.txt", offset=0, length=1)
+
+
+def test_memory_storage_open_read() -> None:
+    storage = MemoryStorage()
+    storage.write("memory://bucket/data.txt", b"abc")
+    with storage.open("memory://bucket/data.txt") as file:
+        assert file.read() == b"abc"
+
+
+def test_memory_storage_open_read_missing() -> None:
+    with pytest.raises(FileNotFoundError, match="object does not exist"):
+        MemoryStorage().open("memory://bucket/data.txt")
+
+
+def test_memory_storage_open_write() -> None:
+    storage = MemoryStorage()
+    with storage.open("memory://bucket/data.txt", mode="wb") as file:
+        file.write(b"abc")
+        assert not storage.exists("memory://bucket/data.txt")
+    assert storage.read_range("memory://bucket/data.txt", offset=0, length=3) == b"abc"
+
+
+def test_memory_storage_open_write_exception() -> None:
+    storage = MemoryStorage()
+
+    def write_and_fail() -> None:
+        with storage.open("memory://bucket/data.txt", mode="wb") as file:
+            file.write(b"abc")
+            msg = "failure"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="failure"):
+        write_and_fail()
+    assert not storage.exists("memory://bucket/data.txt")
+
+
+def test_memory_storage_open_incorrect_mode() -> None:
+    with pytest.raises(ValueError, match="Incorrect mode: r"):
+        MemoryStorage().open("memory://bucket/data.txt", mode="r")
+
+
+def test_memory_storage_list() -> None:
+    storage = MemoryStorage()
+    storage.write("memory://bucket/b.txt", b"abc")
+    storage.write("memory://bucket/a.txt", b"abc")
+    storage.write("memory://bucket/dir/c.txt", b"abc")
+    storage.write("memory://bucket/dir/d.txt", b"abc")
+    storage.write("memory://other/e.txt", b"abc")
+    assert storage.list("memory://bucket") == ["a.txt", "b.txt", "dir"]
+    assert storage.list("memory://bucket/dir/") == ["c.txt", "d.txt"]
+
+
+def test_memory_storage_list_missing() -> None:
+    assert MemoryStorage().list("memory://bucket") == []
+
+
+def test_memory_storage_remove() -> None:
+    storage = MemoryStorage()
+    storage.write("memory://bucket/data.txt", b"abc")
+    storage.remove("memory://bucket/data.txt")
+    assert not storage.exists("memory://bucket/data.txt")
+
+
+def test_memory_storage_remove_missing() -> None:
+    MemoryStorage().remove("memory://bucket/data.txt")
+
+
+def test_memory_storage_stat() -> None:
+    storage = MemoryStorage()
+    storage.write("memory://bucket/data.txt", b"abcdef")
+    stat = storage.stat("memory://bucket/data.txt")
+    assert stat.size == 6
+    assert stat.mtime_ns > 0
+
+
+def test_memory_storage_stat_missing() -> None:
+    with pytest.raises(FileNotFoundError, match="object does not exist"):
+        MemoryStorage().stat("memory://bucket/data.txt")
+
+
+def test_memory_storage_incorrect_location() -> None:
+    with pytest.raises(ValueError, match="Incorrect location"):
+        MemoryStorage().write("s3://bucket/data.txt", b"abc")
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from iden.storage import (
+    LocalStorage,
+    MemoryStorage,
+    S3Storage,
+    get_scheme,
+    get_storage,
+    register_storage,
+)
+from iden.storage import registry as storage_registry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(autouse=True)
+def _reset_storages() -> Iterator[None]:
+    with patch.dict(storage_registry._STORAGES, clear=True):
+        yield
+
+
+################################
+#     Tests for get_scheme     #
+################################
+
+
+@pytest.mark.parametrize(
+    ("location", "scheme"),
+    [
+        (Path("/data/data.json"), "file"),
+        ("/data/data.json", "file"),
+        ("data/data.json", "file"),
+        ("file:///data/data.json", "file"),
+        ("C:/data/data.json", "file"),
+        ("memory://bucket/data.json", "memory"),
+        ("S3://bucket/data.json", "s3"),
+    ],
+)
+def test_get_scheme(location: Path | str, scheme: str) -> None:
+    assert get_scheme(location) == scheme
+
+
+#################################
+#     Tests for get_storage     #
+#################################
+
+
+def test_get_storage_file() -> None:
+    assert isinstance(get_storage("file:///data/data.json"), LocalStorage)
+
+
+def test_get_storage_path() -> None:
+    assert isinstance(get_storage(Path("/data/data.json")), LocalStorage)
+
+
+def test_get_storage_memory() -> None:
+    assert isinstance(get_storage("memory://bucket/data.json"), MemoryStorage)
+
+
+def test_get_storage_s3() -> None:
+    assert isinstance(get_storage("s3://bucket/data.json"), S3Storage)
+
+
+def test_get_storage_same_object() -> None:
+    assert get_storage("memory://bucket/a.json") is get_storage("memory://other/b.json")
+
+
+def test_get_storage_unknown_scheme() -> None:
+    with pytest.raises(ValueError, match="No storage backend registered for the URI scheme"):
+        get_storage("unknown://bucket/data.json")
+
+
+######################################
+#     Tests for register_storage     #
+######################################
+
+
+def test_register_storage() -> None:
+    storage = MemoryStorage()
+    register_storage("mem2", storage)
+    assert get_storage("mem2://bucket/data.json") is storage
+
+
+def test_register_storage_override_default() -> None:
+    storage = MemoryStorage()
+    register_storage("memory", storage)
+    assert get_storage("memory://bucket/data.json") is storage
+
+
+def test_register_storage_exist_ok_false() -> None:
+    register_storage("mem2", MemoryStorage())
+    with pytest.raises(RuntimeError, match="already registered for the URI scheme"):
+        register_storage("mem2", MemoryStorage())
+
+
+def test_register_storage_exist_ok_true() -> None:
+    register_storage("mem2", MemoryStorage())
+    storage = MemoryStorage()
+    register_storage("mem2", storage, exist_ok=True)
+    assert get_storage("mem2://bucket/data.json") is storage
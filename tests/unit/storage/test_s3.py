@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from iden.storage import S3Storage
+from iden.testing import ObjectStoreServer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def server() -> Iterator[ObjectStoreServer]:
+    with ObjectStoreServer() as server:
+        yield server
+
+
+@pytest.fixture
+def storage(server: ObjectStoreServer) -> Iterator[S3Storage]:
+    storage = S3Storage(endpoint_url=server.endpoint_url)
+    yield storage
+    storage.close()
+
+
+###############################
+#     Tests for S3Storage     #
+###############################
+
+
+def test_s3_storage_repr() -> None:
+    assert repr(S3Storage(endpoint_url="http://localhost:9000")) == (
+        "S3Storage(endpoint_url=http://localhost:9000)"
+    )
+
+
+def test_s3_storage_endpoint_url() -> None:
+    assert S3Storage(endpoint_url="http://localhost:9000/").endpoint_url == (
+        "http://localhost:9000"
+    )
+
+
+def test_s3_storage_endpoint_url_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AWS_ENDPOINT_URL", "http://localhost:9000")
+    assert S3Storage().endpoint_url == "http://localhost:9000"
+
+
+def test_s3_storage_endpoint_url_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("AWS_ENDPOINT_URL", raising=False)
+    assert S3Storage().endpoint_url == "https://s3.amazonaws.com"
+
+
+def test_s3_storage_write(server: ObjectStoreServer, storage: S3Storage) -> None:
+    storage.write("s3://bucket/dir/data.txt", b"abcdef")
+    assert server.get_object("bucket", "dir/data.txt") == b"abcdef"
+
+
+def test_s3_storage_read_range(storage: S3Storage) -> None:
+    storage.write("s3://bucket/data.txt", b"abcdef")
+    assert storage.read_range("s3://bucket/data.txt", offset=2, length=3) == b"cde"
+
+
+def test_s3_storage_read_range_after_end(storage: S3Storage) -> None:
+    storage.write("s3://bucket/data.txt", b"abc")
+    assert storage.read_range("s3://bucket/data.txt", offset=2, length=10) == b"c"
+    assert storage.read_range("s3://bucket/data.txt", offset=5, length=10) == b""
+
+
+def test_s3_storage_read_range_empty(storage: S3Storage) -> None:
+    storage.write("s3://bucket/data.txt", b"abc")
+    assert storage.read_range("s3://bucket/data.txt", offset=0, length=0) == b""
+
+
+def test_s3_storage_read_range_missing(storage: S3Storage) -> None:
+    with pytest.raises(FileNotFoundError, match="object does not exist"):
+        storage.read_range("s3://bucket/data.txt", offset=0, length=1)
+
+
+def test_s3_storage_open_read(storage: S3Storage) -> None:
+    storage.write("s3://bucket/data.txt", b"abc")
+    with storage.open("s3://bucket/data.txt") as file:
+        assert file.read() == b"abc"
+
+
+def test_s3_storage_open_read_missing(storage: S3Storage) -> None:
+    with pytest.raises(FileNotFoundError, match="object does not exist"):
+        storage.open("s3://bucket/data.txt")
+
+
+def test_s3_storage_open_write(server: ObjectStoreServer, storage: S3Storage) -> None:
+    with storage.open("s3://bucket/data.txt", mode="wb") as file:
+        file.write(b"abc")
+        assert server.get_object("bucket", "data.txt") is None
+    assert server.get_object("bucket", "data.txt") == b"abc"
+
+
+def test_s3_storage_open_write_exception(server: ObjectStoreServer, storage: S3Storage) -> None:
+
+    def write_and_fail() -> None:
+        with storage.open("s3://bucket/data.txt", mode="wb") as file:
+            file.write(b"abc")
+            msg = "failure"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="failure"):
+        write_and_fail()
+    assert server.get_object("bucket", "data.txt") is None
+
+
+def test_s3_storage_open_incorrect_mode(storage: S3Storage) -> None:
+    with pytest.raises(ValueError, match="Incorrect mode: r"):
+        storage.open("s3://bucket/data.txt", mode="r")
+
+
+def test_s3_storage_list(storage: S3Storage) -> None:
+    storage.write("s3://bucket/b.txt", b"abc")
+    storage.write("s3://bucket/a.txt", b"abc")
+    storage.write("s3://bucket/dir/c.txt", b"abc")
+    storage.write("s3://bucket/dir/d.txt", b"abc")
+    assert storage.list("s3://bucket") == ["a.txt", "b.txt", "dir"]
+    assert storage.list("s3://bucket/dir") == ["c.txt", "d.txt"]
+
+
+def test_s3_storage_list_pagination() -> None:
+    with ObjectStoreServer(max_keys=2) as server:
+        storage = S3Storage(endpoint_url=server.endpoint_url)
+        for i in range(5):
+            storage.write(f"s3://bucket/data{i}.txt", b"abc")
+        assert storage.list("s3://bucket") == [f"data{i}.txt" for i in range(5)]
+        storage.close()
+
+
+def test_s3_storage_list_missing_bucket(storage: S3Storage) -> None:
+    assert storage.list("s3://bucket") == []
+
+
+def test_s3_storage_exists(storage: S3Storage) -> None:
+    assert not storage.exists("s3://bucket/data.txt")
+    storage.write("s3://bucket/data.txt", b"abc")
+    assert storage.exists("s3://bucket/data.txt")
+
+
+def test_s3_storage_remove(server: ObjectStoreServer, storage: S3Storage) -> None:
+    storage.write("s3://bucket/data.txt", b"abc")
+    storage.remove("s3://bucket/data.txt")
+    assert server.get_object("bucket", "data.txt") is None
+
+
+def test_s3_storage_remove_missing(storage: S3Storage) -> None:
+    storage.remove("s3://bucket/data.txt")
+
+
+def test_s3_storage_stat(storage: S3Storage) -> None:
+    storage.write("s3://bucket/data.txt", b"abcdef")
+    stat = storage.stat("s3://bucket/data.txt")
+    assert stat.size == 6
+    assert stat.mtime_ns > 0
+
+
+def test_s3_storage_stat_missing(storage: S3Storage) -> None:
+    with pytest.raises(FileNotFoundError, match="object does not exist"):
+        storage.stat("s3://bucket/data.txt")
+
+
+def test_s3_storage_key_with_special_characters(
+    server: ObjectStoreServer, storage: S3Storage
+) -> None:
+    storage.write("s3://bucket/my data/a+b.txt", b"abc")
+    assert server.get_object("bucket", "my data/a+b.txt") == b"abc"
+    assert storage.read_range("s3://bucket/my data/a+b.txt", offset=0, length=3) == b"abc"
+
+
+def test_s3_storage_connection_reuse(server: ObjectStoreServer, storage: S3Storage) -> None:
+    for i in range(10):
+        storage.write(f"s3://bucket/data{i}.txt", b"abc")
+        storage.read_range(f"s3://bucket/data{i}.txt", offset=0, length=3)
+    assert server.num_requests == 20
+    assert server.num_connections == 1
+
+
+def test_s3_storage_reconnect_after_close(server: ObjectStoreServer, storage: S3Storage) -> None:
+    storage.write("s3://bucket/data.txt", b"abc")
+    storage.close()
+    assert storage.read_range("s3://bucket/data.txt", offset=0, length=3) == b"abc"
+    assert server.num_connections == 2
+
+
+def test_s3_storage_incorrect_location(storage: S3Storage) -> None:
+    with pytest.raises(ValueError, match="Incorrect location"):
+        storage.write("memory://bucket/data.txt", b"abc")
+
+
+def test_s3_storage_incorrect_location_missing_bucket(storage: S3Storage) -> None:
+    with pytest.raises(ValueError, match="Incorrect location"):
+        storage.write("s3:///data.txt", b"abc")
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from iden.storage import (
+    get_extension,
+    get_storage,
+    location_to_str,
+    open_file,
+    sanitize_location,
+)
+
+#######################################
+#     Tests for sanitize_location     #
+#######################################
+
+
+def test_sanitize_location_path(tmp_path: Path) -> None:
+    assert sanitize_location(tmp_path) == tmp_path
+
+
+def test_sanitize_location_file_uri(tmp_path: Path) -> None:
+    assert sanitize_location(tmp_path.as_uri()) == tmp_path
+
+
+def test_sanitize_location_str_path(tmp_path: Path) -> None:
+    assert sanitize_location(tmp_path.as_posix()) == tmp_path
+
+
+def test_sanitize_location_uri() -> None:
+    assert sanitize_location("memory://bucket/data.json") == "memory://bucket/data.json"
+
+
+###################################
+#     Tests for get_extension     #
+###################################
+
+
+@pytest.mark.parametrize(
+    ("location", "extension"),
+    [
+        (Path("/data/data.json"), "json"),
+        (Path("/data/data.tar.gz"), "tar.gz"),
+        ("memory://bucket/data.json", "json"),
+        ("s3://bucket/dir.v1/data", ""),
+    ],
+)
+def test_get_extension(location: Path | str, extension: str) -> None:
+    assert get_extension(location) == extension
+
+
+#####################################
+#     Tests for location_to_str     #
+#####################################
+
+
+def test_location_to_str_path() -> None:
+    assert location_to_str(Path("/data/data.json")) == "/data/data.json"
+
+
+def test_location_to_str_uri() -> None:
+    assert location_to_str("memory://bucket/data.json") == "memory://bucket/data.json"
+
+
+###############################
+#     Tests for open_file     #
+###############################
+
+
+def test_open_file_path_binary(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("dir", "data.bin")
+    with open_file(path, mode="wb") as file:
+        file.write(b"abc")
+    with open_file(path, mode="rb") as file:
+        assert file.read() == b"abc"
+
+
+def test_open_file_path_text(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    with open_file(path.as_uri(), mode="w", encoding="utf-8") as file:
+        file.write("abc")
+    with open_file(path, mode="r", encoding="utf-8") as file:
+        assert file.read() == "abc"
+
+
+def test_open_file_memory_binary() -> None:
+    with open_file("memory://test-open-file/data.bin", mode="wb") as file:
+        file.write(b"abc")
+    with open_file("memory://test-open-file/data.bin", mode="rb") as file:
+        assert file.read() == b"abc"
+
+
+def test_open_file_memory_text() -> None:
+    with open_file("memory://test-open-file/data.txt", mode="w", encoding="utf-8") as file:
+        file.write("abc")
+    with open_file("memory://test-open-file/data.txt", mode="r", encoding="utf-8") as file:
+        assert file.read() == "abc"
+
+
+def test_open_file_memory_text_exception() -> None:
+    location = "memory://test-open-file/failed.txt"
+
+    def write_and_fail() -> None:
+        with open_file(location, mode="w", encoding="utf-8") as file:
+            file.write("abc")
+            msg = "failure"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="failure"):
+        write_and_fail()
+    assert not get_storage(location).exists(location)
+
+
+def test_open_file_incorrect_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect mode: a"):
+        open_file(tmp_path.joinpath("data.txt"), mode="a")
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from iden.cli import bench, inspect, main, validate
+from iden.dataset import create_vanilla_dataset
+from iden.shard import (
+    create_json_shard,
+    create_pickle_shard,
+    create_shard_dict,
+    create_shard_tuple,
+)
+from iden.shard.utils import get_data_nbytes
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def uri(tmp_path: Path) -> str:
+    shards = create_shard_dict(
+        shards={
+            "train": create_shard_tuple(
+                [
+                    create_json_shard(list(range(i)), uri=tmp_path.joinpath(f"train{i}").as_uri())
+                    for i in range(3)
+                ],
+                uri=tmp_path.joinpath("uri_train").as_uri(),
+            ),
+            "val": create_shard_tuple(
+                [create_pickle_shard([42], uri=tmp_path.joinpath("val").as_uri())],
+                uri=tmp_path.joinpath("uri_val").as_uri(),
+            ),
+        },
+        uri=tmp_path.joinpath("uri_shards").as_uri(),
+    )
+    assets = create_shard_dict(
+        shards={"stats": create_json_shard({"mean": 1.0}, uri=tmp_path.joinpath("stats").as_uri())},
+        uri=tmp_path.joinpath("uri_assets").as_uri(),
+    )
+    uri = tmp_path.joinpath("uri").as_uri()
+    create_vanilla_dataset(uri=uri, shards=shards, assets=assets)
+    return uri
+
+
+#############################
+#     Tests for inspect     #
+#############################
+
+
+def test_inspect(uri: str) -> None:
+    output = inspect(uri)
+    assert output.startswith(f"dataset: {uri}\nsplits:\n")
+    assert "  train: 3 shards, " in output
+    assert "(JsonShard: 3)" in output
+    assert "  val: 1 shards, " in output
+    assert "(PickleShard: 1)" in output
+    assert "  stats: JsonShard, " in output
+    assert "total: 4 shards, " in output
+    assert "train0" not in output
+
+
+def test_inspect_show_shards(uri: str, tmp_path: Path) -> None:
+    output = inspect(uri, show_shards=True)
+    assert f"    {tmp_path.joinpath('train0').as_uri()}  " in output
+    assert f"    {tmp_path.joinpath('val').as_uri()}  " in output
+
+
+def test_inspect_show_shards_nbytes_once(uri: str) -> None:
+    with patch("iden.cli.get_data_nbytes", side_effect=get_data_nbytes) as nbytes:
+        inspect(uri, show_shards=True)
+    # 4 shards and 1 asset
+    assert nbytes.call_count == 5
+
+
+def test_inspect_does_not_load_data(uri: str, tmp_path: Path) -> None:
+    # the data files are not read, so a corrupted file is not detected
+    tmp_path.joinpath("train0.json").write_text("[")
+    assert "  train: 3 shards, " in inspect(uri)
+
+
+##############################
+#     Tests for validate     #
+##############################
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_validate(uri: str, num_workers: int) -> None:
+    assert validate(uri, num_workers=num_workers) == []
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_validate_invalid(uri: str, tmp_path: Path, num_workers: int) -> None:
+    tmp_path.joinpath("train1.json").write_text("[")
+    tmp_path.joinpath("stats.json").unlink()
+    errors = validate(uri, num_workers=num_workers)
+    assert [shard_uri for shard_uri, _ in errors] == [
+        tmp_path.joinpath("train1").as_uri(),
+        tmp_path.joinpath("stats").as_uri(),
+    ]
+    assert errors[0][1].startswith("JSONDecodeError: ")
+    assert errors[1][1].startswith("FileNotFoundError: ")
+
+
+###########################
+#     Tests for bench     #
+###########################
+
+
+def test_bench(uri: str) -> None:
+    stats = bench(uri)
+    assert list(stats) == ["train", "val"]
+    assert stats["train"].num_shards == 3
+    assert stats["val"].num_shards == 1
+
+
+def test_bench_prefetch_workers(uri: str) -> None:
+    stats = bench(uri, num_prefetch=2, num_workers=2)
+    assert stats["train"].num_shards == 3
+
+
+def test_bench_splits(uri: str) -> None:
+    assert list(bench(uri, splits=["val"])) == ["val"]
+
+
+def test_bench_incorrect_split(uri: str) -> None:
+    with pytest.raises(ValueError, match=r"Incorrect split: missing"):
+        bench(uri, splits=["missing"])
+
+
+##########################
+#     Tests for main     #
+##########################
+
+
+def test_main_inspect(uri: str, capsys: pytest.CaptureFixture) -> None:
+    assert main(["inspect", uri]) == 0
+    assert capsys.readouterr().out.startswith(f"dataset: {uri}\n")
+
+
+def test_main_inspect_path(uri: str, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    assert main(["inspect", tmp_path.joinpath("uri").as_posix()]) == 0
+    assert capsys.readouterr().out.startswith(f"dataset: {uri}\n")
+
+
+def test_main_validate(uri: str, capsys: pytest.CaptureFixture) -> None:
+    assert main(["validate", uri, "--workers", "2"]) == 0
+    assert capsys.readouterr().out == "OK\n"
+
+
+def test_main_validate_invalid(uri: str, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    tmp_path.joinpath("val.pkl").unlink()
+    assert main(["validate", uri]) == 1
+    output = capsys.readouterr().out
+    assert f"invalid shard {tmp_path.joinpath('val').as_uri()}: FileNotFoundError" in output
+    assert output.endswith("1 invalid shards\n")
+
+
+def test_main_bench(uri: str, capsys: pytest.CaptureFixture) -> None:
+    assert main(["bench", uri, "--split", "train", "--prefetch", "2", "--workers", "2"]) == 0
+    output = capsys.readouterr().out
+    assert output.startswith("train: 3 shards, ")
+    assert "shards/s" in output
+    assert "val" not in output
+
+
+def test_main_missing_command() -> None:
+    with pytest.raises(SystemExit):
+        main([])
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from iden.utils.imports import (
+    check_torch,
+    is_torch_available,
+    raise_error_torch_missing,
+    torch_available,
+)
+
+
+def my_function(n: int = 0) -> int:
+    return 42 + n
+
+
+def test_check_torch_with_package() -> None:
+    with patch("iden.utils.imports.torch.is_torch_available", lambda: True):
+        check_torch()
+
+
+def test_check_torch_without_package() -> None:
+    with (
+        patch("iden.utils.imports.torch.is_torch_available", lambda: False),
+        pytest.raises(RuntimeError, match=r"'torch' package is required but not installed."),
+    ):
+        check_torch()
+
+
+def test_is_torch_available() -> None:
+    assert isinstance(is_torch_available(), bool)
+
+
+def test_torch_available_with_package() -> None:
+    with patch("iden.utils.imports.torch.is_torch_available", lambda: True):
+        fn = torch_available(my_function)
+        assert fn(2) == 44
+
+
+def test_torch_available_without_package() -> None:
+    with patch("iden.utils.imports.torch.is_torch_available", lambda: False):
+        fn = torch_available(my_function)
+        assert fn(2) is None
+
+
+def test_torch_available_decorator_with_package() -> None:
+    with patch("iden.utils.imports.torch.is_torch_available", lambda: True):
+
+        @torch_available
+        def fn(n: int = 0) -> int:
+            return 42 + n
+
+        assert fn(2) == 44
+
+
+def test_torch_available_decorator_without_package() -> None:
+    with patch("iden.utils.imports.torch.is_torch_available", lambda: False):
+
+        @torch_available
+        def fn(n: int = 0) -> int:
+            return 42 + n
+
+        assert fn(2) is None
+
+
+def test_raise_error_torch_missing() -> None:
+    with pytest.raises(RuntimeError, match=r"'torch' package is required but not installed."):
+        raise_error_torch_missing()
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from iden.utils.imports import decorator_package_available
+
+
+def my_function(n: int = 0) -> int:
+    return 42 + n
+
+
+def test_decorator_package_available_condition_true() -> None:
+    fn = decorator_package_available(my_function, lambda: True)
+    assert fn(2) == 44
+
+
+def test_decorator_package_available_condition_false() -> None:
+    fn = decorator_package_available(my_function, lambda: False)
+    assert fn(2) is None
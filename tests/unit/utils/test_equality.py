@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Any
+
+from coola.equality import objects_are_equal
+
+from iden.utils.equality import objects_are_equal as iden_objects_are_equal
+from iden.utils.equality import register_equality_tester
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class Value:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
+        return isinstance(other, Value) and self.value == other.value
+
+
+def run_code(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+##############################################
+#     Tests for register_equality_tester     #
+##############################################
+
+
+def test_register_equality_tester_imported() -> None:
+    register_equality_tester(Value)
+    assert objects_are_equal(Value(1), Value(1))
+    assert not objects_are_equal(Value(1), Value(2))
+
+
+def test_register_equality_tester_not_imported(tmp_path: Path) -> None:
+    uri1, uri2 = tmp_path.joinpath("uri1").as_uri(), tmp_path.joinpath("uri2").as_uri()
+    run_code(
+        "import sys\n"
+        "from iden.shard import create_json_shard, load_from_uri\n"
+        "from iden.utils.equality import objects_are_equal\n"
+        f"shard = create_json_shard([1, 2, 3], uri={uri1!r})\n"
+        f"other = create_json_shard([1, 2, 3], uri={uri2!r})\n"
+        "assert 'coola.equality' not in sys.modules\n"
+        f"assert objects_are_equal(shard, load_from_uri({uri1!r}))\n"
+        "assert not objects_are_equal(shard, other)\n"
+    )
+
+
+def test_register_equality_tester_no_import_hook() -> None:
+    run_code(
+        "import sys\n"
+        "import iden.io, iden.shard, iden.dataset\n"
+        "assert not any(type(finder).__module__.startswith('iden') for finder in sys.meta_path)\n"
+    )
+
+
+#######################################
+#     Tests for objects_are_equal     #
+#######################################
+
+
+def test_objects_are_equal_true() -> None:
+    assert iden_objects_are_equal({"key": Value(1)}, {"key": Value(1)})
+
+
+def test_objects_are_equal_false() -> None:
+    assert not iden_objects_are_equal([Value(1)], [Value(2)])
+
+
+def test_objects_are_equal_equal_nan() -> None:
+    assert iden_objects_are_equal(float("nan"), float("nan"), equal_nan=True)
+    assert not iden_objects_are_equal(float("nan"), float("nan"))
+
+
+def test_objects_are_equal_registers_pending() -> None:
+    run_code(
+        "import iden.io\n"
+        "from iden.utils.equality import objects_are_equal\n"
+        "assert objects_are_equal(1, 1)\n"
+        "from coola.equality.tester import EqualNanEqualityTester, get_default_registry\n"
+        "tester = get_default_registry().find_equality_tester(iden.io.BaseLoader)\n"
+        "assert isinstance(tester, EqualNanEqualityTester)\n"
+    )
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import types
+from typing import TYPE_CHECKING
+
+import pytest
+
+from iden.utils.lazy import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture
+def package() -> Generator[types.ModuleType, None, None]:
+    module = types.ModuleType("my_package")
+    sys.modules["my_package"] = module
+    yield module
+    del sys.modules["my_package"]
+
+
+def get_loaded_modules(code: str) -> list[str]:
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+#########################################
+#     Tests for create_lazy_getattr     #
+#########################################
+
+
+def test_create_lazy_getattr(package: types.ModuleType) -> None:
+    getattr_, _ = create_lazy_getattr("my_package", {"json": ["dumps", "loads"]})
+    assert getattr_("dumps") is json.dumps
+    assert package.dumps is json.dumps
+
+
+def test_create_lazy_getattr_missing(package: types.ModuleType) -> None:  # noqa: ARG001
+    getattr_, _ = create_lazy_getattr("my_package", {"json": ["dumps"]})
+    with pytest.raises(AttributeError, match="module 'my_package' has no attribute 'missing'"):
+        getattr_("missing")
+
+
+def test_create_lazy_getattr_dir(package: types.ModuleType) -> None:
+    package.value = 1
+    _, dir_ = create_lazy_getattr("my_package", {"json": ["dumps"]})
+    names = dir_()
+    assert "dumps" in names
+    assert "value" in names
+    assert names == sorted(names)
+
+
+@pytest.mark.parametrize(
+    "package", ["iden.io", "iden.shard", "iden.shard.loader", "iden.shard.generator"]
+)
+def test_lazy_packages_all(package: str) -> None:
+    module = __import__(package, fromlist=["__all__"])
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    assert set(module.__all__).issubset(dir(module))
+
+
+@pytest.mark.parametrize("package", ["iden.io", "iden.shard"])
+def test_lazy_packages_do_not_import_formats(package: str) -> None:
+    modules = get_loaded_modules(f"import {package}")
+    for name in [
+        "iden.io.cloudpickle",
+        "iden.io.joblib",
+        "iden.io.safetensors",
+        "iden.io.torch",
+        "iden.io.yaml",
+        "iden.shard.loader",
+        "iden.shard.generator",
+        "iden.shard.torch",
+        "iden.shard.safetensors",
+    ]:
+        assert name not in modules
+
+
+def test_lazy_packages_load_from_uri_target(tmp_path: Path) -> None:
+    uri = tmp_path.joinpath("uri").as_uri()
+    code = (
+        "from iden.shard import create_json_shard, load_from_uri\n"
+        f"create_json_shard([1, 2, 3], uri={uri!r})\n"
+        f"assert load_from_uri({uri!r}).get_data() == [1, 2, 3]"
+    )
+    modules = get_loaded_modules(code)
+    assert "iden.shard.loader.json" in modules
+    assert "iden.shard.torch" not in modules
+    for name in ["cloudpickle", "coola.equality", "joblib", "numpy", "torch", "yaml"]:
+        assert name not in modules
+
+
+@pytest.mark.parametrize("package", ["iden", "iden.cache", "iden.dataset", "iden.io", "iden.shard"])
+def test_lazy_packages_do_not_import_optional_dependencies(package: str) -> None:
+    modules = get_loaded_modules(f"import {package}")
+    for name in ["cloudpickle", "coola.equality", "joblib", "numpy", "torch", "yaml"]:
+        assert name not in modules
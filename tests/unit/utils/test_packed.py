@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from iden.utils.packed import PackedStringArray
+
+#######################################
+#     Tests for PackedStringArray     #
+#######################################
+
+
+def test_packed_string_array_repr() -> None:
+    assert repr(PackedStringArray(["abc", "de"])) == "PackedStringArray(size=2, nbytes=29)"
+
+
+def test_packed_string_array_len() -> None:
+    assert len(PackedStringArray(["abc", "de", ""])) == 3
+
+
+def test_packed_string_array_len_empty() -> None:
+    assert len(PackedStringArray()) == 0
+
+
+def test_packed_string_array_getitem() -> None:
+    strings = PackedStringArray(["abc", "", "fghi"])
+    assert [strings[0], strings[1], strings[2]] == ["abc", "", "fghi"]
+
+
+def test_packed_string_array_getitem_negative() -> None:
+    assert PackedStringArray(["abc", "de"])[-1] == "de"
+
+
+@pytest.mark.parametrize("index", [2, -3])
+def test_packed_string_array_getitem_out_of_range(index: int) -> None:
+    strings = PackedStringArray(["abc", "de"])
+    with pytest.raises(IndexError, match=r"is out of range"):
+        strings[index]
+
+
+def test_packed_string_array_getitem_unicode() -> None:
+    strings = PackedStringArray(["é", "日本", "a"])
+    assert list(strings) == ["é", "日本", "a"]
+    assert strings[1] == "日本"
+
+
+def test_packed_string_array_iter() -> None:
+    assert list(PackedStringArray(["abc", "de"])) == ["abc", "de"]
+
+
+def test_packed_string_array_append() -> None:
+    strings = PackedStringArray()
+    strings.append("abc")
+    strings.append("de")
+    assert list(strings) == ["abc", "de"]
+
+
+def test_packed_string_array_nbytes() -> None:
+    assert PackedStringArray(["abc", "de"]).nbytes == 5 + 3 * 8
+
+
+def test_packed_string_array_nbytes_empty() -> None:
+    assert PackedStringArray().nbytes == 8
@@ -1,37 +1,46 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+import asyncio
+import json
+import math
+import sys
+import threading
+from unittest.mock import Mock, patch
 
 import pytest
 
-from iden.utils.time import sync_perf_counter, timeblock
+from iden.utils.time import (
+    TimerRegistry,
+    TimerStats,
+    get_default_timer_registry,
+    sync_perf_counter,
+    timeblock,
+)
 
 #######################################
 #     Tests for sync_perf_counter     #
 #######################################
 
 
-@patch("iden.utils.time.is_torch_available", lambda: False)
 def test_sync_perf_counter_no_torch() -> None:
-    with patch("iden.utils.time.torch.cuda.synchronize") as synchronize_mock:
+    with patch.dict(sys.modules, {"torch": None}):
         assert isinstance(sync_perf_counter(), float)
-        synchronize_mock.assert_not_called()
 
 
-@patch("iden.utils.time.is_torch_available", lambda: True)
-@patch("iden.utils.time.torch.cuda.is_available", lambda: False)
 def test_sync_perf_counter_no_cuda() -> None:
-    with patch("iden.utils.time.torch.cuda.synchronize") as synchronize_mock:
+    torch = Mock()
+    torch.cuda.is_available.return_value = False
+    with patch.dict(sys.modules, {"torch": torch}):
         assert isinstance(sync_perf_counter(), float)
-        synchronize_mock.assert_not_called()
+    torch.cuda.synchronize.assert_not_called()
 
 
-@patch("iden.utils.time.is_torch_available", lambda: True)
-@patch("iden.utils.time.torch.cuda.is_available", lambda: True)
 def test_sync_perf_counter_cuda() -> None:
-    with patch("iden.utils.time.torch.cuda.synchronize") as synchronize_mock:
+    torch = Mock()
+    torch.cuda.is_available.return_value = True
+    with patch.dict(sys.modules, {"torch": torch}):
         assert isinstance(sync_perf_counter(), float)
-        synchronize_mock.assert_called_once_with()
+    torch.cuda.synchronize.assert_called_once_with()
 
 
 ###############################
@@ -58,3 +67,285 @@ def test_timeblock_custom_missing_time() -> None:
         timeblock("message"),
     ):
         pass
+
+
+################################
+#     Tests for TimerStats     #
+################################
+
+
+def test_timer_stats_repr() -> None:
+    assert repr(TimerStats()) == "TimerStats(count=0, total=0, min=inf, max=-inf)"
+
+
+def test_timer_stats_add() -> None:
+    stats = TimerStats()
+    for duration in [3.0, 1.0, 2.0]:
+        stats.add(duration)
+    assert stats.count == 3
+    assert stats.total == 6.0
+    assert stats.min == 1.0
+    assert stats.max == 3.0
+    assert stats.mean == 2.0
+
+
+def test_timer_stats_mean_empty() -> None:
+    assert math.isnan(TimerStats().mean)
+
+
+def test_timer_stats_percentile() -> None:
+    stats = TimerStats()
+    for duration in range(101):
+        stats.add(float(duration))
+    assert stats.percentile(0) == 0.0
+    assert stats.percentile(50) == 50.0
+    assert stats.percentile(90) == 90.0
+    assert stats.percentile(99.5) == 99.5
+    assert stats.percentile(100) == 100.0
+
+
+def test_timer_stats_percentile_empty() -> None:
+    assert math.isnan(TimerStats().percentile(50))
+
+
+def test_timer_stats_max_samples() -> None:
+    stats = TimerStats(max_samples=10)
+    for duration in range(1000):
+        stats.add(float(duration))
+    assert stats.count == 1000
+    assert stats.min == 0.0
+    assert stats.max == 999.0
+    assert len(stats._samples) == 10
+
+
+def test_timer_stats_to_dict() -> None:
+    stats = TimerStats()
+    stats.add(1.0)
+    stats.add(3.0)
+    assert stats.to_dict() == {
+        "count": 2,
+        "total": 4.0,
+        "mean": 2.0,
+        "min": 1.0,
+        "max": 3.0,
+        "p50": 2.0,
+        "p90": 2.8,
+        "p99": pytest.approx(2.98),
+    }
+
+
+def test_timer_stats_to_dict_empty() -> None:
+    values = TimerStats().to_dict()
+    assert values["count"] == 0
+    assert math.isnan(values["min"])
+    assert math.isnan(values["max"])
+
+
+###################################
+#     Tests for TimerRegistry     #
+###################################
+
+
+def test_timer_registry_repr() -> None:
+    assert repr(TimerRegistry()) == "TimerRegistry(enabled=True, num_timers=0)"
+
+
+def test_timer_registry_enable_disable() -> None:
+    timers = TimerRegistry(enabled=False)
+    assert not timers.enabled
+    timers.enable()
+    assert timers.enabled
+    timers.disable()
+    assert not timers.enabled
+
+
+def test_timer_registry_timer() -> None:
+    timers = TimerRegistry()
+    for _ in range(3):
+        with timers.timer("load"):
+            pass
+    stats = timers.get_stats()
+    assert list(stats) == ["load"]
+    assert stats["load"]["count"] == 3
+    assert stats["load"]["total"] >= 0.0
+
+
+def test_timer_registry_timer_nested() -> None:
+    timers = TimerRegistry()
+    with timers.timer("epoch"):
+        with timers.timer("load"):
+            pass
+        with timers.timer("load"):
+            pass
+    with timers.timer("load"):
+        pass
+    stats = timers.get_stats()
+    assert stats["epoch"]["count"] == 1
+    assert stats["epoch/load"]["count"] == 2
+    assert stats["load"]["count"] == 1
+
+
+def test_timer_registry_timer_error() -> None:
+    timers = TimerRegistry()
+    with pytest.raises(RuntimeError, match="failed"), timers.timer("load"):
+        raise RuntimeError("failed")  # noqa: EM101
+    with timers.timer("next"):
+        pass
+    assert list(timers.get_stats()) == ["load", "next"]
+
+
+def test_timer_registry_timer_disabled() -> None:
+    timers = TimerRegistry(enabled=False)
+    with timers.timer("load"):
+        pass
+    assert timers.get_stats() == {}
+
+
+def test_timer_registry_timer_async() -> None:
+    timers = TimerRegistry()
+
+    async def fetch() -> None:
+        async with timers.timer("fetch"):
+            await asyncio.sleep(0)
+
+    async def main() -> None:
+        async with timers.timer("main"):
+            await asyncio.gather(fetch(), fetch())
+
+    asyncio.run(main())
+    stats = timers.get_stats()
+    assert stats["main"]["count"] == 1
+    assert stats["main/fetch"]["count"] == 2
+
+
+def test_timer_registry_timer_async_disabled() -> None:
+    timers = TimerRegistry(enabled=False)
+
+    async def main() -> None:
+        async with timers.timer("main"):
+            pass
+
+    asyncio.run(main())
+    assert timers.get_stats() == {}
+
+
+def test_timer_registry_timer_threads() -> None:
+    timers = TimerRegistry()
+
+    def work() -> None:
+        with timers.timer("work"):
+            pass
+
+    with timers.timer("main"):
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert timers.get_stats()["work"]["count"] == 4
+
+
+def test_timer_registry_timed() -> None:
+    timers = TimerRegistry()
+
+    @timers.timed("process")
+    def process(x: int) -> int:
+        return x + 1
+
+    assert process(1) == 2
+    assert process(2) == 3
+    assert timers.get_stats()["process"]["count"] == 2
+
+
+def test_timer_registry_timed_default_name() -> None:
+    timers = TimerRegistry()
+
+    @timers.timed()
+    def process() -> None:
+        pass
+
+    process()
+    assert list(timers.get_stats()) == [process.__qualname__]
+
+
+def test_timer_registry_timed_async() -> None:
+    timers = TimerRegistry()
+
+    @timers.timed("fetch")
+    async def fetch(x: int) -> int:
+        await asyncio.sleep(0)
+        return x
+
+    assert asyncio.run(fetch(1)) == 1
+    assert timers.get_stats()["fetch"]["count"] == 1
+
+
+def test_timer_registry_timed_enabled_later() -> None:
+    timers = TimerRegistry(enabled=False)
+
+    @timers.timed("process")
+    def process() -> None:
+        pass
+
+    process()
+    timers.enable()
+    process()
+    assert timers.get_stats()["process"]["count"] == 1
+
+
+def test_timer_registry_record() -> None:
+    timers = TimerRegistry()
+    timers.record("load", 0.5)
+    timers.record("load", 1.5)
+    assert timers.get_stats()["load"]["total"] == 2.0
+
+
+def test_timer_registry_reset() -> None:
+    timers = TimerRegistry()
+    timers.record("load", 0.5)
+    timers.reset()
+    assert timers.get_stats() == {}
+
+
+def test_timer_registry_summary() -> None:
+    timers = TimerRegistry()
+    timers.record("load", 0.5)
+    timers.record("epoch/load", 0.25)
+    lines = timers.summary().split("\n")
+    assert len(lines) == 3
+    assert lines[0].startswith("name      ")
+    assert lines[1].startswith("load              1       500.000")
+    assert lines[2].startswith("epoch/load        1       250.000")
+
+
+def test_timer_registry_summary_empty() -> None:
+    assert TimerRegistry().summary().startswith("name  ")
+
+
+def test_timer_registry_to_json() -> None:
+    timers = TimerRegistry()
+    timers.record("load", 0.5)
+    assert json.loads(timers.to_json()) == {
+        "load": {
+            "count": 1,
+            "total": 0.5,
+            "mean": 0.5,
+            "min": 0.5,
+            "max": 0.5,
+            "p50": 0.5,
+            "p90": 0.5,
+            "p99": 0.5,
+        }
+    }
+
+
+################################################
+#     Tests for get_default_timer_registry     #
+################################################
+
+
+def test_get_default_timer_registry() -> None:
+    timers = get_default_timer_registry()
+    assert isinstance(timers, TimerRegistry)
+    assert timers is get_default_timer_registry()
+    assert not timers.enabled
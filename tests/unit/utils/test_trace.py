@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from iden.io import JsonSaver
+from iden.shard import create_json_shard, load_from_uri
+from iden.shard.utils import PrefetchShardIterable
+from iden.utils.trace import (
+    Tracer,
+    get_tracer,
+    start_tracing,
+    stop_tracing,
+    trace_instant,
+    trace_span,
+    tracing,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracer() -> Generator[None, None, None]:
+    yield
+    stop_tracing()
+
+
+############################
+#     Tests for Tracer     #
+############################
+
+
+def test_tracer_repr() -> None:
+    assert repr(Tracer()) == "Tracer(num_events=0, num_dropped=0)"
+
+
+def test_tracer_span() -> None:
+    tracer = Tracer()
+    with tracer.span("load", category="io", fmt="json"):
+        pass
+    events = tracer.get_events()
+    assert len(events) == 1
+    event = events[0]
+    assert event["name"] == "load"
+    assert event["cat"] == "io"
+    assert event["ph"] == "X"
+    assert event["args"] == {"fmt": "json"}
+    assert event["ts"] >= 0
+    assert event["dur"] >= 0
+    assert event["tid"] == threading.get_ident()
+
+
+def fail(tracer: Tracer) -> None:
+    with tracer.span("load"):
+        msg = "load failed"
+        raise RuntimeError(msg)
+
+
+def test_tracer_span_error() -> None:
+    tracer = Tracer()
+    with pytest.raises(RuntimeError, match="load failed"):
+        fail(tracer)
+    assert len(tracer.get_events()) == 1
+
+
+def test_tracer_span_nested() -> None:
+    tracer = Tracer()
+    with tracer.span("outer"), tracer.span("inner"):
+        pass
+    inner, outer = tracer.get_events()
+    assert inner["name"] == "inner"
+    assert outer["name"] == "outer"
+    assert outer["ts"] <= inner["ts"]
+    assert outer["ts"] + outer["dur"] >= inner["ts"] + inner["dur"]
+
+
+def test_tracer_instant() -> None:
+    tracer = Tracer()
+    tracer.instant("cache_hit", category="cache", uri="uri")
+    event = tracer.get_events()[0]
+    assert event["name"] == "cache_hit"
+    assert event["ph"] == "i"
+    assert event["args"] == {"uri": "uri"}
+
+
+def test_tracer_max_events() -> None:
+    tracer = Tracer(max_events=2)
+    for _ in range(5):
+        tracer.instant("event")
+    assert repr(tracer) == "Tracer(num_events=2, num_dropped=3)"
+    assert tracer.to_dict()["otherData"] == {"num_dropped": 3}
+
+
+def test_tracer_clear() -> None:
+    tracer = Tracer(max_events=1)
+    tracer.instant("event")
+    tracer.instant("event")
+    tracer.clear()
+    assert repr(tracer) == "Tracer(num_events=0, num_dropped=0)"
+
+
+def test_tracer_to_dict_threads() -> None:
+    tracer = Tracer()
+
+    def record() -> None:
+        with tracer.span("worker"):
+            pass
+
+    thread = threading.Thread(target=record, name="my-worker")
+    thread.start()
+    thread.join()
+    events = tracer.to_dict()["traceEvents"]
+    assert events[0]["ph"] == "M"
+    assert events[0]["args"] == {"name": "my-worker"}
+    assert events[1]["tid"] == events[0]["tid"]
+
+
+def test_tracer_save(tmp_path: Path) -> None:
+    tracer = Tracer()
+    with tracer.span("load"):
+        pass
+    path = tmp_path.joinpath("subdir/trace.json")
+    tracer.save(path)
+    with path.open() as file:
+        assert json.load(file) == tracer.to_dict()
+
+
+#############################
+#     Tests for tracing     #
+#############################
+
+
+def test_get_tracer_disabled() -> None:
+    assert get_tracer() is None
+
+
+def test_start_tracing() -> None:
+    tracer = start_tracing()
+    assert get_tracer() is tracer
+
+
+def test_start_tracing_tracer() -> None:
+    tracer = Tracer()
+    assert start_tracing(tracer) is tracer
+
+
+def test_stop_tracing() -> None:
+    tracer = start_tracing()
+    assert stop_tracing() is tracer
+    assert get_tracer() is None
+
+
+def test_stop_tracing_disabled() -> None:
+    assert stop_tracing() is None
+
+
+def test_tracing(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("trace.json")
+    with tracing(path) as tracer:
+        assert get_tracer() is tracer
+        with trace_span("block"):
+            pass
+    assert get_tracer() is None
+    assert path.is_file()
+    assert [event["name"] for event in tracer.get_events()] == ["block"]
+
+
+def test_tracing_without_path() -> None:
+    with tracing() as tracer:
+        trace_instant("event")
+    assert len(tracer.get_events()) == 1
+
+
+def test_trace_span_disabled() -> None:
+    with trace_span("block"):
+        pass
+
+
+def test_trace_instant_disabled() -> None:
+    trace_instant("event")
+
+
+def test_tracing_pipeline(tmp_path: Path) -> None:
+    uri = tmp_path.joinpath("uri").as_uri()
+    with tracing() as tracer:
+        shard = create_json_shard([1, 2, 3], uri=uri)
+        shard.get_data(cache=True)
+        shard.get_data(cache=True)
+        shard.clear()
+        list(PrefetchShardIterable([shard]))
+    names = [event["name"] for event in tracer.get_events()]
+    assert names.count("save") == 2
+    assert names.count("load") == 2
+    assert "cache_store" in names
+    assert "cache_hit" in names
+    assert "cache_clear" in names
+    assert "prefetch_wait" in names
+
+
+def test_tracing_saver(tmp_path: Path) -> None:
+    with tracing() as tracer:
+        JsonSaver().save([1, 2, 3], tmp_path.joinpath("data.json"))
+    event = tracer.get_events()[0]
+    assert event["name"] == "save"
+    assert event["args"]["saver"] == "JsonSaver"
+
+
+def test_tracing_load_from_uri(tmp_path: Path) -> None:
+    uri = tmp_path.joinpath("uri").as_uri()
+    create_json_shard([1, 2, 3], uri=uri)
+    with tracing() as tracer:
+        load_from_uri(uri)
+    event = tracer.get_events()[0]
+    assert event["name"] == "load_from_uri"
+    assert event["args"] == {"uri": uri, "type": "shard"}